@@ -30,6 +30,8 @@ from app.models import (
     Round,
     Season,
     Team,
+    TeamRanking,
+    TeamRoundScore,
     User,
 )
 from app.schemas.admin import (
@@ -61,10 +63,14 @@ from app.schemas.admin import (
     AdminTransferPlayerOut,
 )
 from app.services.app_config import get_premium_badge_config, update_premium_badge_config
+from app.services.batch_scoring import recalc_season_points
 from app.services.data_pipeline import ingest_parquets_to_duckdb, sync_duckdb_to_postgres
 from app.services.fantasy import ensure_round, get_or_create_season, get_round_by_number
 from app.services.action_log import log_action
+from app.services.player_summary import adjust_selected_counts, refresh_player_summaries
 from app.services.push_notifications import run_round_deadline_reminders
+from app.services.ranking import refresh_rankings
+from app.services.response_cache import bump_data_version
 from app.services.round_recovery import recover_round_lineups_from_market
 from app.services.scoring import calc_match_points, recalc_round_points
 
@@ -277,6 +283,9 @@ def _revert_transfer_row(
             )
         )
         db.flush()
+        adjust_selected_counts(
+            db, round_obj.season_id, added=[transfer.out_player_id], removed=[transfer.in_player_id]
+        )
         db.delete(transfer)
         return "reverted", None
 
@@ -431,10 +440,30 @@ def _delete_user_data(db: Session, user: User) -> None:
             )
         )
         db.execute(delete(FantasyLineup).where(FantasyLineup.fantasy_team_id.in_(team_ids)))
+        squad_rows = db.execute(
+            select(FantasyTeam.season_id, FantasyTeamPlayer.player_id)
+            .join(FantasyTeam, FantasyTeam.id == FantasyTeamPlayer.fantasy_team_id)
+            .where(FantasyTeamPlayer.fantasy_team_id.in_(team_ids))
+        ).all()
         db.execute(delete(FantasyTeamPlayer).where(FantasyTeamPlayer.fantasy_team_id.in_(team_ids)))
         db.execute(delete(FantasyTransfer).where(FantasyTransfer.fantasy_team_id.in_(team_ids)))
         db.execute(delete(LeagueMember).where(LeagueMember.fantasy_team_id.in_(team_ids)))
+        ranked_season_ids = (
+            db.execute(select(TeamRanking.season_id).where(TeamRanking.fantasy_team_id.in_(team_ids)).distinct())
+            .scalars()
+            .all()
+        )
+        db.execute(delete(TeamRoundScore).where(TeamRoundScore.fantasy_team_id.in_(team_ids)))
+        db.execute(delete(TeamRanking).where(TeamRanking.fantasy_team_id.in_(team_ids)))
         db.execute(delete(FantasyTeam).where(FantasyTeam.id.in_(team_ids)))
+        removed_by_season: dict[int, list[int]] = {}
+        for season_id, player_id in squad_rows:
+            removed_by_season.setdefault(season_id, []).append(player_id)
+        for season_id, player_ids in removed_by_season.items():
+            adjust_selected_counts(db, season_id, removed=player_ids)
+        # The remaining teams move up a rank.
+        for season_id in ranked_season_ids:
+            refresh_rankings(db, db.get(Season, season_id))
 
     db.execute(delete(User).where(User.id == user.id))
 
@@ -466,11 +495,10 @@ def set_admin_premium_badge_config(
 
 
 @router.post("/rebuild_catalog")
-def rebuild_catalog() -> dict:
+def rebuild_catalog(force: bool = Query(default=False)) -> dict:
     settings = get_settings()
-    ingest_parquets_to_duckdb(settings)
-    sync_duckdb_to_postgres(settings)
-    return {"ok": True}
+    ingest = ingest_parquets_to_duckdb(settings, force=force)
+    return {"ok": True, "ingest": ingest, **sync_duckdb_to_postgres(settings)}
 
 
 @router.post("/apply_prices")
@@ -498,6 +526,7 @@ def apply_prices(
         ),
         {"season_id": season.id, "round_id": round_obj.id},
     )
+    bump_data_version(db)
     db.commit()
 
     if refresh_from_duckdb:
@@ -537,6 +566,26 @@ def recalc_round(
         raise
 
 
+@router.post("/recalc_season")
+def recalc_season(db: Session = Depends(get_db)) -> dict:
+    # Rescoring after a rules change. Like recalc_round it rewrites points_round and player_round_stats
+    # (clean sheets and goals conceded resolved from fixtures) for every round; prices and budget caps
+    # stay as the per-round recalcs left them.
+    try:
+        result = recalc_season_points(db)
+    except SQLAlchemyError as exc:
+        db.rollback()
+        log_action(db, category="round", action="recalc_season_failed", details={"error": str(exc)[:500]})
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"db_error: {exc}")
+    log_action(
+        db,
+        category="round",
+        action="recalc_season",
+        details={"rounds": result["rounds"], "points_rows": result["points_rows"]},
+    )
+    return result
+
+
 @router.post("/recalc_match")
 def recalc_match(
     match_id: int = Query(..., ge=1),
@@ -596,6 +645,8 @@ def set_round_status(
 
     if normalized == "Cerrada":
         round_obj.is_closed = True
+        refresh_rankings(db, season)
+        bump_data_version(db)
         db.commit()
         return {"ok": True, "round_number": round_number, "status": "Cerrada"}
 
@@ -625,6 +676,8 @@ def set_round_status(
         else:
             round_item.is_closed = False
 
+    refresh_rankings(db, season)
+    bump_data_version(db)
     db.commit()
     return {"ok": True, "round_number": round_number, "status": normalized, "pending_round": pending_round}
 
@@ -644,6 +697,8 @@ def seed_season_rounds(
 
     for round_number in range(1, rounds + 1):
         ensure_round(db, season.id, round_number)
+    bump_data_version(db)
+    db.commit()
 
     return {"ok": True, "rounds": rounds}
 
@@ -893,6 +948,10 @@ def update_player_injury(
     if not player:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="player_not_found")
     player.is_injured = payload.is_injured
+    # Injury decides whether the captain or vice-captain doubles, so the stored ranks depend on it.
+    db.flush()
+    refresh_rankings(db, get_or_create_season(db))
+    bump_data_version(db)
     db.commit()
     return AdminPlayerInjuryOut(player_id=player_id, is_injured=bool(player.is_injured))
 
@@ -971,6 +1030,7 @@ def upsert_fixture(
         if not updated.rowcount:
             next_id = db.execute(select(func.coalesce(func.max(Fixture.id), 0) + 1)).scalar_one()
             db.execute(insert(Fixture).values(id=next_id, **values))
+        bump_data_version(db)
         db.commit()
     except IntegrityError as exc:
         db.rollback()
@@ -1114,6 +1174,8 @@ def upsert_player_stats(
             ),
             rows,
         )
+        refresh_player_summaries(db, season.id, {row["player_id"] for row in rows})
+        bump_data_version(db)
         db.commit()
     log_action(
         db,
@@ -1558,6 +1620,7 @@ def restore_transfers_for_round(
             fees_reimbursed_total += reimbursed
             teams_reimbursed += 1
 
+    bump_data_version(db)
     db.commit()
 
     return {
@@ -1637,6 +1700,7 @@ def revert_transfer_by_id(
             team.budget_cap = _round_price(Decimal(str(team.budget_cap)) + reimbursed)
             fees_reimbursed_total = reimbursed
 
+    bump_data_version(db)
     db.commit()
 
     return {
@@ -1698,6 +1762,7 @@ def update_fixture(
     if "status" in data and data["status"] is not None:
         fixture.status = data["status"]
 
+    bump_data_version(db)
     db.commit()
     db.refresh(fixture)
 
@@ -1771,6 +1836,7 @@ def update_round_window(
     if "ends_at" in data:
         round_obj.ends_at = data["ends_at"]
 
+    bump_data_version(db)
     db.commit()
     db.refresh(round_obj)
 
@@ -1804,6 +1870,8 @@ def close_round(
     round_obj.is_closed = True
     if round_obj.ends_at is None:
         round_obj.ends_at = func.now()
+    refresh_rankings(db, season)
+    bump_data_version(db)
     db.commit()
     log_action(
         db,
@@ -1879,6 +1947,8 @@ def open_round(
     round_obj.is_closed = False
     if round_obj.starts_at is None:
         round_obj.starts_at = func.now()
+    refresh_rankings(db, season)
+    bump_data_version(db)
     db.commit()
     log_action(
         db,
@@ -1974,6 +2044,7 @@ def delete_user(user_id: int, db: Session = Depends(get_db)) -> dict:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="user_not_found")
     user_email = user.email
     _delete_user_data(db, user)
+    bump_data_version(db)
     db.commit()
     log_action(
         db,
@@ -9,14 +9,12 @@ from sqlalchemy.orm import Session
 from app.db.session import get_db
 from app.models import (
     FantasyTeam,
-    FantasyTeamPlayer,
     Fixture,
     PlayerCatalog,
+    PlayerSeasonSummary,
     PriceHistory,
     PlayerMatchStat,
-    PlayerRoundStat,
     PointsRound,
-    PriceMovement,
     Round,
     Team,
 )
@@ -31,12 +29,15 @@ from app.schemas.catalog import (
     TeamOut,
 )
 from app.services.fantasy import get_current_round, get_or_create_season
+from app.services.player_summary import ensure_player_summaries
+from app.services.response_cache import cached_endpoint
 from app.services.scoring import calc_match_points
 
 router = APIRouter(prefix="/catalog", tags=["catalog"])
 
 
 @router.get("/players", response_model=List[PlayerCatalogOut])
+@cached_endpoint
 def list_players(
     position: Optional[str] = None,
     team_id: Optional[int] = None,
@@ -49,72 +50,11 @@ def list_players(
 ) -> List[PlayerCatalogOut]:
     season = get_or_create_season(db)
     round_obj = get_current_round(db, season.id)
-    stats_subq = (
-        select(
-            PlayerMatchStat.player_id.label("player_id"),
-            func.coalesce(func.sum(PlayerMatchStat.goals), 0).label("goals"),
-            func.coalesce(func.sum(PlayerMatchStat.assists), 0).label("assists"),
-            func.coalesce(func.sum(PlayerMatchStat.minutesplayed), 0).label("minutesplayed"),
-            func.coalesce(func.sum(PlayerMatchStat.saves), 0).label("saves"),
-            func.coalesce(func.sum(PlayerMatchStat.fouls), 0).label("fouls"),
-        )
-        .where(PlayerMatchStat.season_id == season.id)
-        .group_by(PlayerMatchStat.player_id)
-        .subquery()
-    )
-    points_total_subq = (
-        select(
-            PointsRound.player_id.label("player_id"),
-            func.coalesce(func.sum(PointsRound.points), 0).label("points_total"),
-        )
-        .where(PointsRound.season_id == season.id)
-        .group_by(PointsRound.player_id)
-        .subquery()
-    )
-    totals_stats_subq = (
-        select(
-            PlayerRoundStat.player_id.label("player_id"),
-            func.coalesce(func.sum(PlayerRoundStat.clean_sheets), 0).label("clean_sheets_total"),
-            func.coalesce(func.sum(PlayerRoundStat.goals_conceded), 0).label("goals_conceded_total"),
-        )
-        .where(PlayerRoundStat.season_id == season.id)
-        .group_by(PlayerRoundStat.player_id)
-        .subquery()
-    )
-    latest_price_round_subq = (
-        select(func.max(PriceMovement.round_id).label("round_id"))
-        .where(PriceMovement.season_id == season.id)
-        .subquery()
-    )
-    price_movement_subq = (
-        select(
-            PriceMovement.player_id.label("player_id"),
-            PriceMovement.delta.label("price_delta"),
-        )
-        .where(
-            PriceMovement.season_id == season.id,
-            PriceMovement.round_id == latest_price_round_subq.c.round_id,
-        )
-        .subquery()
-    )
-
-    query = (
-        select(
-            PlayerCatalog,
-            stats_subq.c.goals,
-            stats_subq.c.assists,
-            stats_subq.c.minutesplayed,
-            stats_subq.c.saves,
-            stats_subq.c.fouls,
-            func.coalesce(points_total_subq.c.points_total, 0).label("points_total"),
-            func.coalesce(totals_stats_subq.c.clean_sheets_total, 0).label("clean_sheets_total"),
-            func.coalesce(totals_stats_subq.c.goals_conceded_total, 0).label("goals_conceded_total"),
-            price_movement_subq.c.price_delta,
-        )
-        .outerjoin(stats_subq, PlayerCatalog.player_id == stats_subq.c.player_id)
-        .outerjoin(points_total_subq, PlayerCatalog.player_id == points_total_subq.c.player_id)
-        .outerjoin(totals_stats_subq, PlayerCatalog.player_id == totals_stats_subq.c.player_id)
-        .outerjoin(price_movement_subq, PlayerCatalog.player_id == price_movement_subq.c.player_id)
+    ensure_player_summaries(db, season.id)
+    query = select(PlayerCatalog, PlayerSeasonSummary).outerjoin(
+        PlayerSeasonSummary,
+        (PlayerSeasonSummary.player_id == PlayerCatalog.player_id)
+        & (PlayerSeasonSummary.season_id == season.id),
     )
     if position:
         query = query.where(PlayerCatalog.position == position)
@@ -131,7 +71,7 @@ def list_players(
     rows = db.execute(query).all()
     points_map = {}
     if rows and round_obj:
-        player_ids = [row[0].player_id for row in rows]
+        player_ids = [player.player_id for player, _ in rows]
         points_rows = db.execute(
             select(PointsRound.player_id, PointsRound.points).where(
                 PointsRound.season_id == season.id,
@@ -141,18 +81,21 @@ def list_players(
         ).all()
         points_map = {player_id: float(points) for player_id, points in points_rows}
     results: List[PlayerCatalogOut] = []
-    for row in rows:
-        player = row[0]
-        goals = row[1] if row[1] is not None else player.goals
-        assists = row[2] if row[2] is not None else player.assists
-        minutesplayed = row[3] if row[3] is not None else player.minutesplayed
-        saves = row[4] if row[4] is not None else player.saves
-        fouls = row[5] if row[5] is not None else player.fouls
-
-        points_total = float(row[6] or 0)
-        clean_sheets_total = int(row[7] or 0)
-        goals_conceded_total = int(row[8] or 0)
-        price_delta = float(row[9]) if row[9] is not None else None
+    for player, summary in rows:
+        # Without match stats the catalog keeps the base numbers loaded from the parquets.
+        stats = summary if summary is not None and summary.matches_with_stats else player
+        goals = stats.goals
+        assists = stats.assists
+        minutesplayed = stats.minutesplayed
+        saves = stats.saves
+        fouls = stats.fouls
+
+        points_total = float(summary.points_total) if summary is not None else 0.0
+        clean_sheets_total = summary.clean_sheets if summary is not None else 0
+        goals_conceded_total = summary.goals_conceded if summary is not None else 0
+        price_delta = (
+            float(summary.price_delta) if summary is not None and summary.price_delta is not None else None
+        )
         results.append(
             PlayerCatalogOut(
                 player_id=player.player_id,
@@ -211,6 +154,7 @@ def list_player_price_history(
 
 
 @router.get("/player-stats", response_model=List[PlayerStatsOut])
+@cached_endpoint
 def list_player_stats(
     position: Optional[str] = None,
     team_id: Optional[int] = None,
@@ -228,66 +172,12 @@ def list_player_stats(
         or 0
     )
 
-    stats_subq = (
-        select(
-            PlayerMatchStat.player_id.label("player_id"),
-            func.coalesce(func.sum(PlayerMatchStat.goals), 0).label("goals"),
-            func.coalesce(func.sum(PlayerMatchStat.assists), 0).label("assists"),
-            func.coalesce(func.sum(PlayerMatchStat.minutesplayed), 0).label("minutesplayed"),
-            func.coalesce(func.sum(PlayerMatchStat.saves), 0).label("saves"),
-            func.coalesce(func.sum(PlayerMatchStat.fouls), 0).label("fouls"),
-            func.coalesce(func.sum(PlayerMatchStat.yellow_cards), 0).label("yellow_cards"),
-            func.coalesce(func.sum(PlayerMatchStat.red_cards), 0).label("red_cards"),
-        )
-        .where(PlayerMatchStat.season_id == season.id)
-        .group_by(PlayerMatchStat.player_id)
-        .subquery()
-    )
-
-    selected_subq = (
-        select(
-            FantasyTeamPlayer.player_id.label("player_id"),
-            func.count(FantasyTeamPlayer.fantasy_team_id).label("selected_count"),
-        )
-        .join(FantasyTeam, FantasyTeam.id == FantasyTeamPlayer.fantasy_team_id)
-        .where(FantasyTeam.season_id == season.id)
-        .group_by(FantasyTeamPlayer.player_id)
-        .subquery()
-    )
-
-    latest_price_round_subq = (
-        select(func.max(PriceMovement.round_id).label("round_id"))
-        .where(PriceMovement.season_id == season.id)
-        .subquery()
-    )
-    price_movement_subq = (
-        select(
-            PriceMovement.player_id.label("player_id"),
-            PriceMovement.delta.label("price_delta"),
-        )
-        .where(
-            PriceMovement.season_id == season.id,
-            PriceMovement.round_id == latest_price_round_subq.c.round_id,
-        )
-        .subquery()
-    )
-
-    query = (
-        select(
-            PlayerCatalog,
-            stats_subq.c.goals,
-            stats_subq.c.assists,
-            stats_subq.c.minutesplayed,
-            stats_subq.c.saves,
-            stats_subq.c.fouls,
-            stats_subq.c.yellow_cards,
-            stats_subq.c.red_cards,
-            func.coalesce(selected_subq.c.selected_count, 0).label("selected_count"),
-            price_movement_subq.c.price_delta,
-        )
-        .outerjoin(stats_subq, PlayerCatalog.player_id == stats_subq.c.player_id)
-        .outerjoin(selected_subq, PlayerCatalog.player_id == selected_subq.c.player_id)
-        .outerjoin(price_movement_subq, PlayerCatalog.player_id == price_movement_subq.c.player_id)
+    ensure_player_summaries(db, season.id)
+    selected_count = func.coalesce(PlayerSeasonSummary.selected_count, 0)
+    query = select(PlayerCatalog, PlayerSeasonSummary).outerjoin(
+        PlayerSeasonSummary,
+        (PlayerSeasonSummary.player_id == PlayerCatalog.player_id)
+        & (PlayerSeasonSummary.season_id == season.id),
     )
     if position:
         query = query.where(PlayerCatalog.position == position)
@@ -301,14 +191,14 @@ def list_player_stats(
         query = query.where(PlayerCatalog.price_current >= min_price)
 
     query = (
-        query.order_by(func.coalesce(selected_subq.c.selected_count, 0).desc(), PlayerCatalog.name)
+        query.order_by(selected_count.desc(), PlayerCatalog.name)
         .limit(limit)
         .offset(offset)
     )
     rows = db.execute(query).all()
     points_round_map: dict[int, list[dict[str, float | int]]] = {}
     if rows:
-        player_ids = [row[0].player_id for row in rows]
+        player_ids = [player.player_id for player, _ in rows]
         points_rows = db.execute(
             select(PointsRound.player_id, Round.round_number, PointsRound.points)
             .join(Round, PointsRound.round_id == Round.id)
@@ -324,11 +214,12 @@ def list_player_stats(
             )
 
     results: List[PlayerStatsOut] = []
-    for row in rows:
-        player = row[0]
-        selected_count = int(row[8] or 0)
-        selected_percent = (selected_count / total_teams * 100) if total_teams > 0 else 0.0
-        price_delta = float(row[9]) if row[9] is not None else None
+    for player, summary in rows:
+        selected = summary.selected_count if summary is not None else 0
+        selected_percent = (selected / total_teams * 100) if total_teams > 0 else 0.0
+        price_delta = (
+            float(summary.price_delta) if summary is not None and summary.price_delta is not None else None
+        )
         results.append(
             PlayerStatsOut(
                 player_id=player.player_id,
@@ -339,15 +230,15 @@ def list_player_stats(
                 price_current=float(player.price_current),
                 price_delta=price_delta,
                 is_injured=bool(player.is_injured),
-                selected_count=selected_count,
+                selected_count=selected,
                 selected_percent=selected_percent,
-                goals=int(row[1] or 0),
-                assists=int(row[2] or 0),
-                minutesplayed=int(row[3] or 0),
-                saves=int(row[4] or 0),
-                fouls=int(row[5] or 0),
-                yellow_cards=int(row[6] or 0),
-                red_cards=int(row[7] or 0),
+                goals=summary.goals if summary is not None else 0,
+                assists=summary.assists if summary is not None else 0,
+                minutesplayed=summary.minutesplayed if summary is not None else 0,
+                saves=summary.saves if summary is not None else 0,
+                fouls=summary.fouls if summary is not None else 0,
+                yellow_cards=summary.yellow_cards if summary is not None else 0,
+                red_cards=summary.red_cards if summary is not None else 0,
                 rounds=points_round_map.get(player.player_id, []),
             )
         )
@@ -356,6 +247,7 @@ def list_player_stats(
 
 
 @router.get("/fixtures", response_model=List[FixtureOut])
+@cached_endpoint
 def list_fixtures(
     round_number: Optional[int] = None, db: Session = Depends(get_db)
 ) -> List[FixtureOut]:
@@ -382,12 +274,18 @@ def list_fixtures(
             status=fixture.status,
             home_score=fixture.home_score,
             away_score=fixture.away_score,
+            expected_home_goals=float(fixture.expected_home_goals) if fixture.expected_home_goals is not None else None,
+            expected_away_goals=float(fixture.expected_away_goals) if fixture.expected_away_goals is not None else None,
+            prob_home=float(fixture.prob_home) if fixture.prob_home is not None else None,
+            prob_draw=float(fixture.prob_draw) if fixture.prob_draw is not None else None,
+            prob_away=float(fixture.prob_away) if fixture.prob_away is not None else None,
         )
         for fixture, round_no in rows
     ]
 
 
 @router.get("/rounds", response_model=List[RoundOut])
+@cached_endpoint
 def list_rounds(db: Session = Depends(get_db)) -> List[RoundOut]:
     season = get_or_create_season(db)
     rows = (
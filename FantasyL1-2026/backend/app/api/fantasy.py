@@ -5,8 +5,8 @@ from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from decimal import Decimal, ROUND_HALF_UP
-from sqlalchemy import delete, func, select
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, delete, func, select
+from sqlalchemy.orm import Session, aliased
 
 from app.api.deps import get_current_user
 from app.db.session import get_db
@@ -38,7 +38,6 @@ from app.schemas.fantasy import (
 )
 from app.services.fantasy import (
     ensure_lineup,
-    get_club_counts,
     get_current_round,
     get_latest_round,
     get_or_create_fantasy_team,
@@ -48,6 +47,7 @@ from app.services.fantasy import (
     replace_squad,
     upsert_lineup_slots,
 )
+from app.services.player_summary import adjust_selected_counts
 from app.services.validation import validate_lineup, validate_squad
 
 router = APIRouter(prefix="/fantasy", tags=["fantasy"])
@@ -300,146 +300,211 @@ def _find_transfer_that_removed_player(
     )
 
 
-def _build_team_response(
+def _load_team_view_context(
     db: Session, fantasy_team_id: int, round_number: Optional[int] = None
-) -> FantasyTeamOut:
-    team = db.execute(select(FantasyTeam).where(FantasyTeam.id == fantasy_team_id)).scalar_one()
-    round_obj = (
-        get_round_by_number(db, team.season_id, round_number)
-        if round_number
-        else get_current_round(db, team.season_id)
+) -> tuple[FantasyTeam, Round | None, Round | None, int, int, Decimal]:
+    """One round-trip: team, viewed round, previous closed round, transfer count and frozen lineup delta."""
+    round_ = aliased(Round)
+    prev_round = aliased(Round)
+    if round_number:
+        target_round_id = select(Round.id).where(
+            Round.season_id == FantasyTeam.season_id,
+            Round.round_number == round_number,
+        )
+    else:
+        target_round_id = (
+            select(Round.id)
+            .where(Round.season_id == FantasyTeam.season_id, Round.is_closed.is_(False))
+            .order_by(Round.round_number)
+            .limit(1)
+        )
+    prev_round_id = (
+        select(Round.id)
+        .where(
+            Round.season_id == round_.season_id,
+            Round.is_closed.is_(True),
+            Round.round_number < round_.round_number,
+        )
+        .order_by(Round.round_number.desc())
+        .limit(1)
     )
-
-    rows = (
+    prev_lineup_slots = (
+        select(FantasyLineupSlot.player_id)
+        .join(FantasyLineup, FantasyLineup.id == FantasyLineupSlot.lineup_id)
+        .where(
+            FantasyLineup.fantasy_team_id == FantasyTeam.id,
+            FantasyLineup.round_id == prev_round.id,
+            FantasyLineupSlot.player_id.is_not(None),
+        )
+    )
+    transfer_count = (
+        select(func.count())
+        .select_from(FantasyTransfer)
+        .where(
+            FantasyTransfer.fantasy_team_id == FantasyTeam.id,
+            FantasyTransfer.round_id == round_.id,
+        )
+        .correlate(FantasyTeam, round_)
+        .scalar_subquery()
+    )
+    prev_lineup_count = (
+        prev_lineup_slots.with_only_columns(func.count(func.distinct(FantasyLineupSlot.player_id)))
+        .correlate(FantasyTeam, prev_round)
+        .scalar_subquery()
+    )
+    prev_lineup_delta = (
+        select(func.coalesce(func.sum(PriceMovement.delta), 0))
+        .where(
+            PriceMovement.season_id == FantasyTeam.season_id,
+            PriceMovement.round_id == prev_round.id,
+            PriceMovement.player_id.in_(prev_lineup_slots.correlate(FantasyTeam, prev_round)),
+        )
+        .correlate(FantasyTeam, prev_round)
+        .scalar_subquery()
+    )
+    row = db.execute(
+        select(FantasyTeam, round_, prev_round, transfer_count, prev_lineup_count, prev_lineup_delta)
+        .select_from(FantasyTeam)
+        .outerjoin(round_, round_.id == target_round_id.correlate(FantasyTeam).scalar_subquery())
+        .outerjoin(prev_round, prev_round.id == prev_round_id.correlate(round_).scalar_subquery())
+        .where(FantasyTeam.id == fantasy_team_id)
+    ).one()
+    team, round_obj, prev_closed_round, transfers, lineup_count, lineup_delta = row
+    return team, round_obj, prev_closed_round, int(transfers or 0), int(lineup_count or 0), lineup_delta
+
+
+def _load_team_view_rows(
+    db: Session,
+    team: FantasyTeam,
+    round_obj: Round | None,
+    prev_closed_round: Round | None,
+) -> list[tuple]:
+    """One round-trip: squad players with season totals, round stats and previous-round price moves."""
+    round_id = round_obj.id if round_obj else None
+    prev_round_id = prev_closed_round.id if prev_closed_round else None
+    squad_ids = select(FantasyTeamPlayer.player_id).where(FantasyTeamPlayer.fantasy_team_id == team.id)
+    points_totals = (
+        select(PointsRound.player_id, func.sum(PointsRound.points).label("points_total"))
+        .where(PointsRound.season_id == team.season_id, PointsRound.player_id.in_(squad_ids))
+        .group_by(PointsRound.player_id)
+        .cte("squad_points_totals")
+    )
+    stats_totals = (
+        select(
+            PlayerRoundStat.player_id,
+            func.sum(PlayerRoundStat.clean_sheets).label("clean_sheets"),
+            func.sum(PlayerRoundStat.goals_conceded).label("goals_conceded"),
+        )
+        .where(PlayerRoundStat.season_id == team.season_id, PlayerRoundStat.player_id.in_(squad_ids))
+        .group_by(PlayerRoundStat.player_id)
+        .cte("squad_stats_totals")
+    )
+    in_prev_lineup = (
+        select(FantasyLineupSlot.lineup_id)
+        .join(FantasyLineup, FantasyLineup.id == FantasyLineupSlot.lineup_id)
+        .where(
+            FantasyLineup.fantasy_team_id == team.id,
+            FantasyLineup.round_id == prev_round_id,
+            FantasyLineupSlot.player_id == PlayerCatalog.player_id,
+        )
+        .exists()
+    )
+    return (
         db.execute(
-            select(PlayerCatalog, FantasyTeamPlayer)
+            select(
+                PlayerCatalog,
+                FantasyTeamPlayer,
+                points_totals.c.points_total,
+                stats_totals.c.clean_sheets,
+                stats_totals.c.goals_conceded,
+                PointsRound.points.label("points_round"),
+                PlayerRoundStat.goals.label("goals_round"),
+                PlayerRoundStat.assists.label("assists_round"),
+                PlayerRoundStat.saves.label("saves_round"),
+                PriceMovement.delta.label("price_delta"),
+                in_prev_lineup.label("in_prev_lineup"),
+            )
             .join(FantasyTeamPlayer, FantasyTeamPlayer.player_id == PlayerCatalog.player_id)
-            .where(FantasyTeamPlayer.fantasy_team_id == fantasy_team_id)
+            .outerjoin(points_totals, points_totals.c.player_id == PlayerCatalog.player_id)
+            .outerjoin(stats_totals, stats_totals.c.player_id == PlayerCatalog.player_id)
+            .outerjoin(
+                PointsRound,
+                and_(
+                    PointsRound.season_id == team.season_id,
+                    PointsRound.round_id == round_id,
+                    PointsRound.player_id == PlayerCatalog.player_id,
+                ),
+            )
+            .outerjoin(
+                PlayerRoundStat,
+                and_(
+                    PlayerRoundStat.season_id == team.season_id,
+                    PlayerRoundStat.round_id == round_id,
+                    PlayerRoundStat.player_id == PlayerCatalog.player_id,
+                ),
+            )
+            .outerjoin(
+                PriceMovement,
+                and_(
+                    PriceMovement.season_id == team.season_id,
+                    PriceMovement.round_id == prev_round_id,
+                    PriceMovement.player_id == PlayerCatalog.player_id,
+                ),
+            )
+            .where(FantasyTeamPlayer.fantasy_team_id == team.id)
         )
         .all()
     )
+
+
+def _build_team_response(
+    db: Session, fantasy_team_id: int, round_number: Optional[int] = None
+) -> FantasyTeamOut:
+    (
+        team,
+        round_obj,
+        prev_closed_round,
+        transfer_count,
+        prev_lineup_count,
+        prev_lineup_delta,
+    ) = _load_team_view_context(db, fantasy_team_id, round_number)
+    rows = _load_team_view_rows(db, team, round_obj, prev_closed_round)
+
+    club_counts: dict[int, int] = {}
+    for row in rows:
+        club_counts[row.PlayerCatalog.team_id] = club_counts.get(row.PlayerCatalog.team_id, 0) + 1
     rows = _canonicalize_team_rows(rows)
-    points_map = {}
-    total_points_map = {}
-    totals_stats_map = {}
-    round_stats_map = {}
+
     price_delta_map: dict[int, float] = {}
+    cap_delta_total: float | None = None
     market_price_delta_total: float | None = None
     market_price_delta_from_round: int | None = None
     market_price_delta_to_round: int | None = None
-    if rows:
-        player_ids = [player.player_id for player, _ in rows]
-        total_points_rows = db.execute(
-            select(PointsRound.player_id, func.coalesce(func.sum(PointsRound.points), 0))
-            .where(
-                PointsRound.season_id == team.season_id,
-                PointsRound.player_id.in_(player_ids),
-            )
-            .group_by(PointsRound.player_id)
-        ).all()
-        total_points_map = {player_id: float(points) for player_id, points in total_points_rows}
-        totals_stats_rows = db.execute(
-            select(
-                PlayerRoundStat.player_id,
-                func.coalesce(func.sum(PlayerRoundStat.clean_sheets), 0),
-                func.coalesce(func.sum(PlayerRoundStat.goals_conceded), 0),
-            )
-            .where(
-                PlayerRoundStat.season_id == team.season_id,
-                PlayerRoundStat.player_id.in_(player_ids),
-            )
-            .group_by(PlayerRoundStat.player_id)
-        ).all()
-        totals_stats_map = {
-            player_id: {
-                "clean_sheets": int(clean_sheets or 0),
-                "goals_conceded": int(goals_conceded or 0),
-            }
-            for player_id, clean_sheets, goals_conceded in totals_stats_rows
-        }
-        if round_obj:
-            points_rows = db.execute(
-                select(PointsRound.player_id, PointsRound.points).where(
-                    PointsRound.season_id == team.season_id,
-                    PointsRound.round_id == round_obj.id,
-                    PointsRound.player_id.in_(player_ids),
-                )
-            ).all()
-            points_map = {player_id: float(points) for player_id, points in points_rows}
-            round_stats_rows = (
-                db.execute(
-                    select(
-                        PlayerRoundStat.player_id,
-                        PlayerRoundStat.goals,
-                        PlayerRoundStat.assists,
-                        PlayerRoundStat.saves,
-                    ).where(
-                        PlayerRoundStat.season_id == team.season_id,
-                        PlayerRoundStat.round_id == round_obj.id,
-                        PlayerRoundStat.player_id.in_(player_ids),
-                    )
-                )
-                .all()
+    if round_obj and not round_obj.is_closed and prev_closed_round:
+        # Freeze delta to previous closed lineup (the squad when there is none); ignore current transfers.
+        pending_rows = [row for row in rows if row.in_prev_lineup] if prev_lineup_count else rows
+        if prev_lineup_count:
+            pending_total = prev_lineup_delta or 0
+        else:
+            pending_total = sum(
+                (row.price_delta for row in pending_rows if row.price_delta is not None),
+                start=Decimal("0"),
             )
-            round_stats_map = {
-                player_id: {
-                    "goals": int(goals or 0),
-                    "assists": int(assists or 0),
-                    "saves": int(saves or 0),
-                }
-                for player_id, goals, assists, saves in round_stats_rows
+        cap_delta_total = float(_round_price(pending_total))
+        if rows:
+            price_delta_map = {
+                row.PlayerCatalog.player_id: float(row.price_delta)
+                for row in pending_rows
+                if row.price_delta is not None
             }
-
-            if not round_obj.is_closed:
-                prev_closed_round = (
-                    db.execute(
-                        select(Round)
-                        .where(
-                            Round.season_id == team.season_id,
-                            Round.is_closed.is_(True),
-                            Round.round_number < round_obj.round_number,
-                        )
-                        .order_by(Round.round_number.desc())
-                        .limit(1)
-                    )
-                    .scalars()
-                    .first()
-                )
-                if prev_closed_round:
-                    pending_player_ids = _get_previous_closed_lineup_player_ids(
-                        db,
-                        team.id,
-                        team.season_id,
-                        round_obj.round_number,
-                    )
-                    if not pending_player_ids:
-                        pending_player_ids = player_ids
-                    movement_rows = db.execute(
-                        select(PriceMovement.player_id, PriceMovement.delta).where(
-                            PriceMovement.season_id == team.season_id,
-                            PriceMovement.round_id == prev_closed_round.id,
-                            PriceMovement.player_id.in_(pending_player_ids),
-                        )
-                    ).all()
-                    price_delta_map = {
-                        player_id: float(delta or 0)
-                        for player_id, delta in movement_rows
-                    }
-                    # Freeze delta to previous closed lineup; ignore current transfers.
-                    total_delta = sum(price_delta_map.values())
-                    market_price_delta_total = float(
-                        Decimal(str(total_delta)).quantize(
-                            Decimal("0.1"),
-                            rounding=ROUND_HALF_UP,
-                        )
-                    )
-                    market_price_delta_from_round = prev_closed_round.round_number
-                    market_price_delta_to_round = round_obj.round_number
+            market_price_delta_total = cap_delta_total
+            market_price_delta_from_round = prev_closed_round.round_number
+            market_price_delta_to_round = round_obj.round_number
 
     squad = []
-    for player, team_player in rows:
-        totals = totals_stats_map.get(player.player_id)
-        round_stats = round_stats_map.get(player.player_id)
+    for row in rows:
+        player, team_player = row.PlayerCatalog, row.FantasyTeamPlayer
+        has_round_stats = row.goals_round is not None
         squad.append(
             FantasyTeamPlayerOut(
                 player_id=player.player_id,
@@ -453,16 +518,16 @@ def _build_team_response(
                 goals=int(player.goals or 0),
                 assists=int(player.assists or 0),
                 saves=int(player.saves or 0),
-                goals_round=round_stats["goals"] if round_stats else None,
-                assists_round=round_stats["assists"] if round_stats else None,
-                saves_round=round_stats["saves"] if round_stats else None,
-                points_round=points_map.get(player.player_id),
-                points_total=total_points_map.get(player.player_id, 0.0),
+                goals_round=int(row.goals_round) if has_round_stats else None,
+                assists_round=int(row.assists_round or 0) if has_round_stats else None,
+                saves_round=int(row.saves_round or 0) if has_round_stats else None,
+                points_round=float(row.points_round) if row.points_round is not None else None,
+                points_total=float(row.points_total or 0),
                 price_delta=price_delta_map.get(player.player_id)
                 if market_price_delta_total is not None
                 else None,
-                clean_sheets=totals["clean_sheets"] if totals else 0,
-                goals_conceded=totals["goals_conceded"] if totals else 0,
+                clean_sheets=int(row.clean_sheets or 0),
+                goals_conceded=int(row.goals_conceded or 0),
             )
         )
 
@@ -473,23 +538,8 @@ def _build_team_response(
         else requested_round_number
     )
 
-    cap_delta_total = (
-        market_price_delta_total
-        if market_price_delta_total is not None
-        else _get_pending_round_market_delta_total(
-            db,
-            team.season_id,
-            fantasy_team_id,
-            round_obj,
-        )
-    )
     transfer_fee_total = 0.0
     if round_obj and not round_obj.is_closed and round_obj.round_number > 1:
-        transfer_count = _get_transfer_count_for_round(
-            db,
-            team.id,
-            round_obj.id,
-        )
         transfer_fee_total = float(_get_transfer_fee_total_for_count(transfer_count))
     if effective_round_number is not None and effective_round_number <= 1:
         effective_budget_cap = 100.0
@@ -503,12 +553,12 @@ def _build_team_response(
     if round_obj and not round_obj.is_closed:
         # Pending rounds should reflect current market value for budget tracking.
         budget_used_dec = sum(
-            (Decimal(str(player.price_current)) for player, _ in rows),
+            (Decimal(str(row.PlayerCatalog.price_current)) for row in rows),
             start=Decimal("0.0"),
         ).quantize(Decimal("0.1"), rounding=ROUND_HALF_UP)
     else:
         budget_used_dec = sum(
-            (Decimal(str(team_player.bought_price)) for _, team_player in rows),
+            (Decimal(str(row.FantasyTeamPlayer.bought_price)) for row in rows),
             start=Decimal("0.0"),
         ).quantize(Decimal("0.1"), rounding=ROUND_HALF_UP)
     if (
@@ -522,7 +572,6 @@ def _build_team_response(
     ).quantize(Decimal("0.1"), rounding=ROUND_HALF_UP)
     budget_used = float(budget_used_dec)
     budget_left = float(budget_left_dec)
-    club_counts = get_club_counts(db, fantasy_team_id)
 
     return FantasyTeamOut(
         id=team.id,
@@ -692,9 +741,11 @@ def update_favorite_team(
     exists = db.execute(select(Team.id).where(Team.id == payload.team_id)).scalar_one_or_none()
     if not exists:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="team_not_found")
+    team_id = team.id
     team.favorite_team_id = payload.team_id
     db.commit()
-    return _build_team_response(db, team.id)
+    # The view re-reads the (now expired) team itself; touching team.id here would cost a refresh.
+    return _build_team_response(db, team_id)
 
 
 @router.get("/lineup", response_model=LineupOut)
@@ -985,6 +1036,9 @@ def transfer_player(
         db.delete(restored_transfer)
 
     team.budget_cap = _round_price(effective_budget_cap_after)
+    adjust_selected_counts(
+        db, team.season_id, added=[payload.in_player_id], removed=[payload.out_player_id]
+    )
     db.commit()
 
     if transfer is None:
@@ -1,11 +1,9 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
-from app.models import FantasyTeam
 from app.schemas.public import (
     PublicAppConfigOut,
     PublicLeaderboardEntryOut,
@@ -14,34 +12,37 @@ from app.schemas.public import (
 )
 from app.services.app_config import get_public_app_config
 from app.services.premium import get_or_create_season_by_year, get_public_premium_config
-from app.services.ranking import build_rankings
+from app.services.ranking import load_leaderboard_page
+from app.services.response_cache import cached_endpoint
 
 router = APIRouter(prefix="/public", tags=["public"])
 
 
 @router.get("/leaderboard", response_model=PublicLeaderboardOut)
+@cached_endpoint
 def public_leaderboard(
     limit: int = Query(default=25, ge=1, le=100),
     season_year: int = Query(default=2026, ge=2000, le=2100),
+    after_rank: int | None = Query(default=None, ge=0),
     db: Session = Depends(get_db),
 ) -> PublicLeaderboardOut:
     season = get_or_create_season_by_year(db, season_year)
-    team_ids = (
-        db.execute(select(FantasyTeam.id).where(FantasyTeam.season_id == season.id))
-        .scalars()
-        .all()
-    )
-    ranking = build_rankings(db, team_ids)
+    page = load_leaderboard_page(db, season, limit=limit, after_rank=after_rank)
     entries = [
         PublicLeaderboardEntryOut(
-            rank=index + 1,
+            rank=entry.rank,
             fantasy_team_id=entry.fantasy_team_id,
             team_name=entry.team_name,
             points_total=entry.total_points,
         )
-        for index, entry in enumerate(ranking.entries[:limit])
+        for entry in page.entries
     ]
-    return PublicLeaderboardOut(season_year=season.year, limit=limit, entries=entries)
+    return PublicLeaderboardOut(
+        season_year=season.year,
+        limit=limit,
+        next_after_rank=page.next_after_rank,
+        entries=entries,
+    )
 
 
 @router.get("/premium/config", response_model=PublicPremiumConfigOut)
@@ -17,24 +17,51 @@ from app.models import (
     PointsRound,
     Round,
 )
-from app.schemas.ranking import PublicLineupOut, PublicMarketOut, RankingOut
+from app.schemas.ranking import LeaderboardPageOut, PublicLineupOut, PublicMarketOut, RankingOut, TeamRoundsOut
 from app.services.fantasy import get_or_create_fantasy_team, get_or_create_season
-from app.services.ranking import build_rankings
+from app.services.ranking import (
+    load_leaderboard_page,
+    load_leaderboard_window,
+    load_rankings,
+    load_team_rounds,
+)
+from app.services.response_cache import cached_endpoint
 
 router = APIRouter(prefix="/ranking", tags=["ranking"])
 
 
 @router.get("/general", response_model=RankingOut)
+@cached_endpoint
 def ranking_general(
     db: Session = Depends(get_db),
 ) -> RankingOut:
     season = get_or_create_season(db)
-    team_ids = (
-        db.execute(select(FantasyTeam.id).where(FantasyTeam.season_id == season.id))
-        .scalars()
-        .all()
-    )
-    return build_rankings(db, team_ids)
+    return load_rankings(db, season)
+
+
+@router.get("/leaderboard", response_model=LeaderboardPageOut)
+@cached_endpoint
+def ranking_leaderboard(
+    limit: int = Query(default=50, ge=1, le=200),
+    after_rank: int | None = Query(default=None, ge=0),
+    db: Session = Depends(get_db),
+) -> LeaderboardPageOut:
+    season = get_or_create_season(db)
+    return load_leaderboard_page(db, season, limit=limit, after_rank=after_rank)
+
+
+@router.get("/leaderboard/me", response_model=LeaderboardPageOut)
+def ranking_leaderboard_me(
+    radius: int = Query(default=5, ge=0, le=50),
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+) -> LeaderboardPageOut:
+    season = get_or_create_season(db)
+    team = get_or_create_fantasy_team(db, user.id, season.id)
+    window = load_leaderboard_window(db, season, team.id, radius=radius)
+    if window is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="team_not_found")
+    return window
 
 
 @router.get("/league", response_model=RankingOut)
@@ -63,7 +90,19 @@ def ranking_league(
         .scalars()
         .all()
     )
-    return build_rankings(db, team_ids)
+    return load_rankings(db, season, team_ids=list(team_ids))
+
+
+@router.get("/team/{fantasy_team_id}/rounds", response_model=TeamRoundsOut)
+def get_team_rounds(
+    fantasy_team_id: int,
+    db: Session = Depends(get_db),
+) -> TeamRoundsOut:
+    season = get_or_create_season(db)
+    rounds = load_team_rounds(db, season, fantasy_team_id)
+    if rounds is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="team_not_found")
+    return rounds
 
 
 @router.get("/team/{fantasy_team_id}/lineup", response_model=PublicLineupOut)
@@ -60,6 +60,10 @@ class Settings(BaseSettings):
     MOBILE_CORS_ORIGINS: str = "capacitor://localhost,http://localhost"
     SCHEDULER_ENABLED: bool = True
     SCHEDULER_INTERVAL_SECONDS: int = 300
+    SELECTED_COUNT_RECONCILE_SECONDS: int = 3600
+    RESPONSE_CACHE_TTL_SECONDS: int = 60
+    RESPONSE_CACHE_MAX_ENTRIES: int = 512
+    DATA_VERSION_CHECK_SECONDS: int = 5
     SYNC_SKIP_PRUNE_MISSING_PLAYERS: bool = False
     SYNC_PRESERVE_EXISTING_PRICE_CURRENT: bool = False
     SYNC_PRESERVE_EXISTING_BASE_STATS: bool = False
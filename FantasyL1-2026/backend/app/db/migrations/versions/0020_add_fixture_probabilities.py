@@ -0,0 +1,31 @@
+"""add model probabilities to fixtures
+
+Revision ID: 0020_add_fixture_probabilities
+Revises: 0019_add_premium_badge_defaults
+Create Date: 2026-04-10
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0020_add_fixture_probabilities"
+down_revision = "0019_add_premium_badge_defaults"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("fixtures", sa.Column("expected_home_goals", sa.Numeric(4, 2), nullable=True))
+    op.add_column("fixtures", sa.Column("expected_away_goals", sa.Numeric(4, 2), nullable=True))
+    op.add_column("fixtures", sa.Column("prob_home", sa.Numeric(5, 4), nullable=True))
+    op.add_column("fixtures", sa.Column("prob_draw", sa.Numeric(5, 4), nullable=True))
+    op.add_column("fixtures", sa.Column("prob_away", sa.Numeric(5, 4), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("fixtures", "prob_away")
+    op.drop_column("fixtures", "prob_draw")
+    op.drop_column("fixtures", "prob_home")
+    op.drop_column("fixtures", "expected_away_goals")
+    op.drop_column("fixtures", "expected_home_goals")
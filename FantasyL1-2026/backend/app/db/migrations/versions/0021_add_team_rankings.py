@@ -0,0 +1,62 @@
+"""add materialized team round scores and rankings
+
+Revision ID: 0021_add_team_rankings
+Revises: 0020_add_fixture_probabilities
+Create Date: 2026-04-14
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0021_add_team_rankings"
+down_revision = "0020_add_fixture_probabilities"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "team_round_scores",
+        sa.Column("season_id", sa.Integer(), sa.ForeignKey("seasons.id"), primary_key=True),
+        sa.Column("fantasy_team_id", sa.Integer(), sa.ForeignKey("fantasy_teams.id"), primary_key=True),
+        sa.Column("round_number", sa.Integer(), primary_key=True),
+        sa.Column("points", sa.Numeric(8, 2), nullable=False, server_default="0"),
+        sa.Column("cumulative", sa.Numeric(8, 2), nullable=False, server_default="0"),
+        sa.Column("price_delta", sa.Numeric(6, 1), nullable=False, server_default="0"),
+    )
+
+    op.create_table(
+        "team_rankings",
+        sa.Column("season_id", sa.Integer(), sa.ForeignKey("seasons.id"), primary_key=True),
+        sa.Column("fantasy_team_id", sa.Integer(), sa.ForeignKey("fantasy_teams.id"), primary_key=True),
+        sa.Column("rank", sa.Integer(), nullable=False),
+        sa.Column("total_points", sa.Numeric(8, 2), nullable=False, server_default="0"),
+        sa.Column("valid_rounds", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("latest_price_delta", sa.Numeric(6, 1), nullable=False, server_default="0"),
+        sa.Column(
+            "captain_player_id",
+            sa.Integer(),
+            sa.ForeignKey("players_catalog.player_id"),
+            nullable=True,
+        ),
+        sa.Column("captain_round_number", sa.Integer(), nullable=True),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+    )
+    op.create_index(
+        "ix_team_rankings_season_rank",
+        "team_rankings",
+        ["season_id", "rank"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_team_rankings_season_rank", table_name="team_rankings")
+    op.drop_table("team_rankings")
+    op.drop_table("team_round_scores")
@@ -0,0 +1,58 @@
+"""add materialized player season summary
+
+Revision ID: 0022_add_player_season_summary
+Revises: 0021_add_team_rankings
+Create Date: 2026-04-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0022_add_player_season_summary"
+down_revision = "0021_add_team_rankings"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "player_season_summary",
+        sa.Column("season_id", sa.Integer(), sa.ForeignKey("seasons.id"), primary_key=True),
+        sa.Column(
+            "player_id",
+            sa.Integer(),
+            sa.ForeignKey("players_catalog.player_id"),
+            primary_key=True,
+        ),
+        sa.Column("matches_with_stats", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("goals", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("assists", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("minutesplayed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("saves", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("fouls", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("yellow_cards", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("red_cards", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("points_total", sa.Numeric(8, 2), nullable=False, server_default="0"),
+        sa.Column("clean_sheets", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("goals_conceded", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("price_delta", sa.Numeric(4, 1), nullable=True),
+        sa.Column("selected_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+    )
+    op.create_index(
+        "ix_player_season_summary_season_selected",
+        "player_season_summary",
+        ["season_id", "selected_count"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_player_season_summary_season_selected", table_name="player_season_summary")
+    op.drop_table("player_season_summary")
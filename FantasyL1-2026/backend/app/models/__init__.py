@@ -15,6 +15,7 @@ from app.models.tables import (
     PlayerCatalog,
     PlayerMatchStat,
     PlayerRoundStat,
+    PlayerSeasonSummary,
     PointsRound,
     PushDeviceToken,
     RoundPushNotification,
@@ -23,6 +24,8 @@ from app.models.tables import (
     Round,
     Season,
     Team,
+    TeamRanking,
+    TeamRoundScore,
     User,
 )
 
@@ -43,6 +46,7 @@ __all__ = [
     "PlayerCatalog",
     "PlayerMatchStat",
     "PlayerRoundStat",
+    "PlayerSeasonSummary",
     "PointsRound",
     "PushDeviceToken",
     "RoundPushNotification",
@@ -51,5 +55,7 @@ __all__ = [
     "Round",
     "Season",
     "Team",
+    "TeamRanking",
+    "TeamRoundScore",
     "User",
 ]
@@ -6,6 +6,7 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
@@ -89,6 +90,11 @@ class Fixture(Base):
     status = Column(String(20), nullable=False, server_default="Programado")
     home_score = Column(Integer, nullable=True)
     away_score = Column(Integer, nullable=True)
+    expected_home_goals = Column(Numeric(4, 2), nullable=True)
+    expected_away_goals = Column(Numeric(4, 2), nullable=True)
+    prob_home = Column(Numeric(5, 4), nullable=True)
+    prob_draw = Column(Numeric(5, 4), nullable=True)
+    prob_away = Column(Numeric(5, 4), nullable=True)
 
 
 class FantasyTeam(Base):
@@ -200,6 +206,58 @@ class PointsRound(Base):
     points = Column(Numeric(6, 2), nullable=False, server_default="0")
 
 
+class TeamRoundScore(Base):
+    __tablename__ = "team_round_scores"
+
+    season_id = Column(Integer, ForeignKey("seasons.id"), primary_key=True)
+    fantasy_team_id = Column(Integer, ForeignKey("fantasy_teams.id"), primary_key=True)
+    round_number = Column(Integer, primary_key=True)
+    points = Column(Numeric(8, 2), nullable=False, server_default="0")
+    cumulative = Column(Numeric(8, 2), nullable=False, server_default="0")
+    price_delta = Column(Numeric(6, 1), nullable=False, server_default="0")
+
+
+class TeamRanking(Base):
+    __tablename__ = "team_rankings"
+
+    season_id = Column(Integer, ForeignKey("seasons.id"), primary_key=True)
+    fantasy_team_id = Column(Integer, ForeignKey("fantasy_teams.id"), primary_key=True)
+    rank = Column(Integer, nullable=False)
+    total_points = Column(Numeric(8, 2), nullable=False, server_default="0")
+    valid_rounds = Column(Integer, nullable=False, server_default="0")
+    latest_price_delta = Column(Numeric(6, 1), nullable=False, server_default="0")
+    captain_player_id = Column(Integer, ForeignKey("players_catalog.player_id"), nullable=True)
+    captain_round_number = Column(Integer, nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (Index("ix_team_rankings_season_rank", "season_id", "rank"),)
+
+
+class PlayerSeasonSummary(Base):
+    __tablename__ = "player_season_summary"
+
+    season_id = Column(Integer, ForeignKey("seasons.id"), primary_key=True)
+    player_id = Column(Integer, ForeignKey("players_catalog.player_id"), primary_key=True)
+    matches_with_stats = Column(Integer, nullable=False, server_default="0")
+    goals = Column(Integer, nullable=False, server_default="0")
+    assists = Column(Integer, nullable=False, server_default="0")
+    minutesplayed = Column(Integer, nullable=False, server_default="0")
+    saves = Column(Integer, nullable=False, server_default="0")
+    fouls = Column(Integer, nullable=False, server_default="0")
+    yellow_cards = Column(Integer, nullable=False, server_default="0")
+    red_cards = Column(Integer, nullable=False, server_default="0")
+    points_total = Column(Numeric(8, 2), nullable=False, server_default="0")
+    clean_sheets = Column(Integer, nullable=False, server_default="0")
+    goals_conceded = Column(Integer, nullable=False, server_default="0")
+    price_delta = Column(Numeric(4, 1), nullable=True)
+    selected_count = Column(Integer, nullable=False, server_default="0")
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index("ix_player_season_summary_season_selected", "season_id", "selected_count"),
+    )
+
+
 class PlayerRoundStat(Base):
     __tablename__ = "player_round_stats"
 
@@ -75,6 +75,11 @@ class FixtureOut(BaseModel):
     status: str
     home_score: Optional[int] = None
     away_score: Optional[int] = None
+    expected_home_goals: Optional[float] = None
+    expected_away_goals: Optional[float] = None
+    prob_home: Optional[float] = None
+    prob_draw: Optional[float] = None
+    prob_away: Optional[float] = None
 
 
 class RoundOut(BaseModel):
@@ -17,6 +17,7 @@ class PublicLeaderboardEntryOut(BaseModel):
 class PublicLeaderboardOut(BaseModel):
     season_year: int
     limit: int
+    next_after_rank: int | None = None
     entries: list[PublicLeaderboardEntryOut]
 
 
@@ -29,6 +29,7 @@ class RankingRoundOut(BaseModel):
 
 
 class RankingEntryOut(BaseModel):
+    rank: int | None = None
     fantasy_team_id: int
     team_name: str
     total_points: float
@@ -43,6 +44,28 @@ class RankingOut(BaseModel):
     entries: List[RankingEntryOut]
 
 
+class LeaderboardEntryOut(BaseModel):
+    rank: int
+    fantasy_team_id: int
+    team_name: str
+    total_points: float
+    captain_player_id: int | None = None
+    favorite_team_id: int | None = None
+
+
+class LeaderboardPageOut(BaseModel):
+    total_teams: int
+    captain_source_round_number: int | None = None
+    next_after_rank: int | None = None
+    entries: List[LeaderboardEntryOut]
+
+
+class TeamRoundsOut(BaseModel):
+    fantasy_team_id: int
+    rank: int | None = None
+    rounds: List[RankingRoundOut]
+
+
 class PublicLineupPlayerOut(BaseModel):
     player_id: int
     name: str
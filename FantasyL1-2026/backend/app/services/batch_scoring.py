@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+
+from app.models import Season
+from app.services.fantasy import get_or_create_season
+from app.services.player_summary import refresh_player_summaries
+from app.services.ranking import refresh_rankings
+from app.services.response_cache import bump_data_version
+
+ROUND_STAT_COLUMNS = (
+    "minutesplayed",
+    "goals",
+    "assists",
+    "saves",
+    "fouls",
+    "yellow_cards",
+    "red_cards",
+    "clean_sheets",
+    "goals_conceded",
+)
+
+
+@dataclass(frozen=True)
+class MatchStatColumns:
+    """A season's player_match_stats as parallel arrays; nullable columns are float64 with NaN for NULL."""
+
+    round_id: np.ndarray
+    player_id: np.ndarray
+    minutesplayed: np.ndarray
+    goals: np.ndarray
+    assists: np.ndarray
+    saves: np.ndarray
+    fouls: np.ndarray
+    yellow_cards: np.ndarray
+    red_cards: np.ndarray
+    clean_sheet: np.ndarray
+    goals_conceded: np.ndarray
+    position: np.ndarray
+    team_id: np.ndarray
+    home_team_id: np.ndarray
+    away_team_id: np.ndarray
+    home_score: np.ndarray
+    away_score: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.round_id)
+
+    @classmethod
+    def from_rows(cls, rows: list[tuple]) -> "MatchStatColumns":
+        """Build from tuples ordered like the dataclass fields (position may be None)."""
+        columns = list(zip(*rows)) if rows else [()] * 17
+
+        def counts(values: tuple) -> np.ndarray:
+            # Mirrors calc_match_points' `int(value or 0)`.
+            return np.array([int(value or 0) for value in values], dtype=np.int64)
+
+        def nullable(values: tuple) -> np.ndarray:
+            return np.array([np.nan if value is None else float(value) for value in values], dtype=np.float64)
+
+        return cls(
+            round_id=np.array(columns[0], dtype=np.int64),
+            player_id=np.array(columns[1], dtype=np.int64),
+            minutesplayed=counts(columns[2]),
+            goals=counts(columns[3]),
+            assists=counts(columns[4]),
+            saves=counts(columns[5]),
+            fouls=counts(columns[6]),
+            yellow_cards=counts(columns[7]),
+            red_cards=counts(columns[8]),
+            clean_sheet=nullable(columns[9]),
+            goals_conceded=nullable(columns[10]),
+            position=np.array([(value or "").upper() for value in columns[11]], dtype=object),
+            team_id=nullable(columns[12]),
+            home_team_id=nullable(columns[13]),
+            away_team_id=nullable(columns[14]),
+            home_score=nullable(columns[15]),
+            away_score=nullable(columns[16]),
+        )
+
+
+@dataclass(frozen=True)
+class MatchScores:
+    points: np.ndarray
+    clean_sheet: np.ndarray
+    conceded: np.ndarray
+
+
+def score_match_columns(columns: MatchStatColumns) -> MatchScores:
+    """Vectorized calc_match_points: per-row points, resolved clean sheet and goals conceded (NaN for None)."""
+    minutes = columns.minutesplayed
+    played = minutes > 0
+    is_goalkeeper = np.isin(columns.position, ("G", "GK"))
+    keeps_clean_sheet = np.isin(columns.position, ("G", "GK", "D", "M"))
+
+    # Fixture overrides only apply once both scores are in (see _resolve_fixture_overrides).
+    has_score = ~np.isnan(columns.home_score) & ~np.isnan(columns.away_score)
+    from_fixture = np.where(
+        columns.home_team_id == columns.team_id,
+        columns.away_score,
+        np.where(columns.away_team_id == columns.team_id, columns.home_score, np.nan),
+    )
+    from_fixture = np.where(has_score, from_fixture, np.nan)
+    has_from_fixture = ~np.isnan(from_fixture)
+
+    goals_conceded = columns.goals_conceded
+    goals_conceded = np.where(
+        has_from_fixture & (np.isnan(goals_conceded) | (goals_conceded == 0)),
+        from_fixture,
+        goals_conceded,
+    )
+    clean_sheet = columns.clean_sheet
+    clean_sheet = np.where(
+        has_from_fixture & (np.isnan(clean_sheet) | (clean_sheet == 0)) & keeps_clean_sheet & played,
+        (from_fixture == 0).astype(np.float64),
+        clean_sheet,
+    )
+    conceded = np.where(np.isnan(goals_conceded), from_fixture, goals_conceded)
+    has_conceded = ~np.isnan(conceded)
+    kept_clean_sheet = np.where(np.isnan(clean_sheet), conceded == 0, clean_sheet == 1)
+
+    goals = columns.goals
+    points = (
+        goals * 4
+        + (goals // 3) * 3
+        + columns.assists * 3
+        - columns.yellow_cards * 3
+        - columns.red_cards * 5
+        + np.where(minutes >= 90, 2, played.astype(np.int64))
+        - columns.fouls // 5
+        + np.where(is_goalkeeper & (columns.saves > 0), columns.saves // 5, 0)
+    ).astype(np.float64)
+    points -= np.where(is_goalkeeper & played & has_conceded, np.nan_to_num(conceded), 0.0)
+    points += np.where(keeps_clean_sheet & played & kept_clean_sheet, 3.0, 0.0)
+    return MatchScores(points=points, clean_sheet=clean_sheet, conceded=conceded)
+
+
+def aggregate_round_totals(
+    columns: MatchStatColumns, scores: MatchScores
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, dict[str, np.ndarray]]:
+    """Sum match rows per (round_id, player_id) the way recalc_round_points does for a single round."""
+    keys = np.stack([columns.round_id, columns.player_id], axis=1)
+    unique_keys, inverse = np.unique(keys, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    size = len(unique_keys)
+
+    def total(values: np.ndarray) -> np.ndarray:
+        return np.bincount(inverse, weights=values, minlength=size)
+
+    played = columns.minutesplayed > 0
+    kept_clean_sheet = np.where(np.isnan(scores.clean_sheet), scores.conceded == 0, scores.clean_sheet == 1)
+    stats = {
+        "minutesplayed": total(columns.minutesplayed),
+        "goals": total(columns.goals),
+        "assists": total(columns.assists),
+        "saves": total(columns.saves),
+        "fouls": total(columns.fouls),
+        "yellow_cards": total(columns.yellow_cards),
+        "red_cards": total(columns.red_cards),
+        "clean_sheets": total((played & kept_clean_sheet).astype(np.float64)),
+        "goals_conceded": total(np.nan_to_num(scores.conceded)),
+    }
+    return unique_keys[:, 0], unique_keys[:, 1], total(scores.points), stats
+
+
+def load_match_stat_columns(db: Session, season_id: int) -> tuple[list[int], MatchStatColumns]:
+    """Return the rounds that have match stats and the scorable rows (players still in the catalog)."""
+    rows = db.execute(
+        text(
+            """
+            SELECT
+                pms.round_id, pms.player_id, pms.minutesplayed, pms.goals, pms.assists, pms.saves,
+                pms.fouls, pms.yellow_cards, pms.red_cards, pms.clean_sheet, pms.goals_conceded,
+                pc.position, pc.team_id, f.home_team_id, f.away_team_id, f.home_score, f.away_score,
+                pc.player_id IS NOT NULL AS in_catalog
+            FROM player_match_stats AS pms
+            LEFT JOIN players_catalog AS pc ON pc.player_id = pms.player_id
+            LEFT JOIN fixtures AS f
+              ON f.match_id = pms.match_id
+             AND f.season_id = pms.season_id
+             AND f.round_id = pms.round_id
+            WHERE pms.season_id = :season_id
+            """
+        ),
+        {"season_id": season_id},
+    ).all()
+    round_ids = sorted({int(row[0]) for row in rows})
+    return round_ids, MatchStatColumns.from_rows([tuple(row[:17]) for row in rows if row[17]])
+
+
+def recalc_season_points(db: Session, season: Season | None = None) -> dict:
+    """Rescore every round in one pass, rewriting points_round and player_round_stats; prices and budgets stay."""
+    season = season or get_or_create_season(db)
+    round_ids, columns = load_match_stat_columns(db, season.id)
+    if not round_ids:
+        return {"ok": True, "rounds": 0, "points_rows": 0}
+
+    scores = score_match_columns(columns)
+    row_round_ids, row_player_ids, points, stats = aggregate_round_totals(columns, scores)
+
+    params = {"season_id": season.id, "round_ids": round_ids}
+    for table in ("points_round", "player_round_stats"):
+        db.execute(
+            text(f"DELETE FROM {table} WHERE season_id = :season_id AND round_id IN :round_ids").bindparams(
+                bindparam("round_ids", expanding=True)
+            ),
+            params,
+        )
+
+    keys = [
+        {"season_id": season.id, "round_id": int(round_id), "player_id": int(player_id)}
+        for round_id, player_id in zip(row_round_ids, row_player_ids)
+    ]
+    if keys:
+        db.execute(
+            text(
+                """
+                INSERT INTO points_round (season_id, round_id, player_id, points)
+                VALUES (:season_id, :round_id, :player_id, :points)
+                ON CONFLICT (season_id, round_id, player_id)
+                DO UPDATE SET points = EXCLUDED.points
+                """
+            ),
+            [{**key, "points": float(value)} for key, value in zip(keys, points)],
+        )
+        stat_values = [stats[column].astype(np.int64).tolist() for column in ROUND_STAT_COLUMNS]
+        db.execute(
+            text(
+                f"""
+                INSERT INTO player_round_stats (
+                    season_id, round_id, player_id, {", ".join(ROUND_STAT_COLUMNS)}, updated_at
+                )
+                VALUES (
+                    :season_id, :round_id, :player_id, {", ".join(f":{column}" for column in ROUND_STAT_COLUMNS)},
+                    CURRENT_TIMESTAMP
+                )
+                ON CONFLICT (season_id, round_id, player_id)
+                DO UPDATE SET
+                    {", ".join(f"{column} = EXCLUDED.{column}" for column in ROUND_STAT_COLUMNS)},
+                    updated_at = CURRENT_TIMESTAMP
+                """
+            ),
+            [
+                {**key, **dict(zip(ROUND_STAT_COLUMNS, values))}
+                for key, values in zip(keys, zip(*stat_values))
+            ],
+        )
+
+    refresh_player_summaries(db, season.id)
+    refresh_rankings(db, season)
+    bump_data_version(db)
+    db.commit()
+    return {"ok": True, "rounds": len(round_ids), "points_rows": len(keys)}
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import threading
+from array import array
+from dataclasses import dataclass
+from decimal import Decimal, ROUND_HALF_UP
+from types import MappingProxyType
+from typing import Iterable, Mapping
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models import PlayerCatalog
+from app.services.response_cache import response_cache
+
+POSITION_CODES = ("G", "D", "M", "F")
+
+
+def price_tenths(value: float | Decimal | None) -> int:
+    """Price as an integer number of tenths, rounded half-up like the validation budget checks."""
+    try:
+        raw = Decimal(str(value))
+    except Exception:
+        raw = Decimal("0")
+    return int(raw.quantize(Decimal("0.1"), rounding=ROUND_HALF_UP) * 10)
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """Read-only view of the fields squad and lineup validation need, one array slot per player."""
+
+    version: int
+    rows: Mapping[int, int]
+    positions: array
+    team_ids: array
+    prices: array
+
+    @classmethod
+    def build(
+        cls,
+        version: int,
+        players: Iterable[tuple[int, str | None, int, float | Decimal | None]],
+    ) -> "CatalogSnapshot":
+        rows: dict[int, int] = {}
+        positions = array("b")
+        team_ids = array("l")
+        prices = array("l")
+        for player_id, position, team_id, price in players:
+            rows[int(player_id)] = len(positions)
+            # -1 marks a position outside POSITION_CODES.
+            positions.append(POSITION_CODES.index(position) if position in POSITION_CODES else -1)
+            team_ids.append(int(team_id))
+            prices.append(price_tenths(price))
+        return cls(
+            version=version,
+            rows=MappingProxyType(rows),
+            positions=positions,
+            team_ids=team_ids,
+            prices=prices,
+        )
+
+    def position(self, row: int) -> str | None:
+        code = self.positions[row]
+        return POSITION_CODES[code] if code >= 0 else None
+
+
+class CatalogSnapshotStore:
+    """Holds the current snapshot; rebuilt from players_catalog when the data version moves."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._snapshot: CatalogSnapshot | None = None
+
+    def get(self, db: Session, version: int) -> CatalogSnapshot:
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is None or snapshot.version != version:
+                players = db.execute(
+                    select(
+                        PlayerCatalog.player_id,
+                        PlayerCatalog.position,
+                        PlayerCatalog.team_id,
+                        PlayerCatalog.price_current,
+                    )
+                ).all()
+                snapshot = CatalogSnapshot.build(version, players)
+                self._snapshot = snapshot
+        return snapshot
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshot = None
+
+
+catalog_snapshots = CatalogSnapshotStore()
+
+
+def get_catalog_snapshot(db: Session) -> CatalogSnapshot:
+    # Sync, price application and stats changes all bump DATA_VERSION. Squad budgets and positions are
+    # validated against it, so the version is read on every call (one primary-key row) rather than trusted
+    # for DATA_VERSION_CHECK_SECONDS like the response cache; a bump from another worker is seen at once.
+    version = response_cache.data_version(db, 0)
+    return catalog_snapshots.get(db, version)
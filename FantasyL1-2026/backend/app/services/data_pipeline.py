@@ -1,16 +1,24 @@
 from __future__ import annotations
 
+import hashlib
+import io
 import logging
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import duckdb
-from sqlalchemy import bindparam, text
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+from sqlalchemy import select, text
 from sqlalchemy.orm import Session
 
 from app.core.config import Settings, get_settings
 from app.db.session import SessionLocal
+from app.models import AppConfig
 from app.services.fantasy import get_or_create_season
+from app.services.player_summary import reconcile_selected_counts, refresh_player_summaries
+from app.services.ranking import refresh_rankings
+from app.services.response_cache import bump_data_version
 
 logger = logging.getLogger(__name__)
 
@@ -24,10 +32,23 @@ EXPECTED_PARQUETS = {
     "player_team.parquet": "player_team",
     "player_transfer.parquet": "player_transfer",
     "team_stats.parquet": "team_stats",
+    "team_form.parquet": "team_form",
+    "player_form.parquet": "player_form",
+    "team_ratings.parquet": "team_ratings",
+    "match_probabilities.parquet": "match_probabilities",
 }
 
 REQUIRED_PLAYERS_FANTASY_COLS = {"player_id", "name", "position", "team_id", "price"}
 
+PLAYER_BASE_STAT_COLUMNS = ("minutesplayed", "matches_played", "goals", "assists", "saves", "fouls")
+
+SYNC_BATCH_ROWS = 10_000
+
+INGEST_MANIFEST_TABLE = "ingest_manifest"
+
+# app_config key holding the fingerprint of the last bundle whose Postgres sync committed.
+SYNCED_BUNDLE_KEY = "CATALOG_SYNCED_BUNDLE"
+
 
 def _pick_column(columns: Iterable[str], candidates: List[str]) -> Optional[str]:
     for candidate in candidates:
@@ -41,7 +62,69 @@ def _quote_ident(ident: str) -> str:
     return f'"{ident}"'
 
 
-def ingest_parquets_to_duckdb(settings: Settings) -> None:
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _load_ingest_manifest(con: duckdb.DuckDBPyConnection) -> Dict[str, Tuple[int, int, str]]:
+    con.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {INGEST_MANIFEST_TABLE} (
+            table_name VARCHAR PRIMARY KEY,
+            size_bytes BIGINT,
+            mtime_ns BIGINT,
+            content_sha256 VARCHAR,
+            recorded_at TIMESTAMP
+        )
+        """
+    )
+    existing_tables = {row[0] for row in con.execute("SHOW TABLES").fetchall()}
+    return {
+        row[0]: (row[1], row[2], row[3])
+        for row in con.execute(
+            f"SELECT table_name, size_bytes, mtime_ns, content_sha256 FROM {INGEST_MANIFEST_TABLE}"
+        ).fetchall()
+        # A manifest row without its table (dropped by hand) must not block re-ingesting.
+        if row[0] in existing_tables
+    }
+
+
+def _bundle_fingerprint(con: duckdb.DuckDBPyConnection) -> Optional[str]:
+    existing_tables = {row[0] for row in con.execute("SHOW TABLES").fetchall()}
+    if INGEST_MANIFEST_TABLE not in existing_tables:
+        return None
+    rows = con.execute(
+        f"SELECT table_name, content_sha256 FROM {INGEST_MANIFEST_TABLE} ORDER BY table_name"
+    ).fetchall()
+    return hashlib.sha256("\n".join(f"{name}:{digest}" for name, digest in rows).encode()).hexdigest()
+
+
+def catalog_sync_pending(settings: Settings) -> bool:
+    """True when the ingested DuckDB bundle differs from the last one synced to Postgres."""
+    duckdb_path = Path(settings.DUCKDB_PATH)
+    if not duckdb_path.exists():
+        return False
+    con = duckdb.connect(str(duckdb_path), read_only=True)
+    try:
+        fingerprint = _bundle_fingerprint(con)
+    finally:
+        con.close()
+    if fingerprint is None:
+        return True
+    db = SessionLocal()
+    try:
+        synced = db.execute(select(AppConfig.value).where(AppConfig.key == SYNCED_BUNDLE_KEY)).scalar_one_or_none()
+    finally:
+        db.close()
+    return synced != fingerprint
+
+
+def ingest_parquets_to_duckdb(settings: Settings, force: bool = False) -> Dict[str, List[str]]:
+    """Copies changed bundle files into DuckDB; unchanged files (same size+mtime or same SHA-256) are skipped."""
     parquet_dir = Path(settings.PARQUET_DIR)
     if not parquet_dir.exists():
         raise FileNotFoundError(f"parquet_dir_not_found: {parquet_dir}")
@@ -57,158 +140,224 @@ def ingest_parquets_to_duckdb(settings: Settings) -> None:
             duckdb_path.unlink(missing_ok=True)
         con = duckdb.connect(str(duckdb_path))
 
-    for parquet_name, table_name in EXPECTED_PARQUETS.items():
-        parquet_path = parquet_dir / parquet_name
-        if not parquet_path.exists():
-            if parquet_name == "players_fantasy.parquet":
-                raise FileNotFoundError("players_fantasy.parquet_missing")
-            logger.warning("missing_parquet: %s", parquet_path)
-            continue
-
-        if parquet_name == "players_fantasy.parquet":
-            columns = con.read_parquet(parquet_path.as_posix()).columns
-            missing = REQUIRED_PLAYERS_FANTASY_COLS - set(columns)
-            if missing:
-                raise ValueError(f"players_fantasy_missing_columns: {sorted(missing)}")
-
-        con.execute(
-            f"CREATE OR REPLACE TABLE {table_name} AS SELECT * FROM read_parquet(?)",
-            [parquet_path.as_posix()],
-        )
-        logger.info("ingested %s", parquet_name)
+    result: Dict[str, List[str]] = {"ingested": [], "skipped": []}
+    try:
+        manifest = _load_ingest_manifest(con)
+        for parquet_name, table_name in EXPECTED_PARQUETS.items():
+            parquet_path = parquet_dir / parquet_name
+            if not parquet_path.exists():
+                if parquet_name == "players_fantasy.parquet":
+                    raise FileNotFoundError("players_fantasy.parquet_missing")
+                logger.warning("missing_parquet: %s", parquet_path)
+                continue
+
+            stat = parquet_path.stat()
+            previous = manifest.get(table_name)
+            if not force and previous and previous[:2] == (stat.st_size, stat.st_mtime_ns):
+                result["skipped"].append(table_name)
+                continue
+
+            content_sha256 = _file_sha256(parquet_path)
+            unchanged = not force and previous is not None and previous[2] == content_sha256
+            if not unchanged:
+                if parquet_name == "players_fantasy.parquet":
+                    columns = con.read_parquet(parquet_path.as_posix()).columns
+                    missing = REQUIRED_PLAYERS_FANTASY_COLS - set(columns)
+                    if missing:
+                        raise ValueError(f"players_fantasy_missing_columns: {sorted(missing)}")
+
+                con.execute(
+                    f"CREATE OR REPLACE TABLE {table_name} AS SELECT * FROM read_parquet(?)",
+                    [parquet_path.as_posix()],
+                )
+                logger.info("ingested %s", parquet_name)
+            # Republished but identical files only refresh the manifest so the next run takes the stat fast path.
+            con.execute(
+                f"""
+                INSERT OR REPLACE INTO {INGEST_MANIFEST_TABLE}
+                VALUES (?, ?, ?, ?, current_timestamp)
+                """,
+                [table_name, stat.st_size, stat.st_mtime_ns, content_sha256],
+            )
+            result["skipped" if unchanged else "ingested"].append(table_name)
+    finally:
+        con.close()
 
-    con.close()
+    logger.info("ingest_summary ingested=%s skipped=%s", len(result["ingested"]), len(result["skipped"]))
+    return result
+
+
+def _stage_batches(db: Session, table: str, columns: Tuple[str, ...], reader: pa.RecordBatchReader) -> int:
+    """Streams Arrow batches into a staging table: COPY on psycopg, plain inserts elsewhere."""
+    staged = 0
+    connection = db.connection()
+    if connection.dialect.driver == "psycopg":
+        raw = connection.connection.driver_connection
+        write_options = pa_csv.WriteOptions(include_header=False)
+        with raw.cursor() as cursor:
+            with cursor.copy(f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)") as copy:
+                for batch in reader:
+                    buffer = io.BytesIO()
+                    # CSV fields are positional: write them in the COPY column order, not the query's.
+                    pa_csv.write_csv(batch.select(list(columns)), buffer, write_options=write_options)
+                    copy.write(buffer.getvalue())
+                    staged += batch.num_rows
+        return staged
+
+    insert = text(
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(f':{column}' for column in columns)})"
+    )
+    for batch in reader:
+        if batch.num_rows:
+            db.execute(insert, batch.to_pylist())
+            staged += batch.num_rows
+    return staged
 
 
-def _upsert_teams(db: Session, rows: List[dict]) -> None:
-    if not rows:
-        return
+def _create_staging_tables(db: Session) -> None:
+    _drop_staging_tables(db)
+    db.execute(text("CREATE TEMP TABLE sync_teams (id INTEGER, name_short TEXT, name_full TEXT)"))
     db.execute(
         text(
             """
-            INSERT INTO teams (id, name_short, name_full)
-            VALUES (:id, :name_short, :name_full)
-            ON CONFLICT (id) DO UPDATE
-            SET name_short = EXCLUDED.name_short,
-                name_full = EXCLUDED.name_full
+            CREATE TEMP TABLE sync_players (
+                player_id INTEGER, name TEXT, short_name TEXT, position TEXT, team_id INTEGER,
+                price_current NUMERIC(4, 1)
+            )
             """
-        ),
-        rows,
+        )
     )
 
 
-def _upsert_players(
+def _drop_staging_tables(db: Session) -> None:
+    for table in ("sync_teams", "sync_players", "sync_stale_players"):
+        db.execute(text(f"DROP TABLE IF EXISTS {table}"))
+
+
+def _merge_teams(db: Session) -> Dict[str, int]:
+    changed = db.execute(
+        text(
+            """
+            UPDATE teams AS t
+            SET name_short = s.name_short,
+                name_full = s.name_full
+            FROM sync_teams AS s
+            WHERE s.id = t.id
+              AND (t.name_short IS DISTINCT FROM s.name_short OR t.name_full IS DISTINCT FROM s.name_full)
+            """
+        )
+    ).rowcount
+    inserted = db.execute(
+        text(
+            """
+            INSERT INTO teams (id, name_short, name_full)
+            SELECT s.id, s.name_short, s.name_full
+            FROM sync_teams AS s
+            WHERE NOT EXISTS (SELECT 1 FROM teams AS t WHERE t.id = s.id)
+            """
+        )
+    ).rowcount
+    # Every team_id present in players_fantasy must exist in teams (avoid FK violations).
+    inserted += db.execute(
+        text(
+            """
+            INSERT INTO teams (id)
+            SELECT DISTINCT s.team_id
+            FROM sync_players AS s
+            WHERE s.team_id IS NOT NULL
+              AND NOT EXISTS (SELECT 1 FROM teams AS t WHERE t.id = s.team_id)
+            """
+        )
+    ).rowcount
+    return {"inserted": inserted, "changed": changed}
+
+
+def _merge_players(
     db: Session,
-    rows: List[dict],
     preserve_existing_price_current: bool = False,
     preserve_existing_base_stats: bool = False,
-) -> None:
-    if not rows:
-        return
-    payload = [
-        {
-            **row,
-            "preserve_existing_price_current": preserve_existing_price_current,
-            "preserve_existing_base_stats": preserve_existing_base_stats,
-        }
-        for row in rows
-    ]
-    db.execute(
+) -> Dict[str, int]:
+    assignments = {column: f"s.{column}" for column in ("name", "short_name", "position", "team_id")}
+    if not preserve_existing_price_current:
+        assignments["price_current"] = "s.price_current"
+    if not preserve_existing_base_stats:
+        # players_fantasy carries no base stats; the sync resets them unless told to keep them.
+        assignments.update({column: "0" for column in PLAYER_BASE_STAT_COLUMNS})
+
+    set_clause = ",\n                ".join(f"{column} = {value}" for column, value in assignments.items())
+    distinct_clause = "\n                OR ".join(
+        f"p.{column} IS DISTINCT FROM {value}" for column, value in assignments.items()
+    )
+    changed = db.execute(
+        text(
+            f"""
+            UPDATE players_catalog AS p
+            SET {set_clause},
+                updated_at = NOW()
+            FROM sync_players AS s
+            WHERE s.player_id = p.player_id
+              AND (
+                {distinct_clause}
+              )
+            """
+        )
+    ).rowcount
+    inserted = db.execute(
         text(
             """
             INSERT INTO players_catalog (
-                player_id, name, short_name, position, team_id, price_current,
-                minutesplayed, matches_played, goals, assists, saves, fouls, updated_at
-            )
-            VALUES (
-                :player_id, :name, :short_name, :position, :team_id, :price_current,
-                :minutesplayed, :matches_played, :goals, :assists, :saves, :fouls, NOW()
+                player_id, name, short_name, position, team_id, price_current, updated_at
             )
-            ON CONFLICT (player_id) DO UPDATE
-            SET name = EXCLUDED.name,
-                short_name = EXCLUDED.short_name,
-                position = EXCLUDED.position,
-                team_id = EXCLUDED.team_id,
-                price_current = CASE
-                    WHEN :preserve_existing_price_current THEN players_catalog.price_current
-                    ELSE EXCLUDED.price_current
-                END,
-                minutesplayed = CASE
-                    WHEN :preserve_existing_base_stats THEN players_catalog.minutesplayed
-                    ELSE EXCLUDED.minutesplayed
-                END,
-                matches_played = CASE
-                    WHEN :preserve_existing_base_stats THEN players_catalog.matches_played
-                    ELSE EXCLUDED.matches_played
-                END,
-                goals = CASE
-                    WHEN :preserve_existing_base_stats THEN players_catalog.goals
-                    ELSE EXCLUDED.goals
-                END,
-                assists = CASE
-                    WHEN :preserve_existing_base_stats THEN players_catalog.assists
-                    ELSE EXCLUDED.assists
-                END,
-                saves = CASE
-                    WHEN :preserve_existing_base_stats THEN players_catalog.saves
-                    ELSE EXCLUDED.saves
-                END,
-                fouls = CASE
-                    WHEN :preserve_existing_base_stats THEN players_catalog.fouls
-                    ELSE EXCLUDED.fouls
-                END,
-                updated_at = NOW()
+            SELECT s.player_id, s.name, s.short_name, s.position, s.team_id, s.price_current, NOW()
+            FROM sync_players AS s
+            WHERE NOT EXISTS (SELECT 1 FROM players_catalog AS p WHERE p.player_id = s.player_id)
             """
-        ),
-        payload,
-    )
+        )
+    ).rowcount
+    return {"inserted": inserted, "changed": changed}
 
-def _prune_missing_players(db: Session, player_ids: List[int]) -> None:
-    if not player_ids:
-        logger.warning("players_fantasy_empty_skip_prune")
-        return
-    ids_param = bindparam("ids", expanding=True)
-    params = {"ids": player_ids}
 
+PRUNE_STATEMENTS = (
     # Remove references first to avoid FK violations.
+    "DELETE FROM fantasy_team_players WHERE player_id IN (SELECT player_id FROM sync_stale_players)",
+    """
+    DELETE FROM fantasy_transfers
+    WHERE out_player_id IN (SELECT player_id FROM sync_stale_players)
+       OR in_player_id IN (SELECT player_id FROM sync_stale_players)
+    """,
+    "DELETE FROM price_history WHERE player_id IN (SELECT player_id FROM sync_stale_players)",
+    "DELETE FROM price_movements WHERE player_id IN (SELECT player_id FROM sync_stale_players)",
+    "DELETE FROM points_round WHERE player_id IN (SELECT player_id FROM sync_stale_players)",
+    "DELETE FROM player_round_stats WHERE player_id IN (SELECT player_id FROM sync_stale_players)",
+    "DELETE FROM player_match_stats WHERE player_id IN (SELECT player_id FROM sync_stale_players)",
+    "UPDATE fantasy_lineup_slots SET player_id = NULL WHERE player_id IN (SELECT player_id FROM sync_stale_players)",
+    "DELETE FROM player_season_summary WHERE player_id IN (SELECT player_id FROM sync_stale_players)",
+    # refresh_rankings rebuilds these rows right after the prune.
+    """
+    UPDATE team_rankings SET captain_player_id = NULL
+    WHERE captain_player_id IN (SELECT player_id FROM sync_stale_players)
+    """,
+    "DELETE FROM players_catalog WHERE player_id IN (SELECT player_id FROM sync_stale_players)",
+)
+
+
+def _prune_missing_players(db: Session) -> int:
+    """Deletes catalog players absent from sync_players; returns how many were pruned."""
     db.execute(
-        text("DELETE FROM fantasy_team_players WHERE player_id NOT IN :ids").bindparams(ids_param),
-        params,
-    )
-    db.execute(
-        text("DELETE FROM fantasy_transfers WHERE out_player_id NOT IN :ids OR in_player_id NOT IN :ids").bindparams(
-            ids_param
-        ),
-        params,
-    )
-    db.execute(
-        text("DELETE FROM price_history WHERE player_id NOT IN :ids").bindparams(ids_param),
-        params,
-    )
-    db.execute(
-        text("DELETE FROM price_movements WHERE player_id NOT IN :ids").bindparams(ids_param),
-        params,
-    )
-    db.execute(
-        text("DELETE FROM points_round WHERE player_id NOT IN :ids").bindparams(ids_param),
-        params,
-    )
-    db.execute(
-        text("DELETE FROM player_round_stats WHERE player_id NOT IN :ids").bindparams(ids_param),
-        params,
-    )
-    db.execute(
-        text("DELETE FROM player_match_stats WHERE player_id NOT IN :ids").bindparams(ids_param),
-        params,
-    )
-    db.execute(
-        text("UPDATE fantasy_lineup_slots SET player_id = NULL WHERE player_id NOT IN :ids").bindparams(ids_param),
-        params,
-    )
-    db.execute(
-        text("DELETE FROM players_catalog WHERE player_id NOT IN :ids").bindparams(ids_param),
-        params,
+        text(
+            """
+            CREATE TEMP TABLE sync_stale_players AS
+            SELECT p.player_id
+            FROM players_catalog AS p
+            WHERE NOT EXISTS (SELECT 1 FROM sync_players AS s WHERE s.player_id = p.player_id)
+            """
+        )
     )
+    pruned = db.execute(text("SELECT COUNT(*) FROM sync_stale_players")).scalar_one()
+    if pruned:
+        for statement in PRUNE_STATEMENTS:
+            db.execute(text(statement))
+    return pruned
 
 
 def _upsert_fixtures(db: Session, rows: List[dict]) -> None:
@@ -237,7 +386,28 @@ def _upsert_fixtures(db: Session, rows: List[dict]) -> None:
     )
 
 
-def sync_duckdb_to_postgres(settings: Settings | None = None) -> None:
+def _update_fixture_probabilities(db: Session, rows: List[dict]) -> None:
+    # Fixtures stay admin-managed; the pipeline only fills the model outlook of matches already listed.
+    if not rows:
+        return
+    db.execute(
+        text(
+            """
+            UPDATE fixtures
+            SET expected_home_goals = :expected_home_goals,
+                expected_away_goals = :expected_away_goals,
+                prob_home = :prob_home,
+                prob_draw = :prob_draw,
+                prob_away = :prob_away
+            WHERE match_id = :match_id
+            """
+        ),
+        rows,
+    )
+
+
+def sync_duckdb_to_postgres(settings: Settings | None = None) -> Dict[str, Dict[str, int]]:
+    """Stages teams and players_fantasy in temp tables and merges them set-based; returns row counts."""
     settings = settings or get_settings()
     duckdb_path = Path(settings.DUCKDB_PATH)
     if not duckdb_path.exists():
@@ -247,8 +417,11 @@ def sync_duckdb_to_postgres(settings: Settings | None = None) -> None:
     db = SessionLocal()
 
     try:
+        fingerprint = _bundle_fingerprint(con)
         season = get_or_create_season(db)
 
+        _create_staging_tables(db)
+
         # Teams
         team_cols = con.table("teams").columns
         team_id_col = _pick_column(team_cols, ["team_id", "id"])
@@ -261,27 +434,18 @@ def sync_duckdb_to_postgres(settings: Settings | None = None) -> None:
         name_short_expr = _quote_ident(name_short_col) if name_short_col else "NULL"
         name_full_expr = _quote_ident(name_full_col) if name_full_col else name_short_expr
 
-        team_rows = con.execute(
-            f"SELECT {team_id_expr} as id, {name_short_expr} as name_short, {name_full_expr} as name_full FROM teams"
-        ).fetchall()
-        teams_payload = [
-            {"id": row[0], "name_short": row[1], "name_full": row[2]} for row in team_rows
-        ]
-        _upsert_teams(db, teams_payload)
-
-        # Ensure every team_id present in players_fantasy exists in teams (avoid FK violations).
-        fantasy_team_ids = {
-            row[0]
-            for row in con.execute("SELECT DISTINCT team_id FROM players_fantasy").fetchall()
-            if row[0] is not None
-        }
-        known_team_ids = {row[0] for row in team_rows if row[0] is not None}
-        missing_team_ids = sorted(fantasy_team_ids - known_team_ids)
-        if missing_team_ids:
-            _upsert_teams(
-                db,
-                [{"id": team_id, "name_short": None, "name_full": None} for team_id in missing_team_ids],
-            )
+        # The last row wins for repeated ids, as the per-row upsert used to behave.
+        team_reader = con.execute(
+            f"""
+            SELECT {team_id_expr} AS id,
+                   CAST({name_short_expr} AS VARCHAR) AS name_short,
+                   CAST({name_full_expr} AS VARCHAR) AS name_full
+            FROM teams
+            WHERE {team_id_expr} IS NOT NULL
+            QUALIFY row_number() OVER (PARTITION BY {team_id_expr} ORDER BY rowid DESC) = 1
+            """
+        ).to_arrow_reader(SYNC_BATCH_ROWS)
+        _stage_batches(db, "sync_teams", ("id", "name_short", "name_full"), team_reader)
 
         # Players catalog
         player_cols = con.table("players_fantasy").columns
@@ -294,26 +458,21 @@ def sync_duckdb_to_postgres(settings: Settings | None = None) -> None:
         )
         short_name_expr = _quote_ident(short_name_col) if short_name_col else "NULL"
 
-        player_rows = con.execute(
-            f"SELECT player_id, name, position, team_id, price, {short_name_expr} as short_name FROM players_fantasy"
-        ).fetchall()
-        players_payload = [
-            {
-                "player_id": row[0],
-                "name": row[1],
-                "position": row[2],
-                "team_id": row[3],
-                "price_current": float(row[4]),
-                "short_name": row[5],
-                "minutesplayed": 0,
-                "matches_played": 0,
-                "goals": 0,
-                "assists": 0,
-                "saves": 0,
-                "fouls": 0,
-            }
-            for row in player_rows
-        ]
+        player_reader = con.execute(
+            f"""
+            SELECT player_id, name, CAST({short_name_expr} AS VARCHAR) AS short_name, position, team_id,
+                   CAST(price AS DOUBLE) AS price_current
+            FROM players_fantasy
+            QUALIFY row_number() OVER (PARTITION BY player_id ORDER BY rowid DESC) = 1
+            """
+        ).to_arrow_reader(SYNC_BATCH_ROWS)
+        staged_players = _stage_batches(
+            db,
+            "sync_players",
+            ("player_id", "name", "short_name", "position", "team_id", "price_current"),
+            player_reader,
+        )
+
         preserve_existing_price_current = bool(
             getattr(settings, "SYNC_PRESERVE_EXISTING_PRICE_CURRENT", False)
         )
@@ -326,19 +485,69 @@ def sync_duckdb_to_postgres(settings: Settings | None = None) -> None:
                 preserve_existing_price_current,
                 preserve_existing_base_stats,
             )
-        _upsert_players(
+        teams_result = _merge_teams(db)
+        players_result = _merge_players(
             db,
-            players_payload,
             preserve_existing_price_current=preserve_existing_price_current,
             preserve_existing_base_stats=preserve_existing_base_stats,
         )
+        players_result["pruned"] = 0
         if settings.SYNC_SKIP_PRUNE_MISSING_PLAYERS:
             logger.info("skip_prune_missing_players enabled")
+        elif not staged_players:
+            logger.warning("players_fantasy_empty_skip_prune")
         else:
-            _prune_missing_players(db, [row[0] for row in player_rows])
+            players_result["pruned"] = _prune_missing_players(db)
+        _drop_staging_tables(db)
+        logger.info(
+            "sync_catalog teams_inserted=%s teams_changed=%s players_inserted=%s players_changed=%s "
+            "players_pruned=%s",
+            teams_result["inserted"],
+            teams_result["changed"],
+            players_result["inserted"],
+            players_result["changed"],
+            players_result["pruned"],
+        )
 
         # Fixtures are not synced from parquet. They are managed via admin.
+        existing_tables = {row[0] for row in con.execute("SHOW TABLES").fetchall()}
+        if "match_probabilities" in existing_tables:
+            probability_rows = con.execute(
+                """
+                SELECT match_id, expected_home_goals, expected_away_goals, p_home, p_draw, p_away
+                FROM match_probabilities
+                """
+            ).fetchall()
+            _update_fixture_probabilities(
+                db,
+                [
+                    {
+                        "match_id": int(row[0]),
+                        "expected_home_goals": round(float(row[1]), 2),
+                        "expected_away_goals": round(float(row[2]), 2),
+                        "prob_home": round(float(row[3]), 4),
+                        "prob_draw": round(float(row[4]), 4),
+                        "prob_away": round(float(row[5]), 4),
+                    }
+                    for row in probability_rows
+                    if row[0] is not None and None not in row[1:]
+                ],
+            )
+        refresh_player_summaries(db, season.id)
+        reconcile_selected_counts(db, season.id)
+        if players_result["pruned"]:
+            # Pruning drops points_round rows, squad members and lineup slots behind the stored totals.
+            refresh_rankings(db, season)
+        if fingerprint is not None:
+            # Committed with the sync itself, so a failed sync leaves the bundle pending for the watcher.
+            synced = db.get(AppConfig, SYNCED_BUNDLE_KEY)
+            if synced:
+                synced.value = fingerprint
+            else:
+                db.add(AppConfig(key=SYNCED_BUNDLE_KEY, value=fingerprint))
+        bump_data_version(db)
         db.commit()
+        return {"teams": teams_result, "players": players_result}
     finally:
         db.close()
         con.close()
@@ -15,6 +15,7 @@ from app.models import (
     Round,
     Season,
 )
+from app.services.player_summary import adjust_selected_counts
 
 settings = get_settings()
 
@@ -111,6 +112,15 @@ def ensure_round(db: Session, season_id: int, round_number: int) -> Round:
     return round_obj
 
 
+def _move_team_ranking(db: Session, team: FantasyTeam, previous_season_id: int | None) -> None:
+    # Imported here: app.services.ranking imports this module for get_or_create_season.
+    from app.services.ranking import add_team_ranking, remove_team_ranking
+
+    if previous_season_id is not None:
+        remove_team_ranking(db, previous_season_id, team.id)
+    add_team_ranking(db, team.season_id, team.id)
+
+
 def get_or_create_fantasy_team(
     db: Session,
     user_id: int,
@@ -128,19 +138,25 @@ def get_or_create_fantasy_team(
 
     if team:
         changed = False
-        if team.season_id != season_id:
+        previous_season_id = team.season_id
+        season_changed = previous_season_id != season_id
+        if season_changed:
             team.season_id = season_id
             changed = True
         if name and team.name != name:
             team.name = name
             changed = True
         if changed:
+            if season_changed:
+                _move_team_ranking(db, team, previous_season_id)
             db.commit()
             db.refresh(team)
         return team
 
     team = FantasyTeam(user_id=user_id, season_id=season_id, name=name)
     db.add(team)
+    db.flush()
+    _move_team_ranking(db, team, None)
     db.commit()
     db.refresh(team)
     return team
@@ -190,6 +206,13 @@ def replace_squad(
         .all()
     )
     price_map = {p.player_id: float(p.price_current) for p in players}
+    previous_ids = (
+        db.execute(
+            select(FantasyTeamPlayer.player_id).where(FantasyTeamPlayer.fantasy_team_id == fantasy_team_id)
+        )
+        .scalars()
+        .all()
+    )
 
     db.execute(delete(FantasyTeamPlayer).where(FantasyTeamPlayer.fantasy_team_id == fantasy_team_id))
     db.flush()
@@ -204,6 +227,15 @@ def replace_squad(
                 is_active=True,
             )
         )
+    db.flush()
+    team = db.get(FantasyTeam, fantasy_team_id)
+    if team is not None:
+        adjust_selected_counts(
+            db,
+            team.season_id,
+            added=set(player_ids) - set(previous_ids),
+            removed=set(previous_ids) - set(player_ids),
+        )
     db.commit()
 
 
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+from collections import Counter
+from typing import Iterable
+
+from sqlalchemy import bindparam, select, text
+from sqlalchemy.orm import Session
+
+from app.models import PlayerSeasonSummary
+
+SUMMARY_COLUMNS = (
+    "matches_with_stats",
+    "goals",
+    "assists",
+    "minutesplayed",
+    "saves",
+    "fouls",
+    "yellow_cards",
+    "red_cards",
+    "points_total",
+    "clean_sheets",
+    "goals_conceded",
+    "price_delta",
+    "selected_count",
+)
+
+
+def _refresh_sql(filtered: bool) -> str:
+    # Portable SQL (Postgres and SQLite); the trailing WHERE keeps INSERT ... SELECT ... ON CONFLICT unambiguous.
+    def only(column: str) -> str:
+        return f"AND {column} IN :player_ids" if filtered else ""
+
+    # selected_count is only seeded here; afterwards it moves by deltas (see adjust_selected_counts).
+    updates = ",\n            ".join(
+        f"{column} = EXCLUDED.{column}" for column in SUMMARY_COLUMNS if column != "selected_count"
+    )
+    return f"""
+        INSERT INTO player_season_summary (
+            season_id, player_id, {", ".join(SUMMARY_COLUMNS)}, updated_at
+        )
+        SELECT
+            :season_id,
+            pc.player_id,
+            COALESCE(ms.matches_with_stats, 0),
+            COALESCE(ms.goals, 0),
+            COALESCE(ms.assists, 0),
+            COALESCE(ms.minutesplayed, 0),
+            COALESCE(ms.saves, 0),
+            COALESCE(ms.fouls, 0),
+            COALESCE(ms.yellow_cards, 0),
+            COALESCE(ms.red_cards, 0),
+            COALESCE(pr.points_total, 0),
+            COALESCE(rs.clean_sheets, 0),
+            COALESCE(rs.goals_conceded, 0),
+            pm.delta,
+            COALESCE(sel.selected_count, 0),
+            CURRENT_TIMESTAMP
+        FROM players_catalog AS pc
+        LEFT JOIN (
+            SELECT
+                player_id,
+                COUNT(*) AS matches_with_stats,
+                SUM(COALESCE(goals, 0)) AS goals,
+                SUM(COALESCE(assists, 0)) AS assists,
+                SUM(COALESCE(minutesplayed, 0)) AS minutesplayed,
+                SUM(COALESCE(saves, 0)) AS saves,
+                SUM(COALESCE(fouls, 0)) AS fouls,
+                SUM(COALESCE(yellow_cards, 0)) AS yellow_cards,
+                SUM(COALESCE(red_cards, 0)) AS red_cards
+            FROM player_match_stats
+            WHERE season_id = :season_id {only("player_id")}
+            GROUP BY player_id
+        ) AS ms ON ms.player_id = pc.player_id
+        LEFT JOIN (
+            SELECT player_id, SUM(points) AS points_total
+            FROM points_round
+            WHERE season_id = :season_id {only("player_id")}
+            GROUP BY player_id
+        ) AS pr ON pr.player_id = pc.player_id
+        LEFT JOIN (
+            SELECT player_id, SUM(clean_sheets) AS clean_sheets, SUM(goals_conceded) AS goals_conceded
+            FROM player_round_stats
+            WHERE season_id = :season_id {only("player_id")}
+            GROUP BY player_id
+        ) AS rs ON rs.player_id = pc.player_id
+        LEFT JOIN price_movements AS pm
+          ON pm.season_id = :season_id
+         AND pm.player_id = pc.player_id
+         AND pm.round_id = (SELECT MAX(round_id) FROM price_movements WHERE season_id = :season_id)
+        LEFT JOIN (
+            SELECT ftp.player_id AS player_id, COUNT(*) AS selected_count
+            FROM fantasy_team_players AS ftp
+            JOIN fantasy_teams AS ft ON ft.id = ftp.fantasy_team_id
+            WHERE ft.season_id = :season_id {only("ftp.player_id")}
+            GROUP BY ftp.player_id
+        ) AS sel ON sel.player_id = pc.player_id
+        WHERE 1 = 1 {only("pc.player_id")}
+        ON CONFLICT (season_id, player_id) DO UPDATE SET
+            {updates},
+            updated_at = EXCLUDED.updated_at
+    """
+
+
+def refresh_player_summaries(
+    db: Session,
+    season_id: int,
+    player_ids: Iterable[int] | None = None,
+) -> None:
+    """Recompute player_season_summary rows for `player_ids` (every catalog player when None).
+
+    The caller owns the commit, so the summary changes with the data it mirrors.
+    """
+    if player_ids is None:
+        db.execute(text(_refresh_sql(False)), {"season_id": season_id})
+        return
+    ids = sorted({int(player_id) for player_id in player_ids if player_id is not None})
+    if not ids:
+        return
+    statement = text(_refresh_sql(True)).bindparams(
+        bindparam("player_ids", expanding=True)
+    )
+    db.execute(statement, {"season_id": season_id, "player_ids": ids})
+
+
+def refresh_summary_price_deltas(db: Session, season_id: int) -> None:
+    # A new price round changes every player's latest delta, including players it did not move.
+    db.execute(
+        text(
+            """
+            UPDATE player_season_summary
+            SET price_delta = (
+                SELECT pm.delta
+                FROM price_movements AS pm
+                WHERE pm.season_id = :season_id
+                  AND pm.player_id = player_season_summary.player_id
+                  AND pm.round_id = (SELECT MAX(round_id) FROM price_movements WHERE season_id = :season_id)
+            )
+            WHERE season_id = :season_id
+            """
+        ),
+        {"season_id": season_id},
+    )
+
+
+def adjust_selected_counts(
+    db: Session,
+    season_id: int,
+    added: Iterable[int] = (),
+    removed: Iterable[int] = (),
+) -> None:
+    """Move ownership counters by +1/-1 per squad change instead of recounting every squad.
+
+    Each row is bumped in place, so concurrent transfers only wait on the rows of the players
+    they share; ids are applied in order so two transfers never lock them in opposite orders.
+    """
+    deltas: Counter[int] = Counter()
+    deltas.update(int(player_id) for player_id in added)
+    deltas.subtract(int(player_id) for player_id in removed)
+    rows = [
+        {"season_id": season_id, "player_id": player_id, "delta": delta}
+        for player_id, delta in sorted(deltas.items())
+        if delta
+    ]
+    if not rows:
+        return
+    db.execute(
+        text(
+            """
+            UPDATE player_season_summary
+            SET selected_count = selected_count + :delta
+            WHERE season_id = :season_id AND player_id = :player_id
+            """
+        ),
+        rows,
+    )
+
+
+def reconcile_selected_counts(db: Session, season_id: int) -> int:
+    """Recount ownership from fantasy_team_players and fix drifted counters; returns rows fixed.
+
+    The season's summary rows are locked first, in the same player order adjust_selected_counts
+    uses. A transfer that already bumped a counter commits before the recount takes its snapshot,
+    and one that has not yet bumped it applies its delta on top of the recount. Either way no
+    increment is overwritten.
+    """
+    db.execute(
+        select(PlayerSeasonSummary.player_id)
+        .where(PlayerSeasonSummary.season_id == season_id)
+        .order_by(PlayerSeasonSummary.player_id)
+        .with_for_update()
+    ).all()
+    result = db.execute(
+        text(
+            """
+            UPDATE player_season_summary
+            SET selected_count = counts.selected_count
+            FROM (
+                SELECT pss.player_id AS player_id, COUNT(ft.id) AS selected_count
+                FROM player_season_summary AS pss
+                LEFT JOIN fantasy_team_players AS ftp ON ftp.player_id = pss.player_id
+                LEFT JOIN fantasy_teams AS ft ON ft.id = ftp.fantasy_team_id AND ft.season_id = :season_id
+                WHERE pss.season_id = :season_id
+                GROUP BY pss.player_id
+            ) AS counts
+            WHERE player_season_summary.season_id = :season_id
+              AND player_season_summary.player_id = counts.player_id
+              AND player_season_summary.selected_count <> counts.selected_count
+            """
+        ),
+        {"season_id": season_id},
+    )
+    return result.rowcount or 0
+
+
+def ensure_player_summaries(db: Session, season_id: int) -> None:
+    # First read after the migration (or a new season) builds the whole table once.
+    exists = db.execute(
+        select(PlayerSeasonSummary.player_id).where(PlayerSeasonSummary.season_id == season_id).limit(1)
+    ).first()
+    if exists is None:
+        refresh_player_summaries(db, season_id)
+        db.commit()
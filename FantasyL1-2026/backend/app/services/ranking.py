@@ -1,28 +1,43 @@
 from decimal import Decimal, ROUND_HALF_UP
 from typing import Dict, List, Tuple
 
-from sqlalchemy import func, select
+from sqlalchemy import delete, func, insert, literal, select, update
 from sqlalchemy.orm import Session
 
 from app.models import (
     FantasyLineup,
     FantasyLineupSlot,
     FantasyTeam,
-    FantasyTeamPlayer,
     PlayerCatalog,
     PointsRound,
     PriceMovement,
     Round,
+    Season,
+    TeamRanking,
+    TeamRoundScore,
+)
+from app.schemas.ranking import (
+    LeaderboardEntryOut,
+    LeaderboardPageOut,
+    RankingEntryOut,
+    RankingOut,
+    RankingRoundOut,
+    TeamRoundsOut,
 )
-from app.schemas.ranking import RankingEntryOut, RankingOut, RankingRoundOut
 from app.services.fantasy import get_or_create_season
 
 
-def build_rankings(db: Session, team_ids: List[int]) -> RankingOut:
+def _ranking_keys(entry: RankingEntryOut) -> tuple[int, float]:
+    valid_rounds = sum(1 for round_item in entry.rounds if round_item.points > 0)
+    latest_delta = entry.rounds[-1].price_delta if entry.rounds else 0.0
+    return valid_rounds, latest_delta
+
+
+def build_rankings(db: Session, team_ids: List[int], season: Season | None = None) -> RankingOut:
     if not team_ids:
         return RankingOut(round_numbers=[], entries=[])
 
-    season = get_or_create_season(db)
+    season = season or get_or_create_season(db)
 
     team_rows = (
         db.execute(
@@ -174,18 +189,9 @@ def build_rankings(db: Session, team_ids: List[int]) -> RankingOut:
     def _round_tenth(value: float | Decimal) -> float:
         return float(Decimal(str(value)).quantize(Decimal("0.1"), rounding=ROUND_HALF_UP))
 
-    def _sort_key_by_bought_round(
-        bought_round_id: int | None,
-        player_id: int,
-    ) -> tuple[int, int, int]:
-        return (
-            1 if bought_round_id is None else 0,
-            -(bought_round_id or 0),
-            player_id,
-        )
-
-    # For pending round, budget delta must match Team tab logic:
-    # previous closed round movements over current 15-player squad.
+    # For pending round, budget delta follows the Team tab: previous closed round movements over the
+    # previous closed lineup. The Team tab falls back to the current squad for teams without one, but
+    # squad saves and transfers do not refresh these stored rows, so here such teams keep a 0.0 delta.
     pending_delta_map: Dict[int, float] = {}
     closed_rounds = [row[0] for row in round_rows if row[1]]
     previous_closed_round_number = (
@@ -201,7 +207,6 @@ def build_rankings(db: Session, team_ids: List[int]) -> RankingOut:
             )
         ).scalar_one_or_none()
         if previous_closed_round_id is not None:
-            # Prefer the previous closed lineup to freeze delta; fallback to squad.
             lineup_rows = (
                 db.execute(
                     select(FantasyLineup.id, FantasyLineup.fantasy_team_id)
@@ -232,36 +237,11 @@ def build_rankings(db: Session, team_ids: List[int]) -> RankingOut:
                         continue
                     slots_map.setdefault(team_id, []).append(int(player_id))
 
-            players_by_team: Dict[int, list[tuple[int, int | None]]] = {}
-            if len(slots_map) < len(team_ids):
-                team_player_rows = db.execute(
-                    select(
-                        FantasyTeamPlayer.fantasy_team_id,
-                        FantasyTeamPlayer.player_id,
-                        FantasyTeamPlayer.bought_round_id,
-                    )
-                    .join(
-                        PlayerCatalog,
-                        PlayerCatalog.player_id == FantasyTeamPlayer.player_id,
-                    )
-                    .where(FantasyTeamPlayer.fantasy_team_id.in_(team_ids))
-                ).all()
-                for team_id_row, player_id, bought_round_id in team_player_rows:
-                    players_by_team.setdefault(team_id_row, []).append((player_id, bought_round_id))
-
-            canonical_player_ids_by_team: Dict[int, List[int]] = {}
+            canonical_player_ids_by_team: Dict[int, List[int]] = {
+                team_id: player_ids[:15] for team_id, player_ids in slots_map.items()
+            }
             all_player_ids: set[int] = set()
-            for team_id in team_ids:
-                if team_id in slots_map and slots_map[team_id]:
-                    player_ids = slots_map[team_id][:15]
-                else:
-                    rows = players_by_team.get(team_id, [])
-                    rows_sorted = sorted(
-                        rows,
-                        key=lambda row: _sort_key_by_bought_round(row[1], row[0]),
-                    )[:15]
-                    player_ids = [player_id for player_id, _ in rows_sorted]
-                canonical_player_ids_by_team[team_id] = player_ids
+            for player_ids in canonical_player_ids_by_team.values():
                 all_player_ids.update(player_ids)
 
             movement_map: Dict[int, float] = {}
@@ -279,8 +259,7 @@ def build_rankings(db: Session, team_ids: List[int]) -> RankingOut:
                 }
 
             for team_id in team_ids:
-                # Keep pending-round delta aligned with Team tab behavior:
-                # sum movement once per player id in the canonical 15-player squad.
+                # Sum movement once per player id in the previous closed lineup.
                 unique_player_ids = set(canonical_player_ids_by_team.get(team_id, []))
                 total_delta = sum(
                     movement_map.get(player_id, 0.0)
@@ -339,12 +318,12 @@ def build_rankings(db: Session, team_ids: List[int]) -> RankingOut:
         )
 
     def _sort_key(entry: RankingEntryOut):
-        valid_rounds = sum(1 for round_item in entry.rounds if round_item.points > 0)
-        latest_delta = entry.rounds[-1].price_delta if entry.rounds else 0.0
+        valid_rounds, latest_delta = _ranking_keys(entry)
         return (
             -entry.total_points,
             -valid_rounds,
             -latest_delta,
+            entry.fantasy_team_id,
         )
 
     entries.sort(key=_sort_key)
@@ -353,3 +332,303 @@ def build_rankings(db: Session, team_ids: List[int]) -> RankingOut:
         captain_source_round_number=latest_closed_round_number,
         entries=entries,
     )
+
+
+def refresh_rankings(db: Session, season: Season | None = None) -> int:
+    """Rebuild the season's team_round_scores and team_rankings rows.
+
+    Called wherever round points, prices, injuries, round status or the team list change; the caller
+    owns the commit. Concurrent rebuilds queue on the season row lock instead of racing their
+    DELETE + INSERT into a duplicate key.
+    """
+    season = season or get_or_create_season(db)
+    db.flush()
+    _lock_season_rankings(db, season.id)
+    team_ids = (
+        db.execute(select(FantasyTeam.id).where(FantasyTeam.season_id == season.id))
+        .scalars()
+        .all()
+    )
+    ranking = build_rankings(db, list(team_ids), season)
+
+    db.execute(delete(TeamRoundScore).where(TeamRoundScore.season_id == season.id))
+    db.execute(delete(TeamRanking).where(TeamRanking.season_id == season.id))
+
+    ranking_rows = []
+    score_rows = []
+    for index, entry in enumerate(ranking.entries):
+        valid_rounds, latest_delta = _ranking_keys(entry)
+        ranking_rows.append(
+            {
+                "season_id": season.id,
+                "fantasy_team_id": entry.fantasy_team_id,
+                "rank": index + 1,
+                "total_points": entry.total_points,
+                "valid_rounds": valid_rounds,
+                "latest_price_delta": latest_delta,
+                "captain_player_id": entry.captain_player_id,
+                "captain_round_number": ranking.captain_source_round_number,
+            }
+        )
+        score_rows.extend(
+            {
+                "season_id": season.id,
+                "fantasy_team_id": entry.fantasy_team_id,
+                "round_number": round_item.round_number,
+                "points": round_item.points,
+                "cumulative": round_item.cumulative,
+                "price_delta": round_item.price_delta,
+            }
+            for round_item in entry.rounds
+        )
+    if ranking_rows:
+        db.execute(insert(TeamRanking), ranking_rows)
+    if score_rows:
+        db.execute(insert(TeamRoundScore), score_rows)
+    return len(ranking_rows)
+
+
+def add_team_ranking(db: Session, season_id: int, fantasy_team_id: int) -> None:
+    """Rank a team that just joined the season last, with zero points, without rebuilding the season.
+
+    A team with no lineups in the season has nothing to score; the next full refresh (round close,
+    recalc) places it among any other zero-point teams. The caller owns the commit.
+    """
+    db.flush()
+    ranked_count = (
+        select(func.count(TeamRanking.fantasy_team_id))
+        .where(TeamRanking.season_id == season_id)
+        .scalar_subquery()
+    )
+    latest_closed_round = (
+        select(func.max(Round.round_number))
+        .where(Round.season_id == season_id, Round.is_closed.is_(True))
+        .scalar_subquery()
+    )
+    db.execute(
+        insert(TeamRanking).values(
+            season_id=season_id,
+            fantasy_team_id=fantasy_team_id,
+            rank=ranked_count + 1,
+            captain_round_number=latest_closed_round,
+        )
+    )
+    # Zero-point rows for the rounds the season already stores; points, cumulative and delta default to 0.
+    stored_rounds = (
+        select(TeamRoundScore.season_id, literal(fantasy_team_id), TeamRoundScore.round_number)
+        .where(TeamRoundScore.season_id == season_id)
+        .distinct()
+    )
+    db.execute(
+        insert(TeamRoundScore).from_select(
+            [TeamRoundScore.season_id, TeamRoundScore.fantasy_team_id, TeamRoundScore.round_number],
+            stored_rounds,
+        )
+    )
+
+
+def remove_team_ranking(db: Session, season_id: int, fantasy_team_id: int) -> None:
+    """Drop a team that left the season and close the gap in the ranks below it. The caller owns the commit."""
+    removed_rank = db.execute(
+        delete(TeamRanking)
+        .where(TeamRanking.season_id == season_id, TeamRanking.fantasy_team_id == fantasy_team_id)
+        .returning(TeamRanking.rank)
+    ).scalar_one_or_none()
+    db.execute(
+        delete(TeamRoundScore).where(
+            TeamRoundScore.season_id == season_id,
+            TeamRoundScore.fantasy_team_id == fantasy_team_id,
+        )
+    )
+    if removed_rank is not None:
+        db.execute(
+            update(TeamRanking)
+            .where(TeamRanking.season_id == season_id, TeamRanking.rank > removed_rank)
+            .values(rank=TeamRanking.rank - 1)
+        )
+
+
+def _lock_season_rankings(db: Session, season_id: int) -> None:
+    # Row lock held until the caller commits (a no-op on SQLite).
+    db.execute(select(Season.id).where(Season.id == season_id).with_for_update()).first()
+
+
+def _rankings_are_current(db: Session, season_id: int) -> bool:
+    # Teams created (or moved between seasons) since the last refresh invalidate the ranks.
+    teams = select(func.count(FantasyTeam.id)).where(FantasyTeam.season_id == season_id)
+    ranked = select(func.count(TeamRanking.fantasy_team_id)).where(TeamRanking.season_id == season_id)
+    matched = (
+        select(func.count(TeamRanking.fantasy_team_id))
+        .join(FantasyTeam, FantasyTeam.id == TeamRanking.fantasy_team_id)
+        .where(TeamRanking.season_id == season_id, FantasyTeam.season_id == season_id)
+    )
+    team_count, ranked_count, matched_count = db.execute(
+        select(teams.scalar_subquery(), ranked.scalar_subquery(), matched.scalar_subquery())
+    ).one()
+    return team_count == ranked_count == matched_count
+
+
+def _round_out(score: TeamRoundScore) -> RankingRoundOut:
+    return RankingRoundOut(
+        round_number=score.round_number,
+        points=float(score.points),
+        cumulative=float(score.cumulative),
+        price_delta=float(score.price_delta),
+    )
+
+
+def ensure_rankings(db: Session, season: Season) -> None:
+    # Safety net for teams written outside get_or_create_fantasy_team; that path ranks new teams on its own.
+    if _rankings_are_current(db, season.id):
+        return
+    _lock_season_rankings(db, season.id)
+    # Another request may have rebuilt the ranks while this one waited for the lock.
+    if not _rankings_are_current(db, season.id):
+        refresh_rankings(db, season)
+    db.commit()
+
+
+def _leaderboard_query(season_id: int):
+    return (
+        select(TeamRanking, FantasyTeam.name, FantasyTeam.favorite_team_id)
+        .join(FantasyTeam, FantasyTeam.id == TeamRanking.fantasy_team_id)
+        .where(TeamRanking.season_id == season_id)
+        .order_by(TeamRanking.rank)
+    )
+
+
+def load_rankings(
+    db: Session,
+    season: Season | None = None,
+    team_ids: List[int] | None = None,
+) -> RankingOut:
+    """Read the materialized ranking, ordered by the precomputed rank."""
+    season = season or get_or_create_season(db)
+    if team_ids is not None and not team_ids:
+        return RankingOut(round_numbers=[], entries=[])
+    ensure_rankings(db, season)
+
+    query = _leaderboard_query(season.id)
+    score_query = select(TeamRoundScore).where(TeamRoundScore.season_id == season.id)
+    if team_ids is not None:
+        query = query.where(TeamRanking.fantasy_team_id.in_(team_ids))
+        score_query = score_query.where(TeamRoundScore.fantasy_team_id.in_(team_ids))
+    ranking_rows = db.execute(query).all()
+    if not ranking_rows:
+        return RankingOut(round_numbers=[], entries=[])
+
+    rounds_by_team: Dict[int, List[RankingRoundOut]] = {}
+    round_numbers: set[int] = set()
+    for score in db.execute(score_query.order_by(TeamRoundScore.round_number)).scalars():
+        round_numbers.add(score.round_number)
+        rounds_by_team.setdefault(score.fantasy_team_id, []).append(_round_out(score))
+
+    entries = [
+        RankingEntryOut(
+            rank=ranking.rank,
+            fantasy_team_id=ranking.fantasy_team_id,
+            team_name=name or "Sin nombre",
+            total_points=float(ranking.total_points),
+            captain_player_id=ranking.captain_player_id,
+            favorite_team_id=favorite_team_id,
+            rounds=rounds_by_team.get(ranking.fantasy_team_id, []),
+        )
+        for ranking, name, favorite_team_id in ranking_rows
+    ]
+    return RankingOut(
+        round_numbers=sorted(round_numbers),
+        captain_source_round_number=ranking_rows[0][0].captain_round_number,
+        entries=entries,
+    )
+
+
+def _leaderboard_page(db: Session, season_id: int, rows: list, next_after_rank: int | None) -> LeaderboardPageOut:
+    total_teams = int(
+        db.execute(
+            select(func.count(TeamRanking.fantasy_team_id)).where(TeamRanking.season_id == season_id)
+        ).scalar()
+        or 0
+    )
+    return LeaderboardPageOut(
+        total_teams=total_teams,
+        captain_source_round_number=rows[0][0].captain_round_number if rows else None,
+        next_after_rank=next_after_rank,
+        entries=[
+            LeaderboardEntryOut(
+                rank=ranking.rank,
+                fantasy_team_id=ranking.fantasy_team_id,
+                team_name=name or "Sin nombre",
+                total_points=float(ranking.total_points),
+                captain_player_id=ranking.captain_player_id,
+                favorite_team_id=favorite_team_id,
+            )
+            for ranking, name, favorite_team_id in rows
+        ],
+    )
+
+
+def load_leaderboard_page(
+    db: Session,
+    season: Season,
+    limit: int,
+    after_rank: int | None = None,
+) -> LeaderboardPageOut:
+    """Top-N and keyset pages: ranks after `after_rank`, read from the (season_id, rank) index."""
+    ensure_rankings(db, season)
+    query = _leaderboard_query(season.id)
+    if after_rank is not None:
+        query = query.where(TeamRanking.rank > after_rank)
+    rows = db.execute(query.limit(limit + 1)).all()
+    next_after_rank = rows[limit - 1][0].rank if len(rows) > limit else None
+    return _leaderboard_page(db, season.id, rows[:limit], next_after_rank)
+
+
+def load_leaderboard_window(
+    db: Session,
+    season: Season,
+    fantasy_team_id: int,
+    radius: int,
+) -> LeaderboardPageOut | None:
+    """The ranks within `radius` of a team, or None when the team is not ranked this season."""
+    ensure_rankings(db, season)
+    rank = db.execute(
+        select(TeamRanking.rank).where(
+            TeamRanking.season_id == season.id,
+            TeamRanking.fantasy_team_id == fantasy_team_id,
+        )
+    ).scalar_one_or_none()
+    if rank is None:
+        return None
+    query = _leaderboard_query(season.id).where(
+        TeamRanking.rank >= rank - radius,
+        TeamRanking.rank <= rank + radius + 1,
+    )
+    rows = db.execute(query).all()
+    last_rank = rank + radius
+    next_after_rank = last_rank if rows and rows[-1][0].rank > last_rank else None
+    return _leaderboard_page(db, season.id, [row for row in rows if row[0].rank <= last_rank], next_after_rank)
+
+
+def load_team_rounds(db: Session, season: Season, fantasy_team_id: int) -> TeamRoundsOut | None:
+    ensure_rankings(db, season)
+    rank = db.execute(
+        select(TeamRanking.rank).where(
+            TeamRanking.season_id == season.id,
+            TeamRanking.fantasy_team_id == fantasy_team_id,
+        )
+    ).scalar_one_or_none()
+    if rank is None:
+        return None
+    scores = db.execute(
+        select(TeamRoundScore)
+        .where(
+            TeamRoundScore.season_id == season.id,
+            TeamRoundScore.fantasy_team_id == fantasy_team_id,
+        )
+        .order_by(TeamRoundScore.round_number)
+    ).scalars()
+    return TeamRoundsOut(
+        fantasy_team_id=fantasy_team_id,
+        rank=rank,
+        rounds=[_round_out(score) for score in scores],
+    )
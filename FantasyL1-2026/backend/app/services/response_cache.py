@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable
+from urllib.parse import urlencode
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import Integer, String, cast, event, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.models import AppConfig
+
+DATA_VERSION_KEY = "DATA_VERSION"
+PENDING_VERSION_KEY = "pending_data_version"
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    body: bytes
+    etag: str
+    expires_at: float
+
+
+class ResponseCache:
+    """In-process LRU of serialized read responses keyed on data version, path and query."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple, CachedResponse] = OrderedDict()
+        self._version: int | None = None
+        self._version_checked_at = 0.0
+
+    def data_version(self, db: Session, max_age_seconds: float) -> int:
+        # Other workers bump the version in Postgres; re-read it at most every `max_age_seconds`.
+        now = time.monotonic()
+        with self._lock:
+            if self._version is not None and now - self._version_checked_at < max_age_seconds:
+                return self._version
+        value = db.execute(select(AppConfig.value).where(AppConfig.key == DATA_VERSION_KEY)).scalar_one_or_none()
+        version = int(value) if value is not None else 0
+        self.set_version(version)
+        return version
+
+    def set_version(self, version: int) -> None:
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+            self._version = version
+            self._version_checked_at = time.monotonic()
+
+    def get(self, key: tuple) -> CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: tuple, body: bytes, ttl_seconds: float, max_entries: int) -> CachedResponse:
+        entry = CachedResponse(
+            body=body,
+            etag=f'"{hashlib.sha1(body).hexdigest()[:20]}"',
+            expires_at=time.monotonic() + ttl_seconds,
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._version = None
+
+
+response_cache = ResponseCache()
+
+
+def _publish_pending_version(session: Session) -> None:
+    pending = session.info.pop(PENDING_VERSION_KEY, None)
+    if pending is not None:
+        response_cache.set_version(pending[0])
+
+
+def _discard_pending_version(session: Session, previous_transaction) -> None:  # noqa: ANN001
+    # A rolled-back bump must not be published by the session's next, unrelated commit.
+    pending = session.info.get(PENDING_VERSION_KEY)
+    if pending is not None and (previous_transaction is pending[1] or not previous_transaction.nested):
+        session.info.pop(PENDING_VERSION_KEY)
+
+
+def bump_data_version(db: Session) -> int:
+    """Invalidate cached catalog and ranking responses; committed with the caller's transaction."""
+    version = db.execute(
+        update(AppConfig)
+        .where(AppConfig.key == DATA_VERSION_KEY)
+        .values(value=cast(cast(AppConfig.value, Integer) + 1, String))
+        .returning(AppConfig.value)
+    ).scalar_one_or_none()
+    if version is None:
+        db.add(AppConfig(key=DATA_VERSION_KEY, value="1"))
+        version = "1"
+    # Switch this worker only once the new data is visible, so no reader caches the old rows under it.
+    db.info[PENDING_VERSION_KEY] = (int(version), db.get_nested_transaction() or db.get_transaction())
+    if not event.contains(db, "after_commit", _publish_pending_version):
+        event.listen(db, "after_commit", _publish_pending_version)
+        event.listen(db, "after_soft_rollback", _discard_pending_version)
+    return int(version)
+
+
+def _etag_matches(header: str | None, etag: str) -> bool:
+    if not header:
+        return False
+    candidates = {item.strip().removeprefix("W/") for item in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def cached_response(request: Request, db: Session, build: Callable[[], Any]) -> Response:
+    """Serve `build()` as JSON through the response cache, answering 304 on a matching If-None-Match."""
+    settings = get_settings()
+    version = response_cache.data_version(db, settings.DATA_VERSION_CHECK_SECONDS)
+    key = (version, request.url.path, urlencode(sorted(request.query_params.multi_items())))
+    entry = response_cache.get(key)
+    if entry is None:
+        body = json.dumps(jsonable_encoder(build()), separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        entry = response_cache.put(
+            key,
+            body,
+            settings.RESPONSE_CACHE_TTL_SECONDS,
+            settings.RESPONSE_CACHE_MAX_ENTRIES,
+        )
+
+    headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
+
+def cached_endpoint(endpoint: Callable[..., Any]) -> Callable[..., Response]:
+    """Route decorator: serve a public GET endpoint (with a `db` parameter) through `cached_response`."""
+    signature = inspect.signature(endpoint, eval_str=True)
+    parameters = list(signature.parameters.values())
+    parameters.append(inspect.Parameter("request", inspect.Parameter.KEYWORD_ONLY, annotation=Request))
+
+    @functools.wraps(endpoint)
+    def wrapper(*args: Any, request: Request, **kwargs: Any) -> Response:
+        return cached_response(request, kwargs["db"], lambda: endpoint(*args, **kwargs))
+
+    wrapper.__signature__ = signature.replace(parameters=parameters, return_annotation=Response)  # type: ignore[attr-defined]
+    return wrapper
@@ -18,6 +18,8 @@ from app.models import (
     Round,
 )
 from app.services.fantasy import DEFAULT_SLOTS, ensure_lineup, get_or_create_season, get_round_by_number
+from app.services.ranking import refresh_rankings
+from app.services.response_cache import bump_data_version
 from app.services.scoring import recalc_round_points
 
 
@@ -479,6 +481,10 @@ def recover_round_lineups_from_market(
                 "dry_run": True,
                 "note": "player_points_recalc_skipped_in_dry_run",
             }
+    elif apply and recovered_count:
+        refresh_rankings(db, season)
+        bump_data_version(db)
+        db.commit()
 
     summary = {
         "ok": True,
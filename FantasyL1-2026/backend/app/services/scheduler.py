@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 from datetime import datetime, timezone
 import logging
+import time
 
 from sqlalchemy import select
 
@@ -11,19 +12,29 @@ from app.db.session import SessionLocal
 from app.models import Fixture, Round
 from app.services.action_log import log_action
 from app.services.fantasy import get_or_create_season
+from app.services.player_summary import reconcile_selected_counts
 from app.services.push_notifications import run_round_deadline_reminders
+from app.services.ranking import refresh_rankings
+from app.services.response_cache import bump_data_version
 from app.services.scoring import recalc_round_points
 
 logger = logging.getLogger(__name__)
 
 
-async def _scheduler_loop(interval_seconds: int) -> None:
+async def _scheduler_loop(interval_seconds: int, reconcile_seconds: int) -> None:
+    last_reconcile = time.monotonic()
     while True:
         await asyncio.sleep(interval_seconds)
         try:
             with SessionLocal() as db:
                 run_round_deadline_reminders(db, dry_run=False)
                 season = get_or_create_season(db)
+                if time.monotonic() - last_reconcile >= reconcile_seconds:
+                    last_reconcile = time.monotonic()
+                    fixed = reconcile_selected_counts(db, season.id)
+                    db.commit()
+                    if fixed:
+                        logger.warning("selected_count_drift_fixed season_id=%s rows=%s", season.id, fixed)
                 rounds = (
                     db.execute(
                         select(Round)
@@ -53,6 +64,8 @@ async def _scheduler_loop(interval_seconds: int) -> None:
                     round_obj.is_closed = True
                     if round_obj.ends_at is None:
                         round_obj.ends_at = datetime.now(timezone.utc)
+                    refresh_rankings(db, season)
+                    bump_data_version(db)
                     db.commit()
                     log_action(
                         db,
@@ -72,4 +85,5 @@ def start_scheduler() -> asyncio.Task | None:
     if not enabled:
         return None
     interval = int(getattr(settings, "SCHEDULER_INTERVAL_SECONDS", 300))
-    return asyncio.create_task(_scheduler_loop(interval))
+    reconcile = int(getattr(settings, "SELECTED_COUNT_RECONCILE_SECONDS", 3600))
+    return asyncio.create_task(_scheduler_loop(interval, reconcile))
@@ -8,6 +8,9 @@ from sqlalchemy.orm import Session
 
 from app.models import Fixture, PlayerCatalog, PlayerMatchStat
 from app.services.fantasy import get_or_create_season, get_round_by_number
+from app.services.player_summary import refresh_player_summaries, refresh_summary_price_deltas
+from app.services.ranking import refresh_rankings
+from app.services.response_cache import bump_data_version
 
 
 def _round_price(value: float) -> float:
@@ -204,6 +207,12 @@ def recalc_round_points(
 
         points_map[row.player_id] = points_map.get(row.player_id, 0.0) + points
 
+    # Players scored on the previous pass may drop out of this round; their summaries must shrink too.
+    previous_player_ids = db.execute(
+        text("SELECT player_id FROM points_round WHERE season_id = :season_id AND round_id = :round_id"),
+        {"season_id": season.id, "round_id": round_obj.id},
+    ).scalars().all()
+
     # Clear previous round aggregates for recalculation.
     db.execute(
         text("DELETE FROM points_round WHERE season_id = :season_id AND round_id = :round_id"),
@@ -374,6 +383,13 @@ def recalc_round_points(
                 {"season_id": season.id, "round_id": round_obj.id},
             )
 
+    refresh_player_summaries(
+        db, season.id, set(previous_player_ids) | set(points_map) | set(stats_map)
+    )
+    if prices_updated:
+        refresh_summary_price_deltas(db, season.id)
+    refresh_rankings(db, season)
+    bump_data_version(db)
     db.commit()
     return {
         "ok": True,
@@ -8,6 +8,7 @@ from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.models import FantasyTeamPlayer, PlayerCatalog
+from app.services.catalog_snapshot import get_catalog_snapshot, price_tenths
 
 POSITIONS = {"G", "D", "M", "F"}
 
@@ -61,16 +62,15 @@ def validate_squad(
     if len(set(ids)) != len(ids):
         errors.append("squad_has_duplicate_players")
 
-    players = (
-        db.execute(select(PlayerCatalog).where(PlayerCatalog.player_id.in_(ids))).scalars().all()
-    )
-    found_ids = {p.player_id for p in players}
-    missing = sorted(set(ids) - found_ids)
+    snapshot = get_catalog_snapshot(db)
+    unique_ids = list(dict.fromkeys(ids))
+    missing = sorted(pid for pid in unique_ids if pid not in snapshot.rows)
     if missing:
         errors.append("players_not_found: " + ",".join(str(pid) for pid in missing))
         return errors
+    rows = [snapshot.rows[pid] for pid in unique_ids]
 
-    positions = Counter(p.position for p in players)
+    positions = Counter(snapshot.position(row) for row in rows)
     if positions.get("G", 0) != 2:
         errors.append("squad_must_have_2_goalkeepers")
 
@@ -85,23 +85,21 @@ def validate_squad(
     if f_count < 1 or f_count > 3:
         errors.append("squad_forwards_out_of_range")
 
-    invalid_positions = [p.player_id for p in players if p.position not in POSITIONS]
-    if invalid_positions:
+    if positions.get(None):
         errors.append("players_with_invalid_position")
 
-    team_counts = Counter(p.team_id for p in players)
+    team_counts = Counter(snapshot.team_ids[row] for row in rows)
     if any(count > 3 for count in team_counts.values()):
         errors.append("max_3_players_per_team")
 
-    prices_by_id: dict[int, Decimal] = {}
-    for player in players:
-        if budget_prices and player.player_id in budget_prices:
-            prices_by_id[player.player_id] = _round_price(budget_prices[player.player_id])
+    # Prices are compared in integer tenths, the same 0.1 rounding the budget has always used.
+    total_tenths = 0
+    for pid, row in zip(unique_ids, rows):
+        if budget_prices and pid in budget_prices:
+            total_tenths += price_tenths(budget_prices[pid])
         else:
-            prices_by_id[player.player_id] = _round_price(player.price_current)
-    total_price = sum(prices_by_id.values(), start=Decimal("0.0"))
-    cap_value = _round_price(budget_cap)
-    if total_price - cap_value > Decimal("0.0001"):
+            total_tenths += snapshot.prices[row]
+    if total_tenths > price_tenths(budget_cap):
         errors.append("budget_exceeded")
 
     return errors
@@ -148,19 +146,16 @@ def validate_lineup(
     if missing:
         errors.append("lineup_players_not_in_squad")
 
-    players = (
-        db.execute(select(PlayerCatalog).where(PlayerCatalog.player_id.in_(player_ids))).scalars().all()
-    )
-    by_id = {p.player_id: p for p in players}
+    snapshot = get_catalog_snapshot(db)
 
     starter_positions = Counter()
     for slot in starters:
         if slot.player_id is None:
             continue
-        player = by_id.get(slot.player_id)
-        if not player:
+        row = snapshot.rows.get(slot.player_id)
+        if row is None:
             continue
-        starter_positions[player.position] += 1
+        starter_positions[snapshot.position(row)] += 1
 
     if starter_positions.get("G", 0) < 1:
         errors.append("lineup_starters_need_goalkeeper")
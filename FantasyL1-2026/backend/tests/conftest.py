@@ -0,0 +1,44 @@
+"""Shared fixtures for the backend suite.
+
+The older unit modules (test_scoring*, test_validation*) swap sqlalchemy and app.models for
+MagicMock stand-ins in sys.modules while they are imported. The real stack is imported here,
+before any test module, and each module's stand-ins are rolled back once it has been collected,
+so the SQLite-backed modules work in any order or selection.
+"""
+
+import sys
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401
+import app.services.fantasy  # noqa: F401
+import app.services.scoring  # noqa: F401
+import app.services.validation  # noqa: F401
+
+MOCKED_MODULES = ("sqlalchemy", "sqlalchemy.orm", "app.models", "app.services.fantasy")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_make_collect_report(collector):  # noqa: ANN001
+    if not isinstance(collector, pytest.Module):
+        yield
+        return
+    saved = {name: sys.modules[name] for name in MOCKED_MODULES}
+    yield
+    sys.modules.update(saved)
+
+
+@pytest.fixture
+def sqlite_engine():
+    """In-memory SQLite on one shared connection (TestClient threads included), with a NOW() shim."""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+
+    @event.listens_for(engine, "connect")
+    def _register_now(dbapi_connection, connection_record):  # noqa: ANN001
+        dbapi_connection.create_function("NOW", 0, lambda: datetime.now().isoformat(sep=" "))
+
+    yield engine
+    engine.dispose()
@@ -0,0 +1,212 @@
+import math
+import random
+from types import SimpleNamespace
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.db.base import Base
+from app.models import (
+    AppConfig,
+    FantasyLineup,
+    FantasyLineupSlot,
+    FantasyTeam,
+    FantasyTeamPlayer,
+    Fixture,
+    PlayerCatalog,
+    PlayerMatchStat,
+    PlayerRoundStat,
+    PlayerSeasonSummary,
+    PointsRound,
+    PriceMovement,
+    Round,
+    Season,
+    Team,
+    TeamRanking,
+    TeamRoundScore,
+    User,
+)
+from app.services.batch_scoring import MatchStatColumns, recalc_season_points, score_match_columns
+from app.services.scoring import calc_match_points, recalc_round_points
+
+TABLES = [
+    model.__table__
+    for model in (
+        AppConfig,
+        User,
+        Season,
+        Round,
+        Team,
+        PlayerCatalog,
+        Fixture,
+        FantasyTeam,
+        FantasyTeamPlayer,
+        FantasyLineup,
+        FantasyLineupSlot,
+        PlayerMatchStat,
+        PlayerRoundStat,
+        PointsRound,
+        PriceMovement,
+        PlayerSeasonSummary,
+        TeamRoundScore,
+        TeamRanking,
+    )
+]
+
+POSITIONS = ["G", "GK", "g", "D", "M", "F", "X", None]
+
+
+def _random_case(rng: random.Random) -> tuple:
+    team_id = rng.choice([1, 2, 3])
+    has_fixture = rng.random() < 0.8
+
+    def maybe(value: int) -> int | None:
+        return None if rng.random() < 0.2 else value
+
+    return (
+        rng.randint(1, 4),
+        rng.randint(1, 30),
+        maybe(rng.choice([0, 0, 15, 45, 89, 90, 95])),
+        maybe(rng.choice([0, 0, 1, 2, 3, 4, 6])),
+        maybe(rng.randint(0, 3)),
+        maybe(rng.randint(0, 12)),
+        maybe(rng.randint(0, 11)),
+        maybe(rng.randint(0, 2)),
+        maybe(rng.randint(0, 1)),
+        rng.choice([None, 0, 1]),
+        rng.choice([None, 0, 1, 3]),
+        rng.choice(POSITIONS),
+        team_id,
+        rng.choice([1, 2, None]) if has_fixture else None,
+        rng.choice([2, 3, None]) if has_fixture else None,
+        rng.choice([None, 0, 1, 2]) if has_fixture else None,
+        rng.choice([None, 0, 2]) if has_fixture else None,
+    )
+
+
+def _reference(case: tuple) -> tuple:
+    (_, _, minutes, goals, assists, saves, fouls, yellow, red, clean_sheet, conceded, position, team_id,
+     home_team_id, away_team_id, home_score, away_score) = case
+    player = SimpleNamespace(position=position, team_id=team_id)
+    stat = SimpleNamespace(
+        minutesplayed=minutes,
+        goals=goals,
+        assists=assists,
+        saves=saves,
+        fouls=fouls,
+        yellow_cards=yellow,
+        red_cards=red,
+        clean_sheet=clean_sheet,
+        goals_conceded=conceded,
+    )
+    fixture = (
+        SimpleNamespace(
+            home_team_id=home_team_id,
+            away_team_id=away_team_id,
+            home_score=home_score,
+            away_score=away_score,
+        )
+        if home_team_id is not None or away_team_id is not None or home_score is not None or away_score is not None
+        else None
+    )
+    return calc_match_points(player, stat, fixture)
+
+
+def _as_optional(value: float) -> int | None:
+    return None if math.isnan(value) else int(value)
+
+
+def test_vectorized_scores_match_calc_match_points_row_by_row() -> None:
+    rng = random.Random(11)
+    cases = [_random_case(rng) for _ in range(5000)]
+    scores = score_match_columns(MatchStatColumns.from_rows(cases))
+    for index, case in enumerate(cases):
+        points, clean_sheet, conceded = _reference(case)
+        assert scores.points[index] == points, case
+        assert _as_optional(scores.clean_sheet[index]) == clean_sheet, case
+        assert _as_optional(scores.conceded[index]) == conceded, case
+
+
+def _seed(db: Session) -> None:
+    db.add(Season(id=1, year=get_settings().SEASON_YEAR, name="2026"))
+    db.add_all(Team(id=team_id, name_short=f"T{team_id}") for team_id in (1, 2, 3, 4))
+    db.add_all(Round(id=number, season_id=1, round_number=number) for number in (1, 2, 3))
+    rng = random.Random(5)
+    positions = ["G", "D", "M", "F"]
+    db.add_all(
+        PlayerCatalog(
+            player_id=player_id,
+            name=f"Jugador {player_id}",
+            position=positions[player_id % 4],
+            team_id=player_id % 4 + 1,
+            price_current=6.0,
+        )
+        for player_id in range(1, 41)
+    )
+    for round_id in (1, 2):
+        for match_index, (home, away) in enumerate(((1, 2), (3, 4))):
+            match_id = round_id * 10 + match_index
+            db.add(
+                Fixture(
+                    season_id=1,
+                    round_id=round_id,
+                    match_id=match_id,
+                    home_team_id=home,
+                    away_team_id=away,
+                    home_score=rng.randint(0, 2),
+                    away_score=rng.randint(0, 2) if match_index == 0 or round_id == 1 else None,
+                )
+            )
+            for player_id in range(1, 41):
+                if player_id % 4 + 1 not in (home, away) or rng.random() < 0.2:
+                    continue
+                db.add(
+                    PlayerMatchStat(
+                        season_id=1,
+                        round_id=round_id,
+                        match_id=match_id,
+                        player_id=player_id,
+                        minutesplayed=rng.choice([0, 30, 90]),
+                        goals=rng.choice([0, 0, 1, 3]),
+                        assists=rng.randint(0, 1),
+                        saves=rng.randint(0, 7),
+                        fouls=rng.randint(0, 6),
+                        yellow_cards=rng.randint(0, 1),
+                        clean_sheet=rng.choice([None, 0, 1]),
+                        goals_conceded=rng.choice([None, 0, 2]),
+                    )
+                )
+    db.commit()
+
+
+def _round_tables(db: Session) -> tuple[list, list]:
+    points = db.execute(
+        text("SELECT round_id, player_id, points FROM points_round ORDER BY round_id, player_id")
+    ).all()
+    stats = db.execute(
+        text(
+            """
+            SELECT round_id, player_id, minutesplayed, goals, assists, saves, fouls, yellow_cards,
+                   red_cards, clean_sheets, goals_conceded
+            FROM player_round_stats ORDER BY round_id, player_id
+            """
+        )
+    ).all()
+    return [tuple(row) for row in points], [tuple(row) for row in stats]
+
+
+def test_season_recalc_matches_round_by_round_recalc(sqlite_engine) -> None:  # noqa: ANN001
+    Base.metadata.create_all(sqlite_engine, tables=TABLES)
+    with Session(sqlite_engine) as db:
+        _seed(db)
+        for round_number in (1, 2, 3):
+            recalc_round_points(db, round_number=round_number, apply_prices=False)
+        expected = _round_tables(db)
+        assert expected[0]
+
+        db.execute(text("UPDATE points_round SET points = 0"))
+        db.execute(text("DELETE FROM player_round_stats"))
+        db.commit()
+        assert recalc_season_points(db) == {"ok": True, "rounds": 2, "points_rows": len(expected[0])}
+        assert _round_tables(db) == expected
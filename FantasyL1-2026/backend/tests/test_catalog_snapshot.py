@@ -0,0 +1,100 @@
+from types import SimpleNamespace
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.models import AppConfig, FantasyTeam, FantasyTeamPlayer, PlayerCatalog, Season, Team, User
+from app.services.catalog_snapshot import CatalogSnapshot, catalog_snapshots, price_tenths
+from app.services.response_cache import DATA_VERSION_KEY, bump_data_version, response_cache
+from app.services.validation import validate_lineup, validate_squad
+
+TABLES = [model.__table__ for model in (AppConfig, User, Season, Team, PlayerCatalog, FantasyTeam, FantasyTeamPlayer)]
+
+# 2 G, 5 D, 5 M, 3 F spread over five clubs, 3 each.
+SQUAD_POSITIONS = ["G", "G"] + ["D"] * 5 + ["M"] * 5 + ["F"] * 3
+
+
+def _seed(db: Session) -> list[int]:
+    db.add(Season(id=1, year=2026, name="2026"))
+    db.add_all(Team(id=team_id, name_short=f"T{team_id}") for team_id in range(1, 7))
+    db.add_all(
+        PlayerCatalog(
+            player_id=100 + index,
+            name=f"Jugador {index}",
+            position=position,
+            team_id=index // 3 + 1,
+            price_current=6.6,
+        )
+        for index, position in enumerate(SQUAD_POSITIONS)
+    )
+    db.add(PlayerCatalog(player_id=200, name="Extra", position="X", team_id=6, price_current=4.0))
+    db.add(User(id=1, email="user1@example.com", password_hash="x"))
+    db.add(FantasyTeam(id=1, user_id=1, season_id=1, name="Equipo"))
+    db.add_all(FantasyTeamPlayer(fantasy_team_id=1, player_id=100 + index, bought_price=6.6) for index in range(15))
+    db.commit()
+    return [100 + index for index in range(15)]
+
+
+def test_validation_reads_the_catalog_snapshot_and_refreshes_on_version_bump(sqlite_engine) -> None:  # noqa: ANN001
+    Base.metadata.create_all(sqlite_engine, tables=TABLES)
+    response_cache.clear()
+    catalog_snapshots.clear()
+    try:
+        with Session(sqlite_engine) as db:
+            squad = _seed(db)
+            # 15 x 6.6 = 99.0 fits a 99.0 cap exactly; 98.9 does not.
+            assert validate_squad(db, squad, budget_cap=99.0) == []
+            assert validate_squad(db, squad, budget_cap=98.9) == ["budget_exceeded"]
+            assert validate_squad(db, squad, budget_cap=99.0, budget_prices={100: 6.55}) == []
+            assert validate_squad(db, squad[:-1] + [200], budget_cap=120.0) == ["players_with_invalid_position"]
+            assert validate_squad(db, squad[:-1] + [999]) == ["players_not_found: 999"]
+
+            slots = [
+                SimpleNamespace(slot_index=index, is_starter=index not in (1, 6, 11, 14), player_id=player_id)
+                for index, player_id in enumerate(squad)
+            ]
+            assert validate_lineup(db, 1, slots) == []
+
+            # Without a version bump the snapshot keeps serving the old prices.
+            db.execute(update(PlayerCatalog).values(price_current=7.0))
+            db.commit()
+            assert validate_squad(db, squad, budget_cap=99.0) == []
+
+            bump_data_version(db)
+            db.commit()
+            assert validate_squad(db, squad, budget_cap=99.0) == ["budget_exceeded"]
+    finally:
+        response_cache.clear()
+        catalog_snapshots.clear()
+
+
+def test_validation_sees_a_price_change_from_another_worker_immediately(sqlite_engine) -> None:  # noqa: ANN001
+    Base.metadata.create_all(sqlite_engine, tables=TABLES)
+    response_cache.clear()
+    catalog_snapshots.clear()
+    try:
+        with Session(sqlite_engine) as db:
+            squad = _seed(db)
+            db.add(AppConfig(key=DATA_VERSION_KEY, value="1"))
+            db.commit()
+            assert validate_squad(db, squad, budget_cap=99.0) == []
+
+            # Another worker applies prices and bumps the stored version; this worker's cached
+            # version is still within DATA_VERSION_CHECK_SECONDS.
+            db.execute(update(PlayerCatalog).values(price_current=7.0))
+            db.execute(update(AppConfig).where(AppConfig.key == DATA_VERSION_KEY).values(value="2"))
+            db.commit()
+            assert validate_squad(db, squad, budget_cap=99.0) == ["budget_exceeded"]
+    finally:
+        response_cache.clear()
+        catalog_snapshots.clear()
+
+
+def test_snapshot_stores_compact_columns() -> None:
+    snapshot = CatalogSnapshot.build(3, [(7, "D", 2, 5.45), (9, None, 4, None)])
+    assert dict(snapshot.rows) == {7: 0, 9: 1}
+    assert (snapshot.position(0), snapshot.position(1)) == ("D", None)
+    assert list(snapshot.team_ids) == [2, 4]
+    assert list(snapshot.prices) == [55, 0]
+    assert price_tenths("6.25") == 63
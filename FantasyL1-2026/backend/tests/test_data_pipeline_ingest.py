@@ -0,0 +1,48 @@
+import os
+from pathlib import Path
+
+import duckdb
+
+from app.core.config import get_settings
+from app.services.data_pipeline import ingest_parquets_to_duckdb
+
+
+def _write_parquet(path: Path, select_sql: str) -> None:
+    con = duckdb.connect()
+    con.execute(f"COPY ({select_sql}) TO '{path.as_posix()}' (FORMAT parquet)")
+    con.close()
+
+
+def _write_players(parquet_dir: Path, price: float) -> None:
+    _write_parquet(
+        parquet_dir / "players_fantasy.parquet",
+        f"SELECT 1 AS player_id, 'Jugador' AS name, 'M' AS position, 10 AS team_id, {price} AS price",
+    )
+
+
+def test_ingest_skips_unchanged_files(tmp_path) -> None:  # noqa: ANN001
+    parquet_dir = tmp_path / "parquets"
+    parquet_dir.mkdir()
+    _write_parquet(parquet_dir / "teams.parquet", "SELECT 10 AS team_id, 'ALI' AS name")
+    _write_players(parquet_dir, 6.0)
+    settings = get_settings().model_copy(
+        update={"PARQUET_DIR": str(parquet_dir), "DUCKDB_PATH": str(tmp_path / "fantasy.duckdb")}
+    )
+
+    assert ingest_parquets_to_duckdb(settings) == {"ingested": ["teams", "players_fantasy"], "skipped": []}
+    assert ingest_parquets_to_duckdb(settings) == {"ingested": [], "skipped": ["teams", "players_fantasy"]}
+
+    # Republished with identical bytes: the hash matches, so nothing is copied.
+    teams_path = parquet_dir / "teams.parquet"
+    stat = teams_path.stat()
+    os.utime(teams_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+    _write_players(parquet_dir, 7.5)
+    assert ingest_parquets_to_duckdb(settings) == {"ingested": ["players_fantasy"], "skipped": ["teams"]}
+
+    con = duckdb.connect(settings.DUCKDB_PATH)
+    assert con.execute("SELECT price FROM players_fantasy").fetchall() == [(7.5,)]
+    con.execute("DROP TABLE teams")
+    con.close()
+    assert ingest_parquets_to_duckdb(settings) == {"ingested": ["teams"], "skipped": ["players_fantasy"]}
+
+    assert ingest_parquets_to_duckdb(settings, force=True)["ingested"] == ["teams", "players_fantasy"]
@@ -0,0 +1,248 @@
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+
+import duckdb
+import pyarrow as pa
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.db.base import Base
+from app.models import (
+    AppConfig,
+    FantasyLineup,
+    FantasyLineupSlot,
+    FantasyTeam,
+    FantasyTeamPlayer,
+    FantasyTransfer,
+    PlayerCatalog,
+    PlayerMatchStat,
+    PlayerRoundStat,
+    PlayerSeasonSummary,
+    PointsRound,
+    PriceHistory,
+    PriceMovement,
+    Round,
+    Season,
+    Team,
+    TeamRanking,
+    TeamRoundScore,
+    User,
+)
+from app.services import data_pipeline
+from app.services.ranking import refresh_rankings
+
+TABLES = [
+    model.__table__
+    for model in (
+        AppConfig,
+        User,
+        Season,
+        Round,
+        Team,
+        PlayerCatalog,
+        FantasyTeam,
+        FantasyTeamPlayer,
+        FantasyLineup,
+        FantasyLineupSlot,
+        FantasyTransfer,
+        PriceHistory,
+        PriceMovement,
+        PointsRound,
+        PlayerRoundStat,
+        PlayerMatchStat,
+        PlayerSeasonSummary,
+        TeamRoundScore,
+        TeamRanking,
+    )
+]
+
+
+def _write_duckdb(path: Path, players: list[tuple]) -> None:
+    con = duckdb.connect(str(path))
+    con.execute("CREATE TABLE teams (team_id INTEGER, short_name VARCHAR, name VARCHAR)")
+    con.execute("INSERT INTO teams VALUES (1, 'ALI', 'Alianza Lima'), (2, 'UNI', 'Universitario')")
+    con.execute(
+        "CREATE TABLE players_fantasy "
+        "(player_id INTEGER, name VARCHAR, short_name VARCHAR, position VARCHAR, team_id INTEGER, price DOUBLE)"
+    )
+    con.executemany("INSERT INTO players_fantasy VALUES (?, ?, ?, ?, ?, ?)", players)
+    con.close()
+
+
+def _seed(db: Session) -> None:
+    settings = get_settings()
+    db.add(Season(id=1, year=settings.SEASON_YEAR, name=settings.SEASON_NAME))
+    db.add(Team(id=1, name_short="ALI", name_full="Alianza Lima"))
+    db.add_all(
+        [
+            PlayerCatalog(player_id=10, name="Arquero", short_name="A.", position="G", team_id=1, price_current=5.0),
+            PlayerCatalog(
+                player_id=11, name="Defensa", short_name="D.", position="D", team_id=1, price_current=5.5, goals=4
+            ),
+            PlayerCatalog(player_id=12, name="Retirado", short_name="R.", position="M", team_id=1, price_current=6.0),
+        ]
+    )
+    db.add(User(id=1, email="user1@example.com", password_hash="x"))
+    db.add(FantasyTeam(id=1, user_id=1, season_id=1, name="Equipo"))
+    db.add_all(FantasyTeamPlayer(fantasy_team_id=1, player_id=player_id, bought_price=5.0) for player_id in (10, 12))
+    db.add(Round(id=1, season_id=1, round_number=1, is_closed=True))
+    db.add(FantasyLineup(id=1, fantasy_team_id=1, round_id=1))
+    db.add_all(
+        FantasyLineupSlot(lineup_id=1, slot_index=index, is_starter=True, role="M", player_id=player_id)
+        for index, player_id in enumerate((10, 12))
+    )
+    db.add_all(PointsRound(season_id=1, round_id=1, player_id=player_id, points=4) for player_id in (10, 12))
+    db.commit()
+    refresh_rankings(db, db.get(Season, 1))
+    db.commit()
+
+
+def _sync(engine, monkeypatch, tmp_path: Path, players: list[tuple], **overrides) -> dict:  # noqa: ANN001
+    duckdb_path = tmp_path / "fantasy.duckdb"
+    duckdb_path.unlink(missing_ok=True)
+    _write_duckdb(duckdb_path, players)
+    flags = {
+        "SYNC_PRESERVE_EXISTING_PRICE_CURRENT": False,
+        "SYNC_PRESERVE_EXISTING_BASE_STATS": False,
+        "SYNC_SKIP_PRUNE_MISSING_PLAYERS": False,
+    }
+    settings = get_settings().model_copy(update={"DUCKDB_PATH": str(duckdb_path), **flags, **overrides})
+    monkeypatch.setattr(data_pipeline, "SessionLocal", lambda: Session(engine))
+    return data_pipeline.sync_duckdb_to_postgres(settings)
+
+
+def test_sync_merges_only_changed_rows_and_prunes_missing_players(
+    sqlite_engine, monkeypatch, tmp_path  # noqa: ANN001
+) -> None:
+    Base.metadata.create_all(sqlite_engine, tables=TABLES)
+    with Session(sqlite_engine) as db:
+        _seed(db)
+
+    players = [
+        (10, "Arquero", "A.", "G", 1, 5.0),
+        (11, "Defensa", "D.", "D", 1, 5.5),
+        (13, "Nuevo", None, "F", 3, 7.0),
+        (13, "Nuevo", "N.", "F", 2, 7.5),
+    ]
+    result = _sync(sqlite_engine, monkeypatch, tmp_path, players)
+    # Team 2 comes from teams.parquet; the duplicated player 13 keeps its last row.
+    assert result == {
+        "teams": {"inserted": 1, "changed": 0},
+        "players": {"inserted": 1, "changed": 1, "pruned": 1},
+    }
+    with Session(sqlite_engine) as db:
+        catalog = {player.player_id: player for player in db.execute(select(PlayerCatalog)).scalars()}
+        assert sorted(catalog) == [10, 11, 13]
+        assert catalog[11].goals == 0
+        assert (catalog[13].short_name, catalog[13].team_id, float(catalog[13].price_current)) == ("N.", 2, 7.5)
+        assert db.execute(select(FantasyTeamPlayer.player_id)).scalars().all() == [10]
+        assert db.execute(select(Team.name_full).where(Team.id == 2)).scalar_one() == "Universitario"
+        # The pruned player's 4 points no longer count towards the stored total.
+        assert db.execute(select(TeamRanking.total_points)).scalar_one() == 4
+
+    # Re-running the same input touches nothing.
+    result = _sync(sqlite_engine, monkeypatch, tmp_path, players)
+    assert result == {
+        "teams": {"inserted": 0, "changed": 0},
+        "players": {"inserted": 0, "changed": 0, "pruned": 0},
+    }
+
+
+def test_sync_preserve_flags_keep_existing_price_and_base_stats(
+    sqlite_engine, monkeypatch, tmp_path  # noqa: ANN001
+) -> None:
+    Base.metadata.create_all(sqlite_engine, tables=TABLES)
+    with Session(sqlite_engine) as db:
+        _seed(db)
+
+    players = [(10, "Arquero", "A.", "G", 1, 9.0), (11, "Defensa", "D.", "D", 1, 9.0)]
+    result = _sync(
+        sqlite_engine,
+        monkeypatch,
+        tmp_path,
+        players,
+        SYNC_PRESERVE_EXISTING_PRICE_CURRENT=True,
+        SYNC_PRESERVE_EXISTING_BASE_STATS=True,
+        SYNC_SKIP_PRUNE_MISSING_PLAYERS=True,
+    )
+    assert result["players"] == {"inserted": 0, "changed": 0, "pruned": 0}
+    with Session(sqlite_engine) as db:
+        catalog = {player.player_id: player for player in db.execute(select(PlayerCatalog)).scalars()}
+        assert sorted(catalog) == [10, 11, 12]
+        assert (float(catalog[11].price_current), catalog[11].goals) == (5.5, 4)
+
+    result = _sync(sqlite_engine, monkeypatch, tmp_path, players, SYNC_SKIP_PRUNE_MISSING_PLAYERS=True)
+    assert result["players"] == {"inserted": 0, "changed": 2, "pruned": 0}
+    with Session(sqlite_engine) as db:
+        assert db.execute(select(PlayerCatalog.price_current).where(PlayerCatalog.player_id == 11)).scalar_one() == 9.0
+
+
+def test_sync_pending_tracks_the_last_committed_bundle(sqlite_engine, monkeypatch, tmp_path) -> None:  # noqa: ANN001
+    Base.metadata.create_all(sqlite_engine, tables=TABLES)
+    with Session(sqlite_engine) as db:
+        _seed(db)
+    players = [(10, "Arquero", "A.", "G", 1, 5.0), (11, "Defensa", "D.", "D", 1, 5.5)]
+    duckdb_path = tmp_path / "fantasy.duckdb"
+    _write_duckdb(duckdb_path, players)
+    con = duckdb.connect(str(duckdb_path))
+    data_pipeline._load_ingest_manifest(con)
+    con.execute("INSERT INTO ingest_manifest VALUES ('players_fantasy', 1, 1, 'aaa', current_timestamp)")
+    con.close()
+    settings = get_settings().model_copy(update={"DUCKDB_PATH": str(duckdb_path)})
+    monkeypatch.setattr(data_pipeline, "SessionLocal", lambda: Session(sqlite_engine))
+
+    assert data_pipeline.catalog_sync_pending(settings)
+    data_pipeline.sync_duckdb_to_postgres(settings)
+    assert not data_pipeline.catalog_sync_pending(settings)
+
+    # A new ingest whose sync never committed stays pending.
+    con = duckdb.connect(str(duckdb_path))
+    con.execute("UPDATE ingest_manifest SET content_sha256 = 'bbb'")
+    con.close()
+    assert data_pipeline.catalog_sync_pending(settings)
+
+
+class _RecordingCursor:
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+        self.chunks: list[bytes] = []
+
+    def __enter__(self) -> "_RecordingCursor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:  # noqa: ANN002
+        return None
+
+    @contextmanager
+    def copy(self, statement: str):
+        self.statements.append(statement)
+        yield SimpleNamespace(write=self.chunks.append)
+
+
+def test_stage_batches_copies_csv_in_the_staging_column_order() -> None:
+    cursor = _RecordingCursor()
+    raw = SimpleNamespace(cursor=lambda: cursor)
+    connection = SimpleNamespace(
+        dialect=SimpleNamespace(driver="psycopg"),
+        connection=SimpleNamespace(driver_connection=raw),
+    )
+    db = SimpleNamespace(connection=lambda: connection)
+    # The reader yields name_full before name_short; COPY must still receive them in column order.
+    schema = pa.schema([("id", pa.int32()), ("name_full", pa.string()), ("name_short", pa.string())])
+    batches = [
+        pa.record_batch([[1, 2], ["Alianza Lima", 'Sport "Boys", Callao'], ["ALI", None]], schema=schema),
+        pa.record_batch([[3], ["Melgar"], ["MEL"]], schema=schema),
+    ]
+
+    staged = data_pipeline._stage_batches(
+        db, "sync_teams", ("id", "name_short", "name_full"), pa.RecordBatchReader.from_batches(schema, batches)
+    )
+
+    assert staged == 3
+    assert cursor.statements == ["COPY sync_teams (id, name_short, name_full) FROM STDIN WITH (FORMAT csv)"]
+    assert [chunk.decode() for chunk in cursor.chunks] == [
+        '1,"ALI","Alianza Lima"\n2,,"Sport ""Boys"", Callao"\n',
+        '3,"MEL","Melgar"\n',
+    ]
@@ -0,0 +1,167 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_current_user
+from app.api.fantasy import _build_team_response, router
+from app.core.config import get_settings
+from app.db.base import Base
+from app.db.session import get_db
+from app.models import (
+    FantasyLineup,
+    FantasyLineupSlot,
+    FantasyTeam,
+    FantasyTeamPlayer,
+    FantasyTransfer,
+    PlayerCatalog,
+    PlayerRoundStat,
+    PointsRound,
+    PriceMovement,
+    Round,
+    Season,
+    Team,
+    User,
+)
+
+TABLES = [
+    model.__table__
+    for model in (
+        User,
+        Season,
+        Round,
+        Team,
+        PlayerCatalog,
+        FantasyTeam,
+        FantasyTeamPlayer,
+        FantasyTransfer,
+        FantasyLineup,
+        FantasyLineupSlot,
+        PointsRound,
+        PlayerRoundStat,
+        PriceMovement,
+    )
+]
+
+# GET /fantasy/team: season, team, then the team view itself in two statements.
+GET_TEAM_STATEMENTS = 4
+# PUT /fantasy/team/favorite: season, team, club check, update, then the two-statement view.
+PUT_FAVORITE_STATEMENTS = 6
+
+
+def _seed(db: Session) -> None:
+    db.add(Season(id=1, year=get_settings().SEASON_YEAR, name="2026"))
+    db.add_all([Team(id=10, name_short="ALI"), Team(id=20, name_short="UNI")])
+    db.add_all(
+        Round(id=number, season_id=1, round_number=number, is_closed=number < 3) for number in (1, 2, 3)
+    )
+    db.add_all(
+        PlayerCatalog(
+            player_id=player_id,
+            name=f"Jugador {player_id}",
+            position="M",
+            team_id=10 if player_id < 3 else 20,
+            price_current=5.0 + player_id,
+            goals=player_id,
+        )
+        for player_id in range(1, 6)
+    )
+    db.add(User(id=1, email="user1@example.com", password_hash="x"))
+    db.add(FantasyTeam(id=1, user_id=1, season_id=1, name="Equipo", budget_cap=100.0))
+    db.add_all(
+        FantasyTeamPlayer(fantasy_team_id=1, player_id=player_id, bought_price=6.0, bought_round_id=2)
+        for player_id in (1, 2, 3)
+    )
+    # Player 4 was in the round-2 lineup and transferred out for player 3 in round 3.
+    db.add(FantasyLineup(id=1, fantasy_team_id=1, round_id=2))
+    db.add_all(
+        FantasyLineupSlot(lineup_id=1, slot_index=index, is_starter=True, role="M", player_id=player_id)
+        for index, player_id in enumerate((1, 2, 4))
+    )
+    db.add(FantasyTransfer(fantasy_team_id=1, round_id=3, out_player_id=4, in_player_id=3, out_price=6.0, in_price=8.0))
+    db.add_all(
+        [
+            PointsRound(season_id=1, round_id=1, player_id=1, points=4),
+            PointsRound(season_id=1, round_id=2, player_id=1, points=6),
+            PointsRound(season_id=1, round_id=2, player_id=3, points=2),
+            PlayerRoundStat(season_id=1, round_id=2, player_id=1, goals=1, assists=0, saves=0, clean_sheets=1),
+            PlayerRoundStat(season_id=1, round_id=1, player_id=3, goals=0, goals_conceded=2),
+            PriceMovement(season_id=1, round_id=2, player_id=1, points=6, delta=0.2),
+            PriceMovement(season_id=1, round_id=2, player_id=3, points=2, delta=-0.2),
+            PriceMovement(season_id=1, round_id=2, player_id=4, points=-3, delta=-0.3),
+        ]
+    )
+    db.commit()
+
+
+def _client(engine) -> TestClient:  # noqa: ANN001
+    Base.metadata.create_all(engine, tables=TABLES)
+    with Session(engine) as db:
+        _seed(db)
+
+    app = FastAPI()
+    app.include_router(router)
+
+    def override_get_db():
+        with Session(engine) as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user] = lambda: User(id=1, email="user1@example.com")
+    return TestClient(app)
+
+
+def _count_statements(engine, call) -> tuple[object, int]:  # noqa: ANN001
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):  # noqa: ANN001
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        result = call()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return result, len(statements)
+
+
+def test_team_view_freezes_market_delta_to_previous_closed_lineup(sqlite_engine) -> None:  # noqa: ANN001
+    client = _client(sqlite_engine)
+    response, statements = _count_statements(sqlite_engine, lambda: client.get("/fantasy/team"))
+    assert response.status_code == 200
+    assert statements == GET_TEAM_STATEMENTS
+    body = response.json()
+
+    # Previous lineup (1, 2, 4) moved +0.2 and -0.3; player 3's move is not part of the frozen delta.
+    assert body["market_price_delta"] == -0.1
+    assert (body["market_price_delta_from_round"], body["market_price_delta_to_round"]) == (2, 3)
+    assert body["budget_cap"] == 99.9
+    assert body["budget_used"] == 21.0
+    assert body["club_counts"] == {"10": 2, "20": 1}
+    squad = {player["player_id"]: player for player in body["squad"]}
+    assert squad[1]["points_total"] == 10.0
+    assert squad[1]["price_delta"] == 0.2
+    assert squad[1]["clean_sheets"] == 1
+    assert squad[1]["points_round"] is None
+    assert squad[2]["price_delta"] is None
+    assert squad[3]["price_delta"] is None
+    assert squad[3]["goals_conceded"] == 2
+
+
+def test_team_view_for_closed_round_reports_round_stats(sqlite_engine) -> None:  # noqa: ANN001
+    client = _client(sqlite_engine)
+    with Session(sqlite_engine) as db:
+        view = _build_team_response(db, 1, round_number=2)
+    squad = {player.player_id: player for player in view.squad}
+    assert view.market_price_delta is None
+    assert view.budget_cap == 100.0
+    assert (squad[1].points_round, squad[1].goals_round, squad[1].assists_round) == (6.0, 1, 0)
+    assert (squad[2].points_round, squad[2].goals_round) == (None, None)
+    assert squad[3].points_round == 2.0
+
+    response, statements = _count_statements(
+        sqlite_engine, lambda: client.put("/fantasy/team/favorite", json={"team_id": 20})
+    )
+    assert response.status_code == 200
+    assert response.json()["favorite_team_id"] == 20
+    assert statements == PUT_FAVORITE_STATEMENTS
@@ -0,0 +1,143 @@
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.models import (
+    FantasyTeam,
+    FantasyTeamPlayer,
+    PlayerCatalog,
+    PlayerMatchStat,
+    PlayerRoundStat,
+    PlayerSeasonSummary,
+    PointsRound,
+    PriceMovement,
+    Round,
+    Season,
+    Team,
+    User,
+)
+from app.services.fantasy import replace_squad
+from app.services.player_summary import (
+    adjust_selected_counts,
+    ensure_player_summaries,
+    reconcile_selected_counts,
+    refresh_player_summaries,
+    refresh_summary_price_deltas,
+)
+
+TABLES = [
+    model.__table__
+    for model in (
+        User,
+        Season,
+        Round,
+        Team,
+        PlayerCatalog,
+        FantasyTeam,
+        FantasyTeamPlayer,
+        PlayerMatchStat,
+        PlayerRoundStat,
+        PointsRound,
+        PriceMovement,
+        PlayerSeasonSummary,
+    )
+]
+
+
+def _seed(db: Session) -> None:
+    db.add(Season(id=1, year=2026, name="2026"))
+    db.add(Team(id=10, name_short="ALI"))
+    db.add_all(Round(id=number, season_id=1, round_number=number) for number in (1, 2))
+    db.add_all(
+        PlayerCatalog(player_id=player_id, name=f"Jugador {player_id}", position="M", team_id=10, price_current=6.0)
+        for player_id in range(1, 5)
+    )
+    for team_id, squad in {1: [1, 2], 2: [1, 3]}.items():
+        db.add(User(id=team_id, email=f"user{team_id}@example.com", password_hash="x"))
+        db.add(FantasyTeam(id=team_id, user_id=team_id, season_id=1, name=f"Equipo {team_id}"))
+        db.add_all(FantasyTeamPlayer(fantasy_team_id=team_id, player_id=player_id, bought_price=6.0) for player_id in squad)
+    db.add_all(
+        [
+            PlayerMatchStat(season_id=1, round_id=1, match_id=100, player_id=1, minutesplayed=90, goals=1, fouls=2),
+            PlayerMatchStat(season_id=1, round_id=2, match_id=200, player_id=1, minutesplayed=80, goals=2, yellow_cards=1),
+            PlayerMatchStat(season_id=1, round_id=1, match_id=100, player_id=2, minutesplayed=45, assists=1, saves=3),
+        ]
+    )
+    db.add_all(
+        [
+            PointsRound(season_id=1, round_id=1, player_id=1, points=7),
+            PointsRound(season_id=1, round_id=2, player_id=1, points=9),
+            PointsRound(season_id=1, round_id=1, player_id=2, points=3),
+        ]
+    )
+    db.add(PlayerRoundStat(season_id=1, round_id=1, player_id=2, clean_sheets=1, goals_conceded=0))
+    db.add(PlayerRoundStat(season_id=1, round_id=2, player_id=2, clean_sheets=0, goals_conceded=2))
+    db.add(PriceMovement(season_id=1, round_id=1, player_id=1, points=7, delta=0.2))
+    db.add(PriceMovement(season_id=1, round_id=2, player_id=2, points=3, delta=0.1))
+    db.commit()
+
+
+def _summaries(db: Session) -> dict[int, tuple]:
+    rows = db.execute(select(PlayerSeasonSummary).order_by(PlayerSeasonSummary.player_id)).scalars().all()
+    return {
+        row.player_id: (
+            row.matches_with_stats,
+            row.goals,
+            row.assists,
+            row.minutesplayed,
+            row.saves,
+            row.fouls,
+            row.yellow_cards,
+            float(row.points_total),
+            row.clean_sheets,
+            row.goals_conceded,
+            None if row.price_delta is None else float(row.price_delta),
+            row.selected_count,
+        )
+        for row in rows
+    }
+
+
+def test_summary_matches_aggregates_and_incremental_refresh_equals_full(sqlite_engine) -> None:  # noqa: ANN001
+    Base.metadata.create_all(sqlite_engine, tables=TABLES)
+    with Session(sqlite_engine) as db:
+        _seed(db)
+        ensure_player_summaries(db, 1)
+        assert _summaries(db) == {
+            1: (2, 3, 0, 170, 0, 2, 1, 16.0, 0, 0, None, 2),
+            2: (1, 0, 1, 45, 3, 0, 0, 3.0, 1, 2, 0.1, 1),
+            3: (0, 0, 0, 0, 0, 0, 0, 0.0, 0, 0, None, 1),
+            4: (0, 0, 0, 0, 0, 0, 0, 0.0, 0, 0, None, 0),
+        }
+
+        db.add(PointsRound(season_id=1, round_id=2, player_id=3, points=4))
+        db.add(PriceMovement(season_id=1, round_id=2, player_id=3, points=4, delta=0.1))
+        db.flush()
+        refresh_player_summaries(db, 1, [3])
+        refresh_summary_price_deltas(db, 1)
+        replace_squad(db, 1, [3, 4])
+
+        incremental = _summaries(db)
+        assert incremental[1][-1] == 1
+        assert incremental[3][-5:] == (4.0, 0, 0, 0.1, 2)
+        refresh_player_summaries(db, 1)
+        db.commit()
+        assert _summaries(db) == incremental
+
+
+def test_selected_counts_move_by_deltas_and_reconcile_drift(sqlite_engine) -> None:  # noqa: ANN001
+    Base.metadata.create_all(sqlite_engine, tables=TABLES)
+    with Session(sqlite_engine) as db:
+        _seed(db)
+        ensure_player_summaries(db, 1)
+        adjust_selected_counts(db, 1, added=[4, 4], removed=[1])
+        db.commit()
+        counts = {player_id: values[-1] for player_id, values in _summaries(db).items()}
+        assert counts == {1: 1, 2: 1, 3: 1, 4: 2}
+
+        # Only the two drifted counters are rewritten from fantasy_team_players.
+        assert reconcile_selected_counts(db, 1) == 2
+        db.commit()
+        counts = {player_id: values[-1] for player_id, values in _summaries(db).items()}
+        assert counts == {1: 2, 2: 1, 3: 1, 4: 0}
+        assert reconcile_selected_counts(db, 1) == 0
@@ -0,0 +1,218 @@
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.models import (
+    FantasyLineup,
+    FantasyLineupSlot,
+    FantasyTeam,
+    FantasyTeamPlayer,
+    PlayerCatalog,
+    PointsRound,
+    PriceMovement,
+    Round,
+    Season,
+    Team,
+    TeamRanking,
+    TeamRoundScore,
+    User,
+)
+from app.services.ranking import (
+    build_rankings,
+    load_leaderboard_page,
+    load_leaderboard_window,
+    load_rankings,
+    load_team_rounds,
+    refresh_rankings,
+)
+from app.services.fantasy import get_or_create_fantasy_team
+
+
+TABLES = [
+    model.__table__
+    for model in (
+        User,
+        Season,
+        Round,
+        Team,
+        PlayerCatalog,
+        FantasyTeam,
+        FantasyTeamPlayer,
+        FantasyLineup,
+        FantasyLineupSlot,
+        PointsRound,
+        PriceMovement,
+        TeamRoundScore,
+        TeamRanking,
+    )
+]
+
+# team -> round -> (captain, starters); players 1-6 score below, 7 never plays.
+LINEUPS = {
+    1: {1: (1, [1, 2, 3]), 2: (2, [1, 2, 3])},
+    2: {1: (4, [4, 5, 6]), 2: (7, [4, 5, 6]), 3: (4, [4, 5, 6])},
+    3: {1: (1, [1, 5, 7]), 2: (5, [1, 5, 7])},
+}
+POINTS = {1: {1: 6, 2: 2, 3: 1, 4: 3, 5: 4, 6: 2}, 2: {1: 1, 2: 5, 3: 0, 4: 2, 5: 6, 6: 1}}
+DELTAS = {1: {1: 0.2, 5: -0.3}, 2: {2: 0.1, 5: 0.4}}
+
+
+def _seed(db: Session) -> Season:
+    season = Season(id=1, year=2026, name="2026")
+    db.add(season)
+    db.add(Team(id=10, name_short="ALI"))
+    db.add_all(Round(id=number, season_id=1, round_number=number, is_closed=number < 3) for number in (1, 2, 3, 4))
+    db.add_all(
+        PlayerCatalog(player_id=player_id, name=f"Jugador {player_id}", position="M", team_id=10, price_current=6.0)
+        for player_id in range(1, 8)
+    )
+    for team_id, rounds in LINEUPS.items():
+        db.add(User(id=team_id, email=f"user{team_id}@example.com", password_hash="x"))
+        db.add(FantasyTeam(id=team_id, user_id=team_id, season_id=1, name=f"Equipo {team_id}"))
+        for round_id, (captain_id, starters) in rounds.items():
+            lineup_id = team_id * 10 + round_id
+            db.add(FantasyLineup(id=lineup_id, fantasy_team_id=team_id, round_id=round_id, captain_player_id=captain_id))
+            db.add_all(
+                FantasyLineupSlot(lineup_id=lineup_id, slot_index=index, is_starter=True, role="M", player_id=player_id)
+                for index, player_id in enumerate(starters)
+            )
+    for round_id, points in POINTS.items():
+        db.add_all(PointsRound(season_id=1, round_id=round_id, player_id=player_id, points=value) for player_id, value in points.items())
+    for round_id, deltas in DELTAS.items():
+        db.add_all(
+            PriceMovement(season_id=1, round_id=round_id, player_id=player_id, points=0, delta=delta)
+            for player_id, delta in deltas.items()
+        )
+    db.commit()
+    return season
+
+
+def _session(engine) -> Session:  # noqa: ANN001
+    Base.metadata.create_all(engine, tables=TABLES)
+    return Session(engine)
+
+
+def test_materialized_rankings_match_live_computation(sqlite_engine) -> None:  # noqa: ANN001
+    with _session(sqlite_engine) as db:
+        season = _seed(db)
+        live = build_rankings(db, [1, 2, 3], season)
+        assert refresh_rankings(db, season) == 3
+        db.commit()
+
+        stored = load_rankings(db, season)
+        assert stored.round_numbers == live.round_numbers == [1, 2, 3]
+        assert stored.captain_source_round_number == live.captain_source_round_number == 2
+        assert [entry.rank for entry in stored.entries] == [1, 2, 3]
+        for stored_entry, live_entry in zip(stored.entries, live.entries):
+            assert stored_entry.model_dump(exclude={"rank"}) == live_entry.model_dump(exclude={"rank"})
+
+        league = load_rankings(db, season, team_ids=[3, 1])
+        assert [entry.fantasy_team_id for entry in league.entries] == [
+            entry.fantasy_team_id for entry in live.entries if entry.fantasy_team_id in {1, 3}
+        ]
+
+
+def test_leaderboard_pages_windows_and_team_rounds(sqlite_engine) -> None:  # noqa: ANN001
+    with _session(sqlite_engine) as db:
+        season = _seed(db)
+        live = build_rankings(db, [1, 2, 3], season)
+        order = [entry.fantasy_team_id for entry in live.entries]
+
+        first = load_leaderboard_page(db, season, limit=2)
+        assert [entry.fantasy_team_id for entry in first.entries] == order[:2]
+        assert (first.total_teams, first.next_after_rank) == (3, 2)
+        rest = load_leaderboard_page(db, season, limit=2, after_rank=first.next_after_rank)
+        assert [entry.rank for entry in rest.entries] == [3]
+        assert rest.next_after_rank is None
+
+        window = load_leaderboard_window(db, season, order[0], radius=1)
+        assert [entry.rank for entry in window.entries] == [1, 2]
+        assert window.next_after_rank == 2
+        assert load_leaderboard_window(db, season, 99, radius=1) is None
+
+        rounds = load_team_rounds(db, season, order[1])
+        assert rounds.rank == 2
+        assert rounds.rounds == live.entries[1].rounds
+
+
+def test_load_rankings_refreshes_when_teams_change(sqlite_engine) -> None:  # noqa: ANN001
+    with _session(sqlite_engine) as db:
+        season = _seed(db)
+        refresh_rankings(db, season)
+        db.commit()
+
+        db.add(User(id=4, email="user4@example.com", password_hash="x"))
+        db.add(FantasyTeam(id=4, user_id=4, season_id=1, name="Nuevo"))
+        db.commit()
+        ranking = load_rankings(db, season)
+        assert [entry.rank for entry in ranking.entries] == [1, 2, 3, 4]
+        assert ranking.entries[-1].fantasy_team_id == 4
+        assert ranking.entries[-1].total_points == 0.0
+
+
+def _stored_rankings(db: Session, season_id: int) -> tuple[list, list]:
+    rankings = db.execute(
+        select(
+            TeamRanking.fantasy_team_id,
+            TeamRanking.rank,
+            TeamRanking.total_points,
+            TeamRanking.captain_round_number,
+        )
+        .where(TeamRanking.season_id == season_id)
+        .order_by(TeamRanking.rank)
+    ).all()
+    scores = db.execute(
+        select(TeamRoundScore.fantasy_team_id, TeamRoundScore.round_number, TeamRoundScore.points)
+        .where(TeamRoundScore.season_id == season_id)
+        .order_by(TeamRoundScore.fantasy_team_id, TeamRoundScore.round_number)
+    ).all()
+    return [tuple(row) for row in rankings], [tuple(row) for row in scores]
+
+
+def test_team_signup_and_season_move_rank_the_team_without_a_rebuild(sqlite_engine) -> None:  # noqa: ANN001
+    with _session(sqlite_engine) as db:
+        season = _seed(db)
+        db.add(Season(id=2, year=2025, name="2025"))
+        refresh_rankings(db, season)
+        db.commit()
+
+        db.add(User(id=5, email="user5@example.com", password_hash="x"))
+        db.commit()
+        team = get_or_create_fantasy_team(db, 5, season.id, name="Recien llegado")
+        appended = _stored_rankings(db, season.id)
+        assert appended[0][-1][:2] == (team.id, 4)
+        assert [row[1:] for row in appended[1] if row[0] == team.id] == [(1, 0), (2, 0), (3, 0)]
+        # The appended row is what a full rebuild would have written.
+        refresh_rankings(db, season)
+        db.commit()
+        assert _stored_rankings(db, season.id) == appended
+
+        leader = appended[0][0][0]
+        get_or_create_fantasy_team(db, leader, 2)
+        moved = _stored_rankings(db, season.id)
+        assert [row[:2] for row in moved[0]] == [(row[0], index + 1) for index, row in enumerate(appended[0][1:])]
+        assert leader not in {row[0] for row in moved[1]}
+        assert _stored_rankings(db, 2)[0] == [(leader, 1, 0, None)]
+
+
+def test_stored_pending_delta_ignores_the_current_squad(sqlite_engine) -> None:  # noqa: ANN001
+    with _session(sqlite_engine) as db:
+        season = _seed(db)
+        # Team 4 has no round 2 lineup; its squad holds players that moved in round 2.
+        db.add(User(id=4, email="user4@example.com", password_hash="x"))
+        db.add(FantasyTeam(id=4, user_id=4, season_id=1, name="Sin alineacion"))
+        db.add_all(FantasyTeamPlayer(fantasy_team_id=4, player_id=player_id, bought_price=6.0) for player_id in (2, 5))
+        refresh_rankings(db, season)
+        db.commit()
+
+        stored = db.execute(
+            select(TeamRanking.latest_price_delta).where(TeamRanking.fantasy_team_id == 4)
+        ).scalar_one()
+        pending = db.execute(
+            select(TeamRoundScore.price_delta).where(
+                TeamRoundScore.fantasy_team_id == 4, TeamRoundScore.round_number == 3
+            )
+        ).scalar_one()
+        assert (float(stored), float(pending)) == (0.0, 0.0)
+        # Teams with a previous closed lineup still carry its frozen delta.
+        assert [round_item.price_delta for round_item in load_team_rounds(db, season, 2).rounds][-1] == 0.4
@@ -0,0 +1,99 @@
+from fastapi import Depends, FastAPI, Query
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.db.base import Base
+from app.models import AppConfig
+from app.services.response_cache import ResponseCache, bump_data_version, cached_endpoint, response_cache
+
+
+def _client(engine, monkeypatch) -> tuple[TestClient, list[int]]:  # noqa: ANN001
+    monkeypatch.setenv("DATABASE_URL", "sqlite://")
+    monkeypatch.setenv("JWT_SECRET", "test-secret")
+    monkeypatch.setenv("ADMIN_TOKEN", "test-admin")
+    get_settings.cache_clear()
+    Base.metadata.create_all(engine, tables=[AppConfig.__table__])
+    response_cache.clear()
+
+    calls: list[int] = []
+    app = FastAPI()
+
+    def get_db():
+        with Session(engine) as db:
+            yield db
+
+    @app.get("/items")
+    @cached_endpoint
+    def list_items(limit: int = Query(default=2, ge=1), db: Session = Depends(get_db)) -> list[dict]:
+        calls.append(limit)
+        return [{"index": index, "version": len(calls)} for index in range(limit)]
+
+    return TestClient(app), calls
+
+
+def test_cached_endpoint_serves_etags_and_invalidates_on_version_bump(
+    sqlite_engine, monkeypatch  # noqa: ANN001
+) -> None:
+    client, calls = _client(sqlite_engine, monkeypatch)
+    try:
+        first = client.get("/items", params={"limit": 2})
+        assert first.status_code == 200
+        assert first.json() == [{"index": 0, "version": 1}, {"index": 1, "version": 1}]
+        etag = first.headers["etag"]
+
+        assert client.get("/items", params={"limit": 2}).json() == first.json()
+        not_modified = client.get("/items", params={"limit": 2}, headers={"If-None-Match": etag})
+        assert (not_modified.status_code, not_modified.content) == (304, b"")
+        assert client.get("/items", params={"limit": 3}).status_code == 200
+        assert calls == [2, 3]
+        assert client.get("/items", params={"limit": 0}).status_code == 422
+
+        with Session(sqlite_engine) as db:
+            assert bump_data_version(db) == 1
+            db.commit()
+            assert bump_data_version(db) == 2
+            db.rollback()
+        refreshed = client.get("/items", params={"limit": 2}, headers={"If-None-Match": etag})
+        assert refreshed.status_code == 200
+        assert refreshed.headers["etag"] != etag
+        assert calls == [2, 3, 2]
+    finally:
+        get_settings.cache_clear()
+        response_cache.clear()
+
+
+def test_response_cache_evicts_least_recently_used_and_expired_entries() -> None:
+    cache = ResponseCache()
+    cache.put(("a",), b"1", ttl_seconds=60, max_entries=2)
+    cache.put(("b",), b"2", ttl_seconds=60, max_entries=2)
+    assert cache.get(("a",)) is not None
+    cache.put(("c",), b"3", ttl_seconds=60, max_entries=2)
+    assert cache.get(("b",)) is None
+    assert cache.get(("a",)).body == b"1"
+
+    cache.put(("d",), b"4", ttl_seconds=0, max_entries=2)
+    assert cache.get(("d",)) is None
+
+
+def test_rolled_back_bump_is_not_published_by_a_later_commit(sqlite_engine) -> None:  # noqa: ANN001
+    Base.metadata.create_all(sqlite_engine, tables=[AppConfig.__table__])
+    response_cache.clear()
+    try:
+        with Session(sqlite_engine) as db:
+            assert bump_data_version(db) == 1
+            db.commit()
+            assert response_cache.data_version(db, 60) == 1
+
+            assert bump_data_version(db) == 2
+            db.rollback()
+            db.add(AppConfig(key="UNRELATED", value="x"))
+            db.commit()
+            assert response_cache.data_version(db, 60) == 1
+
+            with db.begin_nested():
+                assert bump_data_version(db) == 2
+            db.commit()
+            assert response_cache.data_version(db, 60) == 2
+    finally:
+        response_cache.clear()
@@ -447,6 +447,16 @@ export default function FixturesPage() {
                             ? `${match.home_score} - ${match.away_score}`
                             : ""}
                         </p>
+                        {match.home_score == null &&
+                        match.prob_home != null &&
+                        match.prob_draw != null &&
+                        match.prob_away != null ? (
+                          <p className="text-[10px] text-muted">
+                            {`L ${Math.round(match.prob_home * 100)}% - E ${Math.round(
+                              match.prob_draw * 100
+                            )}% - V ${Math.round(match.prob_away * 100)}%`}
+                          </p>
+                        ) : null}
                         {canShowMatchStats(match) ? (
                           <p className="text-[10px] text-muted">Ver puntos</p>
                         ) : null}
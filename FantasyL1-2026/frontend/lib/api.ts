@@ -21,6 +21,7 @@ import {
   LineupSlot,
   LineupOut,
   League,
+  LeaderboardPage,
   Player,
   PlayerPriceHistoryPoint,
   PlayerStatsEntry,
@@ -28,6 +29,7 @@ import {
   PublicMarket,
   RankingResponse,
   RoundInfo,
+  TeamRounds,
   MatchPlayerStat,
   NotificationDevice,
   NotificationDevicePlatform,
@@ -996,6 +998,26 @@ export async function getRankingGeneral(token?: string): Promise<RankingResponse
   return apiFetch("/ranking/general", {}, token);
 }
 
+export async function getRankingLeaderboard(
+  limit = 50,
+  afterRank?: number | null,
+  token?: string
+): Promise<LeaderboardPage> {
+  const query = afterRank != null ? `&after_rank=${afterRank}` : "";
+  return apiFetch(`/ranking/leaderboard?limit=${limit}${query}`, {}, token);
+}
+
+export async function getRankingAroundMe(token: string, radius = 5): Promise<LeaderboardPage> {
+  return apiFetch(`/ranking/leaderboard/me?radius=${radius}`, {}, token);
+}
+
+export async function getRankingTeamRounds(
+  token: string | undefined,
+  fantasyTeamId: number
+): Promise<TeamRounds> {
+  return apiFetch(`/ranking/team/${fantasyTeamId}/rounds`, {}, token);
+}
+
 export async function getPublicLeaderboard(
   limit = 25,
   seasonYear = 2026
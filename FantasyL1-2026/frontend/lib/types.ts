@@ -65,6 +65,11 @@ export type Fixture = {
   status: "Programado" | "Postergado" | "Finalizado";
   home_score?: number | null;
   away_score?: number | null;
+  expected_home_goals?: number | null;
+  expected_away_goals?: number | null;
+  prob_home?: number | null;
+  prob_draw?: number | null;
+  prob_away?: number | null;
 };
 
 export type RoundInfo = {
@@ -421,6 +426,7 @@ export type RankingRound = {
 };
 
 export type RankingEntry = {
+  rank?: number | null;
   fantasy_team_id: number;
   team_name: string;
   total_points: number;
@@ -429,6 +435,28 @@ export type RankingEntry = {
   rounds: RankingRound[];
 };
 
+export type LeaderboardEntry = {
+  rank: number;
+  fantasy_team_id: number;
+  team_name: string;
+  total_points: number;
+  captain_player_id?: number | null;
+  favorite_team_id?: number | null;
+};
+
+export type LeaderboardPage = {
+  total_teams: number;
+  captain_source_round_number?: number | null;
+  next_after_rank?: number | null;
+  entries: LeaderboardEntry[];
+};
+
+export type TeamRounds = {
+  fantasy_team_id: number;
+  rank?: number | null;
+  rounds: RankingRound[];
+};
+
 export type RankingResponse = {
   round_numbers: number[];
   captain_source_round_number?: number | null;
@@ -483,6 +511,7 @@ export type PublicLeaderboardEntry = {
 export type PublicLeaderboard = {
   season_year: number;
   limit: number;
+  next_after_rank?: number | null;
   entries: PublicLeaderboardEntry[];
 };
 
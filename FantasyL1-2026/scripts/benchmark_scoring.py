@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+BACKEND_DIR = BASE_DIR / "backend"
+sys.path.append(str(BACKEND_DIR))
+
+# Scores synthetic rows in memory; settings only need to load.
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("JWT_SECRET", "benchmark")
+os.environ.setdefault("ADMIN_TOKEN", "benchmark")
+
+from app.services.batch_scoring import (  # noqa: E402
+    MatchStatColumns,
+    aggregate_round_totals,
+    score_match_columns,
+)
+from app.services.scoring import calc_match_points  # noqa: E402
+
+
+def _synthetic_rows(rounds: int, players: int, rng: random.Random) -> list[tuple]:
+    # Shaped like a Liga 1 season: every player appears once per round, 18 clubs in 9 fixtures.
+    rows = []
+    for round_id in range(1, rounds + 1):
+        scores = {club: (rng.randint(0, 3), rng.randint(0, 3)) for club in range(1, 19, 2)}
+        for player_id in range(1, players + 1):
+            club = player_id % 18 + 1
+            home = club if club % 2 else club - 1
+            home_score, away_score = scores[home]
+            rows.append(
+                (
+                    round_id,
+                    player_id,
+                    rng.choice([0, 20, 60, 90]),
+                    rng.choice([0, 0, 0, 1, 2]),
+                    rng.choice([0, 0, 1]),
+                    rng.randint(0, 6),
+                    rng.randint(0, 5),
+                    rng.choice([0, 0, 1]),
+                    rng.choice([0, 0, 0, 1]),
+                    None,
+                    None,
+                    "GDMF"[player_id % 4],
+                    club,
+                    home,
+                    home + 1,
+                    home_score,
+                    away_score,
+                )
+            )
+    return rows
+
+
+def _reference(rows: list[tuple]) -> dict[tuple[int, int], float]:
+    points: dict[tuple[int, int], float] = {}
+    for row in rows:
+        player = SimpleNamespace(position=row[11], team_id=row[12])
+        stat = SimpleNamespace(
+            minutesplayed=row[2],
+            goals=row[3],
+            assists=row[4],
+            saves=row[5],
+            fouls=row[6],
+            yellow_cards=row[7],
+            red_cards=row[8],
+            clean_sheet=row[9],
+            goals_conceded=row[10],
+        )
+        fixture = SimpleNamespace(home_team_id=row[13], away_team_id=row[14], home_score=row[15], away_score=row[16])
+        value, _, _ = calc_match_points(player, stat, fixture)
+        points[(row[0], row[1])] = points.get((row[0], row[1]), 0.0) + value
+    return points
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time vectorized season scoring against calc_match_points.")
+    parser.add_argument("--rounds", type=int, default=38)
+    parser.add_argument("--players", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rows = _synthetic_rows(args.rounds, args.players, random.Random(args.seed))
+    columns = MatchStatColumns.from_rows(rows)
+
+    started = time.perf_counter()
+    round_ids, player_ids, points, _ = aggregate_round_totals(columns, score_match_columns(columns))
+    vectorized = time.perf_counter() - started
+
+    started = time.perf_counter()
+    expected = _reference(rows)
+    reference = time.perf_counter() - started
+
+    mismatches = sum(
+        1
+        for round_id, player_id, value in zip(round_ids, player_ids, points)
+        if expected[(int(round_id), int(player_id))] != value
+    )
+    print(f"rows: {len(rows):,}")
+    print(f"vectorized score + aggregate: {vectorized * 1000:.1f} ms")
+    print(f"calc_match_points loop: {reference * 1000:.1f} ms ({reference / vectorized:.1f}x)")
+    print(f"mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+BACKEND_DIR = BASE_DIR / "backend"
+sys.path.append(str(BACKEND_DIR))
+
+# Runs against an in-memory SQLite catalog; no Postgres needed.
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("JWT_SECRET", "benchmark")
+os.environ.setdefault("ADMIN_TOKEN", "benchmark")
+
+from sqlalchemy import create_engine, select  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.db.base import Base  # noqa: E402
+from app.models import AppConfig, PlayerCatalog, Team  # noqa: E402
+from app.services.catalog_snapshot import catalog_snapshots  # noqa: E402
+from app.services.response_cache import response_cache  # noqa: E402
+from app.services.validation import validate_squad  # noqa: E402
+
+SQUAD_SHAPE = {"G": 2, "D": 5, "M": 5, "F": 3}
+
+
+def _seed(db: Session, players: int, clubs: int, rng: random.Random) -> dict[str, list[int]]:
+    db.add_all(Team(id=club, name_short=f"C{club}") for club in range(1, clubs + 1))
+    by_position: dict[str, list[int]] = {position: [] for position in SQUAD_SHAPE}
+    positions = list(SQUAD_SHAPE)
+    for player_id in range(1, players + 1):
+        position = positions[player_id % len(positions)]
+        by_position[position].append(player_id)
+        db.add(
+            PlayerCatalog(
+                player_id=player_id,
+                name=f"Jugador {player_id}",
+                position=position,
+                team_id=rng.randint(1, clubs),
+                price_current=round(rng.uniform(4.0, 12.0), 1),
+            )
+        )
+    db.commit()
+    return by_position
+
+
+def _random_squads(by_position: dict[str, list[int]], count: int, rng: random.Random) -> list[list[int]]:
+    return [
+        [player_id for position, size in SQUAD_SHAPE.items() for player_id in rng.sample(by_position[position], size)]
+        for _ in range(count)
+    ]
+
+
+def _per_second(count: int, seconds: float) -> float:
+    return count / seconds if seconds > 0 else float("inf")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time squad validation against the in-process catalog snapshot.")
+    parser.add_argument("--players", type=int, default=600, help="Catalog size")
+    parser.add_argument("--clubs", type=int, default=18, help="Number of clubs")
+    parser.add_argument("--validations", type=int, default=20000, help="Squads to validate")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[AppConfig.__table__, Team.__table__, PlayerCatalog.__table__])
+    response_cache.clear()
+    catalog_snapshots.clear()
+
+    with Session(engine) as db:
+        squads = _random_squads(_seed(db, args.players, args.clubs, rng), args.validations, rng)
+
+        started = time.perf_counter()
+        validate_squad(db, squads[0])
+        cold = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for squad in squads:
+            validate_squad(db, squad)
+        snapshot_seconds = time.perf_counter() - started
+
+        # What every validation used to pay before any checks ran: one catalog query per squad.
+        sample = squads[: min(len(squads), 2000)]
+        started = time.perf_counter()
+        for squad in sample:
+            db.execute(select(PlayerCatalog).where(PlayerCatalog.player_id.in_(squad))).scalars().all()
+        query_seconds = time.perf_counter() - started
+
+    print(f"snapshot build: {cold * 1000:.1f} ms for {args.players} players")
+    print(f"snapshot validation: {_per_second(len(squads), snapshot_seconds):,.0f} squads/s")
+    print(f"catalog query alone (previous path): {_per_second(len(sample), query_seconds):,.0f} squads/s (SQLite, no network)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import argparse
 import logging
 import sys
 from pathlib import Path
@@ -14,6 +15,9 @@ from app.services.data_pipeline import ingest_parquets_to_duckdb
 logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load the parquet bundle into DuckDB, skipping unchanged files.")
+    parser.add_argument("--force", action="store_true", help="Re-ingest every file even if unchanged.")
+    args = parser.parse_args()
     settings = get_settings()
-    ingest_parquets_to_duckdb(settings)
-    print("duckdb_ingest_ok")
+    result = ingest_parquets_to_duckdb(settings, force=args.force)
+    print(f"duckdb_ingest_ok ingested={len(result['ingested'])} skipped={len(result['skipped'])}")
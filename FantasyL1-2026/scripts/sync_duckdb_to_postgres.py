@@ -15,5 +15,5 @@ logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
 
 if __name__ == "__main__":
     settings = get_settings()
-    sync_duckdb_to_postgres(settings)
-    print("duckdb_sync_ok")
+    result = sync_duckdb_to_postgres(settings)
+    print(f"duckdb_sync_ok {result}")
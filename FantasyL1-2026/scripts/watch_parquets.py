@@ -14,7 +14,7 @@ sys.path.append(str(BACKEND_DIR))
 sys.path.append(str(SCRIPTS_DIR))
 
 from app.core.config import get_settings
-from app.services.data_pipeline import ingest_parquets_to_duckdb, sync_duckdb_to_postgres
+from app.services.data_pipeline import catalog_sync_pending, ingest_parquets_to_duckdb, sync_duckdb_to_postgres
 
 try:
     from create_empty_matches_2026 import main as ensure_empty_matches_2026
@@ -35,10 +35,14 @@ def snapshot_parquets(path: Path) -> Dict[str, Tuple[int, int]]:
     return state
 
 
-def run_pipeline(settings) -> None:
+def run_pipeline(settings, always_sync: bool = False) -> None:
     if ensure_empty_matches_2026:
         ensure_empty_matches_2026()
     ingest_parquets_to_duckdb(settings)
+    # Compared against the last committed sync, not this ingest: a sync that failed earlier is retried.
+    if not always_sync and not catalog_sync_pending(settings):
+        logging.info("watch_bundle_unchanged_skip_sync")
+        return
     sync_duckdb_to_postgres(settings)
 
 
@@ -75,7 +79,7 @@ def main() -> None:
 
     if args.run_on_start:
         logging.info("watch_run_start")
-        run_pipeline(settings)
+        run_pipeline(settings, always_sync=True)
         state = snapshot_parquets(watch_dir)
 
     pending = False
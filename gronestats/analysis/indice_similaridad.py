@@ -2,13 +2,16 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 
+from gronestats.stats import player_stats
+
 # === CONFIG ===
 FILE = Path(r"data\Jugadores_Datos_totales_Liga 1 Peru_2025.xlsx")
 NORIEGA_ID = 1020375
 
 # ---------- utilidades ----------
 def per90(s, minutes):
-    return s * 90 / minutes.replace(0, np.nan)
+    # NaN stats stay NaN so nanpercentile skips them instead of counting a zero.
+    return player_stats.per90(s, minutes, fill=np.nan, keep_nan=True)
 
 def preparar_datos(df):
     df = df.copy()
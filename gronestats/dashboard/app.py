@@ -7,6 +7,7 @@ from gronestats.dashboard.config import APP_SUBTITLE, APP_TITLE, DEFAULT_DASHBOA
 from gronestats.dashboard.data import (
     build_team_options,
     describe_active_scope,
+    enable_shared_frame_views,
     load_consolidated_season_overview,
     load_dashboard_data,
     load_season_catalog,
@@ -30,6 +31,7 @@ from gronestats.dashboard.views.shared import inject_base_styles, render_action_
 
 
 st.set_page_config(page_title=f"{APP_TITLE} | Dashboard", page_icon=":soccer:", layout="wide")
+enable_shared_frame_views()
 inject_base_styles()
 
 catalog_signature = season_catalog_signature()
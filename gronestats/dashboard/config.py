@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from pathlib import Path
+
 from gronestats.data_layout import league_data_root, repository_root
 
 APP_TITLE = "GroneStatz"
@@ -20,6 +22,27 @@ REGULAR_SEASON_MAX_ROUND = 20
 ROUND_RANGE_FALLBACK = (1, REGULAR_SEASON_MAX_ROUND)
 TOP_FORM_TEAMS = 5
 RECENT_FORM_MATCHES = 5
+SIMILAR_PLAYERS_LIMIT = 8
+
+
+def published_season_count(data_root: Path) -> int:
+    if not data_root.is_dir():
+        return 0
+    return sum(1 for path in data_root.iterdir() if path.is_dir() and path.name.isdigit())
+
+
+# Every published season stays loaded so switching seasons never evicts and rebuilds a bundle.
+# memory_harness puts one season bundle at roughly 55-215 MB of RSS (2026 partial to 2023 full),
+# so the five seasons published today cost about 0.8 GB per process at most.
+DASHBOARD_CACHE_MAX_SEASONS = max(5, published_season_count(DATA_ROOT))
+DASHBOARD_SCOPE_CACHE_ENTRIES = 16
+DASHBOARD_MATCH_STATS_CACHE_ENTRIES = 64
+
+FIGURE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+FIGURE_CACHE_DISK_MAX_BYTES = 512 * 1024 * 1024
+FIGURE_CACHE_DPI = 144
+FIGURE_CACHE_DIR_ENV = "GRONESTATS_FIGURE_CACHE_DIR"
+PRERENDERED_ASSETS_DIRNAME = "assets"
 
 TOURNAMENT_LABELS = {
     "Liga 1, Apertura": "Apertura",
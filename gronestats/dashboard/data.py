@@ -10,6 +10,8 @@ import streamlit as st
 
 from gronestats.data_layout import season_layout
 from gronestats.dashboard.config import (
+    BASE_DIR,
+    DASHBOARD_CACHE_MAX_SEASONS,
     DATA_ROOT,
     DEFAULT_SEASON_YEAR,
     DEFAULT_DASHBOARD_TOURNAMENTS,
@@ -22,6 +24,9 @@ from gronestats.dashboard.config import (
     build_season_label,
 )
 from gronestats.dashboard.models import ConsolidatedSeasonOverview, DatasetBundle, FilterState, SeasonDataset
+from gronestats.season_catalog import CATALOG_SCHEMA_VERSION, LEAGUE_CATALOG_INDEX_FILENAME, build_league_catalog_index
+from gronestats.stats.heatmap_grid import bin_heatmap_points
+from gronestats.stats.shot_coordinates import add_shot_coordinate_columns
 
 
 DASHBOARD_TABLES = (
@@ -33,15 +38,29 @@ DASHBOARD_TABLES = (
     "team_stats.parquet",
     "average_positions.parquet",
     "heatmap_points.parquet",
+    "heatmap_grid.parquet",
     "shot_events.parquet",
     "match_momentum.parquet",
+    "team_form.parquet",
+    "player_form.parquet",
+    "team_ratings.parquet",
+    "match_probabilities.parquet",
+    "season_projections.parquet",
 )
 
 
 def read_parquet(path: Path, *, columns: list[str] | None = None) -> pd.DataFrame:
     if not path.exists():
         return pd.DataFrame()
-    return pd.read_parquet(path, columns=columns)
+    return pd.read_parquet(path, columns=columns, memory_map=True)
+
+
+def enable_shared_frame_views() -> None:
+    # The season bundle is shared by every session; with copy-on-write, per-session
+    # filters and derived columns stay lazy views and never write into the cached frames.
+    # pandas >= 3 always behaves this way and deprecates the option.
+    if int(pd.__version__.split(".", 1)[0]) < 3:
+        pd.set_option("mode.copy_on_write", True)
 
 
 def read_json(path: Path) -> dict[str, Any]:
@@ -329,7 +348,17 @@ def normalize_heatmap_points(df: pd.DataFrame) -> pd.DataFrame:
     for column in ["x", "y"]:
         if column in work.columns:
             work[column] = pd.to_numeric(work[column], errors="coerce")
-    return work.sort_values(["match_id", "player_id"], kind="mergesort").reset_index(drop=True)
+    return work.sort_values(["player_id", "match_id"], kind="mergesort").reset_index(drop=True)
+
+
+def normalize_heatmap_grid(df: pd.DataFrame) -> pd.DataFrame:
+    if df.empty:
+        return df
+    work = df.copy()
+    for column in ["match_id", "player_id", "team_id", "cell_x", "cell_y", "points_count"]:
+        if column in work.columns:
+            work[column] = pd.to_numeric(work[column], errors="coerce").astype("Int64")
+    return work.sort_values(["player_id", "match_id"], kind="mergesort").reset_index(drop=True)
 
 
 def normalize_shot_events(df: pd.DataFrame) -> pd.DataFrame:
@@ -360,6 +389,7 @@ def normalize_shot_events(df: pd.DataFrame) -> pd.DataFrame:
     for column in ["shot_type", "incident_type", "goal_type", "situation", "body_part", "team_name", "name"]:
         if column in work.columns:
             work[column] = work[column].astype("string").str.strip()
+    work = add_shot_coordinate_columns(work)
     sort_columns = [column for column in ["match_id", "time_seconds", "time", "shot_id"] if column in work.columns]
     if sort_columns:
         work = work.sort_values(sort_columns, kind="mergesort")
@@ -384,6 +414,18 @@ def normalize_match_momentum(df: pd.DataFrame) -> pd.DataFrame:
     return work.reset_index(drop=True)
 
 
+def normalize_form_table(df: pd.DataFrame, key: str) -> pd.DataFrame:
+    # Published snapshots (current form, ratings): one row per team, player or match, keyed for direct lookups.
+    if df.empty or key not in df.columns:
+        return pd.DataFrame()
+    work = df.copy()
+    for column in [key, "team_id", "last_match_id"]:
+        if column in work.columns:
+            work[column] = pd.to_numeric(work[column], errors="coerce").astype("Int64")
+    work = work.dropna(subset=[key]).drop_duplicates(subset=[key], keep="last")
+    return work.set_index(work[key].astype("int64"), drop=False).rename_axis(None)
+
+
 def filter_regular_season_matches(matches: pd.DataFrame) -> pd.DataFrame:
     if matches.empty:
         return matches
@@ -469,7 +511,15 @@ def season_parquet_signature(season_year: int) -> tuple[tuple[str, float], ...]:
     return tuple(files)
 
 
-def season_catalog_signature() -> tuple[tuple[int, tuple[tuple[str, float], ...]], ...]:
+def league_catalog_index_path() -> Path:
+    return DATA_ROOT / LEAGUE_CATALOG_INDEX_FILENAME
+
+
+def season_catalog_signature() -> tuple[Any, ...]:
+    # Published releases keep a league-level index up to date, so one stat detects any publish.
+    index_path = league_catalog_index_path()
+    if index_path.exists():
+        return ((LEAGUE_CATALOG_INDEX_FILENAME, index_path.stat().st_mtime),)
     if not DATA_ROOT.exists():
         return tuple()
 
@@ -482,35 +532,33 @@ def season_catalog_signature() -> tuple[tuple[int, tuple[tuple[str, float], ...]
     return tuple(sorted(signatures, key=lambda item: item[0], reverse=True))
 
 
-def _discover_available_seasons() -> list[SeasonDataset]:
-    seasons: list[SeasonDataset] = []
+@st.cache_data(show_spinner=False)
+def load_league_catalog_index(signature: tuple[Any, ...]) -> dict[str, Any]:
+    index = read_json(league_catalog_index_path())
+    if index.get("schema_version") == CATALOG_SCHEMA_VERSION:
+        return index
     if not DATA_ROOT.exists():
-        return seasons
-
-    for season_dir in DATA_ROOT.iterdir():
-        if not season_dir.is_dir() or not season_dir.name.isdigit():
-            continue
-        season_year = int(season_dir.name)
-        current_dir = season_layout(season_year, league=LEAGUE_NAME).dashboard.current_dir
-        if not (current_dir / "matches.parquet").exists():
-            continue
-        manifest = read_json(current_dir / "manifest.json")
-        validation = read_json(current_dir / "validation.json")
-        seasons.append(
-            SeasonDataset(
-                season_year=season_year,
-                season_label=build_season_label(season_year),
-                data_dir=current_dir,
-                manifest=manifest,
-                validation=validation,
-            )
-        )
-    return sorted(seasons, key=lambda item: item.season_year, reverse=True)
+        return {"seasons": []}
+    return build_league_catalog_index(LEAGUE_NAME, repo_root=BASE_DIR)
 
 
 @st.cache_data(show_spinner=False)
-def load_season_catalog(_signature: tuple[tuple[int, tuple[tuple[str, float], ...]], ...]) -> tuple[SeasonDataset, ...]:
-    return tuple(_discover_available_seasons())
+def load_season_catalog(signature: tuple[Any, ...]) -> tuple[SeasonDataset, ...]:
+    seasons = [
+        SeasonDataset(
+            season_year=int(entry["season_year"]),
+            season_label=build_season_label(int(entry["season_year"])),
+            data_dir=season_current_dir(int(entry["season_year"])),
+            manifest={"release_id": entry.get("release_id"), "ended_at": entry.get("ended_at")},
+            validation={
+                "status": entry.get("validation_status", "unknown"),
+                "validated_at": entry.get("validated_at"),
+                "warnings": list(entry.get("warnings", [])),
+            },
+        )
+        for entry in load_league_catalog_index(signature).get("seasons", [])
+    ]
+    return tuple(sorted(seasons, key=lambda item: item.season_year, reverse=True))
 
 
 def resolve_default_season_year(seasons: tuple[SeasonDataset, ...] | list[SeasonDataset]) -> int:
@@ -529,114 +577,49 @@ def resolve_season_dataset(
     return None
 
 
-def _top_scorer(player_match: pd.DataFrame) -> tuple[str, int]:
-    if player_match.empty:
-        return ("Sin datos", 0)
-
-    work = player_match.copy()
-    if "player_id" in work.columns:
-        work["player_id"] = pd.to_numeric(work["player_id"], errors="coerce").astype("Int64")
-    if "goals" not in work.columns:
-        work["goals"] = 0
-    work["goals"] = pd.to_numeric(work["goals"], errors="coerce").fillna(0)
-    if "name" not in work.columns:
-        work["name"] = pd.NA
-    work["name"] = work["name"].astype("string").str.strip()
-    work = work.loc[work["player_id"].notna() & work["name"].notna()].copy()
-    if work.empty:
-        return ("Sin datos", 0)
-
-    scorers = (
-        work.groupby(["player_id", "name"], dropna=False)["goals"]
-        .sum()
-        .reset_index()
-        .sort_values(["goals", "name"], ascending=[False, True], kind="mergesort")
-        .reset_index(drop=True)
-    )
-    leader = scorers.iloc[0]
-    return (str(leader["name"]), int(leader["goals"]))
-
-
 @st.cache_data(show_spinner=False)
-def load_consolidated_season_overview(
-    _signature: tuple[tuple[int, tuple[tuple[str, float], ...]], ...],
-) -> ConsolidatedSeasonOverview:
-    seasons = load_season_catalog(_signature)
+def load_consolidated_season_overview(signature: tuple[Any, ...]) -> ConsolidatedSeasonOverview:
+    index = load_league_catalog_index(signature)
+    seasons = load_season_catalog(signature)
+    season_lookup = {dataset.season_year: dataset for dataset in seasons}
     rows: list[dict[str, Any]] = []
-    unique_player_ids: set[int] = set()
-    total_matches = 0
-    total_goals = 0
-    passed_seasons = 0
-    warning_seasons = 0
-
-    for dataset in seasons:
-        matches = read_parquet(dataset.data_dir / "matches.parquet", columns=["match_id", "home_score", "away_score"])
-        teams = read_parquet(dataset.data_dir / "teams.parquet", columns=["team_id"])
-        players = read_parquet(dataset.data_dir / "players.parquet", columns=["player_id"])
-        player_match = read_parquet(dataset.data_dir / "player_match.parquet", columns=["player_id", "name", "goals"])
-
-        if "player_id" in players.columns:
-            unique_player_ids.update(
-                pd.to_numeric(players["player_id"], errors="coerce").dropna().astype(int).tolist()
-            )
-
-        match_count = int(matches["match_id"].nunique()) if "match_id" in matches.columns else 0
-        team_count = int(teams["team_id"].nunique()) if "team_id" in teams.columns else 0
-        player_count = int(players["player_id"].nunique()) if "player_id" in players.columns else 0
-        goals = 0
-        if not matches.empty:
-            home_goals = pd.to_numeric(matches.get("home_score"), errors="coerce").fillna(0)
-            away_goals = pd.to_numeric(matches.get("away_score"), errors="coerce").fillna(0)
-            goals = int((home_goals + away_goals).sum())
-        goals_per_match = round(goals / match_count, 2) if match_count else 0.0
-        top_scorer_name, top_scorer_goals = _top_scorer(player_match)
-        validated_at = dataset.validation.get("validated_at") or dataset.manifest.get("ended_at")
-
-        total_matches += match_count
-        total_goals += goals
-        if dataset.validation_status == "passed":
-            passed_seasons += 1
-        if dataset.warning_count:
-            warning_seasons += 1
-
+    for entry in index.get("seasons", []):
+        dataset = season_lookup[int(entry["season_year"])]
         rows.append(
             {
                 "season_year": dataset.season_year,
                 "season_label": dataset.season_label,
-                "matches": match_count,
-                "teams": team_count,
-                "players": player_count,
-                "goals": goals,
-                "goals_per_match": goals_per_match,
+                "matches": int(entry.get("matches", 0)),
+                "teams": int(entry.get("teams", 0)),
+                "players": int(entry.get("players", 0)),
+                "goals": int(entry.get("goals", 0)),
+                "goals_per_match": float(entry.get("goals_per_match", 0.0)),
                 "validation_status": dataset.validation_status,
                 "warning_count": dataset.warning_count,
                 "coverage_label": dataset.coverage_label,
-                "release_id": dataset.manifest.get("release_id", "-"),
-                "validated_at": validated_at,
-                "top_scorer": top_scorer_name,
-                "top_scorer_goals": top_scorer_goals,
+                "release_id": entry.get("release_id") or "-",
+                "validated_at": entry.get("validated_at") or entry.get("ended_at"),
+                "top_scorer": entry.get("top_scorer", "Sin datos"),
+                "top_scorer_goals": int(entry.get("top_scorer_goals", 0)),
             }
         )
 
     seasons_table = pd.DataFrame(rows)
     if not seasons_table.empty:
         seasons_table = seasons_table.sort_values("season_year", ascending=False).reset_index(drop=True)
-    goals_per_match = round(total_goals / total_matches, 2) if total_matches else 0.0
     return ConsolidatedSeasonOverview(
         total_seasons=len(seasons),
-        total_matches=total_matches,
-        total_players=len(unique_player_ids),
-        total_goals=total_goals,
-        goals_per_match=goals_per_match,
-        passed_seasons=passed_seasons,
-        warning_seasons=warning_seasons,
+        total_matches=int(index.get("total_matches", 0)),
+        total_players=int(index.get("total_players", 0)),
+        total_goals=int(index.get("total_goals", 0)),
+        goals_per_match=float(index.get("goals_per_match", 0.0)),
+        passed_seasons=sum(1 for dataset in seasons if dataset.validation_status == "passed"),
+        warning_seasons=sum(1 for dataset in seasons if dataset.warning_count),
         seasons_table=seasons_table,
     )
 
 
-@st.cache_data(show_spinner=False)
-def load_dashboard_data(season_year: int, _signature: tuple[tuple[str, float], ...]) -> DatasetBundle:
-    data_dir = season_current_dir(season_year)
+def build_dashboard_bundle(data_dir: Path, season_year: int) -> DatasetBundle:
     manifest = read_json(data_dir / "manifest.json")
     validation = read_json(data_dir / "validation.json")
     matches = normalize_matches(read_parquet(data_dir / "matches.parquet"))
@@ -655,10 +638,13 @@ def load_dashboard_data(season_year: int, _signature: tuple[tuple[str, float], .
         normalize_average_positions(read_parquet(data_dir / "average_positions.parquet")),
         allowed_match_ids,
     )
-    heatmap_points = filter_by_match_ids(
-        normalize_heatmap_points(read_parquet(data_dir / "heatmap_points.parquet")),
-        allowed_match_ids,
-    )
+    # Releases with a pre-binned grid skip the raw heatmap points entirely.
+    heatmap_grid_path = data_dir / "heatmap_grid.parquet"
+    if heatmap_grid_path.exists():
+        heatmap_grid = normalize_heatmap_grid(read_parquet(heatmap_grid_path))
+    else:
+        heatmap_grid = bin_heatmap_points(normalize_heatmap_points(read_parquet(data_dir / "heatmap_points.parquet")))
+    heatmap_grid = filter_by_match_ids(heatmap_grid, allowed_match_ids)
     shot_events = filter_by_match_ids(
         normalize_shot_events(read_parquet(data_dir / "shot_events.parquet")),
         allowed_match_ids,
@@ -667,6 +653,12 @@ def load_dashboard_data(season_year: int, _signature: tuple[tuple[str, float], .
         normalize_match_momentum(read_parquet(data_dir / "match_momentum.parquet")),
         allowed_match_ids,
     )
+    # Current form is maintained incrementally by the pipeline; older releases simply lack it.
+    team_form = normalize_form_table(read_parquet(data_dir / "team_form.parquet"), "team_id")
+    player_form = normalize_form_table(read_parquet(data_dir / "player_form.parquet"), "player_id")
+    team_ratings = normalize_form_table(read_parquet(data_dir / "team_ratings.parquet"), "team_id")
+    match_probabilities = normalize_form_table(read_parquet(data_dir / "match_probabilities.parquet"), "match_id")
+    season_projections = normalize_form_table(read_parquet(data_dir / "season_projections.parquet"), "team_id")
     return DatasetBundle(
         season_year=season_year,
         season_label=build_season_label(season_year),
@@ -678,7 +670,7 @@ def load_dashboard_data(season_year: int, _signature: tuple[tuple[str, float], .
         player_totals=player_totals,
         team_stats=team_stats,
         average_positions=average_positions,
-        heatmap_points=heatmap_points,
+        heatmap_points=pd.DataFrame(),
         validation_status=str(validation.get("status", "unknown")),
         validation_warnings=tuple(validation.get("warnings", [])),
         manifest=manifest,
@@ -686,9 +678,22 @@ def load_dashboard_data(season_year: int, _signature: tuple[tuple[str, float], .
         loaded_at=datetime.now(),
         shot_events=shot_events,
         match_momentum=match_momentum,
+        heatmap_grid=heatmap_grid,
+        team_form=team_form,
+        player_form=player_form,
+        team_ratings=team_ratings,
+        match_probabilities=match_probabilities,
+        season_projections=season_projections,
     )
 
 
+@st.cache_resource(show_spinner=False, max_entries=DASHBOARD_CACHE_MAX_SEASONS)
+def load_dashboard_data(season_year: int, signature: tuple[tuple[str, float], ...]) -> DatasetBundle:
+    # One immutable bundle per process and release signature; sessions share it without
+    # the pickle round-trip st.cache_data performs on every read.
+    return build_dashboard_bundle(season_current_dir(season_year), season_year)
+
+
 def _find_image(entity_id: int | str | None, directory: Path) -> Path | None:
     if entity_id is None:
         return None
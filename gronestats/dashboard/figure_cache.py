@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Callable
+
+from matplotlib import pyplot as plt
+import streamlit as st
+
+from gronestats.dashboard.config import (
+    FIGURE_CACHE_DIR_ENV,
+    FIGURE_CACHE_DISK_MAX_BYTES,
+    FIGURE_CACHE_DPI,
+    FIGURE_CACHE_MAX_BYTES,
+)
+
+
+FIGURE_FORMATS = ("png", "svg", "json")
+
+
+@dataclass(frozen=True)
+class FigureCacheKey:
+    release_id: str
+    chart: str
+    entity: str
+    scope: str
+    theme: str
+    fmt: str = "png"
+
+    @property
+    def digest(self) -> str:
+        payload = "|".join([self.release_id, self.chart, self.entity, self.scope, self.theme, self.fmt])
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def render_figure_bytes(fig: Any, fmt: str = "png", *, dpi: int = FIGURE_CACHE_DPI) -> bytes:
+    if fmt not in FIGURE_FORMATS:
+        raise ValueError(f"Unsupported figure format '{fmt}'. Expected one of {FIGURE_FORMATS}.")
+    if fmt == "json":
+        # Plotly figures keep their interactivity by caching the figure spec instead of an image.
+        return fig.to_json().encode("utf-8")
+    buffer = BytesIO()
+    try:
+        fig.savefig(buffer, format=fmt, dpi=dpi, facecolor=fig.get_facecolor(), bbox_inches="tight")
+    finally:
+        plt.close(fig)
+    return buffer.getvalue()
+
+
+def prerendered_asset_path(assets_dir: Path, key: FigureCacheKey) -> Path:
+    return assets_dir / f"{key.digest}.{key.fmt}"
+
+
+def read_prerendered_asset(assets_dir: Path | None, key: FigureCacheKey) -> bytes | None:
+    if assets_dir is None:
+        return None
+    path = prerendered_asset_path(assets_dir, key)
+    if not path.exists():
+        return None
+    try:
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+class FigureCache:
+    def __init__(
+        self,
+        *,
+        max_bytes: int = FIGURE_CACHE_MAX_BYTES,
+        disk_dir: Path | None = None,
+        disk_max_bytes: int = FIGURE_CACHE_DISK_MAX_BYTES,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = disk_max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _disk_path(self, key: FigureCacheKey) -> Path | None:
+        if self.disk_dir is None:
+            return None
+        return self.disk_dir / key.release_id / f"{key.digest}.{key.fmt}"
+
+    def _remember(self, digest: str, payload: bytes) -> None:
+        if len(payload) > self.max_bytes:
+            return
+        previous = self._entries.pop(digest, None)
+        if previous is not None:
+            self._size -= len(previous)
+        self._entries[digest] = payload
+        self._size += len(payload)
+        while self._size > self.max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    def _read_disk(self, key: FigureCacheKey) -> bytes | None:
+        path = self._disk_path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            payload = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            return None
+        return payload
+
+    def _write_disk(self, key: FigureCacheKey, payload: bytes) -> None:
+        path = self._disk_path(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(f"{path.suffix}.tmp")
+            temp_path.write_bytes(payload)
+            temp_path.replace(path)
+            self._prune_disk()
+        except OSError:
+            return
+
+    def _prune_disk(self) -> None:
+        if self.disk_dir is None:
+            return
+        files = [path for path in self.disk_dir.rglob("*") if path.is_file() and path.suffix.lstrip(".") in FIGURE_FORMATS]
+        stats = [(path, path.stat()) for path in files]
+        total = sum(stat.st_size for _, stat in stats)
+        for path, stat in sorted(stats, key=lambda item: item[1].st_mtime):
+            if total <= self.disk_max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
+
+    def get(self, key: FigureCacheKey) -> bytes | None:
+        with self._lock:
+            payload = self._entries.get(key.digest)
+            if payload is not None:
+                self._entries.move_to_end(key.digest)
+                self.hits += 1
+                return payload
+        payload = self._read_disk(key)
+        with self._lock:
+            if payload is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key.digest, payload)
+        return payload
+
+    def put(self, key: FigureCacheKey, payload: bytes) -> None:
+        with self._lock:
+            self._remember(key.digest, payload)
+        self._write_disk(key, payload)
+
+    def get_or_render(
+        self,
+        key: FigureCacheKey,
+        build: Callable[[], Any],
+        *,
+        assets_dir: Path | None = None,
+    ) -> bytes:
+        payload = self.get(key)
+        if payload is None:
+            payload = read_prerendered_asset(assets_dir, key)
+            if payload is not None:
+                with self._lock:
+                    self._remember(key.digest, payload)
+                return payload
+            payload = render_figure_bytes(build(), key.fmt)
+            self.put(key, payload)
+        return payload
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+@st.cache_resource(show_spinner=False)
+def get_figure_cache() -> FigureCache:
+    disk_dir = os.getenv(FIGURE_CACHE_DIR_ENV, "").strip()
+    return FigureCache(disk_dir=Path(disk_dir) if disk_dir else None)
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from gronestats.dashboard.config import DASHBOARD_MATCH_STATS_CACHE_ENTRIES
+from gronestats.dashboard.scope_cache import ScopeCache
+
+
+MATCH_STAT_GROUP_ORDER = [
+    "Match overview",
+    "Shots",
+    "Attack",
+    "Passes",
+    "Defending",
+    "Duels",
+    "Goalkeeping",
+    "Discipline",
+]
+
+
+def format_stat_values(values: pd.Series, is_percent: pd.Series | bool = False) -> pd.Series:
+    numeric = pd.to_numeric(values, errors="coerce").astype("float64")
+    percent = pd.Series(is_percent, index=numeric.index, dtype=bool) if np.isscalar(is_percent) else is_percent.astype(bool)
+    rounded = numeric.round(2)
+    is_integer = rounded.notna() & (rounded == np.floor(rounded))
+    formatted = pd.Series("-", index=numeric.index, dtype="object")
+    decimals = numeric.notna() & ~is_integer
+    formatted[decimals] = rounded[decimals].astype(str)
+    formatted[is_integer] = rounded[is_integer].astype("int64").astype(str)
+    percent_mask = numeric.notna() & percent
+    formatted[percent_mask] = numeric[percent_mask].round(0).astype("int64").astype(str) + "%"
+    return formatted
+
+
+def clean_stat_labels(frame: pd.DataFrame) -> pd.Series:
+    names = frame["name"].astype("string") if "name" in frame.columns else pd.Series(pd.NA, index=frame.index, dtype="string")
+    keys = frame["KEY"].astype("string").str.strip().fillna("") if "KEY" in frame.columns else pd.Series("", index=frame.index, dtype="string")
+    from_key = keys.str.replace(r"(?<!^)([A-Z])", r" \1", regex=True).str.strip().str.capitalize()
+    from_key = from_key.where(keys != "", "Sin etiqueta")
+    return names.fillna(from_key).astype(object)
+
+
+def is_percent_stats(frame: pd.DataFrame) -> pd.Series:
+    render_type = pd.to_numeric(frame.get("RENDERTYPE", pd.Series(index=frame.index, dtype="float64")), errors="coerce").fillna(0)
+    keys = frame["KEY"].astype("string").fillna("").str.lower() if "KEY" in frame.columns else pd.Series("", index=frame.index, dtype="string")
+    return (
+        (render_type == 2)
+        | keys.str.contains("percent", regex=False)
+        | (keys == "ballpossession")
+    ).astype(bool)
+
+
+def prepare_match_stats(team_stats: pd.DataFrame) -> pd.DataFrame:
+    if team_stats.empty or "match_id" not in team_stats.columns:
+        return pd.DataFrame()
+    work = team_stats.dropna(subset=["match_id"]).copy()
+    if work.empty:
+        return pd.DataFrame()
+    for column in ["GROUP", "KEY", "name"]:
+        if column not in work.columns:
+            work[column] = pd.NA
+    work["group_label"] = work["GROUP"].astype("string").fillna("Otros").astype(object)
+    group_positions = {label: position for position, label in enumerate(MATCH_STAT_GROUP_ORDER)}
+    work["group_rank"] = work["group_label"].map(group_positions).fillna(len(MATCH_STAT_GROUP_ORDER)).astype("int64")
+    work["home_value"] = work["HOMEVALUE"].where(work["HOMEVALUE"].notna(), work.get("HOMETOTAL")) if "HOMEVALUE" in work.columns else work.get("HOMETOTAL")
+    work["away_value"] = work["AWAYVALUE"].where(work["AWAYVALUE"].notna(), work.get("AWAYTOTAL")) if "AWAYVALUE" in work.columns else work.get("AWAYTOTAL")
+    work["is_percent"] = is_percent_stats(work)
+    work["Grupo"] = work["group_label"]
+    work["Metrica"] = clean_stat_labels(work)
+    work["Local"] = format_stat_values(work["home_value"], work["is_percent"])
+    work["Visita"] = format_stat_values(work["away_value"], work["is_percent"])
+    work["match_id"] = pd.to_numeric(work["match_id"], errors="coerce").astype("int64")
+    # Stable sort keeps the published row order (ALL before 1ST/2ND periods) inside each stat.
+    return work.sort_values(["match_id", "group_rank", "group_label", "name", "KEY"], kind="mergesort").reset_index(drop=True)
+
+
+@dataclass(frozen=True)
+class MatchStatsIndex:
+    frame: pd.DataFrame
+    offsets: dict[int, tuple[int, int]]
+    # Per-match memos; the index lives on a DatasetBundle shared by every session.
+    _lookups: ScopeCache = field(default_factory=ScopeCache, repr=False, compare=False)
+    _groups: ScopeCache = field(default_factory=ScopeCache, repr=False, compare=False)
+
+    @classmethod
+    def from_frame(cls, team_stats: pd.DataFrame) -> MatchStatsIndex:
+        prepared = prepare_match_stats(team_stats)
+        if prepared.empty:
+            return cls(frame=prepared, offsets={})
+        match_ids = prepared["match_id"].to_numpy()
+        unique_ids, starts = np.unique(match_ids, return_index=True)
+        ends = np.append(starts[1:], len(match_ids))
+        offsets = {int(match_id): (int(start), int(end)) for match_id, start, end in zip(unique_ids, starts, ends)}
+        return cls(frame=prepared, offsets=offsets)
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.offsets
+
+    def match_rows(self, match_id: int) -> pd.DataFrame:
+        bounds = self.offsets.get(int(match_id))
+        if bounds is None:
+            return pd.DataFrame()
+        return self.frame.iloc[bounds[0] : bounds[1]]
+
+    def lookup(self, match_id: int) -> pd.DataFrame:
+        return self._lookups.get_or_build(
+            int(match_id), lambda: self._build_lookup(match_id), DASHBOARD_MATCH_STATS_CACHE_ENTRIES
+        )
+
+    def grouped(self, match_id: int) -> OrderedDict[str, pd.DataFrame]:
+        return self._groups.get_or_build(
+            int(match_id), lambda: self._build_groups(match_id), DASHBOARD_MATCH_STATS_CACHE_ENTRIES
+        )
+
+    def _build_lookup(self, match_id: int) -> pd.DataFrame:
+        rows = self.match_rows(match_id)
+        return pd.DataFrame() if rows.empty else rows.drop_duplicates(subset=["KEY"], keep="first").set_index("KEY", drop=False)
+
+    def _build_groups(self, match_id: int) -> OrderedDict[str, pd.DataFrame]:
+        rows = self.match_rows(match_id)
+        groups: OrderedDict[str, pd.DataFrame] = OrderedDict()
+        if not rows.empty:
+            rows = rows.drop_duplicates(subset=["GROUP", "KEY"], keep="first")
+            group_labels = rows["Grupo"].dropna().astype(str).unique().tolist()
+            ordered_groups = [label for label in MATCH_STAT_GROUP_ORDER if label in group_labels]
+            ordered_groups.extend(sorted(label for label in group_labels if label not in MATCH_STAT_GROUP_ORDER))
+            for group in ordered_groups:
+                groups[group] = rows[rows["Grupo"] == group][["Metrica", "Local", "Visita", "KEY"]].reset_index(drop=True)
+        return groups
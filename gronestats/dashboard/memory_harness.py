@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import multiprocessing
+import pickle
+from typing import Any, Callable
+
+import psutil
+
+from gronestats.dashboard.data import build_dashboard_bundle, enable_shared_frame_views, season_current_dir
+from gronestats.dashboard.metrics import apply_match_filters, build_player_visual_matches
+from gronestats.dashboard.models import DatasetBundle, FilterState
+
+
+SESSION_STRATEGIES = ("cache_data", "cache_resource")
+
+
+def current_rss_bytes() -> int:
+    return int(psutil.Process().memory_info().rss)
+
+
+def _session_bundle(shared: DatasetBundle, strategy: str) -> DatasetBundle:
+    if strategy == "cache_data":
+        # st.cache_data hands every reader its own unpickled copy of the cached value.
+        return pickle.loads(pickle.dumps(shared, protocol=pickle.HIGHEST_PROTOCOL))
+    if strategy == "cache_resource":
+        return shared
+    raise ValueError(f"Unsupported session strategy '{strategy}'. Expected one of {SESSION_STRATEGIES}.")
+
+
+def _session_views(bundle: DatasetBundle) -> dict[str, Any]:
+    matches = bundle.matches
+    rounds = matches["round_number"].dropna() if "round_number" in matches.columns else matches.iloc[0:0]
+    round_range = (int(rounds.min()), int(rounds.max())) if len(rounds) else (1, 1)
+    filters = FilterState(round_range=round_range, min_minutes=0)
+    filtered_matches = apply_match_filters(matches, filters)
+    player_ids = list(bundle.heatmap_index.offsets)[:1] if bundle.heatmap_index is not None else []
+    return {
+        "matches": filtered_matches,
+        "player_match": bundle.player_match[bundle.player_match["match_id"].isin(filtered_matches["match_id"])]
+        if "match_id" in bundle.player_match.columns
+        else bundle.player_match,
+        "visual_matches": [build_player_visual_matches(bundle, filters, player_id) for player_id in player_ids],
+    }
+
+
+def simulate_sessions(
+    load_bundle: Callable[[], DatasetBundle],
+    sessions: int,
+    *,
+    strategy: str,
+) -> list[dict[str, Any]]:
+    gc.collect()
+    baseline = current_rss_bytes()
+    shared = load_bundle()
+    held: list[tuple[DatasetBundle, dict[str, Any]]] = []
+    samples: list[dict[str, Any]] = []
+    for session_index in range(1, sessions + 1):
+        bundle = _session_bundle(shared, strategy)
+        held.append((bundle, _session_views(bundle)))
+        gc.collect()
+        rss = current_rss_bytes()
+        samples.append(
+            {
+                "strategy": strategy,
+                "sessions": session_index,
+                "rss_mb": round(rss / 1024 / 1024, 1),
+                "delta_mb": round((rss - baseline) / 1024 / 1024, 1),
+                "distinct_bundles": len({id(item[0]) for item in held}),
+            }
+        )
+    return samples
+
+
+def _measure_in_fresh_process(season_year: int, sessions: int, strategy: str) -> list[dict[str, Any]]:
+    enable_shared_frame_views()
+    data_dir = season_current_dir(season_year)
+    return simulate_sessions(lambda: build_dashboard_bundle(data_dir, season_year), sessions, strategy=strategy)
+
+
+def measure_rss_by_sessions(season_year: int, sessions: int, strategies: tuple[str, ...] = SESSION_STRATEGIES) -> list[dict[str, Any]]:
+    samples: list[dict[str, Any]] = []
+    context = multiprocessing.get_context("spawn")
+    for strategy in strategies:
+        # Each strategy starts from a clean interpreter so allocator state does not leak between runs.
+        with context.Pool(processes=1) as pool:
+            samples.extend(pool.apply(_measure_in_fresh_process, (season_year, sessions, strategy)))
+    return samples
+
+
+def format_samples(samples: list[dict[str, Any]]) -> str:
+    lines = [f"{'strategy':<16}{'sessions':>10}{'rss_mb':>10}{'delta_mb':>10}{'bundles':>9}"]
+    for sample in samples:
+        lines.append(
+            f"{sample['strategy']:<16}{sample['sessions']:>10}{sample['rss_mb']:>10.1f}"
+            f"{sample['delta_mb']:>10.1f}{sample['distinct_bundles']:>9}"
+        )
+    return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Measure dashboard RSS against concurrent session count.")
+    parser.add_argument("--season", type=int, required=True)
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--strategy", choices=(*SESSION_STRATEGIES, "all"), default="all")
+    parser.add_argument("--json", action="store_true", help="Print raw samples as JSON instead of a table.")
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    strategies = SESSION_STRATEGIES if args.strategy == "all" else (args.strategy,)
+    samples = measure_rss_by_sessions(args.season, args.sessions, strategies)
+    print(json.dumps(samples, indent=2) if args.json else format_samples(samples))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
-import ast
 from collections import OrderedDict
-import json
 import re
 
+import numpy as np
 import pandas as pd
 
-from gronestats.dashboard.config import COLORS, DEFAULT_DASHBOARD_TOURNAMENTS, PREFERRED_MATCH_STATS, RECENT_FORM_MATCHES, REGULAR_SEASON_MAX_ROUND, TOP_FORM_TEAMS
+from gronestats.dashboard.config import COLORS, DASHBOARD_SCOPE_CACHE_ENTRIES, DEFAULT_DASHBOARD_TOURNAMENTS, PREFERRED_MATCH_STATS, RECENT_FORM_MATCHES, REGULAR_SEASON_MAX_ROUND, SIMILAR_PLAYERS_LIMIT, TOP_FORM_TEAMS
+from gronestats.dashboard.match_stats import MatchStatsIndex
 from gronestats.dashboard.models import DatasetBundle, FilterState, LeagueOverview, MatchSummary, PlayerProfile, TeamProfile
+from gronestats.stats.player_stats import per90, per_match, percentile_ranks
+from gronestats.stats.shot_coordinates import add_shot_coordinate_columns
+from gronestats.stats.team_stats import goal_difference, match_points, match_results
 
 
 PLAYER_TOTAL_COLUMNS = [
@@ -23,22 +26,26 @@ PLAYER_TOTAL_COLUMNS = [
     "penaltyconceded",
 ]
 
+PLAYER_PERCENTILE_METRICS = {
+    "G": [
+        ("Atajadas / 90", "saves_per90"),
+        ("Minutos", "minutesplayed"),
+        ("Partidos", "matches_played"),
+    ],
+    "default": [
+        ("Goles / 90", "goals_per90"),
+        ("Asistencias / 90", "assists_per90"),
+        ("Acciones de gol / 90", "goal_actions_per90"),
+        ("Minutos", "minutesplayed"),
+    ],
+}
+PLAYER_PERCENTILE_COLUMNS = list(dict.fromkeys(column for metrics in PLAYER_PERCENTILE_METRICS.values() for _, column in metrics))
+
 PLAYER_AVERAGE_POSITION_MODE = "Mostrar solo posicion promedio"
 PLAYER_HEATMAP_MODE = "Mostrar solo heatmap"
 PLAYER_CONTEXTUAL_SCOPE = "Partido contextual"
 PLAYER_ACCUMULATED_SCOPE = "Acumulado del tramo regular"
 
-MATCH_STAT_GROUP_ORDER = [
-    "Match overview",
-    "Shots",
-    "Attack",
-    "Passes",
-    "Defending",
-    "Duels",
-    "Goalkeeping",
-    "Discipline",
-]
-
 HEX_COLOR_PATTERN = re.compile(r"^#[0-9a-fA-F]{6}$")
 
 
@@ -71,22 +78,6 @@ def _resolve_team_color(teams: pd.DataFrame, team_id: int | None, fallback: str)
     return _normalize_team_color(subset.iloc[0], fallback)
 
 
-def _is_percent_stat(row: pd.Series) -> bool:
-    render_type = pd.to_numeric(pd.Series([row.get("RENDERTYPE")]), errors="coerce").fillna(0).iloc[0]
-    key = str(row.get("KEY", "")).lower()
-    return bool(render_type == 2 or "percent" in key or "percentage" in key or key == "ballpossession")
-
-
-def _clean_stat_label(row: pd.Series) -> str:
-    label = row.get("name")
-    if pd.notna(label):
-        return str(label)
-    key = str(row.get("KEY", "")).strip()
-    if not key:
-        return "Sin etiqueta"
-    return re.sub(r"(?<!^)([A-Z])", r" \1", key).strip().capitalize()
-
-
 def _has_usable_text(value: object) -> bool:
     if value is None or pd.isna(value):
         return False
@@ -200,39 +191,21 @@ def _format_pair(home_value: object, away_value: object, is_percent: bool = Fals
     return f"{_format_stat_value(home_value, is_percent=is_percent)} vs {_format_stat_value(away_value, is_percent=is_percent)}"
 
 
-def _group_rank(value: object) -> tuple[int, str]:
-    label = str(value) if pd.notna(value) else "Otros"
-    try:
-        return (MATCH_STAT_GROUP_ORDER.index(label), label)
-    except ValueError:
-        return (len(MATCH_STAT_GROUP_ORDER), label)
-
-
-def _build_match_stat_subset(team_stats: pd.DataFrame, match_id: int) -> pd.DataFrame:
-    if team_stats.empty:
-        return pd.DataFrame()
-    subset = team_stats[team_stats["match_id"] == match_id].copy()
-    if subset.empty:
-        return pd.DataFrame()
-    subset["group_rank"] = subset["GROUP"].map(lambda value: _group_rank(value)[0])
-    subset["group_label"] = subset["GROUP"].fillna("Otros").astype(str)
-    return subset.sort_values(["group_rank", "group_label", "name", "KEY"], kind="mergesort").reset_index(drop=True)
+def _match_stats_index(team_stats: pd.DataFrame | MatchStatsIndex) -> MatchStatsIndex:
+    if isinstance(team_stats, MatchStatsIndex):
+        return team_stats
+    return MatchStatsIndex.from_frame(team_stats)
 
 
-def _build_match_stat_lookup(team_stats: pd.DataFrame, match_id: int) -> pd.DataFrame:
-    subset = _build_match_stat_subset(team_stats, match_id)
-    if subset.empty:
-        return pd.DataFrame()
-    return subset.drop_duplicates(subset=["KEY"], keep="first").set_index("KEY", drop=False)
+def _build_match_stat_lookup(team_stats: pd.DataFrame | MatchStatsIndex, match_id: int) -> pd.DataFrame:
+    return _match_stats_index(team_stats).lookup(match_id)
 
 
 def _get_match_stat_pair(lookup: pd.DataFrame, key: str) -> tuple[object, object]:
     if lookup.empty or key not in lookup.index:
         return (pd.NA, pd.NA)
     row = lookup.loc[key]
-    home_value = row["HOMEVALUE"] if pd.notna(row.get("HOMEVALUE")) else row.get("HOMETOTAL")
-    away_value = row["AWAYVALUE"] if pd.notna(row.get("AWAYVALUE")) else row.get("AWAYTOTAL")
-    return (home_value, away_value)
+    return (row["home_value"], row["away_value"])
 
 
 def apply_round_filter(matches: pd.DataFrame, round_range: tuple[int, int]) -> pd.DataFrame:
@@ -288,9 +261,9 @@ def build_team_match_rows(matches: pd.DataFrame) -> pd.DataFrame:
         }
     )
     rows = pd.concat([home, away], ignore_index=True)
-    rows["goal_difference"] = rows["goals_for"] - rows["goals_against"]
-    rows["result"] = rows["goal_difference"].map(lambda value: "W" if value > 0 else "D" if value == 0 else "L")
-    rows["points"] = rows["result"].map({"W": 3, "D": 1, "L": 0}).astype(int)
+    rows["goal_difference"] = goal_difference(rows["goals_for"], rows["goals_against"]).astype(int)
+    rows["result"] = match_results(rows["goals_for"], rows["goals_against"])
+    rows["points"] = match_points(rows["goals_for"], rows["goals_against"]).astype(int)
     rows["fixture_label"] = rows["team_name"] + " vs " + rows["opponent_name"]
     return rows.sort_values(["fecha_dt", "match_id", "team_name"]).reset_index(drop=True)
 
@@ -339,14 +312,13 @@ def calculate_team_splits(team_rows: pd.DataFrame) -> pd.DataFrame:
         .reset_index()
     )
     for column, numerator in [("ppg", "points"), ("gf_pg", "goals_for"), ("ga_pg", "goals_against")]:
-        splits[column] = (splits[numerator] / splits["matches"].replace(0, pd.NA)).fillna(0).round(2)
+        splits[column] = per_match(splits[numerator], splits["matches"]).round(2)
     return splits
 
 
 def add_per90_metrics(frame: pd.DataFrame) -> pd.DataFrame:
     work = frame.copy()
     minutes = pd.to_numeric(work.get("minutesplayed", 0), errors="coerce").fillna(0).astype(float)
-    base = minutes.div(90).replace(0, pd.NA)
     per90_map = {
         "goals_per90": "goals",
         "assists_per90": "assists",
@@ -362,7 +334,7 @@ def add_per90_metrics(frame: pd.DataFrame) -> pd.DataFrame:
             )
         else:
             values = pd.to_numeric(work.get(source, 0), errors="coerce").fillna(0)
-        work[output] = values.astype(float).div(base).astype("Float64").fillna(0.0).round(2)
+        work[output] = per90(values.astype(float), minutes).astype("Float64").round(2)
     return work
 
 
@@ -456,6 +428,38 @@ def build_base_player_stats(bundle: DatasetBundle, filters: FilterState) -> pd.D
     return aggregate_player_stats(bundle.player_match, bundle.players, bundle.teams, match_ids=match_ids)
 
 
+def _cached_scope(bundle: DatasetBundle, key: tuple[object, ...], build):
+    # Bundles are shared across sessions, so only the most recent scopes are kept.
+    return bundle.scope_cache.get_or_build(key, build, DASHBOARD_SCOPE_CACHE_ENTRIES)
+
+
+def build_player_percentile_table(player_stats: pd.DataFrame) -> pd.DataFrame:
+    if player_stats.empty:
+        return pd.DataFrame(columns=["player_id", *PLAYER_PERCENTILE_COLUMNS])
+    # Every metric is ranked inside its position cohort once per scope; players without a
+    # position are ranked against the whole scope.
+    zeros = pd.Series(0.0, index=player_stats.index)
+    table = pd.DataFrame(
+        {
+            column: percentile_ranks(player_stats.get(column, zeros), player_stats["position"]) * 100
+            for column in PLAYER_PERCENTILE_COLUMNS
+        },
+        index=player_stats.index,
+    ).round(0)
+    table.insert(0, "player_id", player_stats["player_id"].astype(int).to_numpy())
+    return table.drop_duplicates(subset=["player_id"]).set_index("player_id")
+
+
+def build_player_scope(bundle: DatasetBundle, filters: FilterState) -> tuple[pd.DataFrame, pd.DataFrame]:
+    def build() -> tuple[pd.DataFrame, pd.DataFrame]:
+        player_stats = _filter_presentable_players(build_base_player_stats(bundle, filters))
+        if not player_stats.empty:
+            player_stats = player_stats[player_stats["minutesplayed"] >= filters.min_minutes].reset_index(drop=True)
+        return player_stats, build_player_percentile_table(player_stats)
+
+    return _cached_scope(bundle, ("players", filters), build)
+
+
 def build_leaderboards(player_stats: pd.DataFrame) -> dict[str, pd.DataFrame]:
     if player_stats.empty:
         return OrderedDict()
@@ -493,15 +497,118 @@ def build_leaderboards(player_stats: pd.DataFrame) -> dict[str, pd.DataFrame]:
     return leaders
 
 
-def build_top_team_form(matches: pd.DataFrame) -> pd.DataFrame:
-    team_rows = build_team_match_rows(matches)
+def build_form_snapshot(form_table: pd.DataFrame, entity_id: int) -> dict[str, object]:
+    if form_table.empty or int(entity_id) not in form_table.index:
+        return {}
+    return form_table.loc[int(entity_id)].to_dict()
+
+
+def describe_form(form: dict[str, object]) -> str:
+    # One-line summary of a published team or player form snapshot for profile captions.
+    if not form:
+        return ""
+    matches = _safe_int(form.get("form_matches", 0))
+    if "form_sequence" in form:
+        streak_labels = {"W": "victorias", "D": "empates", "L": "derrotas"}
+        streak = streak_labels.get(_safe_text(form.get("streak_result"), ""), "partidos")
+        return (
+            f"Racha actual: {_safe_int(form.get('streak_length', 0))} {streak} | "
+            f"Ultimos {matches}: {_safe_int(form.get('form_points', 0))} pts "
+            f"({_safe_int(form.get('form_goals_for', 0))}-{_safe_int(form.get('form_goals_against', 0))}) | "
+            f"Forma ponderada: {_safe_float(form.get('ewm_points')):.2f} pts/partido"
+        )
+    parts = [
+        f"Ultimos {matches} partidos: {_safe_int(form.get('form_goals', 0))} goles, "
+        f"{_safe_int(form.get('form_assists', 0))} asistencias, {_safe_int(form.get('form_minutesplayed', 0))} min"
+    ]
+    rating = form.get("ewm_rating")
+    if rating is not None and pd.notna(rating):
+        parts.append(f"Rating ponderado: {_safe_float(rating):.2f}")
+    if _safe_int(form.get("scoring_streak", 0)) > 1:
+        parts.append(f"Marca en {_safe_int(form.get('scoring_streak', 0))} partidos seguidos")
+    return " | ".join(parts)
+
+
+def describe_rating(rating: dict[str, object]) -> str:
+    # Published Poisson/Elo strength of a team, as of its latest rated match.
+    if not rating:
+        return ""
+    elo_change = _safe_float(rating.get("elo_change"))
+    return (
+        f"Ranking de fuerza: #{_safe_int(rating.get('net_rank', 0))} | "
+        f"Elo {_safe_float(rating.get('elo')):.0f} ({elo_change:+.0f}) | "
+        f"Goles esperados ante un rival promedio: {_safe_float(rating.get('expected_goals_for')):.2f} a favor, "
+        f"{_safe_float(rating.get('expected_goals_against')):.2f} en contra"
+    )
+
+
+def describe_match_probabilities(probabilities: dict[str, object], home_name: str, away_name: str) -> str:
+    # Pre-match outlook from the ratings fitted on results before kickoff.
+    if not probabilities:
+        return ""
+    return (
+        f"Previa del modelo: {home_name} {_safe_float(probabilities.get('p_home')):.0%} | "
+        f"Empate {_safe_float(probabilities.get('p_draw')):.0%} | "
+        f"{away_name} {_safe_float(probabilities.get('p_away')):.0%} | "
+        f"Goles esperados {_safe_float(probabilities.get('expected_home_goals')):.2f}-"
+        f"{_safe_float(probabilities.get('expected_away_goals')):.2f}"
+    )
+
+
+def build_season_projection_table(projections: pd.DataFrame) -> pd.DataFrame:
+    # Published Monte Carlo outlook; stage columns only appear once that stage has fixtures.
+    if projections.empty:
+        return pd.DataFrame()
+    columns = {
+        "team_name": "Equipo",
+        "points": "Pts",
+        "matches_remaining": "Por jugar",
+        "expected_points": "Pts esperados",
+        "expected_position": "Pos. esperada",
+        "p_apertura": "Apertura",
+        "p_clausura": "Clausura",
+        "p_aggregate_first": "1ro acumulado",
+        "p_playoff": "Playoff",
+        "p_relegation": "Descenso",
+    }
+    work = projections.reset_index(drop=True)
+    table = work[["team_id"]].copy()
+    for source, label in columns.items():
+        if source not in work.columns or (source.startswith("p_") and work[source].isna().all()):
+            continue
+        values = work[source]
+        if source.startswith("p_"):
+            table[label] = (pd.to_numeric(values, errors="coerce") * 100).round(1)
+        elif source.startswith("expected_"):
+            table[label] = pd.to_numeric(values, errors="coerce").round(1)
+        else:
+            table[label] = values
+    return table
+
+
+def build_top_team_form(matches: pd.DataFrame, team_form: pd.DataFrame | None = None) -> pd.DataFrame:
     standings = calculate_standings(matches)
-    if team_rows.empty or standings.empty:
+    if standings.empty:
         return pd.DataFrame()
 
-    top_team_ids = standings.head(TOP_FORM_TEAMS)["team_id"].tolist()
+    top = standings.head(TOP_FORM_TEAMS)
+    if team_form is not None and not team_form.empty and set(top["team_id"].astype(int)).issubset(team_form.index):
+        # Season-wide scope: the pipeline already publishes each team's last-N results.
+        sequences = team_form.loc[top["team_id"].astype(int), "form_sequence"].fillna("").astype(str)
+        return pd.DataFrame(
+            {
+                "team_id": top["team_id"].to_numpy(),
+                "team_name": top["team_name"].to_numpy(),
+                "Pts": top["Pts"].astype(int).to_numpy(),
+                "GF": top["GF"].astype(int).to_numpy(),
+                "GC": top["GC"].astype(int).to_numpy(),
+                "Form": [list(sequence[-RECENT_FORM_MATCHES:]) for sequence in sequences],
+            }
+        )
+
+    team_rows = build_team_match_rows(matches)
     records: list[dict[str, object]] = []
-    for team_id in top_team_ids:
+    for team_id in top["team_id"].tolist():
         subset = team_rows[team_rows["team_id"] == team_id].sort_values(["fecha_dt", "match_id"])
         if subset.empty:
             continue
@@ -603,12 +710,13 @@ def build_league_overview(bundle: DatasetBundle, filters: FilterState) -> League
         standings=standings,
         goals_by_round=goals_by_round,
         venue_goals=venue_goals,
-        form_table=build_top_team_form(matches),
+        form_table=build_top_team_form(matches, bundle.team_form if len(matches) == len(bundle.matches) else None),
         leaders=build_leaderboards(player_stats),
         top_matches=build_top_matches(matches),
         standings_tables=tuple(standings_tables),
         grand_final_results=grand_final_results,
         grand_final_only=grand_final_only,
+        projections=build_season_projection_table(bundle.season_projections) if len(matches) == len(bundle.matches) else pd.DataFrame(),
     )
 
 
@@ -681,6 +789,8 @@ def build_team_profile(bundle: DatasetBundle, filters: FilterState, team_id: int
         splits=calculate_team_splits(team_rows),
         top_players=top_players,
         comparison=comparison,
+        form=build_form_snapshot(bundle.team_form, team_id),
+        rating=build_form_snapshot(bundle.team_ratings, team_id),
     )
 
 
@@ -690,23 +800,8 @@ def build_player_visual_matches(bundle: DatasetBundle, filters: FilterState, pla
         return pd.DataFrame()
 
     match_ids = set(filtered_matches["match_id"].dropna().astype(int).tolist())
-    average_match_ids = set()
-    heatmap_match_ids = set()
-
-    if not bundle.average_positions.empty:
-        average_match_ids = set(
-            bundle.average_positions[
-                (bundle.average_positions["player_id"] == player_id)
-                & (bundle.average_positions["match_id"].isin(match_ids))
-            ]["match_id"].dropna().astype(int).tolist()
-        )
-    if not bundle.heatmap_points.empty:
-        heatmap_match_ids = set(
-            bundle.heatmap_points[
-                (bundle.heatmap_points["player_id"] == player_id)
-                & (bundle.heatmap_points["match_id"].isin(match_ids))
-            ]["match_id"].dropna().astype(int).tolist()
-        )
+    average_match_ids = bundle.average_position_index.player_match_ids(player_id, match_ids)
+    heatmap_match_ids = bundle.heatmap_index.player_match_ids(player_id, match_ids)
 
     visual_ids = sorted(average_match_ids | heatmap_match_ids)
     if not visual_ids:
@@ -763,12 +858,9 @@ def _build_player_contextual_average_position(
     if visual_match_id is None:
         return None
 
-    if bundle.average_positions.empty:
+    if bundle.average_position_index.is_empty:
         return None
-    average_subset = bundle.average_positions[
-        (bundle.average_positions["player_id"] == player_id)
-        & (bundle.average_positions["match_id"] == visual_match_id)
-    ].copy()
+    average_subset = bundle.average_position_index.player_rows(player_id, {visual_match_id})
     if average_subset.empty:
         return None
     return average_subset.iloc[0]
@@ -780,13 +872,9 @@ def _build_player_contextual_heatmap(
     player_id: int,
     visual_match_id: int | None,
 ) -> pd.DataFrame:
-    if bundle.heatmap_points.empty or visual_match_id is None:
+    if bundle.heatmap_index.is_empty or visual_match_id is None:
         return pd.DataFrame()
-    heatmap_points = bundle.heatmap_points[
-        (bundle.heatmap_points["player_id"] == player_id)
-        & (bundle.heatmap_points["match_id"] == visual_match_id)
-    ].copy()
-    return heatmap_points.sort_values(["match_id"], kind="mergesort").reset_index(drop=True)
+    return bundle.heatmap_index.player_rows(player_id, {visual_match_id}).reset_index(drop=True)
 
 
 def _build_player_accumulated_heatmap(
@@ -795,7 +883,7 @@ def _build_player_accumulated_heatmap(
     *,
     player_id: int,
 ) -> pd.DataFrame:
-    if bundle.heatmap_points.empty:
+    if bundle.heatmap_index.is_empty:
         return pd.DataFrame()
 
     filtered_matches = apply_regular_season_filters(bundle.matches, filters)
@@ -806,11 +894,7 @@ def _build_player_accumulated_heatmap(
     if not match_ids:
         return pd.DataFrame()
 
-    heatmap_points = bundle.heatmap_points[
-        (bundle.heatmap_points["player_id"] == player_id)
-        & (bundle.heatmap_points["match_id"].isin(match_ids))
-    ].copy()
-    return heatmap_points.sort_values(["match_id"], kind="mergesort").reset_index(drop=True)
+    return bundle.heatmap_index.player_rows(player_id, match_ids).reset_index(drop=True)
 
 
 def _build_player_accumulated_average_position(
@@ -819,7 +903,7 @@ def _build_player_accumulated_average_position(
     *,
     player_id: int,
 ) -> pd.Series | None:
-    if bundle.average_positions.empty:
+    if bundle.average_position_index.is_empty:
         return None
 
     filtered_matches = apply_regular_season_filters(bundle.matches, filters)
@@ -829,10 +913,7 @@ def _build_player_accumulated_average_position(
     if not match_ids:
         return None
 
-    subset = bundle.average_positions[
-        (bundle.average_positions["player_id"] == player_id)
-        & (bundle.average_positions["match_id"].isin(match_ids))
-    ].copy()
+    subset = bundle.average_position_index.player_rows(player_id, match_ids).copy()
     if subset.empty:
         return None
 
@@ -914,23 +995,8 @@ def _build_player_accumulated_visual_coverage(
         }
 
     match_ids = set(regular_matches["match_id"].dropna().astype(int).tolist())
-    average_match_ids = set()
-    heatmap_match_ids = set()
-
-    if not bundle.average_positions.empty:
-        average_match_ids = set(
-            bundle.average_positions[
-                (bundle.average_positions["player_id"] == player_id)
-                & (bundle.average_positions["match_id"].isin(match_ids))
-            ]["match_id"].dropna().astype(int).tolist()
-        )
-    if not bundle.heatmap_points.empty:
-        heatmap_match_ids = set(
-            bundle.heatmap_points[
-                (bundle.heatmap_points["player_id"] == player_id)
-                & (bundle.heatmap_points["match_id"].isin(match_ids))
-            ]["match_id"].dropna().astype(int).tolist()
-        )
+    average_match_ids = bundle.average_position_index.player_match_ids(player_id, match_ids)
+    heatmap_match_ids = bundle.heatmap_index.player_match_ids(player_id, match_ids)
 
     average_matches = regular_matches[regular_matches["match_id"].isin(average_match_ids)].copy()
     heatmap_matches = regular_matches[regular_matches["match_id"].isin(heatmap_match_ids)].copy()
@@ -945,17 +1011,17 @@ def _build_player_accumulated_visual_coverage(
 def _resolve_player_visual_defaults(
     *,
     contextual_average_position_row: pd.Series | None,
-    contextual_heatmap_points: pd.DataFrame,
+    contextual_heatmap_grid: pd.DataFrame,
     accumulated_average_position_row: pd.Series | None,
-    accumulated_heatmap_points: pd.DataFrame,
+    accumulated_heatmap_grid: pd.DataFrame,
 ) -> tuple[str, str]:
     if contextual_average_position_row is not None:
         return PLAYER_AVERAGE_POSITION_MODE, PLAYER_CONTEXTUAL_SCOPE
-    if not contextual_heatmap_points.empty:
+    if not contextual_heatmap_grid.empty:
         return PLAYER_HEATMAP_MODE, PLAYER_CONTEXTUAL_SCOPE
     if accumulated_average_position_row is not None:
         return PLAYER_AVERAGE_POSITION_MODE, PLAYER_ACCUMULATED_SCOPE
-    if not accumulated_heatmap_points.empty:
+    if not accumulated_heatmap_grid.empty:
         return PLAYER_HEATMAP_MODE, PLAYER_ACCUMULATED_SCOPE
     return PLAYER_AVERAGE_POSITION_MODE, PLAYER_CONTEXTUAL_SCOPE
 
@@ -967,10 +1033,9 @@ def build_players_table(
     position: str | None = None,
     search: str | None = None,
 ) -> pd.DataFrame:
-    player_stats = _filter_presentable_players(build_base_player_stats(bundle, filters))
+    player_stats, _ = build_player_scope(bundle, filters)
     if player_stats.empty:
-        return player_stats
-    player_stats = player_stats[player_stats["minutesplayed"] >= filters.min_minutes]
+        return player_stats.copy()
     if team_id is not None:
         player_stats = player_stats[player_stats["team_id"] == team_id]
     if position:
@@ -983,6 +1048,31 @@ def build_players_table(
     ).reset_index(drop=True)
 
 
+def build_similar_players(
+    bundle: DatasetBundle,
+    player_id: int,
+    *,
+    limit: int = SIMILAR_PLAYERS_LIMIT,
+    same_position: bool = True,
+) -> pd.DataFrame:
+    index = bundle.similarity_index
+    if index is None or player_id not in index:
+        return pd.DataFrame()
+    similar = index.top_k(int(player_id), limit, same_position=same_position)
+    if similar.empty:
+        return similar
+    if not bundle.teams.empty:
+        team_lookup = bundle.teams[["team_id", "team_name"]].drop_duplicates(subset=["team_id"])
+        team_lookup["team_id"] = pd.to_numeric(team_lookup["team_id"], errors="coerce").astype("Int64")
+        similar = similar.merge(team_lookup, on="team_id", how="left")
+    if "team_name" not in similar.columns:
+        similar["team_name"] = pd.NA
+    similar["similarity_score"] = similar["similarity_score"].round(1)
+    for column in ["goals_per90", "assists_per90", "rating"]:
+        similar[column] = pd.to_numeric(similar[column], errors="coerce").round(2)
+    return similar.rename(columns={"similar_player_id": "player_id"})
+
+
 def build_player_profile(
     bundle: DatasetBundle,
     filters: FilterState,
@@ -991,11 +1081,8 @@ def build_player_profile(
     context_match_id: int | None = None,
     visual_match_id: int | None = None,
 ) -> PlayerProfile | None:
-    player_stats = _filter_presentable_players(build_base_player_stats(bundle, filters))
-    if player_stats.empty:
-        return None
-    player_stats = player_stats[player_stats["minutesplayed"] >= filters.min_minutes].reset_index(drop=True)
-    if player_stats.empty or player_id not in set(player_stats["player_id"].astype(int).tolist()):
+    player_stats, percentile_table = build_player_scope(bundle, filters)
+    if player_stats.empty or player_id not in percentile_table.index:
         return None
 
     selected = player_stats[player_stats["player_id"] == player_id]
@@ -1004,32 +1091,17 @@ def build_player_profile(
     player_row = selected.iloc[0]
     if not _has_usable_text(player_row.get("name")):
         return None
-    cohort = player_stats[player_stats["position"] == player_row["position"]].copy()
-    if cohort.empty:
-        cohort = player_stats.copy()
-
-    if str(player_row["position"]) == "G":
-        metrics = [
-            ("Atajadas / 90", "saves_per90"),
-            ("Minutos", "minutesplayed"),
-            ("Partidos", "matches_played"),
-        ]
-    else:
-        metrics = [
-            ("Goles / 90", "goals_per90"),
-            ("Asistencias / 90", "assists_per90"),
-            ("Acciones de gol / 90", "goal_actions_per90"),
-            ("Minutos", "minutesplayed"),
-        ]
-
-    percentiles = []
-    for label, column in metrics:
-        cohort_values = pd.to_numeric(cohort[column], errors="coerce").fillna(0)
-        ranks = cohort_values.rank(pct=True, method="max")
-        player_index = cohort.index[cohort["player_id"] == player_id]
-        percentile = float((ranks.loc[player_index[0]] * 100).round(0)) if len(player_index) else 0
-        value = float(pd.to_numeric(pd.Series([player_row[column]]), errors="coerce").fillna(0).iloc[0])
-        percentiles.append({"Metric": label, "value": round(value, 2), "percentile": percentile})
+
+    metrics = PLAYER_PERCENTILE_METRICS["G" if str(player_row["position"]) == "G" else "default"]
+    player_percentiles = percentile_table.loc[player_id]
+    percentiles = [
+        {
+            "Metric": label,
+            "value": round(_safe_float(player_row[column]), 2),
+            "percentile": float(player_percentiles[column]),
+        }
+        for label, column in metrics
+    ]
 
     filtered_matches = apply_match_filters(bundle.matches, filters)
     player_recent = bundle.player_match[
@@ -1056,7 +1128,7 @@ def build_player_profile(
         player_id=player_id,
         visual_match_id=contextual_payload_match_id,
     )
-    contextual_heatmap_points = _build_player_contextual_heatmap(
+    contextual_heatmap_grid = _build_player_contextual_heatmap(
         bundle,
         player_id=player_id,
         visual_match_id=contextual_payload_match_id,
@@ -1066,7 +1138,7 @@ def build_player_profile(
         filters,
         player_id=player_id,
     )
-    accumulated_heatmap_points = _build_player_accumulated_heatmap(
+    accumulated_heatmap_grid = _build_player_accumulated_heatmap(
         bundle,
         filters,
         player_id=player_id,
@@ -1077,9 +1149,9 @@ def build_player_profile(
     }
     default_visual_mode, default_visual_scope = _resolve_player_visual_defaults(
         contextual_average_position_row=contextual_average_position_row,
-        contextual_heatmap_points=contextual_heatmap_points,
+        contextual_heatmap_grid=contextual_heatmap_grid,
         accumulated_average_position_row=accumulated_average_position_row,
-        accumulated_heatmap_points=accumulated_heatmap_points,
+        accumulated_heatmap_grid=accumulated_heatmap_grid,
     )
 
     summary = {
@@ -1105,8 +1177,12 @@ def build_player_profile(
         default_visual_scope=default_visual_scope,
         contextual_average_position_row=contextual_average_position_row,
         accumulated_average_position_row=accumulated_average_position_row,
-        contextual_heatmap_points=contextual_heatmap_points,
-        accumulated_heatmap_points=accumulated_heatmap_points,
+        contextual_heatmap_grid=contextual_heatmap_grid,
+        accumulated_heatmap_grid=accumulated_heatmap_grid,
+        similar_players=build_similar_players(bundle, player_id),
+        form=build_form_snapshot(bundle.player_form, player_id),
+        release_id=bundle.release_id,
+        assets_dir=bundle.assets_dir,
     )
 
 
@@ -1137,7 +1213,7 @@ def build_match_catalog(
     return matches.sort_values(["fecha_dt", "match_id"], ascending=[False, False]).reset_index(drop=True)
 
 
-def build_match_stat_table(team_stats: pd.DataFrame, match_id: int) -> pd.DataFrame:
+def build_match_stat_table(team_stats: pd.DataFrame | MatchStatsIndex, match_id: int) -> pd.DataFrame:
     lookup = _build_match_stat_lookup(team_stats, match_id)
     if lookup.empty:
         return pd.DataFrame()
@@ -1258,36 +1334,8 @@ def build_match_team_average_positions(
     return combined, metadata
 
 
-def build_grouped_match_stats(team_stats: pd.DataFrame, match_id: int) -> OrderedDict[str, pd.DataFrame]:
-    subset = _build_match_stat_subset(team_stats, match_id)
-    if subset.empty:
-        return OrderedDict()
-
-    subset = subset.drop_duplicates(subset=["GROUP", "KEY"], keep="first").copy()
-    subset["Grupo"] = subset["group_label"]
-    subset["Metrica"] = subset.apply(_clean_stat_label, axis=1)
-    subset["Local"] = subset.apply(
-        lambda row: _format_stat_value(
-            row["HOMEVALUE"] if pd.notna(row.get("HOMEVALUE")) else row.get("HOMETOTAL"),
-            is_percent=_is_percent_stat(row),
-        ),
-        axis=1,
-    )
-    subset["Visita"] = subset.apply(
-        lambda row: _format_stat_value(
-            row["AWAYVALUE"] if pd.notna(row.get("AWAYVALUE")) else row.get("AWAYTOTAL"),
-            is_percent=_is_percent_stat(row),
-        ),
-        axis=1,
-    )
-    groups = OrderedDict()
-    group_labels = subset["Grupo"].dropna().astype(str).unique().tolist()
-    ordered_groups = [label for label in MATCH_STAT_GROUP_ORDER if label in group_labels]
-    ordered_groups.extend(sorted(label for label in group_labels if label not in MATCH_STAT_GROUP_ORDER))
-    for group in ordered_groups:
-        frame = subset[subset["Grupo"] == group][["Metrica", "Local", "Visita", "KEY"]].reset_index(drop=True)
-        groups[group] = frame
-    return groups
+def build_grouped_match_stats(team_stats: pd.DataFrame | MatchStatsIndex, match_id: int) -> OrderedDict[str, pd.DataFrame]:
+    return _match_stats_index(team_stats).grouped(match_id)
 
 
 def build_match_player_rows(player_match: pd.DataFrame, match_row: pd.Series) -> pd.DataFrame:
@@ -1331,57 +1379,21 @@ def build_match_player_rows(player_match: pd.DataFrame, match_row: pd.Series) ->
     return subset.drop(columns="_side_order").reset_index(drop=True)
 
 
-def _resolve_event_side(value: object) -> str:
-    if pd.isna(value):
-        return "Sin lado"
-    if isinstance(value, bool):
-        return "Local" if value else "Visita"
-    text = str(value).strip().lower()
-    if text in {"true", "1", "home", "local"}:
-        return "Local"
-    if text in {"false", "0", "away", "visita"}:
-        return "Visita"
-    return "Sin lado"
-
-
-def _parse_goal_mouth_coordinates(value: object) -> tuple[float | None, float | None]:
-    if value is None:
-        return (None, None)
-
-    payload = value
-    if isinstance(value, str):
-        text = value.strip()
-        if not text or text.lower() in {"nan", "none", "<na>"}:
-            return (None, None)
-        payload = None
-        for parser in (ast.literal_eval, json.loads):
-            try:
-                payload = parser(text)
-                break
-            except Exception:
-                continue
-        if payload is None:
-            return (None, None)
-    elif not isinstance(value, (dict, list, tuple)):
-        try:
-            if pd.isna(value):
-                return (None, None)
-        except Exception:
-            return (None, None)
-
-    if isinstance(payload, dict):
-        y_value = payload.get("y")
-        z_value = payload.get("z")
-    elif isinstance(payload, (list, tuple)) and len(payload) >= 2:
-        y_value, z_value = payload[0], payload[1]
-    else:
-        return (None, None)
+EVENT_SIDE_TOKENS = {
+    "true": "Local",
+    "1": "Local",
+    "home": "Local",
+    "local": "Local",
+    "false": "Visita",
+    "0": "Visita",
+    "away": "Visita",
+    "visita": "Visita",
+}
+
 
-    y_numeric = pd.to_numeric(pd.Series([y_value]), errors="coerce").iloc[0]
-    z_numeric = pd.to_numeric(pd.Series([z_value]), errors="coerce").iloc[0]
-    if pd.isna(y_numeric) or pd.isna(z_numeric):
-        return (None, None)
-    return (float(y_numeric), float(z_numeric))
+def _resolve_event_sides(is_home: pd.Series) -> pd.Series:
+    tokens = is_home.astype("string").str.strip().str.lower()
+    return tokens.map(EVENT_SIDE_TOKENS).fillna("Sin lado").astype(object)
 
 
 def build_match_shot_events(shot_events: pd.DataFrame, match_row: pd.Series) -> tuple[pd.DataFrame, dict[str, object]]:
@@ -1398,30 +1410,25 @@ def build_match_shot_events(shot_events: pd.DataFrame, match_row: pd.Series) ->
             subset[column] = pd.to_numeric(subset[column], errors="coerce")
     subset["shot_type_norm"] = subset.get("shot_type", pd.Series(index=subset.index, dtype="object")).astype("string").str.strip().str.lower()
 
-    subset["side"] = subset.get("is_home", pd.Series(index=subset.index, dtype="object")).map(_resolve_event_side)
+    subset["side"] = _resolve_event_sides(subset.get("is_home", pd.Series(index=subset.index, dtype="object")))
     home_id = _safe_optional_int(match_row.get("home_id"))
     away_id = _safe_optional_int(match_row.get("away_id"))
     if "team_id" in subset.columns:
-        team_ids = pd.to_numeric(subset["team_id"], errors="coerce").astype("Int64")
-        subset.loc[subset["side"] == "Sin lado", "side"] = team_ids.map(
-            lambda value: "Local"
-            if pd.notna(value) and home_id is not None and int(value) == home_id
-            else "Visita"
-            if pd.notna(value) and away_id is not None and int(value) == away_id
-            else "Sin lado"
+        team_ids = pd.to_numeric(subset["team_id"], errors="coerce").astype("float64").to_numpy()
+        no_match = np.zeros(len(team_ids), dtype=bool)
+        team_sides = np.select(
+            [
+                team_ids == home_id if home_id is not None else no_match,
+                team_ids == away_id if away_id is not None else no_match,
+            ],
+            ["Local", "Visita"],
+            default="Sin lado",
         )
+        unresolved = (subset["side"] == "Sin lado").to_numpy()
+        subset.loc[unresolved, "side"] = team_sides[unresolved]
 
-    goal_mouth_pairs = subset.get(
-        "goal_mouth_coordinates",
-        pd.Series(index=subset.index, dtype="object"),
-    ).map(_parse_goal_mouth_coordinates)
-    goal_mouth_frame = pd.DataFrame(
-        goal_mouth_pairs.tolist(),
-        index=subset.index,
-        columns=["goal_mouth_y", "goal_mouth_z"],
-    )
-    subset["goal_mouth_y"] = pd.to_numeric(goal_mouth_frame["goal_mouth_y"], errors="coerce")
-    subset["goal_mouth_z"] = pd.to_numeric(goal_mouth_frame["goal_mouth_z"], errors="coerce")
+    # Releases publish numeric goal-mouth columns; only older rows still need their payload parsed.
+    subset = add_shot_coordinate_columns(subset)
 
     raw_x = pd.to_numeric(subset.get("x", pd.Series(index=subset.index, dtype="float64")), errors="coerce")
     raw_y = pd.to_numeric(subset.get("y", pd.Series(index=subset.index, dtype="float64")), errors="coerce")
@@ -1564,7 +1571,11 @@ def build_match_standout_players(player_rows: pd.DataFrame) -> pd.DataFrame:
     return pd.DataFrame(rows)
 
 
-def build_match_insight_cards(match_row: pd.Series, team_stats: pd.DataFrame, standout_players: pd.DataFrame) -> list[dict[str, str]]:
+def build_match_insight_cards(
+    match_row: pd.Series,
+    team_stats: pd.DataFrame | MatchStatsIndex,
+    standout_players: pd.DataFrame,
+) -> list[dict[str, str]]:
     lookup = _build_match_stat_lookup(team_stats, int(match_row["match_id"]))
     possession_home, possession_away = _get_match_stat_pair(lookup, "ballPossession")
     passes_home, passes_away = _get_match_stat_pair(lookup, "passes")
@@ -1702,7 +1713,7 @@ def build_match_summary(
     if matches.empty:
         return None
     match_row = matches.iloc[0]
-    grouped_stats = build_grouped_match_stats(bundle.team_stats, int(match_row["match_id"]))
+    grouped_stats = build_grouped_match_stats(bundle.match_stats_index, int(match_row["match_id"]))
     player_rows = build_match_player_rows(bundle.player_match, match_row)
     standout_players = build_match_standout_players(player_rows)
     shot_events, shot_events_metadata = build_match_shot_events(bundle.shot_events, match_row)
@@ -1721,11 +1732,11 @@ def build_match_summary(
         match_row=match_row,
         home_team_color=home_team_color,
         away_team_color=away_team_color,
-        curated_stats=build_match_stat_table(bundle.team_stats, int(match_row["match_id"])),
+        curated_stats=build_match_stat_table(bundle.match_stats_index, int(match_row["match_id"])),
         grouped_stats=grouped_stats,
         player_rows=player_rows,
         standout_players=standout_players,
-        insight_cards=build_match_insight_cards(match_row, bundle.team_stats, standout_players),
+        insight_cards=build_match_insight_cards(match_row, bundle.match_stats_index, standout_players),
         home_context_matches=build_team_context_matches(filtered_matches, int(match_row["home_id"]), int(match_row["match_id"])),
         away_context_matches=build_team_context_matches(filtered_matches, int(match_row["away_id"]), int(match_row["match_id"])),
         catalog_neighbors=build_catalog_neighbors(catalog, int(match_row["match_id"])),
@@ -1739,4 +1750,7 @@ def build_match_summary(
         goalkeeper_saves=goalkeeper_saves,
         season_has_shot_layer=bundle.has_shot_layer,
         season_has_momentum_layer=bundle.has_momentum_layer,
+        probabilities=build_form_snapshot(bundle.match_probabilities, int(match_row["match_id"])),
+        release_id=bundle.release_id,
+        assets_dir=bundle.assets_dir,
     )
@@ -5,8 +5,15 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
+from gronestats.dashboard.config import PRERENDERED_ASSETS_DIRNAME
+from gronestats.dashboard.match_stats import MatchStatsIndex
+from gronestats.dashboard.scope_cache import ScopeCache
+from gronestats.stats.heatmap_grid import bin_heatmap_points
+from gronestats.stats.similarity import SimilarityIndex, build_similarity_features
+
 
 @dataclass(frozen=True)
 class FilterState:
@@ -15,6 +22,59 @@ class FilterState:
     tournaments: tuple[str, ...] = ()
 
 
+@dataclass(frozen=True)
+class PlayerLayerIndex:
+    frame: pd.DataFrame
+    offsets: dict[int, tuple[int, int]]
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame) -> PlayerLayerIndex:
+        if frame.empty or not {"player_id", "match_id"}.issubset(frame.columns):
+            return cls(frame=frame.iloc[0:0], offsets={})
+
+        work = frame
+        if frame["player_id"].isna().any():
+            work = frame.loc[frame["player_id"].notna()]
+        player_ids = work["player_id"].to_numpy(dtype="int64")
+        match_ids = work["match_id"].to_numpy(dtype="float64", na_value=np.nan)
+        same_player = player_ids[1:] == player_ids[:-1]
+        is_sorted = bool(
+            np.all((player_ids[1:] > player_ids[:-1]) | (same_player & ~(match_ids[1:] < match_ids[:-1])))
+        )
+        if not is_sorted:
+            work = work.sort_values(["player_id", "match_id"], kind="mergesort")
+            player_ids = work["player_id"].to_numpy(dtype="int64")
+        if work is not frame:
+            work = work.reset_index(drop=True)
+
+        unique_ids, starts = np.unique(player_ids, return_index=True)
+        stops = np.append(starts[1:], len(player_ids))
+        offsets = {
+            int(player_id): (int(start), int(stop))
+            for player_id, start, stop in zip(unique_ids.tolist(), starts.tolist(), stops.tolist())
+        }
+        return cls(frame=work, offsets=offsets)
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.offsets
+
+    def player_rows(self, player_id: int, match_ids: set[int] | None = None) -> pd.DataFrame:
+        bounds = self.offsets.get(int(player_id))
+        if bounds is None:
+            return self.frame.iloc[0:0]
+        rows = self.frame.iloc[bounds[0] : bounds[1]]
+        if match_ids is not None:
+            rows = rows.loc[rows["match_id"].isin(match_ids)]
+        return rows
+
+    def player_match_ids(self, player_id: int, match_ids: set[int] | None = None) -> set[int]:
+        rows = self.player_rows(player_id, match_ids)
+        if rows.empty:
+            return set()
+        return set(rows["match_id"].dropna().astype(int).tolist())
+
+
 @dataclass(frozen=True)
 class DatasetBundle:
     season_year: int
@@ -35,6 +95,39 @@ class DatasetBundle:
     loaded_at: datetime
     shot_events: pd.DataFrame = field(default_factory=pd.DataFrame)
     match_momentum: pd.DataFrame = field(default_factory=pd.DataFrame)
+    heatmap_grid: pd.DataFrame = field(default_factory=pd.DataFrame)
+    team_form: pd.DataFrame = field(default_factory=pd.DataFrame)
+    player_form: pd.DataFrame = field(default_factory=pd.DataFrame)
+    team_ratings: pd.DataFrame = field(default_factory=pd.DataFrame)
+    match_probabilities: pd.DataFrame = field(default_factory=pd.DataFrame)
+    season_projections: pd.DataFrame = field(default_factory=pd.DataFrame)
+    heatmap_index: PlayerLayerIndex | None = None
+    average_position_index: PlayerLayerIndex | None = None
+    match_stats_index: MatchStatsIndex | None = None
+    similarity_index: SimilarityIndex | None = None
+    scope_cache: ScopeCache = field(default_factory=ScopeCache, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Heatmaps are rendered from per-match binned counts; raw points are only binned
+        # here when a release predates the published heatmap_grid table.
+        if self.heatmap_grid.empty and not self.heatmap_points.empty:
+            object.__setattr__(self, "heatmap_grid", bin_heatmap_points(self.heatmap_points))
+        # Per-player slices of the positional layers are contiguous views, so profile
+        # lookups avoid boolean masks over the full season frames.
+        if self.heatmap_index is None:
+            object.__setattr__(self, "heatmap_index", PlayerLayerIndex.from_frame(self.heatmap_grid))
+        if self.average_position_index is None:
+            object.__setattr__(self, "average_position_index", PlayerLayerIndex.from_frame(self.average_positions))
+        # Match stat labels and formatted values are computed once; each match page reads a slice.
+        if self.match_stats_index is None:
+            object.__setattr__(self, "match_stats_index", MatchStatsIndex.from_frame(self.team_stats))
+        # Season-long per-90 features are normalized once so similar-player queries are a matrix pass.
+        if self.similarity_index is None:
+            object.__setattr__(
+                self,
+                "similarity_index",
+                SimilarityIndex.from_frame(build_similarity_features(self.player_match, self.player_totals)),
+            )
 
     @property
     def has_schedule(self) -> bool:
@@ -54,7 +147,7 @@ class DatasetBundle:
 
     @property
     def has_positional_layer(self) -> bool:
-        return not self.average_positions.empty or not self.heatmap_points.empty
+        return not self.average_positions.empty or not self.heatmap_grid.empty
 
     @property
     def has_shot_layer(self) -> bool:
@@ -64,6 +157,16 @@ class DatasetBundle:
     def has_momentum_layer(self) -> bool:
         return not self.match_momentum.empty
 
+    @property
+    def release_id(self) -> str:
+        release_id = str(self.manifest.get("release_id") or "").strip()
+        return release_id or f"{self.season_year}-{self.loaded_at:%Y%m%d%H%M%S}"
+
+    @property
+    def assets_dir(self) -> Path | None:
+        assets_dir = self.data_dir / PRERENDERED_ASSETS_DIRNAME
+        return assets_dir if assets_dir.is_dir() else None
+
     @property
     def warning_count(self) -> int:
         return len(self.validation_warnings)
@@ -133,6 +236,7 @@ class LeagueOverview:
     standings_tables: tuple[tuple[str, pd.DataFrame], ...] = field(default_factory=tuple)
     grand_final_results: pd.DataFrame = field(default_factory=pd.DataFrame)
     grand_final_only: bool = False
+    projections: pd.DataFrame = field(default_factory=pd.DataFrame)
 
 
 @dataclass(frozen=True)
@@ -146,6 +250,8 @@ class TeamProfile:
     splits: pd.DataFrame
     top_players: pd.DataFrame
     comparison: pd.DataFrame
+    form: dict[str, object] = field(default_factory=dict)
+    rating: dict[str, object] = field(default_factory=dict)
 
 
 @dataclass(frozen=True)
@@ -163,8 +269,12 @@ class PlayerProfile:
     default_visual_scope: str
     contextual_average_position_row: pd.Series | None
     accumulated_average_position_row: pd.Series | None
-    contextual_heatmap_points: pd.DataFrame
-    accumulated_heatmap_points: pd.DataFrame
+    contextual_heatmap_grid: pd.DataFrame
+    accumulated_heatmap_grid: pd.DataFrame
+    similar_players: pd.DataFrame = field(default_factory=pd.DataFrame)
+    form: dict[str, object] = field(default_factory=dict)
+    release_id: str = ""
+    assets_dir: Path | None = None
 
 
 @dataclass(frozen=True)
@@ -191,3 +301,6 @@ class MatchSummary:
     goalkeeper_saves: pd.DataFrame = field(default_factory=pd.DataFrame)
     season_has_shot_layer: bool = False
     season_has_momentum_layer: bool = False
+    probabilities: dict[str, object] = field(default_factory=dict)
+    release_id: str = ""
+    assets_dir: Path | None = None
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import matplotlib
+
+import pandas as pd
+
+from gronestats.dashboard.config import DEFAULT_DASHBOARD_TOURNAMENTS, PRERENDERED_ASSETS_DIRNAME
+from gronestats.dashboard.data import build_dashboard_bundle, read_json
+from gronestats.dashboard.figure_cache import prerendered_asset_path, render_figure_bytes
+from gronestats.dashboard.metrics import build_match_summary, build_player_profile
+from gronestats.dashboard.models import DatasetBundle, FilterState
+from gronestats.dashboard.views.figure_specs import (
+    FigureSpec,
+    match_average_positions_figure_spec,
+    match_goalkeeper_saves_figure_spec,
+    match_goalmouth_figure_spec,
+    match_momentum_figure_spec,
+    match_shotmap_figure_spec,
+    player_accumulated_heatmap_figure_spec,
+)
+
+
+PRERENDER_INDEX_FILENAME = "index.json"
+PRERENDER_CHUNK_SIZE = 24
+
+_WORKER_BUNDLE: DatasetBundle | None = None
+_WORKER_ASSETS_DIR: Path | None = None
+
+
+def full_season_filters(bundle: DatasetBundle) -> FilterState:
+    matches = bundle.matches
+    tournament_values: list[str] = []
+    if "tournament" in matches.columns:
+        tournament_values = matches["tournament"].dropna().astype(str).unique().tolist()
+    tournaments = [value for value in DEFAULT_DASHBOARD_TOURNAMENTS if value in tournament_values] or tournament_values
+    scope = matches[matches["tournament"].isin(tournaments)] if tournaments else matches
+    rounds = pd.to_numeric(scope.get("round_number", pd.Series(dtype="float64")), errors="coerce").dropna()
+    round_range = (int(rounds.min()), int(rounds.max())) if not rounds.empty else (1, 1)
+    return FilterState(round_range=round_range, min_minutes=0, tournaments=tuple(tournaments))
+
+
+def match_figure_specs(bundle: DatasetBundle, filters: FilterState, match_id: int) -> list[FigureSpec]:
+    summary = build_match_summary(bundle, filters, match_id, pd.DataFrame())
+    if summary is None:
+        return []
+    specs: list[FigureSpec] = []
+    metadata = summary.shot_events_metadata or {}
+    if not summary.shot_events.empty and metadata.get("has_pitch_map"):
+        specs.append(match_shotmap_figure_spec(summary))
+    if not summary.shot_events.empty and metadata.get("has_goal_mouth_map"):
+        specs.append(match_goalmouth_figure_spec(summary))
+    if not summary.momentum_series.empty:
+        specs.append(match_momentum_figure_spec(summary))
+    if not summary.goalkeeper_saves.empty:
+        specs.append(match_goalkeeper_saves_figure_spec(summary))
+    if not summary.team_average_positions.empty:
+        specs.append(match_average_positions_figure_spec(summary))
+    return specs
+
+
+def player_figure_specs(bundle: DatasetBundle, filters: FilterState, player_id: int) -> list[FigureSpec]:
+    profile = build_player_profile(bundle, filters, player_id)
+    if profile is None or profile.accumulated_heatmap_grid.empty:
+        return []
+    return [player_accumulated_heatmap_figure_spec(profile)]
+
+
+def _write_assets(assets_dir: Path, specs: list[FigureSpec]) -> list[dict[str, str]]:
+    written: list[dict[str, str]] = []
+    for key, build in specs:
+        path = prerendered_asset_path(assets_dir, key)
+        temp_path = path.with_suffix(f"{path.suffix}.tmp")
+        temp_path.write_bytes(render_figure_bytes(build(), key.fmt))
+        temp_path.replace(path)
+        written.append({"file": path.name, "chart": key.chart, "entity": key.entity, "scope": key.scope})
+    return written
+
+
+def _render_chunk(
+    bundle: DatasetBundle,
+    assets_dir: Path,
+    kind: str,
+    entity_ids: list[int],
+) -> list[dict[str, str]]:
+    filters = full_season_filters(bundle)
+    build_specs = match_figure_specs if kind == "match" else player_figure_specs
+    written: list[dict[str, str]] = []
+    for entity_id in entity_ids:
+        written.extend(_write_assets(assets_dir, build_specs(bundle, filters, entity_id)))
+    return written
+
+
+def _init_worker(release_dir: str, season_year: int, assets_dir: str) -> None:
+    global _WORKER_BUNDLE, _WORKER_ASSETS_DIR
+    matplotlib.use("Agg")
+    _WORKER_BUNDLE = build_dashboard_bundle(Path(release_dir), season_year)
+    _WORKER_ASSETS_DIR = Path(assets_dir)
+
+
+def _render_chunk_in_worker(kind: str, entity_ids: list[int]) -> list[dict[str, str]]:
+    if _WORKER_BUNDLE is None or _WORKER_ASSETS_DIR is None:
+        raise RuntimeError("Prerender worker was not initialized.")
+    return _render_chunk(_WORKER_BUNDLE, _WORKER_ASSETS_DIR, kind, entity_ids)
+
+
+def _chunks(values: list[int], size: int) -> list[list[int]]:
+    return [values[start : start + size] for start in range(0, len(values), size)]
+
+
+def prerender_release_assets(
+    release_dir: Path,
+    *,
+    season_year: int,
+    max_workers: int | None = None,
+) -> dict[str, Any]:
+    # Without a manifest release_id each process would derive its own cache keys.
+    if not str(read_json(release_dir / "manifest.json").get("release_id") or "").strip():
+        return {"status": "skipped", "reason": "manifest.json has no release_id", "asset_count": 0}
+    matplotlib.use("Agg")
+    bundle = build_dashboard_bundle(release_dir, season_year)
+    assets_dir = release_dir / PRERENDERED_ASSETS_DIRNAME
+    assets_dir.mkdir(parents=True, exist_ok=True)
+    match_ids = sorted(bundle.matches["match_id"].dropna().astype(int).unique().tolist()) if not bundle.matches.empty else []
+    player_ids = sorted(bundle.heatmap_index.offsets) if bundle.heatmap_index is not None else []
+    tasks = [("match", chunk) for chunk in _chunks(match_ids, PRERENDER_CHUNK_SIZE)]
+    tasks.extend(("player", chunk) for chunk in _chunks(player_ids, PRERENDER_CHUNK_SIZE))
+
+    workers = max_workers if max_workers is not None else min(len(tasks), os.cpu_count() or 1)
+    written: list[dict[str, str]] = []
+    if workers <= 1 or len(tasks) <= 1:
+        for kind, entity_ids in tasks:
+            written.extend(_render_chunk(bundle, assets_dir, kind, entity_ids))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(str(release_dir), season_year, str(assets_dir)),
+        ) as executor:
+            futures = [executor.submit(_render_chunk_in_worker, kind, entity_ids) for kind, entity_ids in tasks]
+            for future in futures:
+                written.extend(future.result())
+
+    index = {
+        "release_id": bundle.release_id,
+        "season_year": season_year,
+        "match_count": len(match_ids),
+        "player_count": len(player_ids),
+        "asset_count": len(written),
+        "assets": written,
+    }
+    (assets_dir / PRERENDER_INDEX_FILENAME).write_text(json.dumps(index, indent=2, ensure_ascii=False), encoding="utf-8")
+    return {"status": "rendered", "assets_dir": str(assets_dir)} | {key: value for key, value in index.items() if key != "assets"}
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable
+
+
+class ScopeCache:
+    """Bounded FIFO of per-scope or per-match tables; bundles (and this cache) are shared by concurrent sessions."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Any, Any] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_build(self, key: Any, build: Callable[[], Any], max_entries: int) -> Any:
+        with self._lock:
+            cached = self._entries.get(key)
+        if cached is not None:
+            return cached
+        # Built outside the lock so one slow scope does not stall other sessions; a racing
+        # session may build the same scope, and the first stored value wins.
+        value = build()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                return cached
+            while len(self._entries) >= max_entries:
+                self._entries.popitem(last=False)
+            self._entries[key] = value
+        return value
+
+    def __getstate__(self) -> dict[str, Any]:
+        with self._lock:
+            return {"entries": OrderedDict(self._entries)}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._lock = threading.Lock()
+        self._entries = state["entries"]
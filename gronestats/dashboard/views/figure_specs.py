@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import hashlib
+from typing import Callable
+
+import pandas as pd
+
+from gronestats.dashboard.config import COLORS
+from gronestats.dashboard.figure_cache import FigureCacheKey
+from gronestats.dashboard.metrics import PLAYER_ACCUMULATED_SCOPE
+from gronestats.dashboard.models import MatchSummary, PlayerProfile
+from gronestats.dashboard.views.pitch import (
+    build_goalkeeper_saves_figure,
+    build_match_average_positions_figure,
+    build_match_goalmouth_figure,
+    build_match_momentum_figure,
+    build_match_shotmap_figure,
+    build_player_heatmap_figure,
+)
+from gronestats.dashboard.views.shared import safe_int, safe_text
+
+
+FigureSpec = tuple[FigureCacheKey, Callable[[], object]]
+
+
+def figure_scope_token(*parts: object) -> str:
+    payload = "|".join(str(part) for part in parts)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def frame_token(frame: pd.DataFrame | None) -> str:
+    if frame is None or frame.empty:
+        return "empty"
+    hashed = pd.util.hash_pandas_object(frame.astype("string"), index=False)
+    return f"{len(frame)}:{','.join(frame.columns.astype(str))}:{int(hashed.sum()) & 0xFFFFFFFFFFFFFFFF:x}"
+
+
+def format_rounds_label(rounds: list[str]) -> str:
+    if not rounds:
+        return "sin tramos disponibles"
+    if len(rounds) == 1:
+        return rounds[0]
+    if len(rounds) <= 4:
+        return ", ".join(rounds)
+    return f"{rounds[0]} ... {rounds[-1]}"
+
+
+def accumulated_heatmap_footer_note(profile: PlayerProfile) -> str:
+    coverage = profile.visual_coverage or {}
+    return (
+        f"Puntos de calor: {safe_int(profile.accumulated_heatmap_grid['points_count'].sum())} | "
+        f"Partidos: {int(coverage.get('regular_heatmap_match_count', 0))} | "
+        f"{format_rounds_label(coverage.get('regular_heatmap_round_labels', []))}"
+    )
+
+
+def player_heatmap_figure_spec(
+    profile: PlayerProfile,
+    *,
+    scope: str,
+    heatmap_grid: pd.DataFrame,
+    average_position_row: pd.Series | None,
+    title_suffix: str,
+    footer_note: str,
+) -> FigureSpec:
+    marker = (
+        (average_position_row.get("average_x"), average_position_row.get("average_y"), average_position_row.get("shirt_number"))
+        if average_position_row is not None
+        else None
+    )
+    player_name = safe_text(profile.player_row.get("name"), "Jugador")
+    key = FigureCacheKey(
+        release_id=profile.release_id,
+        chart="player_heatmap",
+        entity=str(profile.player_id),
+        scope=f"{scope}:{figure_scope_token(frame_token(heatmap_grid), marker, player_name, title_suffix, footer_note)}",
+        theme=f"{COLORS['surface']}|{profile.team_color}",
+    )
+    return key, lambda: build_player_heatmap_figure(
+        heatmap_grid,
+        average_position_row=average_position_row,
+        title_suffix=title_suffix,
+        footer_note=footer_note,
+        team_color=profile.team_color,
+        player_name=player_name,
+    )
+
+
+def player_accumulated_heatmap_figure_spec(profile: PlayerProfile) -> FigureSpec:
+    return player_heatmap_figure_spec(
+        profile,
+        scope=PLAYER_ACCUMULATED_SCOPE,
+        heatmap_grid=profile.accumulated_heatmap_grid,
+        average_position_row=profile.accumulated_average_position_row,
+        title_suffix="heatmap acumulado del jugador",
+        footer_note=accumulated_heatmap_footer_note(profile),
+    )
+
+
+def _match_figure_key(summary: MatchSummary, chart: str, frame: pd.DataFrame, *scope_parts: object, fmt: str = "png") -> FigureCacheKey:
+    return FigureCacheKey(
+        release_id=summary.release_id,
+        chart=chart,
+        entity=str(summary.match_id),
+        scope=figure_scope_token(frame_token(frame), *scope_parts),
+        theme=f"{COLORS['surface']}|{summary.home_team_color}|{summary.away_team_color}",
+        fmt=fmt,
+    )
+
+
+def _team_names(summary: MatchSummary) -> tuple[str, str]:
+    row = summary.match_row
+    return safe_text(row.get("home"), "Local"), safe_text(row.get("away"), "Visita")
+
+
+def match_average_positions_figure_spec(summary: MatchSummary) -> FigureSpec:
+    home_team, away_team = _team_names(summary)
+    metadata = summary.average_position_metadata or {}
+    key = _match_figure_key(summary, "match_average_positions", summary.team_average_positions, sorted(metadata.items()))
+    return key, lambda: build_match_average_positions_figure(
+        summary.team_average_positions,
+        home_team=home_team,
+        away_team=away_team,
+        metadata=metadata,
+        home_color=summary.home_team_color,
+        away_color=summary.away_team_color,
+    )
+
+
+def match_goalkeeper_saves_figure_spec(summary: MatchSummary) -> FigureSpec:
+    home_team, away_team = _team_names(summary)
+    key = _match_figure_key(summary, "goalkeeper_saves", summary.goalkeeper_saves, home_team, away_team)
+    return key, lambda: build_goalkeeper_saves_figure(
+        summary.goalkeeper_saves,
+        home_team=home_team,
+        away_team=away_team,
+        home_color=summary.home_team_color,
+        away_color=summary.away_team_color,
+    )
+
+
+def match_shotmap_figure_spec(summary: MatchSummary) -> FigureSpec:
+    home_team, away_team = _team_names(summary)
+    metadata = summary.shot_events_metadata or {}
+    key = _match_figure_key(summary, "match_shotmap", summary.shot_events, home_team, away_team, sorted(metadata.items()))
+    return key, lambda: build_match_shotmap_figure(
+        summary.shot_events,
+        home_team=home_team,
+        away_team=away_team,
+        metadata=metadata,
+        home_color=summary.home_team_color,
+        away_color=summary.away_team_color,
+    )
+
+
+def match_goalmouth_figure_spec(summary: MatchSummary) -> FigureSpec:
+    home_team, away_team = _team_names(summary)
+    metadata = summary.shot_events_metadata or {}
+    key = _match_figure_key(
+        summary,
+        "match_goalmouth",
+        summary.shot_events,
+        home_team,
+        away_team,
+        sorted(metadata.items()),
+        fmt="json",
+    )
+    return key, lambda: build_match_goalmouth_figure(
+        summary.shot_events,
+        home_team=home_team,
+        away_team=away_team,
+        metadata=metadata,
+    )
+
+
+def match_momentum_figure_spec(summary: MatchSummary) -> FigureSpec:
+    home_team, away_team = _team_names(summary)
+    key = _match_figure_key(summary, "match_momentum", summary.momentum_series, home_team, away_team)
+    return key, lambda: build_match_momentum_figure(
+        summary.momentum_series,
+        home_team=home_team,
+        away_team=away_team,
+        home_color=summary.home_team_color,
+        away_color=summary.away_team_color,
+    )
@@ -4,19 +4,22 @@ import pandas as pd
 import streamlit as st
 
 from gronestats.dashboard.data import find_player_image
+from gronestats.dashboard.metrics import describe_match_probabilities
 from gronestats.dashboard.models import MatchSummary
 from gronestats.dashboard.state import build_action
-from gronestats.dashboard.views.pitch import (
-    build_goalkeeper_saves_figure,
-    build_match_goalmouth_figure,
-    build_match_average_positions_figure,
-    build_match_momentum_figure,
-    build_match_shotmap_figure,
+from gronestats.dashboard.views.figure_specs import (
+    match_average_positions_figure_spec,
+    match_goalkeeper_saves_figure_spec,
+    match_goalmouth_figure_spec,
+    match_momentum_figure_spec,
+    match_shotmap_figure_spec,
 )
 from gronestats.dashboard.views.shared import (
     build_team_palette,
     get_selected_row_index,
     render_action_button,
+    render_cached_figure,
+    render_cached_plotly,
     render_empty_state,
     render_form_chips,
     render_navigation_surface,
@@ -249,6 +252,10 @@ def _render_match_header(summary: MatchSummary) -> dict[str, object] | None:
     </section>
     """
     st.markdown(header_html, unsafe_allow_html=True)
+    if summary.probabilities:
+        st.caption(
+            describe_match_probabilities(summary.probabilities, safe_text(row.get("home"), "Local"), safe_text(row.get("away"), "Visita"))
+        )
 
     home_team_id = safe_optional_int(row.get("home_id"))
     away_team_id = safe_optional_int(row.get("away_id"))
@@ -332,31 +339,13 @@ def _render_match_event_summary(summary: MatchSummary, row: pd.Series) -> None:
                 note_parts.append(orientation_note)
         render_selection_note(" ".join(part for part in note_parts if part))
         if shotmap_state["has_pitch_map"]:
-            st.pyplot(
-                build_match_shotmap_figure(
-                    summary.shot_events,
-                    home_team=safe_text(row.get("home"), "Local"),
-                    away_team=safe_text(row.get("away"), "Visita"),
-                    metadata=summary.shot_events_metadata,
-                    home_color=summary.home_team_color,
-                    away_color=summary.away_team_color,
-                ),
-                use_container_width=True,
-            )
+            render_cached_figure(*match_shotmap_figure_spec(summary), assets_dir=summary.assets_dir)
         if shotmap_state["has_goal_mouth_map"]:
             render_section_title(
                 "Definiciones sobre el arco",
                 "Complementa el mapa de tiros cuando la geometria publicada viene concentrada sobre el arco.",
             )
-            st.plotly_chart(
-                build_match_goalmouth_figure(
-                    summary.shot_events,
-                    home_team=safe_text(row.get("home"), "Local"),
-                    away_team=safe_text(row.get("away"), "Visita"),
-                    metadata=summary.shot_events_metadata,
-                ),
-                use_container_width=True,
-            )
+            render_cached_plotly(*match_goalmouth_figure_spec(summary), assets_dir=summary.assets_dir)
 
     event_cols = st.columns([1.15, 0.85], gap="medium")
     with event_cols[0]:
@@ -370,16 +359,7 @@ def _render_match_event_summary(summary: MatchSummary, row: pd.Series) -> None:
                 render_selection_note(note)
             render_empty_state(message)
         else:
-            st.pyplot(
-                build_match_momentum_figure(
-                    summary.momentum_series,
-                    home_team=safe_text(row.get("home"), "Local"),
-                    away_team=safe_text(row.get("away"), "Visita"),
-                    home_color=summary.home_team_color,
-                    away_color=summary.away_team_color,
-                ),
-                use_container_width=True,
-            )
+            render_cached_figure(*match_momentum_figure_spec(summary), assets_dir=summary.assets_dir)
 
     with event_cols[1]:
         render_section_title(
@@ -389,16 +369,7 @@ def _render_match_event_summary(summary: MatchSummary, row: pd.Series) -> None:
         if summary.goalkeeper_saves.empty:
             render_empty_state("Sin registros de atajadas de arquero en player_match para este match_id.")
         else:
-            st.pyplot(
-                build_goalkeeper_saves_figure(
-                    summary.goalkeeper_saves,
-                    home_team=safe_text(row.get("home"), "Local"),
-                    away_team=safe_text(row.get("away"), "Visita"),
-                    home_color=summary.home_team_color,
-                    away_color=summary.away_team_color,
-                ),
-                use_container_width=True,
-            )
+            render_cached_figure(*match_goalkeeper_saves_figure_spec(summary), assets_dir=summary.assets_dir)
             st.dataframe(
                 summary.goalkeeper_saves[["side", "name", "team_name", "saves", "minutesplayed"]],
                 use_container_width=True,
@@ -487,17 +458,7 @@ def render_match_detail(summary: MatchSummary | None) -> dict[str, object] | Non
                 f"Local: {safe_text(metadata.get('home_strategy'), 'sin datos')} ({safe_int(metadata.get('home_count'))}) | "
                 f"Visita: {safe_text(metadata.get('away_strategy'), 'sin datos')} ({safe_int(metadata.get('away_count'))})"
             )
-            st.pyplot(
-                build_match_average_positions_figure(
-                    summary.team_average_positions,
-                    home_team=safe_text(row.get("home"), "Local"),
-                    away_team=safe_text(row.get("away"), "Visita"),
-                    metadata=metadata,
-                    home_color=summary.home_team_color,
-                    away_color=summary.away_team_color,
-                ),
-                use_container_width=True,
-            )
+            render_cached_figure(*match_average_positions_figure_spec(summary), assets_dir=summary.assets_dir)
 
         _render_match_event_summary(summary, row)
 
@@ -193,6 +193,25 @@ def render_overview(overview: LeagueOverview) -> dict[str, object] | None:
                 if action is None and next_action is not None:
                     action = next_action
 
+    if not overview.projections.empty:
+        render_section_title(
+            "Proyeccion de temporada",
+            "Probabilidades (%) de simular el resto del calendario con los ratings actuales.",
+        )
+        projection_event = st.dataframe(
+            overview.projections.drop(columns=["team_id"]),
+            use_container_width=True,
+            hide_index=True,
+            key="overview_projections",
+            on_select="rerun",
+            selection_mode="single-row",
+        )
+        row_index = get_selected_row_index(projection_event)
+        if action is None and row_index is not None:
+            team_id = safe_optional_int(overview.projections.iloc[row_index].get("team_id"))
+            if team_id is not None:
+                action = build_action("team", team_id=team_id)
+
     render_section_title("Lideres", "Selecciona una fila para abrir el perfil del jugador.")
     if not overview.leaders:
         render_empty_state(
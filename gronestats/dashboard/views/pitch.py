@@ -4,12 +4,14 @@ from matplotlib import pyplot as plt
 from matplotlib.colors import LinearSegmentedColormap
 from matplotlib.lines import Line2D
 from mplsoccer import VerticalPitch
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
 from gronestats.dashboard.config import COLORS
 from gronestats.dashboard.views.shared import build_team_palette, safe_int, safe_text
+from gronestats.stats.heatmap_grid import HEATMAP_GRID_BINS, sum_heatmap_grid
 
 
 PLAYER_HEATMAP_CMAP = LinearSegmentedColormap.from_list(
@@ -97,25 +99,33 @@ def build_player_average_position_figure(
     return fig
 
 
+def _heatmap_grid_statistic(pitch: VerticalPitch, heatmap_grid: pd.DataFrame) -> dict[str, object]:
+    bin_statistic = pitch.bin_statistic(np.array([50.0]), np.array([50.0]), statistic="count", bins=HEATMAP_GRID_BINS)
+    totals = sum_heatmap_grid(heatmap_grid)
+    # Grid rows are stored with ascending y cells; follow the pitch orientation.
+    if bin_statistic["cy"][0, 0] > bin_statistic["cy"][-1, 0]:
+        totals = totals[::-1, :]
+    bin_statistic["statistic"] = np.ma.masked_less(totals, 1)
+    return bin_statistic
+
+
 def build_player_heatmap_figure(
-    heatmap_points: pd.DataFrame,
+    heatmap_grid: pd.DataFrame,
     average_position_row: pd.Series | None = None,
     *,
     title_suffix: str = "heatmap del jugador",
     footer_note: str | None = None,
     team_color: str | None = None,
+    player_name: str | None = None,
 ):
     pitch, fig, ax = _base_pitch((5.8, 8.2))
     palette = build_team_palette(team_color or COLORS["accent"])
-    pitch.hexbin(
-        heatmap_points["x"],
-        heatmap_points["y"],
+    pitch.heatmap(
+        _heatmap_grid_statistic(pitch, heatmap_grid),
         ax=ax,
-        gridsize=(12, 9),
         edgecolors="none",
         cmap=PLAYER_HEATMAP_CMAP,
         alpha=0.9,
-        mincnt=1,
     )
     if average_position_row is not None:
         label = (
@@ -133,8 +143,9 @@ def build_player_heatmap_figure(
             edgecolor=palette["primary"],
             size=220,
         )
+    # The binned grid carries no names; without a marker row the caller supplies the player's name.
     focus_name = safe_text(
-        average_position_row.get("name") if average_position_row is not None else heatmap_points["name"].iloc[0],
+        average_position_row.get("name") if average_position_row is not None else player_name,
         "Jugador",
     )
     ax.set_title(
@@ -146,7 +157,7 @@ def build_player_heatmap_figure(
     ax.text(
         0.03,
         0.02,
-        footer_note or f"Puntos de calor: {len(heatmap_points)}",
+        footer_note or f"Puntos de calor: {safe_int(heatmap_grid['points_count'].sum()) if not heatmap_grid.empty else 0}",
         transform=ax.transAxes,
         color=COLORS["muted"],
         fontsize=9,
@@ -8,10 +8,16 @@ from gronestats.dashboard.metrics import (
     PLAYER_AVERAGE_POSITION_MODE,
     PLAYER_CONTEXTUAL_SCOPE,
     PLAYER_HEATMAP_MODE,
+    describe_form,
 )
 from gronestats.dashboard.models import PlayerProfile
 from gronestats.dashboard.state import build_action
-from gronestats.dashboard.views.pitch import build_player_average_position_figure, build_player_heatmap_figure
+from gronestats.dashboard.views.figure_specs import (
+    format_rounds_label,
+    player_accumulated_heatmap_figure_spec,
+    player_heatmap_figure_spec,
+)
+from gronestats.dashboard.views.pitch import build_player_average_position_figure
 from gronestats.dashboard.views.shared import (
     build_percentile_figure,
     get_selected_row_index,
@@ -19,12 +25,15 @@ from gronestats.dashboard.views.shared import (
     render_identity_panel,
     render_navigation_surface,
     render_panel_close,
+    render_cached_figure,
     render_panel_open,
     render_section_title,
     render_selection_note,
+    safe_int,
     safe_optional_int,
     safe_text,
 )
+from gronestats.stats.similarity import SIMILARITY_MIN_MINUTES
 
 
 def _format_match_option(visual_matches, value: int) -> str:
@@ -34,16 +43,6 @@ def _format_match_option(visual_matches, value: int) -> str:
     return safe_text(selected.iloc[0], f"Partido {value}")
 
 
-def _format_rounds_label(rounds: list[str]) -> str:
-    if not rounds:
-        return "sin tramos disponibles"
-    if len(rounds) == 1:
-        return rounds[0]
-    if len(rounds) <= 4:
-        return ", ".join(rounds)
-    return f"{rounds[0]} ... {rounds[-1]}"
-
-
 def _describe_available_views(profile: PlayerProfile, selected_match_row) -> str:
     available = []
     if selected_match_row is not None and bool(selected_match_row.get("has_average_position")):
@@ -52,7 +51,7 @@ def _describe_available_views(profile: PlayerProfile, selected_match_row) -> str
         available.append("heatmap contextual")
     if profile.accumulated_average_position_row is not None:
         available.append("posicion promedio acumulada")
-    if not profile.accumulated_heatmap_points.empty:
+    if not profile.accumulated_heatmap_grid.empty:
         available.append("heatmap acumulado")
     return ", ".join(available) if available else "ninguna vista disponible"
 
@@ -212,8 +211,8 @@ def render_player_profile(profile: PlayerProfile | None) -> dict[str, object] |
                 average_rounds = coverage.get("regular_average_round_labels", [])
                 heatmap_rounds = coverage.get("regular_heatmap_round_labels", [])
                 render_selection_note(
-                    f"Cobertura del tramo regular | Posicion promedio: {average_match_count} partidos ({_format_rounds_label(average_rounds)}) | "
-                    f"Heatmap: {heatmap_match_count} partidos ({_format_rounds_label(heatmap_rounds)})"
+                    f"Cobertura del tramo regular | Posicion promedio: {average_match_count} partidos ({format_rounds_label(average_rounds)}) | "
+                    f"Heatmap: {heatmap_match_count} partidos ({format_rounds_label(heatmap_rounds)})"
                 )
 
             selected_match = visual_matches[visual_matches["match_id"] == selected_match_id].head(1)
@@ -249,25 +248,25 @@ def render_player_profile(profile: PlayerProfile | None) -> dict[str, object] |
                         use_container_width=True,
                     )
             elif selected_scope == PLAYER_CONTEXTUAL_SCOPE and selected_mode == PLAYER_HEATMAP_MODE:
-                if profile.contextual_heatmap_points.empty:
+                if profile.contextual_heatmap_grid.empty:
                     render_empty_state(
                         "No hay heatmap disponible para este jugador en el partido contextual seleccionado. "
                         f"Disponible: {_describe_available_views(profile, selected_match_row)}."
                     )
                 else:
-                    st.pyplot(
-                        build_player_heatmap_figure(
-                            profile.contextual_heatmap_points,
-                            average_position_row=profile.contextual_average_position_row,
-                            title_suffix="heatmap contextual",
-                            footer_note=(
-                                f"Puntos de calor: {len(profile.contextual_heatmap_points)} | "
-                                f"{safe_text(selected_match_row.get('partido') if selected_match_row is not None else None, 'Partido contextual')}"
-                            ),
-                            team_color=profile.team_color,
-                        ),
-                        use_container_width=True,
+                    footer_note = (
+                        f"Puntos de calor: {safe_int(profile.contextual_heatmap_grid['points_count'].sum())} | "
+                        f"{safe_text(selected_match_row.get('partido') if selected_match_row is not None else None, 'Partido contextual')}"
+                    )
+                    key, build = player_heatmap_figure_spec(
+                        profile,
+                        scope=PLAYER_CONTEXTUAL_SCOPE,
+                        heatmap_grid=profile.contextual_heatmap_grid,
+                        average_position_row=profile.contextual_average_position_row,
+                        title_suffix="heatmap contextual",
+                        footer_note=footer_note,
                     )
+                    render_cached_figure(key, build, assets_dir=profile.assets_dir)
             elif selected_scope == PLAYER_ACCUMULATED_SCOPE and selected_mode == PLAYER_AVERAGE_POSITION_MODE:
                 if profile.accumulated_average_position_row is None:
                     render_empty_state(
@@ -288,25 +287,14 @@ def render_player_profile(profile: PlayerProfile | None) -> dict[str, object] |
                         use_container_width=True,
                     )
             else:
-                if profile.accumulated_heatmap_points.empty:
+                if profile.accumulated_heatmap_grid.empty:
                     render_empty_state(
                         "No hay heatmap acumulado disponible para este jugador dentro del tramo regular activo. "
                         f"Disponible: {_describe_available_views(profile, selected_match_row)}."
                     )
                 else:
-                    st.pyplot(
-                        build_player_heatmap_figure(
-                            profile.accumulated_heatmap_points,
-                            average_position_row=profile.accumulated_average_position_row,
-                            title_suffix="heatmap acumulado del jugador",
-                            footer_note=(
-                                f"Puntos de calor: {len(profile.accumulated_heatmap_points)} | "
-                                f"Partidos: {heatmap_match_count} | {_format_rounds_label(heatmap_rounds)}"
-                            ),
-                            team_color=profile.team_color,
-                        ),
-                        use_container_width=True,
-                    )
+                    # Full-season accumulated heatmaps may already be pre-rendered in the release.
+                    render_cached_figure(*player_accumulated_heatmap_figure_spec(profile), assets_dir=profile.assets_dir)
         render_panel_close()
 
     left, right = st.columns([1.02, 1.18], gap="medium")
@@ -328,6 +316,8 @@ def render_player_profile(profile: PlayerProfile | None) -> dict[str, object] |
         if profile.recent_matches.empty:
             render_empty_state("No hay apariciones recientes para este jugador.")
         else:
+            if profile.form:
+                st.caption(describe_form(profile.form))
             render_selection_note("Cada fila abre el match y conserva el origen del perfil.")
             recent_event = st.dataframe(
                 profile.recent_matches[["round_label", "partido", "minutesplayed", "goals", "assists", "goal_actions_per90"]],
@@ -362,4 +352,42 @@ def render_player_profile(profile: PlayerProfile | None) -> dict[str, object] |
                     else None
                 )
 
+    render_section_title(
+        "Jugadores similares",
+        "Perfiles por 90 mas cercanos en la temporada completa, dentro de la misma posicion.",
+    )
+    if profile.similar_players.empty:
+        render_empty_state(f"No hay jugadores comparables: el indice de similitud exige {SIMILARITY_MIN_MINUTES} minutos en la temporada.")
+    else:
+        render_selection_note("Selecciona una fila para abrir el perfil del jugador similar.")
+        similar_event = st.dataframe(
+            profile.similar_players[["rank", "name", "team_name", "minutesplayed", "similarity_score", "goals_per90", "assists_per90", "rating"]],
+            use_container_width=True,
+            hide_index=True,
+            key=f"player_similar_{profile.player_id}",
+            on_select="rerun",
+            selection_mode="single-row",
+            column_config={
+                "rank": "#",
+                "name": "Jugador",
+                "team_name": "Equipo",
+                "minutesplayed": "Min",
+                "similarity_score": "Similitud",
+                "goals_per90": "G/90",
+                "assists_per90": "A/90",
+                "rating": "Rating",
+            },
+        )
+        row_index = get_selected_row_index(similar_event)
+        if action is None and row_index is not None:
+            selected = profile.similar_players.iloc[row_index]
+            similar_id = safe_optional_int(selected.get("player_id"))
+            if similar_id is not None:
+                action = build_action(
+                    "player",
+                    player_id=similar_id,
+                    team_id=safe_optional_int(selected.get("team_id")),
+                    position=safe_text(selected.get("position"), "Todas"),
+                )
+
     return action
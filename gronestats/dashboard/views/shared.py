@@ -3,13 +3,16 @@ from __future__ import annotations
 from datetime import datetime
 from pathlib import Path
 import re
-from typing import Iterable
+from typing import Any, Callable, Iterable
 
+from matplotlib import pyplot as plt
 import pandas as pd
 import plotly.graph_objects as go
+import plotly.io as pio
 import streamlit as st
 
 from gronestats.dashboard.config import APP_TITLE, BASE_CSS, COLORS
+from gronestats.dashboard.figure_cache import FigureCacheKey, get_figure_cache
 
 
 HEX_COLOR_PATTERN = re.compile(r"^#[0-9a-fA-F]{6}$")
@@ -231,6 +234,29 @@ def render_panel_close() -> None:
     st.markdown("</div>", unsafe_allow_html=True)
 
 
+def render_cached_figure(
+    key: FigureCacheKey,
+    build: Callable[[], plt.Figure],
+    *,
+    assets_dir: Path | None = None,
+) -> None:
+    payload = get_figure_cache().get_or_render(key, build, assets_dir=assets_dir)
+    if key.fmt == "svg":
+        st.image(payload.decode("utf-8"), use_container_width=True)
+    else:
+        st.image(payload, use_container_width=True)
+
+
+def render_cached_plotly(
+    key: FigureCacheKey,
+    build: Callable[[], Any],
+    *,
+    assets_dir: Path | None = None,
+) -> None:
+    payload = get_figure_cache().get_or_render(key, build, assets_dir=assets_dir)
+    st.plotly_chart(pio.from_json(payload.decode("utf-8")), use_container_width=True)
+
+
 def render_empty_state(message: str) -> None:
     st.markdown(f"<div class='gs-empty'>{message}</div>", unsafe_allow_html=True)
 
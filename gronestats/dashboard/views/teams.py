@@ -3,6 +3,7 @@ from __future__ import annotations
 import streamlit as st
 
 from gronestats.dashboard.data import find_team_image
+from gronestats.dashboard.metrics import describe_form, describe_rating
 from gronestats.dashboard.models import TeamProfile
 from gronestats.dashboard.state import build_action
 from gronestats.dashboard.views.shared import (
@@ -85,6 +86,10 @@ def render_team_view(profile: TeamProfile | None, *, player_layer_available: boo
             render_empty_state("No hay partidos recientes para mostrar.")
         else:
             st.markdown(render_form_chips(profile.recent_matches["result"].tolist()), unsafe_allow_html=True)
+            if profile.form:
+                st.caption(describe_form(profile.form))
+            if profile.rating:
+                st.caption(describe_rating(profile.rating))
             render_selection_note("Tabla navegable: una fila abre el partido y conserva el foco en este equipo.")
             recent_event = st.dataframe(
                 profile.recent_matches[["round_label", "opponent_name", "venue", "marcador", "resultado"]],
@@ -2,11 +2,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 import pandas as pd
 
 from gronestats.processing.fantasy_export import FANTASY_EXPORT_TABLES, build_fantasy_export_bundle
+from gronestats.stats.heatmap_grid import bin_heatmap_points
+from gronestats.stats.shot_coordinates import add_shot_coordinate_columns
 
 
 @dataclass(frozen=True)
@@ -231,6 +233,11 @@ CANONICAL_SCHEMAS: dict[str, TableSchema] = {
             _float("z"),
             _int("team_id"),
             _string("team_name"),
+            _float("goal_mouth_y"),
+            _float("goal_mouth_z"),
+            _float("block_x"),
+            _float("block_y"),
+            _float("block_z"),
         ),
     ),
     "match_momentum_canonical": TableSchema(
@@ -292,8 +299,201 @@ DASHBOARD_EXPORT_SCHEMAS: dict[str, TableSchema] = {
     "team_stats": TableSchema("team_stats", CANONICAL_SCHEMAS["team_stats_canonical"].columns[1:]),
     "average_positions": TableSchema("average_positions", CANONICAL_SCHEMAS["average_positions_canonical"].columns[1:]),
     "heatmap_points": TableSchema("heatmap_points", CANONICAL_SCHEMAS["heatmap_points_canonical"].columns[1:]),
+    "heatmap_grid": TableSchema(
+        "heatmap_grid",
+        (
+            _int("match_id"),
+            _int("player_id"),
+            _int("team_id"),
+            _int("cell_x"),
+            _int("cell_y"),
+            _int("points_count"),
+        ),
+    ),
     "shot_events": TableSchema("shot_events", CANONICAL_SCHEMAS["shot_events_canonical"].columns[1:]),
     "match_momentum": TableSchema("match_momentum", CANONICAL_SCHEMAS["match_momentum_canonical"].columns[1:]),
+    "team_form": TableSchema(
+        "team_form",
+        (
+            _int("team_id"),
+            _int("last_match_id"),
+            _datetime("last_match_date"),
+            _int("form_matches"),
+            _int("form_points"),
+            _int("form_goals_for"),
+            _int("form_goals_against"),
+            _string("form_sequence"),
+            _string("streak_result"),
+            _int("streak_length"),
+            _float("ewm_points"),
+            _float("ewm_goal_difference"),
+        ),
+    ),
+    "player_form": TableSchema(
+        "player_form",
+        (
+            _int("player_id"),
+            _int("team_id"),
+            _int("last_match_id"),
+            _datetime("last_match_date"),
+            _int("form_matches"),
+            _int("form_minutesplayed"),
+            _int("form_goals"),
+            _int("form_assists"),
+            _float("ewm_rating"),
+            _int("scoring_streak"),
+        ),
+    ),
+    "team_ratings": TableSchema(
+        "team_ratings",
+        (
+            _int("team_id"),
+            _datetime("rated_at"),
+            _int("matches_played"),
+            _float("attack"),
+            _float("defence"),
+            _float("net_rating"),
+            _int("net_rank"),
+            _float("elo"),
+            _float("elo_change"),
+            _float("expected_goals_for"),
+            _float("expected_goals_against"),
+        ),
+    ),
+    "match_probabilities": TableSchema(
+        "match_probabilities",
+        (
+            _int("match_id"),
+            _string("tournament"),
+            _int("round_number"),
+            _int("home_id"),
+            _int("away_id"),
+            _bool("is_played"),
+            _float("expected_home_goals"),
+            _float("expected_away_goals"),
+            _float("p_home"),
+            _float("p_draw"),
+            _float("p_away"),
+            _float("elo_home"),
+            _float("elo_away"),
+            _float("elo_expected_home"),
+        ),
+    ),
+    "season_projections": TableSchema(
+        "season_projections",
+        (
+            _int("team_id"),
+            _string("team_name"),
+            _int("points"),
+            _int("matches_remaining"),
+            _float("expected_points"),
+            _float("expected_position"),
+            _float("p_apertura"),
+            _float("p_clausura"),
+            _float("p_aggregate_first"),
+            _float("p_playoff"),
+            _float("p_relegation"),
+        ),
+    ),
+}
+
+
+# Rolling-form state is appended match by match (see gronestats.processing.form_tables), so it
+# lives beside the canonical tables instead of being rewritten with them on every upsert.
+FORM_STATE_SCHEMAS: dict[str, TableSchema] = {
+    "team_form_state": TableSchema(
+        "team_form_state",
+        (
+            _int("season_year"),
+            _int("team_id"),
+            _int("match_id"),
+            _datetime("match_date"),
+            _int("round_number"),
+            _int("opponent_id"),
+            _bool("is_home"),
+            _int("goals_for"),
+            _int("goals_against"),
+            _int("goal_difference"),
+            _int("points"),
+            _string("result"),
+            _int("form_matches"),
+            _int("form_points"),
+            _int("form_goals_for"),
+            _int("form_goals_against"),
+            _float("ewm_points"),
+            _float("ewm_goal_difference"),
+            _string("streak_value"),
+            _int("streak_length"),
+            _string("form_sequence"),
+        ),
+    ),
+    "player_form_state": TableSchema(
+        "player_form_state",
+        (
+            _int("season_year"),
+            _int("player_id"),
+            _int("match_id"),
+            _datetime("match_date"),
+            _int("round_number"),
+            _int("team_id"),
+            _int("minutesplayed"),
+            _int("goals"),
+            _int("assists"),
+            _float("rating"),
+            _bool("scored"),
+            _int("form_matches"),
+            _int("form_minutesplayed"),
+            _int("form_goals"),
+            _int("form_assists"),
+            _float("ewm_rating"),
+            _string("streak_value"),
+            _int("streak_length"),
+        ),
+    ),
+}
+
+
+# Ratings are refit step by step (see gronestats.processing.rating_tables); the match rows keep
+# the scores each step was fitted on so a corrected result is detected and the season refit.
+RATING_STATE_SCHEMAS: dict[str, TableSchema] = {
+    "match_rating_state": TableSchema(
+        "match_rating_state",
+        (
+            _int("season_year"),
+            _int("match_id"),
+            _int("step"),
+            _datetime("match_date"),
+            _string("tournament"),
+            _int("round_number"),
+            _int("home_id"),
+            _int("away_id"),
+            _int("home_score"),
+            _int("away_score"),
+            _float("expected_home_goals"),
+            _float("expected_away_goals"),
+            _float("p_home"),
+            _float("p_draw"),
+            _float("p_away"),
+            _float("elo_home"),
+            _float("elo_away"),
+            _float("elo_expected_home"),
+        ),
+    ),
+    "team_rating_state": TableSchema(
+        "team_rating_state",
+        (
+            _int("season_year"),
+            _int("step"),
+            _datetime("step_date"),
+            _int("team_id"),
+            _float("attack"),
+            _float("defence"),
+            _float("elo"),
+            _int("matches_played"),
+            _float("intercept"),
+            _float("home_advantage"),
+        ),
+    ),
 }
 
 
@@ -524,8 +724,12 @@ def build_dashboard_bundle_from_canonical(canonical_tables: dict[str, pd.DataFra
             canonical_tables["heatmap_points_canonical"].drop(columns=["season_year"]),
             DASHBOARD_EXPORT_SCHEMAS["heatmap_points"],
         ),
+        "heatmap_grid": cast_frame_to_schema(
+            bin_heatmap_points(canonical_tables["heatmap_points_canonical"]),
+            DASHBOARD_EXPORT_SCHEMAS["heatmap_grid"],
+        ),
         "shot_events": cast_frame_to_schema(
-            canonical_tables["shot_events_canonical"].drop(columns=["season_year"]),
+            add_shot_coordinate_columns(canonical_tables["shot_events_canonical"].drop(columns=["season_year"])),
             DASHBOARD_EXPORT_SCHEMAS["shot_events"],
         ),
         "match_momentum": cast_frame_to_schema(
@@ -558,9 +762,14 @@ def _schema_sql(schema: TableSchema) -> str:
     return f'CREATE TABLE IF NOT EXISTS "{schema.name}" ({columns})'
 
 
-def ensure_warehouse_tables(connection: Any) -> None:
-    for schema in CANONICAL_SCHEMAS.values():
+def ensure_warehouse_tables(connection: Any, schemas: Iterable[TableSchema] | None = None) -> None:
+    for schema in CANONICAL_SCHEMAS.values() if schemas is None else schemas:
         connection.execute(_schema_sql(schema))
+        # Warehouses created before a column was added to the contract get it appended in place.
+        existing = {str(row[0]) for row in connection.execute(f'DESCRIBE "{schema.name}"').fetchall()}
+        for column in schema.columns:
+            if column.name not in existing:
+                connection.execute(f'ALTER TABLE "{schema.name}" ADD COLUMN "{column.name}" {column.duckdb_type}')
 
 
 def upsert_canonical_tables(warehouse_path: Path, canonical_tables: dict[str, pd.DataFrame], season: int) -> dict[str, int]:
@@ -604,6 +813,60 @@ def load_canonical_tables_for_season(warehouse_path: Path, season: int) -> dict[
         con.close()
 
 
+def load_canonical_table(warehouse_path: Path, table_name: str) -> pd.DataFrame:
+    duckdb = _load_duckdb()
+    if not warehouse_path.exists():
+        raise FileNotFoundError(f"warehouse_not_found: {warehouse_path}")
+    con = duckdb.connect(str(warehouse_path), read_only=True)
+    try:
+        frame = con.execute(f'SELECT * FROM "{table_name}" ORDER BY season_year').fetch_df()
+        return cast_frame_to_schema(frame, CANONICAL_SCHEMAS[table_name])
+    finally:
+        con.close()
+
+
+def load_season_rows(warehouse_path: Path, schema: TableSchema, season: int) -> pd.DataFrame:
+    if not warehouse_path.exists():
+        return empty_typed_frame(schema)
+    duckdb = _load_duckdb()
+    con = duckdb.connect(str(warehouse_path), read_only=True)
+    try:
+        existing_tables = {row[0] for row in con.execute("SHOW TABLES").fetchall()}
+        if schema.name not in existing_tables:
+            return empty_typed_frame(schema)
+        frame = con.execute(f'SELECT * FROM "{schema.name}" WHERE season_year = ?', [int(season)]).fetch_df()
+        return cast_frame_to_schema(frame, schema)
+    finally:
+        con.close()
+
+
+def write_season_rows(
+    warehouse_path: Path,
+    schema: TableSchema,
+    frame: pd.DataFrame,
+    season: int,
+    *,
+    replace: bool,
+) -> int:
+    # replace=True swaps the whole season; otherwise rows are appended to what is already stored.
+    duckdb = _load_duckdb()
+    warehouse_path.parent.mkdir(parents=True, exist_ok=True)
+    typed = cast_frame_to_schema(frame.assign(season_year=int(season)), schema)
+    con = duckdb.connect(str(warehouse_path))
+    try:
+        ensure_warehouse_tables(con, [schema])
+        if replace:
+            con.execute(f'DELETE FROM "{schema.name}" WHERE season_year = ?', [int(season)])
+        temp_name = f"staging_{schema.name}"
+        con.register(temp_name, typed)
+        columns_sql = ", ".join(f'"{column}"' for column in schema.column_names)
+        con.execute(f'INSERT INTO "{schema.name}" ({columns_sql}) SELECT {columns_sql} FROM "{temp_name}"')
+        con.unregister(temp_name)
+    finally:
+        con.close()
+    return int(len(typed))
+
+
 def validate_warehouse_contract(warehouse_path: Path, season: int) -> dict[str, Any]:
     blocking_errors: list[str] = []
     warnings: list[str] = []
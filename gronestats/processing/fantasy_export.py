@@ -7,11 +7,11 @@ import pandas as pd
 from gronestats.processing.fantasy_pricing import (
     _remap_prices_by_position_quantiles,
     _round_float_columns,
-    _safe_per_match,
     _stretch_goalkeeper_prices,
     apply_price_outlier_corrections,
     calculate_price,
 )
+from gronestats.stats.player_stats import per_match
 
 
 FANTASY_EXPORT_TABLES = (
@@ -194,13 +194,13 @@ def build_players_fantasy_export(players: pd.DataFrame, player_totals: pd.DataFr
     for column in ["goals", "assists", "saves", "fouls", "minutesplayed", "penaltywon", "penaltysave", "penaltyconceded", "matches_played"]:
         fantasy[column] = pd.to_numeric(fantasy.get(column, 0), errors="coerce").fillna(0)
 
-    fantasy["goals_pm"] = _safe_per_match(fantasy["goals"], fantasy["matches_played"])
-    fantasy["assists_pm"] = _safe_per_match(fantasy["assists"], fantasy["matches_played"])
-    fantasy["saves_pm"] = _safe_per_match(fantasy["saves"], fantasy["matches_played"])
-    fantasy["fouls_pm"] = _safe_per_match(fantasy["fouls"], fantasy["matches_played"])
-    fantasy["penaltywon_pm"] = _safe_per_match(fantasy["penaltywon"], fantasy["matches_played"])
-    fantasy["penaltysave_pm"] = _safe_per_match(fantasy["penaltysave"], fantasy["matches_played"])
-    fantasy["penaltyconceded_pm"] = _safe_per_match(fantasy["penaltyconceded"], fantasy["matches_played"])
+    fantasy["goals_pm"] = per_match(fantasy["goals"], fantasy["matches_played"])
+    fantasy["assists_pm"] = per_match(fantasy["assists"], fantasy["matches_played"])
+    fantasy["saves_pm"] = per_match(fantasy["saves"], fantasy["matches_played"])
+    fantasy["fouls_pm"] = per_match(fantasy["fouls"], fantasy["matches_played"])
+    fantasy["penaltywon_pm"] = per_match(fantasy["penaltywon"], fantasy["matches_played"])
+    fantasy["penaltysave_pm"] = per_match(fantasy["penaltysave"], fantasy["matches_played"])
+    fantasy["penaltyconceded_pm"] = per_match(fantasy["penaltyconceded"], fantasy["matches_played"])
     fantasy["price"] = fantasy.apply(calculate_price, axis=1)
 
     valid_mask = fantasy["minutesplayed"] >= 90
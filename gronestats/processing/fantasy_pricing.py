@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import pandas as pd
 
+from gronestats.stats.player_stats import per_match
+
 
 def _round_float_columns(df: pd.DataFrame, decimals: int = 2) -> pd.DataFrame:
     if df.empty:
@@ -15,8 +17,7 @@ def _round_float_columns(df: pd.DataFrame, decimals: int = 2) -> pd.DataFrame:
 
 
 def _safe_per_match(series: pd.Series, matches: pd.Series) -> pd.Series:
-    safe_matches = matches.where(matches > 0)
-    return series.div(safe_matches).fillna(0)
+    return per_match(series, matches)
 
 
 def _stretch_goalkeeper_prices(
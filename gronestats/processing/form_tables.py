@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from gronestats.processing.canonical_warehouse import (
+    DASHBOARD_EXPORT_SCHEMAS,
+    FORM_STATE_SCHEMAS,
+    cast_frame_to_schema,
+    load_season_rows,
+    write_season_rows,
+)
+from gronestats.stats.form import (
+    PLAYER_FORM_SPEC,
+    TEAM_FORM_SPEC,
+    FormSpec,
+    extend_form,
+    latest_form,
+    player_form_inputs,
+    sort_form_rows,
+    team_form_inputs,
+)
+
+
+FORM_TABLES = ("team_form", "player_form")
+FORM_STATE_TABLES: dict[str, tuple[str, FormSpec]] = {
+    "team_form": ("team_form_state", TEAM_FORM_SPEC),
+    "player_form": ("player_form_state", PLAYER_FORM_SPEC),
+}
+
+
+def form_inputs_from_canonical(canonical_tables: dict[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
+    matches = canonical_tables.get("matches_canonical", pd.DataFrame())
+    player_match = canonical_tables.get("player_match_canonical", pd.DataFrame())
+    return {
+        "team_form": team_form_inputs(matches),
+        "player_form": player_form_inputs(player_match, matches),
+    }
+
+
+def _same_values(left: pd.Series, right: pd.Series) -> np.ndarray:
+    both_missing = (left.isna() & right.isna()).to_numpy(dtype=bool)
+    equal = (left == right).fillna(False).to_numpy(dtype=bool)
+    return equal | both_missing
+
+
+def plan_form_update(state: pd.DataFrame, inputs: pd.DataFrame, spec: FormSpec, schema_name: str) -> pd.DataFrame | None:
+    """Return the input rows still missing from `state`, or None when the season must be rebuilt.
+
+    Appending is only safe when every stored match is unchanged and each team/player's new
+    matches come after the ones already folded into its form.
+    """
+    if state.empty:
+        return None
+    keys = [spec.key, "match_id"]
+    schema = FORM_STATE_SCHEMAS[schema_name]
+    current = cast_frame_to_schema(inputs.assign(season_year=0), schema)[list(spec.input_columns)]
+    previous = state[list(spec.input_columns)]
+
+    stored = previous.merge(current, on=keys, how="left", suffixes=("", "_current"), indicator=True)
+    if (stored["_merge"] != "both").any():
+        return None
+    for column in spec.input_columns:
+        if column in keys:
+            continue
+        if not _same_values(stored[column], stored[f"{column}_current"]).all():
+            return None
+
+    marked = current.merge(previous[keys], on=keys, how="left", indicator=True)
+    new_rows = current.loc[(marked["_merge"] == "left_only").to_numpy()]
+    if new_rows.empty:
+        return new_rows
+
+    ordered = sort_form_rows(
+        pd.concat(
+            [previous[[*keys, "match_date"]].assign(is_new=False), new_rows[[*keys, "match_date"]].assign(is_new=True)],
+            ignore_index=True,
+        )
+    )
+    ordered["position"] = np.arange(len(ordered))
+    last_stored = ordered.loc[~ordered["is_new"]].groupby(spec.key)["position"].max()
+    first_new = ordered.loc[ordered["is_new"]].groupby(spec.key)["position"].min()
+    aligned = pd.concat([last_stored.rename("last_stored"), first_new.rename("first_new")], axis=1).dropna()
+    if (aligned["first_new"] < aligned["last_stored"]).any():
+        return None
+    return new_rows
+
+
+def update_form_state(warehouse_path: Path, canonical_tables: dict[str, pd.DataFrame], season: int) -> dict[str, dict[str, Any]]:
+    # Only matches not yet folded into the stored form are processed; a corrected or
+    # out-of-order match falls back to recomputing the season for that table.
+    inputs = form_inputs_from_canonical(canonical_tables)
+    summary: dict[str, dict[str, Any]] = {}
+    for table_name, (schema_name, spec) in FORM_STATE_TABLES.items():
+        schema = FORM_STATE_SCHEMAS[schema_name]
+        state = load_season_rows(warehouse_path, schema, season)
+        new_rows = plan_form_update(state, inputs[table_name], spec, schema_name)
+        if new_rows is None:
+            computed = extend_form(pd.DataFrame(), inputs[table_name], spec)
+            rows_written = write_season_rows(warehouse_path, schema, computed, season, replace=True)
+            summary[schema_name] = {"mode": "rebuilt", "rows_written": rows_written}
+        else:
+            computed = extend_form(state, new_rows, spec)
+            rows_written = write_season_rows(warehouse_path, schema, computed, season, replace=False) if not computed.empty else 0
+            summary[schema_name] = {"mode": "appended", "rows_written": rows_written}
+    return summary
+
+
+def build_form_tables(form_states: dict[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
+    team = latest_form(form_states.get("team_form", pd.DataFrame()), TEAM_FORM_SPEC).rename(
+        columns={"match_id": "last_match_id", "match_date": "last_match_date", "streak_value": "streak_result"}
+    )
+    player = latest_form(form_states.get("player_form", pd.DataFrame()), PLAYER_FORM_SPEC).rename(
+        columns={"match_id": "last_match_id", "match_date": "last_match_date"}
+    )
+    scoring = player["streak_value"].astype(str) == "True"
+    player["scoring_streak"] = np.where(scoring, player["streak_length"], 0)
+    return {
+        "team_form": cast_frame_to_schema(team, DASHBOARD_EXPORT_SCHEMAS["team_form"]),
+        "player_form": cast_frame_to_schema(player, DASHBOARD_EXPORT_SCHEMAS["player_form"]),
+    }
+
+
+def load_form_tables(warehouse_path: Path, season: int) -> dict[str, pd.DataFrame]:
+    return build_form_tables(
+        {
+            table_name: load_season_rows(warehouse_path, FORM_STATE_SCHEMAS[schema_name], season)
+            for table_name, (schema_name, _) in FORM_STATE_TABLES.items()
+        }
+    )
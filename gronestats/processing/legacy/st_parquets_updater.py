@@ -22,6 +22,7 @@ try:
         _round_float_columns,
         _stretch_goalkeeper_prices,
         _remap_prices_by_position_quantiles,
+        _safe_per_match,
     )
 except ModuleNotFoundError:
     BASE_DIR = repository_root()
@@ -33,6 +34,7 @@ except ModuleNotFoundError:
         _round_float_columns,
         _stretch_goalkeeper_prices,
         _remap_prices_by_position_quantiles,
+        _safe_per_match,
     )
 
 # -------------------------
@@ -390,11 +392,6 @@ def build_view(players_fantasy: pd.DataFrame, players: pd.DataFrame, teams: pd.D
     return view
 
 
-def _safe_per_match(series: pd.Series, matches: pd.Series) -> pd.Series:
-    safe_matches = matches.where(matches > 0)
-    return series.div(safe_matches).fillna(0)
-
-
 def recalc_players_fantasy(players_fantasy: pd.DataFrame, players: pd.DataFrame) -> pd.DataFrame:
     fantasy = normalize_player_columns(players_fantasy)
     players = normalize_player_columns(players)
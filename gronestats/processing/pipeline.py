@@ -11,6 +11,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from gronestats.data_layout import SeasonDataLayout, season_layout
@@ -26,10 +27,21 @@ from gronestats.processing.fantasy_export import (
     FANTASY_EXPORT_TABLES,
     validate_fantasy_export_bundle,
 )
+from gronestats.processing.form_tables import FORM_TABLES, load_form_tables, update_form_state
 from gronestats.processing.optional_sheet_backfill import (
     load_optional_backfill_report_for_staging,
     warning_suffix_from_backfill_report,
 )
+from gronestats.processing.rating_tables import (
+    PROJECTION_TABLES,
+    RATING_TABLES,
+    build_projection_tables,
+    load_rating_tables,
+    update_rating_state,
+)
+from gronestats.scouting_index import update_scouting_index, vectors_from_canonical
+from gronestats.season_catalog import update_league_catalog_index, write_season_catalog
+from gronestats.stats.shot_coordinates import add_shot_coordinate_columns
 
 PROVIDER_NAME = "SofaScore (Opta-backed)"
 FANTASY_PROVIDER_NAME = "Fantasy Liga 1 Admin"
@@ -288,6 +300,8 @@ class RunContext:
     publish_target: str
     logger: "PipelineLogger"
     manifest: dict[str, Any]
+    prerender_assets: bool = False
+    prerender_workers: int | None = None
 
 
 class PipelineLogger:
@@ -453,6 +467,24 @@ def latest_master_clean_path(paths: PipelinePaths) -> Path:
     return latest
 
 
+def upcoming_master_fixtures(paths: PipelinePaths) -> pd.DataFrame:
+    # The raw master still lists scheduled matches (no score yet); canonical tables only keep played ones.
+    columns = ["match_id", "home_id", "away_id", "tournament", "round_number"]
+    latest = find_latest_file(paths.raw_master_raw_dir, "*.xlsx")
+    if latest is None:
+        return pd.DataFrame(columns=columns)
+    master = pd.read_excel(latest)
+    if not {"match_id", "home_id", "away_id", "home_score"}.issubset(master.columns):
+        return pd.DataFrame(columns=columns)
+    pending = master.loc[master["home_score"].isna()].dropna(subset=["match_id", "home_id", "away_id"])
+    fixtures = pending[["match_id", "home_id", "away_id"]].astype("int64")
+    fixtures["tournament"] = pending["tournament"].astype("string") if "tournament" in pending.columns else pd.NA
+    fixtures["round_number"] = (
+        pd.to_numeric(pending["round_number"], errors="coerce").astype("Int64") if "round_number" in pending.columns else pd.NA
+    )
+    return fixtures.reset_index(drop=True)
+
+
 def candidate_source_season_dirs(paths: PipelinePaths) -> list[Path]:
     candidates: list[Path] = []
     seen: set[str] = set()
@@ -1488,17 +1520,17 @@ def build_shot_events_curated(shotmap_raw: pd.DataFrame, matches: pd.DataFrame)
     match_lookup = matches[["match_id", "home_id", "away_id", "home", "away"]].copy() if {"match_id", "home_id", "away_id", "home", "away"}.issubset(matches.columns) else pd.DataFrame()
     if not match_lookup.empty:
         result = result.merge(match_lookup, on="match_id", how="left")
-        result["is_home_resolved"] = result["is_home"].fillna(False).astype(bool)
-        result["team_id"] = result.apply(
-            lambda row: row.get("home_id") if row.get("is_home_resolved") else row.get("away_id"),
-            axis=1,
-        )
-        result["team_name"] = result.apply(
-            lambda row: row.get("home") if row.get("is_home_resolved") else row.get("away"),
-            axis=1,
-        )
-        result = result.drop(columns=["home_id", "away_id", "home", "away", "is_home_resolved"], errors="ignore")
-        result["team_id"] = pd.to_numeric(result["team_id"], errors="coerce").astype("Int64")
+        is_home = result["is_home"].fillna(False).astype(bool).to_numpy()
+        home_ids = pd.to_numeric(result["home_id"], errors="coerce").astype("float64").to_numpy()
+        away_ids = pd.to_numeric(result["away_id"], errors="coerce").astype("float64").to_numpy()
+        result["team_id"] = pd.Series(np.where(is_home, home_ids, away_ids), index=result.index).astype("Int64")
+        result["team_name"] = pd.Series(
+            np.where(is_home, result["home"].astype(object).to_numpy(), result["away"].astype(object).to_numpy()),
+            index=result.index,
+        ).astype("string")
+        result = result.drop(columns=["home_id", "away_id", "home", "away"], errors="ignore")
+    # Goal-mouth and block payloads are published as numbers so the dashboard never parses them per shot.
+    result = add_shot_coordinate_columns(result)
     result = result.sort_values(["match_id", "time_seconds", "shot_id"], kind="mergesort")
     return result.reset_index(drop=True)
 
@@ -2423,6 +2455,8 @@ def phase_build_warehouse(ctx: RunContext) -> dict[str, Any]:
     return {
         "warehouse_path": str(ctx.paths.warehouse_db_path),
         "canonical_rows": row_counts,
+        "form_state": update_form_state(ctx.paths.warehouse_db_path, canonical_tables, ctx.paths.season),
+        "rating_state": update_rating_state(ctx.paths.warehouse_db_path, canonical_tables, ctx.paths.season),
     }
 
 
@@ -2469,27 +2503,41 @@ def phase_publish(ctx: RunContext) -> dict[str, Any]:
     selected_targets = selected_publish_targets(ctx.publish_target)
     published: dict[str, dict[str, Any]] = {}
     canonical_tables = load_canonical_tables_for_season(ctx.paths.warehouse_db_path, ctx.paths.season)
+    form_tables = load_form_tables(ctx.paths.warehouse_db_path, ctx.paths.season)
+    rating_tables = load_rating_tables(ctx.paths.warehouse_db_path, ctx.paths.season, upcoming_master_fixtures(ctx.paths))
+    projection_tables = build_projection_tables(canonical_tables, rating_tables)
 
     if "dashboard" in selected_targets:
         reset_dir(ctx.paths.dashboard_release_dir, ctx.paths.season_dir)
         dashboard_bundle = build_dashboard_bundle_from_canonical(canonical_tables)
-        write_table_bundle(ctx.paths.dashboard_release_dir, dashboard_bundle)
+        write_table_bundle(ctx.paths.dashboard_release_dir, {**dashboard_bundle, **form_tables, **rating_tables, **projection_tables})
         shutil.copy2(ctx.paths.manifest_path, ctx.paths.dashboard_release_dir / "manifest.json")
         shutil.copy2(ctx.paths.validation_path, ctx.paths.dashboard_release_dir / "validation.json")
+        write_season_catalog(ctx.paths.dashboard_release_dir, season_year=ctx.paths.season)
         published["dashboard"] = {
             "release_dir": str(ctx.paths.dashboard_release_dir),
             "current_dir": str(ctx.paths.dashboard_current_dir),
             "published_tables": [
                 table_name
-                for table_name in REQUIRED_CURATED_TABLES
+                for table_name in (*REQUIRED_CURATED_TABLES, *FORM_TABLES, *RATING_TABLES, *PROJECTION_TABLES)
                 if (ctx.paths.dashboard_release_dir / f"{table_name}.parquet").exists()
             ],
         }
+        if ctx.prerender_assets:
+            # Imported lazily so pipeline runs without the dashboard stack unless assets are requested.
+            from gronestats.dashboard.prerender import prerender_release_assets
+
+            ctx.logger.log("Pre-rendering dashboard figures into the release directory")
+            published["dashboard"]["prerendered_assets"] = prerender_release_assets(
+                ctx.paths.dashboard_release_dir,
+                season_year=ctx.paths.season,
+                max_workers=ctx.prerender_workers,
+            )
 
     if "fantasy" in selected_targets:
         reset_dir(ctx.paths.fantasy_release_dir, ctx.paths.season_dir)
         fantasy_bundle = build_fantasy_bundle_from_canonical(canonical_tables)
-        write_table_bundle(ctx.paths.fantasy_release_dir, fantasy_bundle)
+        write_table_bundle(ctx.paths.fantasy_release_dir, {**fantasy_bundle, **form_tables, **rating_tables})
         shutil.copy2(ctx.paths.manifest_path, ctx.paths.fantasy_release_dir / "manifest.json")
         shutil.copy2(ctx.paths.validation_path, ctx.paths.fantasy_release_dir / "validation.json")
         published["fantasy"] = {
@@ -2497,13 +2545,25 @@ def phase_publish(ctx: RunContext) -> dict[str, Any]:
             "current_dir": str(ctx.paths.fantasy_current_dir),
             "published_tables": [
                 table_name
-                for table_name in FANTASY_EXPORT_TABLES
+                for table_name in (*FANTASY_EXPORT_TABLES, *FORM_TABLES, *RATING_TABLES)
                 if (ctx.paths.fantasy_release_dir / f"{table_name}.parquet").exists()
             ],
         }
 
     if "dashboard" in selected_targets:
         publish_release_atomically(ctx.paths.dashboard_release_dir, ctx.paths.dashboard_current_dir)
+        published["dashboard"]["catalog_index"] = str(
+            update_league_catalog_index(ctx.paths.league, repo_root=ctx.paths.base_dir)
+        )
+        published["dashboard"]["scouting_index"] = str(
+            update_scouting_index(
+                vectors_from_canonical(canonical_tables, season_year=ctx.paths.season),
+                season_year=ctx.paths.season,
+                league=ctx.paths.league,
+                repo_root=ctx.paths.base_dir,
+                warehouse_path=ctx.paths.warehouse_db_path,
+            )
+        )
     if "fantasy" in selected_targets:
         publish_release_atomically(ctx.paths.fantasy_release_dir, ctx.paths.fantasy_current_dir)
 
@@ -2535,6 +2595,8 @@ def run_pipeline(args: argparse.Namespace) -> int:
         publish_target=args.publish_target,
         logger=logger,
         manifest=manifest,
+        prerender_assets=bool(getattr(args, "prerender_assets", False)),
+        prerender_workers=getattr(args, "prerender_workers", None),
     )
 
     if args.dry_run:
@@ -2670,6 +2732,12 @@ def build_parser() -> argparse.ArgumentParser:
     run_parser.add_argument("--force", action="store_true")
     run_parser.add_argument("--publish-target", choices=PUBLISH_TARGET_CHOICES, default="all")
     run_parser.add_argument("--dry-run", action="store_true")
+    run_parser.add_argument(
+        "--prerender-assets",
+        action="store_true",
+        help="Render match and full-season player figures into the dashboard release at publish time.",
+    )
+    run_parser.add_argument("--prerender-workers", type=int, default=None, help="Worker processes for --prerender-assets.")
 
     validate_parser = subparsers.add_parser("validate", help="Validate a published release or dashboard/current.")
     validate_parser.add_argument("--league", default="Liga 1 Peru")
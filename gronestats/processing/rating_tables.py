@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from gronestats.processing.canonical_warehouse import (
+    DASHBOARD_EXPORT_SCHEMAS,
+    RATING_STATE_SCHEMAS,
+    cast_frame_to_schema,
+    load_season_rows,
+    write_season_rows,
+)
+from gronestats.stats.ratings import (
+    RatingState,
+    advance_ratings,
+    carry_over_elo,
+    fixture_probabilities,
+    rating_inputs,
+    state_from_ratings,
+)
+from gronestats.stats.season_simulation import simulate_season
+
+
+RATING_TABLES = ("team_ratings", "match_probabilities")
+PROJECTION_TABLES = ("season_projections",)
+RATING_MATCH_KEYS = ["match_id", "step", "home_id", "away_id", "home_score", "away_score"]
+
+
+def previous_season_elo(warehouse_path: Path, season: int) -> pd.Series | None:
+    # Elo carries across seasons (regressed toward the mean); the Poisson fit restarts from its prior.
+    previous = load_season_rows(warehouse_path, RATING_STATE_SCHEMAS["team_rating_state"], season - 1)
+    if previous.empty:
+        return None
+    final = state_from_ratings(previous).elo
+    return carry_over_elo(final)
+
+
+def plan_rating_update(match_state: pd.DataFrame, inputs: pd.DataFrame) -> pd.DataFrame | None:
+    """Return the matches still missing from `match_state`, or None when the season must be refit.
+
+    Appending is only safe when every stored match is unchanged and all new matches fall in
+    steps after the last one already fitted.
+    """
+    if match_state.empty:
+        return None
+    stored = match_state[RATING_MATCH_KEYS].merge(
+        inputs[RATING_MATCH_KEYS], on="match_id", how="left", suffixes=("", "_current"), indicator=True
+    )
+    if (stored["_merge"] != "both").any():
+        return None
+    for column in RATING_MATCH_KEYS[1:]:
+        if not (stored[column].astype("int64") == stored[f"{column}_current"].astype("int64")).all():
+            return None
+    new_rows = inputs.loc[~inputs["match_id"].isin(match_state["match_id"])]
+    if not new_rows.empty and int(new_rows["step"].min()) <= int(match_state["step"].max()):
+        return None
+    return new_rows
+
+
+def update_rating_state(
+    warehouse_path: Path,
+    canonical_tables: dict[str, pd.DataFrame],
+    season: int,
+) -> dict[str, Any]:
+    # Only steps not yet fitted are processed; a corrected or late-arriving result refits the season.
+    inputs = rating_inputs(canonical_tables.get("matches_canonical", pd.DataFrame()))
+    match_schema = RATING_STATE_SCHEMAS["match_rating_state"]
+    team_schema = RATING_STATE_SCHEMAS["team_rating_state"]
+    match_state = load_season_rows(warehouse_path, match_schema, season)
+    new_rows = plan_rating_update(match_state, inputs)
+
+    if new_rows is None:
+        state = RatingState.initial(previous_season_elo(warehouse_path, season))
+        probabilities, ratings, _ = advance_ratings(inputs.iloc[0:0], inputs, state)
+        mode, replace = "rebuilt", True
+        new_rows = inputs
+    else:
+        team_state = load_season_rows(warehouse_path, team_schema, season)
+        played = match_state.sort_values(["step", "match_id"], kind="mergesort")
+        probabilities, ratings, _ = advance_ratings(played, new_rows, state_from_ratings(team_state))
+        mode, replace = "appended", False
+
+    matches_written = 0
+    steps_written = 0
+    if replace or not new_rows.empty:
+        match_rows = new_rows.merge(probabilities.drop(columns=["step", "home_id", "away_id"]), on="match_id", how="left")
+        matches_written = write_season_rows(warehouse_path, match_schema, match_rows, season, replace=replace)
+        write_season_rows(warehouse_path, team_schema, ratings, season, replace=replace)
+        steps_written = int(ratings["step"].nunique()) if not ratings.empty else 0
+    return {"mode": mode, "matches_written": matches_written, "steps_written": steps_written}
+
+
+def build_rating_tables(
+    match_state: pd.DataFrame,
+    team_state: pd.DataFrame,
+    fixtures: pd.DataFrame | None = None,
+) -> dict[str, pd.DataFrame]:
+    state = state_from_ratings(team_state)
+    latest = team_state.loc[team_state["step"] == state.last_step] if not team_state.empty else team_state
+    latest = latest.loc[latest["matches_played"] > 0].sort_values("team_id").reset_index(drop=True)
+
+    team = latest[["team_id", "step_date", "matches_played", "attack", "defence", "elo"]].rename(columns={"step_date": "rated_at"})
+    team["net_rating"] = team["attack"] + team["defence"]
+    team["net_rank"] = team["net_rating"].rank(ascending=False, method="min").astype("Int64")
+    # Elo moved only by each side's latest match, so its pre-match rating gives the last change.
+    sides = pd.concat(
+        [
+            match_state[["step", "match_id", "home_id", "elo_home"]].set_axis(["step", "match_id", "team_id", "elo_before"], axis=1),
+            match_state[["step", "match_id", "away_id", "elo_away"]].set_axis(["step", "match_id", "team_id", "elo_before"], axis=1),
+        ],
+        ignore_index=True,
+    )
+    last_match = sides.sort_values(["step", "match_id"], kind="mergesort").groupby("team_id").tail(1)
+    team = team.merge(last_match[["team_id", "elo_before"]], on="team_id", how="left")
+    team["elo_change"] = team["elo"] - team["elo_before"]
+    # Expected goals against a league-average opponent, splitting the home edge.
+    neutral = state.poisson.intercept + state.poisson.home_advantage / 2
+    team["expected_goals_for"] = np.exp(neutral + team["attack"])
+    team["expected_goals_against"] = np.exp(neutral - team["defence"])
+
+    played = match_state.assign(is_played=True)
+    upcoming = pd.DataFrame()
+    if fixtures is not None and not fixtures.empty and not team_state.empty:
+        pending = fixtures.loc[~fixtures["match_id"].isin(match_state["match_id"])]
+        upcoming = fixture_probabilities(pending, state).assign(is_played=False)
+        for column in ("tournament", "round_number"):
+            if column in pending.columns:
+                upcoming[column] = pending[column].to_numpy()
+    frames = [frame for frame in (played, upcoming) if not frame.empty]
+    probabilities = pd.DataFrame()
+    if frames:
+        probabilities = pd.concat(frames, ignore_index=True).sort_values(
+            ["is_played", "match_id"], ascending=[False, True], kind="mergesort"
+        )
+    return {
+        "team_ratings": cast_frame_to_schema(team, DASHBOARD_EXPORT_SCHEMAS["team_ratings"]),
+        "match_probabilities": cast_frame_to_schema(probabilities, DASHBOARD_EXPORT_SCHEMAS["match_probabilities"]),
+    }
+
+
+def load_rating_tables(warehouse_path: Path, season: int, fixtures: pd.DataFrame | None = None) -> dict[str, pd.DataFrame]:
+    return build_rating_tables(
+        load_season_rows(warehouse_path, RATING_STATE_SCHEMAS["match_rating_state"], season),
+        load_season_rows(warehouse_path, RATING_STATE_SCHEMAS["team_rating_state"], season),
+        fixtures,
+    )
+
+
+def build_projection_tables(canonical_tables: dict[str, pd.DataFrame], rating_tables: dict[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
+    # Monte Carlo completion of the season from the played results and the pending fixtures' odds.
+    probabilities = rating_tables["match_probabilities"]
+    teams = canonical_tables.get("teams_canonical", pd.DataFrame())
+    team_names = (
+        dict(zip(teams["team_id"].astype("int64"), teams["short_name"].astype(str)))
+        if {"team_id", "short_name"}.issubset(teams.columns)
+        else None
+    )
+    projections = simulate_season(
+        canonical_tables.get("matches_canonical", pd.DataFrame()),
+        probabilities.loc[~probabilities["is_played"].astype(bool)],
+        team_names=team_names,
+    )["season_projections"]
+    return {"season_projections": cast_frame_to_schema(projections, DASHBOARD_EXPORT_SCHEMAS["season_projections"])}
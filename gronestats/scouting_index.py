@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from gronestats.data_layout import DEFAULT_LEAGUE_NAME, league_data_root, league_warehouse_db_path, season_layout
+from gronestats.processing.canonical_warehouse import load_canonical_table
+from gronestats.stats.similarity import DEFAULT_SIMILARITY_FEATURES, build_similarity_features
+
+
+SCOUTING_INDEX_FILENAME = "scouting_index.parquet"
+SCOUTING_MIN_MINUTES = 450
+SCOUTING_FEATURE_COLUMNS = [feature.column for feature in DEFAULT_SIMILARITY_FEATURES]
+SCOUTING_IDENTITY_COLUMNS = ["season_year", "player_id", "name", "team_id", "position", "minutesplayed", "matches_played"]
+SCOUTING_INDEX_COLUMNS = [*SCOUTING_IDENTITY_COLUMNS, *SCOUTING_FEATURE_COLUMNS]
+
+
+def scouting_index_path(league: str = DEFAULT_LEAGUE_NAME, *, repo_root: Path | None = None) -> Path:
+    return league_data_root(league, repo_root=repo_root) / SCOUTING_INDEX_FILENAME
+
+
+def build_season_vectors(
+    player_match: pd.DataFrame,
+    player_totals: pd.DataFrame | None,
+    *,
+    season_year: int,
+    min_minutes: int = SCOUTING_MIN_MINUTES,
+) -> pd.DataFrame:
+    features = build_similarity_features(player_match, player_totals, min_minutes=min_minutes)
+    if features.empty:
+        return pd.DataFrame(columns=SCOUTING_INDEX_COLUMNS)
+    features["season_year"] = int(season_year)
+    vectors = features[SCOUTING_INDEX_COLUMNS].copy()
+    vectors["season_year"] = vectors["season_year"].astype("int64")
+    vectors["player_id"] = vectors["player_id"].astype("int64")
+    vectors["name"] = vectors["name"].astype("string")
+    vectors[["minutesplayed", "matches_played"]] = vectors[["minutesplayed", "matches_played"]].astype("int64")
+    vectors[SCOUTING_FEATURE_COLUMNS] = vectors[SCOUTING_FEATURE_COLUMNS].astype("float64")
+    return vectors
+
+
+def vectors_from_canonical(canonical_tables: dict[str, pd.DataFrame], *, season_year: int) -> pd.DataFrame:
+    return build_season_vectors(
+        canonical_tables.get("player_match_canonical", pd.DataFrame()).drop(columns=["season_year"], errors="ignore"),
+        canonical_tables.get("player_totals_season_canonical", pd.DataFrame()).drop(columns=["season_year"], errors="ignore"),
+        season_year=season_year,
+    )
+
+
+def _write_index(path: Path, vectors: pd.DataFrame) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.tmp")
+    ordered = vectors.sort_values(["season_year", "player_id"], kind="mergesort").reset_index(drop=True)
+    ordered[SCOUTING_INDEX_COLUMNS].to_parquet(temp_path, index=False)
+    temp_path.replace(path)
+
+
+def _published_season_vectors(league: str, repo_root: Path | None) -> list[pd.DataFrame]:
+    league_dir = league_data_root(league, repo_root=repo_root)
+    vectors: list[pd.DataFrame] = []
+    season_dirs = sorted(path for path in league_dir.iterdir() if path.is_dir() and path.name.isdigit()) if league_dir.exists() else []
+    for season_dir in season_dirs:
+        current_dir = season_layout(int(season_dir.name), league=league, repo_root=repo_root).dashboard.current_dir
+        if not (current_dir / "player_match.parquet").exists():
+            continue
+        totals_path = current_dir / "player_totals_full_season.parquet"
+        vectors.append(
+            build_season_vectors(
+                pd.read_parquet(current_dir / "player_match.parquet"),
+                pd.read_parquet(totals_path) if totals_path.exists() else None,
+                season_year=int(season_dir.name),
+            )
+        )
+    return vectors
+
+
+def _warehouse_season_vectors(warehouse_path: Path) -> list[pd.DataFrame]:
+    player_match = load_canonical_table(warehouse_path, "player_match_canonical")
+    player_totals = load_canonical_table(warehouse_path, "player_totals_season_canonical")
+    return [
+        build_season_vectors(
+            season_rows.drop(columns=["season_year"]),
+            player_totals.loc[player_totals["season_year"] == season_year].drop(columns=["season_year"]),
+            season_year=int(season_year),
+        )
+        for season_year, season_rows in player_match.groupby("season_year", sort=True)
+    ]
+
+
+def rebuild_scouting_index(
+    league: str = DEFAULT_LEAGUE_NAME,
+    *,
+    repo_root: Path | None = None,
+    warehouse_path: Path | None = None,
+) -> Path:
+    warehouse_path = warehouse_path or league_warehouse_db_path(league, repo_root=repo_root)
+    # The warehouse is the source of truth; checkouts without it fall back to published releases.
+    vectors = _warehouse_season_vectors(warehouse_path) if warehouse_path.exists() else _published_season_vectors(league, repo_root)
+    vectors = [frame for frame in vectors if not frame.empty]
+    path = scouting_index_path(league, repo_root=repo_root)
+    _write_index(path, pd.concat(vectors, ignore_index=True) if vectors else pd.DataFrame(columns=SCOUTING_INDEX_COLUMNS))
+    return path
+
+
+def update_scouting_index(
+    season_vectors: pd.DataFrame,
+    *,
+    season_year: int,
+    league: str = DEFAULT_LEAGUE_NAME,
+    repo_root: Path | None = None,
+    warehouse_path: Path | None = None,
+) -> Path:
+    path = scouting_index_path(league, repo_root=repo_root)
+    if not path.exists():
+        return rebuild_scouting_index(league, repo_root=repo_root, warehouse_path=warehouse_path)
+    # Publishing one season only swaps that season's rows; the other seasons are not recomputed.
+    existing = pd.read_parquet(path)
+    kept = existing.loc[existing["season_year"] != int(season_year)]
+    frames = [frame for frame in [kept, season_vectors] if not frame.empty]
+    _write_index(path, pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=SCOUTING_INDEX_COLUMNS))
+    return path
+
+
+@dataclass(frozen=True)
+class ScoutingIndex:
+    players: pd.DataFrame
+    matrix: np.ndarray
+    squared_norms: np.ndarray
+    rows: dict[tuple[int, int], int]
+
+    @classmethod
+    def from_frame(cls, vectors: pd.DataFrame) -> ScoutingIndex:
+        players = vectors.reset_index(drop=True)
+        if players.empty:
+            return cls(players=players, matrix=np.empty((0, len(SCOUTING_FEATURE_COLUMNS))), squared_norms=np.empty(0), rows={})
+        values = players[SCOUTING_FEATURE_COLUMNS].astype("float64")
+        values = values.fillna(values.median()).fillna(0.0).to_numpy(dtype="float64")
+        # Standardizing across every season puts per-90 rates from different years on one scale.
+        std = values.std(axis=0)
+        matrix = np.ascontiguousarray((values - values.mean(axis=0)) / np.where(std > 0, std, 1.0))
+        rows = {
+            (int(season_year), int(player_id)): row
+            for row, (season_year, player_id) in enumerate(zip(players["season_year"].tolist(), players["player_id"].tolist()))
+        }
+        return cls(players=players, matrix=matrix, squared_norms=np.einsum("ij,ij->i", matrix, matrix), rows=rows)
+
+    @classmethod
+    def load(cls, league: str = DEFAULT_LEAGUE_NAME, *, repo_root: Path | None = None) -> ScoutingIndex:
+        path = scouting_index_path(league, repo_root=repo_root)
+        return cls.from_frame(pd.read_parquet(path) if path.exists() else pd.DataFrame(columns=SCOUTING_INDEX_COLUMNS))
+
+    @property
+    def seasons(self) -> list[int]:
+        return sorted(set(int(season_year) for season_year, _ in self.rows))
+
+    def player_seasons(self, player_id: int) -> list[int]:
+        return sorted(season_year for season_year, candidate_id in self.rows if candidate_id == int(player_id))
+
+    def nearest_many(
+        self,
+        queries: list[tuple[int, int]],
+        k: int = 10,
+        *,
+        seasons: list[int] | None = None,
+        same_position: bool = False,
+        exclude_same_player: bool = True,
+    ) -> pd.DataFrame:
+        result_columns = ["query_season_year", "query_player_id", "rank", "season_year", "player_id", "distance"]
+        query_rows = np.array([self.rows[(int(season), int(player))] for season, player in queries if (int(season), int(player)) in self.rows], dtype="int64")
+        if query_rows.size == 0 or k <= 0:
+            return pd.DataFrame(columns=result_columns)
+
+        # Brute-force k-NN: one BLAS matrix product gives every squared euclidean distance.
+        distances = self.squared_norms[query_rows][:, None] + self.squared_norms[None, :] - 2.0 * (self.matrix[query_rows] @ self.matrix.T)
+        candidate_ids = self.players["player_id"].to_numpy(dtype="int64")
+        candidate_seasons = self.players["season_year"].to_numpy(dtype="int64")
+        excluded = np.zeros(distances.shape, dtype=bool)
+        excluded[np.arange(len(query_rows)), query_rows] = True
+        if exclude_same_player:
+            excluded |= candidate_ids[query_rows][:, None] == candidate_ids[None, :]
+        if seasons:
+            excluded |= ~np.isin(candidate_seasons, seasons)[None, :]
+        if same_position:
+            positions = self.players["position"].astype("string").fillna("").to_numpy(dtype=object)
+            excluded |= positions[query_rows][:, None] != positions[None, :]
+        distances = np.where(excluded, np.inf, np.maximum(distances, 0.0))
+
+        limit = min(k, distances.shape[1])
+        top = np.argpartition(distances, limit - 1, axis=1)[:, :limit]
+        top_distances = np.take_along_axis(distances, top, axis=1)
+        order = np.argsort(top_distances, axis=1, kind="stable")
+        top = np.take_along_axis(top, order, axis=1)
+        top_distances = np.take_along_axis(top_distances, order, axis=1)
+        result = pd.DataFrame(
+            {
+                "query_season_year": np.repeat(candidate_seasons[query_rows], limit),
+                "query_player_id": np.repeat(candidate_ids[query_rows], limit),
+                "rank": np.tile(np.arange(1, limit + 1, dtype="int64"), len(query_rows)),
+                "season_year": candidate_seasons[top].ravel(),
+                "player_id": candidate_ids[top].ravel(),
+                "distance": np.sqrt(top_distances.ravel()),
+            }
+        )
+        return result.loc[np.isfinite(result["distance"])].reset_index(drop=True)
+
+    def nearest(
+        self,
+        player_id: int,
+        season_year: int | None = None,
+        k: int = 10,
+        *,
+        seasons: list[int] | None = None,
+        same_position: bool = False,
+        exclude_same_player: bool = True,
+    ) -> pd.DataFrame:
+        player_seasons = self.player_seasons(player_id)
+        if not player_seasons:
+            return pd.DataFrame()
+        query_season = int(season_year) if season_year is not None else player_seasons[-1]
+        neighbours = self.nearest_many(
+            [(query_season, int(player_id))],
+            k,
+            seasons=seasons,
+            same_position=same_position,
+            exclude_same_player=exclude_same_player,
+        )
+        if neighbours.empty:
+            return neighbours
+        identity = self.players[SCOUTING_INDEX_COLUMNS]
+        return neighbours.drop(columns=["query_season_year", "query_player_id"]).merge(identity, on=["season_year", "player_id"], how="left")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Query or rebuild the cross-season player scouting index.")
+    parser.add_argument("--league", default=DEFAULT_LEAGUE_NAME)
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild every season from the warehouse (or published releases).")
+    parser.add_argument("--player-id", type=int)
+    parser.add_argument("--season", type=int, help="Season of the reference player; defaults to their latest season.")
+    parser.add_argument("--seasons", type=int, nargs="*", help="Restrict candidates to these seasons.")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--same-position", action="store_true")
+    args = parser.parse_args()
+
+    if args.rebuild:
+        print(rebuild_scouting_index(args.league))
+    if args.player_id is None:
+        return
+    index = ScoutingIndex.load(args.league)
+    neighbours = index.nearest(args.player_id, args.season, args.top, seasons=args.seasons, same_position=args.same_position)
+    if neighbours.empty:
+        print(f"Player {args.player_id} is not in the scouting index.")
+        return
+    neighbours["distance"] = neighbours["distance"].round(3)
+    print(neighbours[["rank", "season_year", "player_id", "name", "position", "minutesplayed", "distance"]].to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import argparse
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from gronestats.data_layout import DEFAULT_LEAGUE_NAME, league_data_root, season_layout
+
+
+SEASON_CATALOG_FILENAME = "catalog.json"
+LEAGUE_CATALOG_INDEX_FILENAME = "catalog_index.json"
+CATALOG_SCHEMA_VERSION = 1
+
+
+def _read_json(path: Path) -> dict[str, Any]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _read_parquet(path: Path, columns: list[str]) -> pd.DataFrame:
+    if not path.exists():
+        return pd.DataFrame()
+    return pd.read_parquet(path, columns=columns)
+
+
+def _write_json_atomically(path: Path, payload: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.tmp")
+    temp_path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+    temp_path.replace(path)
+
+
+def top_scorer(player_match: pd.DataFrame) -> tuple[str, int]:
+    if player_match.empty:
+        return ("Sin datos", 0)
+
+    work = player_match.copy()
+    if "player_id" in work.columns:
+        work["player_id"] = pd.to_numeric(work["player_id"], errors="coerce").astype("Int64")
+    if "goals" not in work.columns:
+        work["goals"] = 0
+    work["goals"] = pd.to_numeric(work["goals"], errors="coerce").fillna(0)
+    if "name" not in work.columns:
+        work["name"] = pd.NA
+    work["name"] = work["name"].astype("string").str.strip()
+    work = work.loc[work["player_id"].notna() & work["name"].notna()].copy()
+    if work.empty:
+        return ("Sin datos", 0)
+
+    scorers = (
+        work.groupby(["player_id", "name"], dropna=False)["goals"]
+        .sum()
+        .reset_index()
+        .sort_values(["goals", "name"], ascending=[False, True], kind="mergesort")
+        .reset_index(drop=True)
+    )
+    leader = scorers.iloc[0]
+    return (str(leader["name"]), int(leader["goals"]))
+
+
+def build_season_catalog(dataset_dir: Path, *, season_year: int) -> dict[str, Any]:
+    manifest = _read_json(dataset_dir / "manifest.json")
+    validation = _read_json(dataset_dir / "validation.json")
+    matches = _read_parquet(dataset_dir / "matches.parquet", ["match_id", "home_score", "away_score"])
+    teams = _read_parquet(dataset_dir / "teams.parquet", ["team_id"])
+    players = _read_parquet(dataset_dir / "players.parquet", ["player_id"])
+    player_match = _read_parquet(dataset_dir / "player_match.parquet", ["player_id", "name", "goals"])
+
+    player_ids: list[int] = []
+    if "player_id" in players.columns:
+        player_ids = sorted(set(pd.to_numeric(players["player_id"], errors="coerce").dropna().astype(int).tolist()))
+    match_count = int(matches["match_id"].nunique()) if "match_id" in matches.columns else 0
+    team_count = int(teams["team_id"].nunique()) if "team_id" in teams.columns else 0
+    goals = 0
+    if not matches.empty:
+        home_goals = pd.to_numeric(matches.get("home_score"), errors="coerce").fillna(0)
+        away_goals = pd.to_numeric(matches.get("away_score"), errors="coerce").fillna(0)
+        goals = int((home_goals + away_goals).sum())
+    top_scorer_name, top_scorer_goals = top_scorer(player_match)
+    warnings = validation.get("warnings", [])
+
+    return {
+        "schema_version": CATALOG_SCHEMA_VERSION,
+        "season_year": int(season_year),
+        "release_id": manifest.get("release_id"),
+        "ended_at": manifest.get("ended_at"),
+        "matches": match_count,
+        "teams": team_count,
+        "players": len(player_ids),
+        "goals": goals,
+        "goals_per_match": round(goals / match_count, 2) if match_count else 0.0,
+        "top_scorer": top_scorer_name,
+        "top_scorer_goals": top_scorer_goals,
+        "validation_status": str(validation.get("status", "unknown")),
+        "validated_at": validation.get("validated_at"),
+        "warnings": warnings if isinstance(warnings, list) else [],
+        "player_ids": player_ids,
+    }
+
+
+def write_season_catalog(dataset_dir: Path, *, season_year: int) -> dict[str, Any]:
+    catalog = build_season_catalog(dataset_dir, season_year=season_year)
+    _write_json_atomically(dataset_dir / SEASON_CATALOG_FILENAME, catalog)
+    return catalog
+
+
+def league_catalog_index_path(league: str = DEFAULT_LEAGUE_NAME, *, repo_root: Path | None = None) -> Path:
+    return league_data_root(league, repo_root=repo_root) / LEAGUE_CATALOG_INDEX_FILENAME
+
+
+def build_league_catalog_index(league: str = DEFAULT_LEAGUE_NAME, *, repo_root: Path | None = None) -> dict[str, Any]:
+    league_dir = league_data_root(league, repo_root=repo_root)
+    seasons: list[dict[str, Any]] = []
+    unique_player_ids: set[int] = set()
+    season_dirs = sorted(
+        (path for path in league_dir.iterdir() if path.is_dir() and path.name.isdigit()),
+        key=lambda path: int(path.name),
+        reverse=True,
+    ) if league_dir.exists() else []
+    for season_dir in season_dirs:
+        season_year = int(season_dir.name)
+        current_dir = season_layout(season_year, league=league, repo_root=repo_root).dashboard.current_dir
+        if not (current_dir / "matches.parquet").exists():
+            continue
+        catalog = _read_json(current_dir / SEASON_CATALOG_FILENAME)
+        # Releases published before catalog.json existed are summarized from their parquets once here.
+        if catalog.get("schema_version") != CATALOG_SCHEMA_VERSION:
+            catalog = build_season_catalog(current_dir, season_year=season_year)
+        unique_player_ids.update(int(player_id) for player_id in catalog.get("player_ids", []))
+        seasons.append({key: value for key, value in catalog.items() if key != "player_ids"})
+
+    total_matches = sum(int(entry["matches"]) for entry in seasons)
+    total_goals = sum(int(entry["goals"]) for entry in seasons)
+    return {
+        "schema_version": CATALOG_SCHEMA_VERSION,
+        "league": league,
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "total_seasons": len(seasons),
+        "total_matches": total_matches,
+        "total_players": len(unique_player_ids),
+        "total_goals": total_goals,
+        "goals_per_match": round(total_goals / total_matches, 2) if total_matches else 0.0,
+        "seasons": seasons,
+    }
+
+
+def update_league_catalog_index(league: str = DEFAULT_LEAGUE_NAME, *, repo_root: Path | None = None) -> Path:
+    path = league_catalog_index_path(league, repo_root=repo_root)
+    _write_json_atomically(path, build_league_catalog_index(league, repo_root=repo_root))
+    return path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild the league-level season catalog index.")
+    parser.add_argument("--league", default=DEFAULT_LEAGUE_NAME)
+    args = parser.parse_args()
+    print(update_league_catalog_index(args.league))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import argparse
+import timeit
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from gronestats.stats.player_stats import per90, percentile_ranks, rolling_sum
+from gronestats.stats.team_stats import match_points
+
+
+BENCHMARK_ROWS = 50_000
+BENCHMARK_REPEATS = 5
+# Minimum best-of-N speedup over the reference, each well under what the kernel measures at 50k rows.
+BENCHMARK_MIN_SPEEDUP = {"per90": 5.0, "percentile_ranks": 1.0, "rolling_sum": 5.0, "match_points": 3.0}
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    name: str
+    rows: int
+    vectorized_seconds: float
+    reference_seconds: float
+
+    @property
+    def within_budget(self) -> bool:
+        return self.speedup >= BENCHMARK_MIN_SPEEDUP.get(self.name, 1.0)
+
+    @property
+    def speedup(self) -> float:
+        return self.reference_seconds / self.vectorized_seconds if self.vectorized_seconds > 0 else float("inf")
+
+
+def benchmark_frame(rows: int = BENCHMARK_ROWS, *, seed: int = 7) -> pd.DataFrame:
+    # Synthetic player-match rows shaped like the published releases: ~30 appearances per player.
+    rng = np.random.default_rng(seed)
+    players = max(rows // 30, 1)
+    return pd.DataFrame(
+        {
+            "player_id": np.sort(rng.integers(1, players + 1, rows)),
+            "position": rng.choice(["G", "D", "M", "F"], rows),
+            "minutesplayed": pd.array(rng.integers(0, 91, rows), dtype="Int64"),
+            "goals": pd.array(rng.poisson(0.15, rows), dtype="Int64"),
+            "rating": rng.normal(6.8, 0.6, rows),
+            "goals_against": rng.poisson(1.2, rows),
+        }
+    )
+
+
+def _reference_per90(frame: pd.DataFrame) -> list[float]:
+    return [
+        float(goals) * 90 / float(minutes) if pd.notna(minutes) and minutes > 0 else 0.0
+        for goals, minutes in zip(frame["goals"].fillna(0), frame["minutesplayed"])
+    ]
+
+
+def _reference_percentiles(frame: pd.DataFrame) -> pd.Series:
+    return frame.groupby("position")["rating"].transform(lambda values: values.rank(pct=True, method="max"))
+
+
+def _reference_rolling(frame: pd.DataFrame) -> pd.Series:
+    goals = frame["goals"].astype(float).fillna(0.0)
+    return goals.groupby(frame["player_id"]).transform(lambda values: values.rolling(5, min_periods=1).sum())
+
+
+def _reference_points(frame: pd.DataFrame) -> list[int]:
+    return [
+        3 if goals_for > goals_against else 1 if goals_for == goals_against else 0
+        for goals_for, goals_against in zip(frame["goals"].fillna(0), frame["goals_against"])
+    ]
+
+
+BENCHMARKS: dict[str, tuple[Callable[[pd.DataFrame], object], Callable[[pd.DataFrame], object]]] = {
+    "per90": (lambda frame: per90(frame["goals"], frame["minutesplayed"]), _reference_per90),
+    "percentile_ranks": (
+        lambda frame: percentile_ranks(frame["rating"], frame["position"]),
+        _reference_percentiles,
+    ),
+    "rolling_sum": (lambda frame: rolling_sum(frame["goals"], 5, frame["player_id"]), _reference_rolling),
+    "match_points": (lambda frame: match_points(frame["goals"], frame["goals_against"]), _reference_points),
+}
+
+
+def _best_time(function: Callable[[pd.DataFrame], object], frame: pd.DataFrame, repeats: int) -> float:
+    return min(timeit.repeat(lambda: function(frame), number=1, repeat=repeats))
+
+
+def run_benchmarks(
+    rows: int = BENCHMARK_ROWS,
+    *,
+    repeats: int = BENCHMARK_REPEATS,
+    names: list[str] | None = None,
+) -> list[BenchmarkResult]:
+    # Best-of-N wall times for each kernel against a row-wise / groupby-apply reference.
+    frame = benchmark_frame(rows)
+    results = []
+    for name in names or list(BENCHMARKS):
+        vectorized, reference = BENCHMARKS[name]
+        results.append(
+            BenchmarkResult(
+                name=name,
+                rows=rows,
+                vectorized_seconds=_best_time(vectorized, frame, repeats),
+                reference_seconds=_best_time(reference, frame, repeats),
+            )
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time the vectorized stats kernels against naive references.")
+    parser.add_argument("--rows", type=int, default=BENCHMARK_ROWS)
+    parser.add_argument("--repeats", type=int, default=BENCHMARK_REPEATS)
+    parser.add_argument("--benchmark", action="append", choices=list(BENCHMARKS), dest="names")
+    parser.add_argument("--check", action="store_true", help="Exit non-zero if any kernel misses its speedup budget.")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.rows, repeats=args.repeats, names=args.names)
+    for result in results:
+        print(
+            f"{result.name:<18} rows={result.rows:<8} "
+            f"vectorized={result.vectorized_seconds * 1000:8.2f}ms "
+            f"reference={result.reference_seconds * 1000:8.2f}ms "
+            f"speedup={result.speedup:6.1f}x"
+            f"{'' if result.within_budget else '  OVER BUDGET'}"
+        )
+    if args.check and not all(result.within_budget for result in results):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from gronestats.stats.player_stats import rolling_sum
+from gronestats.stats.team_stats import goal_difference, match_points, match_results
+
+
+FORM_WINDOW = 5
+FORM_EWM_ALPHA = 0.3
+FORM_ORDER_COLUMNS = ["match_date", "match_id"]
+
+
+@dataclass(frozen=True)
+class FormSpec:
+    key: str
+    input_columns: tuple[str, ...]
+    sum_columns: tuple[str, ...]
+    ewm_columns: tuple[str, ...]
+    streak_column: str
+    sequence_column: str | None = None
+    window: int = FORM_WINDOW
+    alpha: float = FORM_EWM_ALPHA
+
+    @property
+    def output_columns(self) -> tuple[str, ...]:
+        columns = [
+            "form_matches",
+            *(f"form_{column}" for column in self.sum_columns),
+            *(f"ewm_{column}" for column in self.ewm_columns),
+            "streak_value",
+            "streak_length",
+        ]
+        if self.sequence_column is not None:
+            columns.append("form_sequence")
+        return tuple(columns)
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        return (*self.input_columns, *self.output_columns)
+
+
+TEAM_FORM_SPEC = FormSpec(
+    key="team_id",
+    input_columns=(
+        "team_id",
+        "match_id",
+        "match_date",
+        "round_number",
+        "opponent_id",
+        "is_home",
+        "goals_for",
+        "goals_against",
+        "goal_difference",
+        "points",
+        "result",
+    ),
+    sum_columns=("points", "goals_for", "goals_against"),
+    ewm_columns=("points", "goal_difference"),
+    streak_column="result",
+    sequence_column="result",
+)
+PLAYER_FORM_SPEC = FormSpec(
+    key="player_id",
+    input_columns=(
+        "player_id",
+        "match_id",
+        "match_date",
+        "round_number",
+        "team_id",
+        "minutesplayed",
+        "goals",
+        "assists",
+        "rating",
+        "scored",
+    ),
+    sum_columns=("minutesplayed", "goals", "assists"),
+    ewm_columns=("rating",),
+    streak_column="scored",
+)
+
+
+def _match_dates(matches: pd.DataFrame) -> pd.Series:
+    if "fecha_dt" in matches.columns:
+        return pd.to_datetime(matches["fecha_dt"], errors="coerce")
+    if "fecha" in matches.columns:
+        return pd.to_datetime(matches["fecha"], format="%d/%m/%Y %H:%M", errors="coerce")
+    return pd.Series(pd.NaT, index=matches.index, dtype="datetime64[ns]")
+
+
+def sort_form_rows(rows: pd.DataFrame) -> pd.DataFrame:
+    # Same chronology the dashboard uses for recent form: kickoff, then match_id; undated matches last.
+    if rows.empty:
+        return rows.reset_index(drop=True)
+    return rows.sort_values(FORM_ORDER_COLUMNS, kind="mergesort", na_position="last").reset_index(drop=True)
+
+
+def team_form_inputs(matches: pd.DataFrame) -> pd.DataFrame:
+    if matches.empty or not {"home_score", "away_score"}.issubset(matches.columns):
+        return pd.DataFrame(columns=list(TEAM_FORM_SPEC.input_columns))
+    completed = matches.dropna(subset=["home_score", "away_score", "home_id", "away_id"])
+    dates = _match_dates(completed)
+    sides = []
+    for is_home, team, opponent, scored, conceded in (
+        (True, "home_id", "away_id", "home_score", "away_score"),
+        (False, "away_id", "home_id", "away_score", "home_score"),
+    ):
+        sides.append(
+            pd.DataFrame(
+                {
+                    "team_id": completed[team].astype("int64").to_numpy(),
+                    "match_id": completed["match_id"].astype("int64").to_numpy(),
+                    "match_date": dates.to_numpy(),
+                    "round_number": completed["round_number"].to_numpy() if "round_number" in completed.columns else pd.NA,
+                    "opponent_id": completed[opponent].astype("int64").to_numpy(),
+                    "is_home": is_home,
+                    "goals_for": completed[scored].astype("int64").to_numpy(),
+                    "goals_against": completed[conceded].astype("int64").to_numpy(),
+                }
+            )
+        )
+    rows = pd.concat(sides, ignore_index=True)
+    rows["goal_difference"] = goal_difference(rows["goals_for"], rows["goals_against"]).astype("int64")
+    rows["points"] = match_points(rows["goals_for"], rows["goals_against"])
+    rows["result"] = match_results(rows["goals_for"], rows["goals_against"])
+    return sort_form_rows(rows[list(TEAM_FORM_SPEC.input_columns)])
+
+
+def player_form_inputs(player_match: pd.DataFrame, matches: pd.DataFrame) -> pd.DataFrame:
+    # Only appearances count toward player form; unused substitutes do not break a scoring run.
+    if player_match.empty or "minutesplayed" not in player_match.columns:
+        return pd.DataFrame(columns=list(PLAYER_FORM_SPEC.input_columns))
+    appearances = player_match.loc[
+        player_match["player_id"].notna() & (pd.to_numeric(player_match["minutesplayed"], errors="coerce").fillna(0) > 0)
+    ]
+    schedule = pd.DataFrame(
+        {
+            "match_id": matches["match_id"].astype("int64").to_numpy(),
+            "match_date": _match_dates(matches).to_numpy(),
+            "round_number": matches["round_number"].to_numpy() if "round_number" in matches.columns else pd.NA,
+        }
+    ).drop_duplicates(subset=["match_id"])
+    rows = pd.DataFrame(
+        {
+            "player_id": appearances["player_id"].astype("int64").to_numpy(),
+            "match_id": appearances["match_id"].astype("int64").to_numpy(),
+            "team_id": appearances["team_id"].to_numpy() if "team_id" in appearances.columns else pd.NA,
+            "minutesplayed": pd.to_numeric(appearances["minutesplayed"], errors="coerce").fillna(0).astype("int64").to_numpy(),
+            "goals": pd.to_numeric(appearances.get("goals", 0), errors="coerce").fillna(0).astype("int64").to_numpy(),
+            "assists": pd.to_numeric(appearances.get("assists", 0), errors="coerce").fillna(0).astype("int64").to_numpy(),
+            "rating": pd.to_numeric(appearances.get("rating", np.nan), errors="coerce").astype("float64").to_numpy(),
+        }
+    )
+    rows = rows.merge(schedule, on="match_id", how="inner")
+    rows["scored"] = rows["goals"] > 0
+    return sort_form_rows(rows[list(PLAYER_FORM_SPEC.input_columns)])
+
+
+def _ewm_with_state(last: pd.DataFrame, rows: pd.DataFrame, spec: FormSpec, column: str) -> np.ndarray:
+    # Adjust=False EWM is a first-order recurrence, so the previous value seeds the new rows exactly.
+    seed = pd.DataFrame({spec.key: last[spec.key].to_numpy(), "value": last[f"ewm_{column}"].to_numpy(dtype="float64")})
+    fresh = pd.DataFrame({spec.key: rows[spec.key].to_numpy(), "value": rows[column].to_numpy(dtype="float64")})
+    work = pd.concat([seed, fresh], ignore_index=True)
+    work["is_new"] = np.r_[np.zeros(len(seed), dtype=bool), np.ones(len(fresh), dtype=bool)]
+    work["row"] = np.r_[np.full(len(seed), -1), np.arange(len(fresh))]
+    work = work.sort_values(spec.key, kind="mergesort")
+    smoothed = (
+        work.groupby(spec.key, sort=False)["value"]
+        .ewm(alpha=spec.alpha, adjust=False, ignore_na=True)
+        .mean()
+        .reset_index(level=0, drop=True)
+    )
+    work["smoothed"] = smoothed
+    result = np.empty(len(fresh), dtype="float64")
+    new_rows = work.loc[work["is_new"]]
+    result[new_rows["row"].to_numpy()] = new_rows["smoothed"].to_numpy()
+    return result
+
+
+def _streaks_with_state(last: pd.DataFrame, rows: pd.DataFrame, spec: FormSpec) -> tuple[np.ndarray, np.ndarray]:
+    seed = pd.DataFrame(
+        {
+            spec.key: last[spec.key].to_numpy(),
+            "value": last["streak_value"].astype(str).to_numpy(dtype=object),
+            "base": last["streak_length"].to_numpy(dtype="int64"),
+        }
+    )
+    fresh = pd.DataFrame(
+        {
+            spec.key: rows[spec.key].to_numpy(),
+            "value": rows[spec.streak_column].astype(str).to_numpy(dtype=object),
+            "base": np.ones(len(rows), dtype="int64"),
+        }
+    )
+    work = pd.concat([seed, fresh], ignore_index=True)
+    work["row"] = np.r_[np.full(len(seed), -1), np.arange(len(fresh))]
+    work = work.sort_values(spec.key, kind="mergesort").reset_index(drop=True)
+    keys = work[spec.key].to_numpy()
+    values = work["value"].to_numpy()
+    starts = np.r_[True, (keys[1:] != keys[:-1]) | (values[1:] != values[:-1])]
+    run_ids = np.cumsum(starts)
+    run_base = work["base"].groupby(run_ids).transform("first").to_numpy()
+    position = work.groupby(run_ids).cumcount().to_numpy()
+    new_mask = work["row"].to_numpy() >= 0
+    lengths = np.empty(len(fresh), dtype="int64")
+    streak_values = np.empty(len(fresh), dtype=object)
+    lengths[work.loc[new_mask, "row"].to_numpy()] = (run_base + position)[new_mask]
+    streak_values[work.loc[new_mask, "row"].to_numpy()] = values[new_mask]
+    return streak_values, lengths
+
+
+def extend_form(state: pd.DataFrame, rows: pd.DataFrame, spec: FormSpec) -> pd.DataFrame:
+    """Compute form columns for `rows`, continuing each entity from its rows already in `state`.
+
+    Every new row must come after the entity's last state row; with an empty state this is the
+    full-season computation, so appending round by round reproduces it exactly.
+    """
+    rows = sort_form_rows(rows[list(spec.input_columns)])
+    if rows.empty:
+        return pd.DataFrame(columns=list(spec.columns))
+    history = state.loc[state[spec.key].isin(rows[spec.key].unique())] if not state.empty else state
+    history = sort_form_rows(history) if not history.empty else pd.DataFrame(columns=list(spec.columns))
+    seed = history.groupby(spec.key, sort=False).tail(spec.window - 1) if spec.window > 1 else history.iloc[0:0]
+    last = history.groupby(spec.key, sort=False).tail(1)
+
+    combined = pd.concat([seed[list(spec.input_columns)], rows], ignore_index=True)
+    combined["row"] = np.r_[np.full(len(seed), -1), np.arange(len(rows))]
+    combined = combined.sort_values(spec.key, kind="mergesort").reset_index(drop=True)
+    new_mask = combined["row"].to_numpy() >= 0
+    targets = combined.loc[new_mask, "row"].to_numpy()
+    keys = combined[spec.key]
+
+    result = rows.copy()
+
+    def place(values: np.ndarray) -> np.ndarray:
+        placed = np.empty(len(rows), dtype=values.dtype)
+        placed[targets] = values[new_mask]
+        return placed
+
+    result["form_matches"] = place(np.asarray(rolling_sum(np.ones(len(combined)), spec.window, keys))).astype("int64")
+    for column in spec.sum_columns:
+        result[f"form_{column}"] = place(np.asarray(rolling_sum(combined[column], spec.window, keys)))
+    for column in spec.ewm_columns:
+        result[f"ewm_{column}"] = _ewm_with_state(last, rows, spec, column)
+    result["streak_value"], result["streak_length"] = _streaks_with_state(last, rows, spec)
+    if spec.sequence_column is not None:
+        grouped = combined.groupby(spec.key, sort=False)[spec.sequence_column]
+        sequence = pd.Series("", index=combined.index, dtype=object)
+        for lag in range(spec.window - 1, -1, -1):
+            sequence = sequence + grouped.shift(lag).fillna("").astype(str)
+        result["form_sequence"] = place(sequence.to_numpy(dtype=object))
+    return result[list(spec.columns)]
+
+
+def latest_form(form_rows: pd.DataFrame, spec: FormSpec) -> pd.DataFrame:
+    # Current form per entity: the last row of each team or player in match order.
+    if form_rows.empty:
+        return pd.DataFrame(columns=list(spec.columns))
+    return sort_form_rows(form_rows).groupby(spec.key, sort=False).tail(1).sort_values(spec.key).reset_index(drop=True)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+
+# Cells along the pitch length (x) and width (y) on the opta 0-100 scale.
+HEATMAP_GRID_BINS = (12, 9)
+HEATMAP_GRID_COLUMNS = ["match_id", "player_id", "team_id", "cell_x", "cell_y", "points_count"]
+
+
+def empty_heatmap_grid() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "match_id": pd.Series(dtype="Int64"),
+            "player_id": pd.Series(dtype="Int64"),
+            "team_id": pd.Series(dtype="Int64"),
+            "cell_x": pd.Series(dtype="Int64"),
+            "cell_y": pd.Series(dtype="Int64"),
+            "points_count": pd.Series(dtype="Int64"),
+        }
+    )
+
+
+def _cell_index(values: np.ndarray, cells: int) -> np.ndarray:
+    return np.clip(np.floor(values / 100.0 * cells), 0, cells - 1).astype("int64")
+
+
+def bin_heatmap_points(
+    heatmap_points: pd.DataFrame,
+    bins: tuple[int, int] = HEATMAP_GRID_BINS,
+) -> pd.DataFrame:
+    if heatmap_points.empty or not {"match_id", "player_id", "x", "y"}.issubset(heatmap_points.columns):
+        return empty_heatmap_grid()
+
+    work = pd.DataFrame(
+        {
+            "match_id": pd.to_numeric(heatmap_points["match_id"], errors="coerce").astype("Int64"),
+            "player_id": pd.to_numeric(heatmap_points["player_id"], errors="coerce").astype("Int64"),
+            "team_id": pd.to_numeric(heatmap_points["team_id"], errors="coerce").astype("Int64")
+            if "team_id" in heatmap_points.columns
+            else pd.array([pd.NA] * len(heatmap_points), dtype="Int64"),
+            "x": pd.to_numeric(heatmap_points["x"], errors="coerce").astype("float64"),
+            "y": pd.to_numeric(heatmap_points["y"], errors="coerce").astype("float64"),
+        }
+    )
+    work = work.dropna(subset=["match_id", "player_id", "x", "y"])
+    if work.empty:
+        return empty_heatmap_grid()
+
+    work["cell_x"] = _cell_index(work["x"].to_numpy(), bins[0])
+    work["cell_y"] = _cell_index(work["y"].to_numpy(), bins[1])
+    grid = (
+        work.groupby(["player_id", "match_id", "team_id", "cell_x", "cell_y"], dropna=False, sort=True)
+        .size()
+        .rename("points_count")
+        .reset_index()
+    )
+    for column in HEATMAP_GRID_COLUMNS:
+        grid[column] = grid[column].astype("Int64")
+    return grid[HEATMAP_GRID_COLUMNS].reset_index(drop=True)
+
+
+def sum_heatmap_grid(
+    heatmap_grid: pd.DataFrame,
+    bins: tuple[int, int] = HEATMAP_GRID_BINS,
+) -> np.ndarray:
+    totals = np.zeros((bins[1], bins[0]), dtype="float64")
+    if heatmap_grid.empty:
+        return totals
+    cell_x = pd.to_numeric(heatmap_grid["cell_x"], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    cell_y = pd.to_numeric(heatmap_grid["cell_y"], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    counts = pd.to_numeric(heatmap_grid["points_count"], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    valid = (
+        ~np.isnan(cell_x)
+        & ~np.isnan(cell_y)
+        & ~np.isnan(counts)
+        & (cell_x >= 0)
+        & (cell_x < bins[0])
+        & (cell_y >= 0)
+        & (cell_y < bins[1])
+    )
+    np.add.at(totals, (cell_y[valid].astype("int64"), cell_x[valid].astype("int64")), counts[valid])
+    return totals
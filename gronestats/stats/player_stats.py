@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+
+def as_float_array(values: Any) -> np.ndarray:
+    # Accepts numpy arrays, pandas columns (nullable dtypes included) and Arrow arrays; nulls become NaN.
+    if isinstance(values, (pd.Series, pd.Index)):
+        if pd.api.types.is_numeric_dtype(values.dtype) or pd.api.types.is_bool_dtype(values.dtype):
+            return values.to_numpy(dtype="float64", na_value=np.nan)
+        return pd.to_numeric(values, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    if hasattr(values, "to_numpy") and hasattr(values, "null_count"):
+        # pyarrow Array / ChunkedArray.
+        return np.asarray(values.to_numpy(zero_copy_only=False), dtype="float64")
+    if np.isscalar(values):
+        return np.asarray([values], dtype="float64")
+    return np.asarray(values, dtype="float64")
+
+
+def wrap_like(result: np.ndarray, template: Any) -> np.ndarray | pd.Series:
+    if isinstance(template, pd.Series):
+        return pd.Series(result, index=template.index, name=template.name)
+    return result
+
+
+def _object_keys(groups: Any) -> np.ndarray:
+    if isinstance(groups, (pd.Series, pd.Index)):
+        return groups.to_numpy(dtype=object)
+    if hasattr(groups, "to_pylist"):
+        return np.asarray(groups.to_pylist(), dtype=object)
+    return np.asarray(groups, dtype=object)
+
+
+def _broadcast(values: Any, length: int) -> np.ndarray:
+    array = as_float_array(values)
+    return np.broadcast_to(array, (length,)) if array.shape == (1,) else array
+
+
+def safe_divide(
+    numerator: Any,
+    denominator: Any,
+    *,
+    scale: float = 1.0,
+    fill: float = 0.0,
+    keep_nan: bool = False,
+) -> np.ndarray | pd.Series:
+    # Missing numerators count as 0 unless keep_nan, which leaves them NaN for nan-aware reducers.
+    top = as_float_array(numerator)
+    bottom = _broadcast(denominator, len(top))
+    if not keep_nan:
+        top = np.nan_to_num(top, nan=0.0)
+    valid = np.isfinite(bottom) & (bottom > 0)
+    result = np.full(top.shape, fill, dtype="float64")
+    np.divide(top * scale, bottom, out=result, where=valid)
+    return wrap_like(result, numerator)
+
+
+def per90(values: Any, minutes: Any, *, fill: float = 0.0, keep_nan: bool = False) -> np.ndarray | pd.Series:
+    return safe_divide(values, minutes, scale=90.0, fill=fill, keep_nan=keep_nan)
+
+
+def per_match(values: Any, matches: Any, *, fill: float = 0.0) -> np.ndarray | pd.Series:
+    return safe_divide(values, matches, fill=fill)
+
+
+def shrunk_rate(
+    successes: Any,
+    trials: Any,
+    *,
+    prior_weight: float,
+    prior_rate: float | None = None,
+) -> np.ndarray | pd.Series:
+    # Empirical-Bayes rate: small samples are pulled toward the pooled (or given) prior rate.
+    hits = np.nan_to_num(as_float_array(successes), nan=0.0)
+    attempts = np.nan_to_num(_broadcast(trials, len(hits)), nan=0.0)
+    if prior_rate is None:
+        total = attempts.sum()
+        prior_rate = float(hits.sum() / total) if total > 0 else 0.0
+    result = (hits + prior_weight * prior_rate) / (attempts + prior_weight)
+    return wrap_like(result, successes)
+
+
+def percentile_ranks(
+    values: Any,
+    groups: Any | None = None,
+    *,
+    method: str = "max",
+    fill: float | None = 0.0,
+) -> np.ndarray | pd.Series:
+    # Ranks in (0, 1], optionally inside each group; rows without a group rank against everyone.
+    array = as_float_array(values)
+    if fill is not None:
+        array = np.where(np.isnan(array), fill, array)
+    if method not in ("min", "max", "average"):
+        return wrap_like(_pandas_percentile_ranks(array, groups, method), values)
+    if groups is None:
+        return wrap_like(_sorted_percentile_ranks(array, np.zeros(len(array), dtype="int64"), method), values)
+    keys = groups if isinstance(groups, (pd.Series, pd.Index)) else _object_keys(groups)
+    codes, uniques = pd.factorize(keys, use_na_sentinel=True)
+    missing = codes < 0
+    ranks = _sorted_percentile_ranks(array, np.where(missing, len(uniques), codes).astype("int64"), method)
+    if missing.any():
+        ranks[missing] = _sorted_percentile_ranks(array, np.zeros(len(array), dtype="int64"), method)[missing]
+    return wrap_like(ranks, values)
+
+
+def _sorted_percentile_ranks(array: np.ndarray, codes: np.ndarray, method: str) -> np.ndarray:
+    # Sort by value, then stably by group (a radix sort on the narrow code dtype): a tie run's first and
+    # last positions give the min and max ranks, and each group's non-NaN count the denominator.
+    ranks = np.full(len(array), np.nan, dtype="float64")
+    valid = np.flatnonzero(~np.isnan(array))
+    if not len(valid):
+        return ranks
+    valid_values = array[valid]
+    valid_codes = codes[valid]
+    narrow_codes = valid_codes.astype(np.min_scalar_type(int(valid_codes.max())))
+    by_value = np.argsort(valid_values)
+    by_group = by_value[np.argsort(narrow_codes[by_value], kind="stable")]
+    order = valid[by_group]
+    sorted_values = valid_values[by_group]
+    sorted_codes = valid_codes[by_group]
+    group_sizes = np.bincount(sorted_codes)
+    group_starts = (np.cumsum(group_sizes) - group_sizes)[sorted_codes]
+    run_breaks = np.flatnonzero((sorted_codes[1:] != sorted_codes[:-1]) | (sorted_values[1:] != sorted_values[:-1]))
+    run_ids = np.zeros(len(order), dtype="int64")
+    run_ids[run_breaks + 1] = 1
+    run_ids = np.cumsum(run_ids)
+    run_firsts = np.concatenate([[0], run_breaks + 1])[run_ids]
+    run_lasts = np.concatenate([run_breaks, [len(order) - 1]])[run_ids]
+    if method == "max":
+        sorted_ranks = run_lasts - group_starts + 1.0
+    elif method == "min":
+        sorted_ranks = run_firsts - group_starts + 1.0
+    else:
+        sorted_ranks = (run_firsts + run_lasts) / 2.0 - group_starts + 1.0
+    ranks[order] = sorted_ranks / group_sizes[sorted_codes]
+    return ranks
+
+
+def _pandas_percentile_ranks(array: np.ndarray, groups: Any | None, method: str) -> np.ndarray:
+    series = pd.Series(array)
+    if groups is None:
+        return series.rank(pct=True, method=method).to_numpy(dtype="float64")
+    keys = pd.Series(_object_keys(groups))
+    ranks = series.groupby(keys, dropna=True).rank(pct=True, method=method)
+    missing = keys.isna().to_numpy()
+    if missing.any():
+        ranks[missing] = series.rank(pct=True, method=method)[missing]
+    return ranks.to_numpy(dtype="float64")
+
+
+def _group_codes(groups: Any | None, length: int) -> np.ndarray:
+    if groups is None:
+        return np.zeros(length, dtype="int64")
+    codes, _ = pd.factorize(_object_keys(groups), use_na_sentinel=False)
+    return codes.astype("int64")
+
+
+def rolling_sum(
+    values: Any,
+    window: int,
+    groups: Any | None = None,
+) -> np.ndarray | pd.Series:
+    # Trailing-window sums per group via one cumulative sum; rows must be chronological inside each group.
+    array = np.nan_to_num(as_float_array(values), nan=0.0)
+    codes = _group_codes(groups, len(array))
+    order = np.argsort(codes, kind="stable")
+    sorted_values = array[order]
+    sorted_codes = codes[order]
+    cumulative = np.concatenate([[0.0], np.cumsum(sorted_values)])
+    positions = np.arange(len(array))
+    group_starts = np.searchsorted(sorted_codes, sorted_codes, side="left")
+    window_starts = np.maximum(positions - window + 1, group_starts)
+    sums = np.empty(len(array), dtype="float64")
+    sums[order] = cumulative[positions + 1] - cumulative[window_starts]
+    return wrap_like(sums, values)
+
+
+def rolling_count(values: Any, window: int, groups: Any | None = None) -> np.ndarray | pd.Series:
+    observed = (~np.isnan(as_float_array(values))).astype("float64")
+    return wrap_like(as_float_array(rolling_sum(observed, window, groups)), values)
+
+
+def rolling_mean(values: Any, window: int, groups: Any | None = None) -> np.ndarray | pd.Series:
+    sums = as_float_array(rolling_sum(values, window, groups))
+    counts = as_float_array(rolling_count(values, window, groups))
+    return wrap_like(as_float_array(safe_divide(sums, counts, fill=np.nan)), values)
@@ -0,0 +1,425 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+
+RATING_RIDGE = 2.0
+RATING_MAX_GOALS = 10
+RATING_IRLS_MAX_ITER = 50
+RATING_IRLS_TOL = 1e-10
+# Priors used before a season has any result: league-average scoring and a typical home edge.
+RATING_PRIOR_INTERCEPT = float(np.log(1.1))
+RATING_PRIOR_HOME_ADVANTAGE = 0.3
+ELO_INITIAL = 1500.0
+ELO_K = 20.0
+ELO_HOME_ADVANTAGE = 60.0
+ELO_SEASON_CARRY = 0.7
+
+MATCH_PROBABILITY_COLUMNS = [
+    "match_id",
+    "step",
+    "home_id",
+    "away_id",
+    "expected_home_goals",
+    "expected_away_goals",
+    "p_home",
+    "p_draw",
+    "p_away",
+    "elo_home",
+    "elo_away",
+    "elo_expected_home",
+]
+TEAM_RATING_COLUMNS = [
+    "step",
+    "step_date",
+    "team_id",
+    "attack",
+    "defence",
+    "elo",
+    "matches_played",
+    "intercept",
+    "home_advantage",
+]
+
+
+@dataclass(frozen=True)
+class PoissonRatings:
+    # log E[goals] = intercept + home_advantage * is_home + attack[team] - defence[opponent];
+    # attack and defence are centred, so 0 is a league-average side.
+    team_ids: np.ndarray
+    intercept: float
+    home_advantage: float
+    attack: np.ndarray
+    defence: np.ndarray
+    iterations: int = 0
+
+    @classmethod
+    def prior(cls, team_ids: Any = ()) -> PoissonRatings:
+        ids = np.asarray(sorted(set(np.asarray(team_ids, dtype="int64").tolist())), dtype="int64")
+        return cls(
+            team_ids=ids,
+            intercept=RATING_PRIOR_INTERCEPT,
+            home_advantage=RATING_PRIOR_HOME_ADVANTAGE,
+            attack=np.zeros(len(ids)),
+            defence=np.zeros(len(ids)),
+        )
+
+    def _strengths(self, team_ids: Any, values: np.ndarray) -> np.ndarray:
+        lookup = pd.Series(values, index=self.team_ids)
+        return lookup.reindex(np.asarray(team_ids, dtype="int64")).fillna(0.0).to_numpy()
+
+    def expected_goals(self, home_ids: Any, away_ids: Any) -> tuple[np.ndarray, np.ndarray]:
+        home_attack = self._strengths(home_ids, self.attack)
+        away_attack = self._strengths(away_ids, self.attack)
+        home_defence = self._strengths(home_ids, self.defence)
+        away_defence = self._strengths(away_ids, self.defence)
+        home = np.exp(self.intercept + self.home_advantage + home_attack - away_defence)
+        away = np.exp(self.intercept + away_attack - home_defence)
+        return home, away
+
+
+def _design(home_codes: np.ndarray, away_codes: np.ndarray, teams: int) -> np.ndarray:
+    # Two rows per match (home goals, away goals); columns: intercept, home, attack[n], defence[n].
+    matches = len(home_codes)
+    design = np.zeros((2 * matches, 2 + 2 * teams))
+    rows = np.arange(matches)
+    design[:, 0] = 1.0
+    design[rows, 1] = 1.0
+    design[rows, 2 + home_codes] = 1.0
+    design[rows, 2 + teams + away_codes] = -1.0
+    design[matches + rows, 2 + away_codes] = 1.0
+    design[matches + rows, 2 + teams + home_codes] = -1.0
+    return design
+
+
+def fit_poisson_ratings(
+    home_ids: Any,
+    away_ids: Any,
+    home_goals: Any,
+    away_goals: Any,
+    *,
+    ridge: float = RATING_RIDGE,
+    weights: Any | None = None,
+    init: PoissonRatings | None = None,
+    max_iter: int = RATING_IRLS_MAX_ITER,
+    tol: float = RATING_IRLS_TOL,
+) -> PoissonRatings:
+    """Fit attack/defence strengths with ridge-penalized Poisson IRLS.
+
+    Each iteration is one weighted least-squares solve on the dense design; `init` warm-starts
+    from a previous fit, which is how round-by-round refits converge in a few iterations.
+    """
+    home = np.asarray(home_ids, dtype="int64")
+    away = np.asarray(away_ids, dtype="int64")
+    if len(home) == 0:
+        return init if init is not None else PoissonRatings.prior()
+    team_ids, codes = np.unique(np.concatenate([home, away]), return_inverse=True)
+    teams = len(team_ids)
+    design = _design(codes[: len(home)], codes[len(home) :], teams)
+    goals = np.concatenate([np.asarray(home_goals, dtype="float64"), np.asarray(away_goals, dtype="float64")])
+    row_weights = np.ones(len(goals)) if weights is None else np.tile(np.asarray(weights, dtype="float64"), 2)
+    penalty = np.full(design.shape[1], float(ridge))
+    penalty[:2] = 0.0
+
+    start = init if init is not None else PoissonRatings.prior(team_ids)
+    beta = np.concatenate(
+        [
+            [start.intercept, start.home_advantage],
+            start._strengths(team_ids, start.attack),
+            start._strengths(team_ids, start.defence),
+        ]
+    )
+    iterations = 0
+    for iterations in range(1, max_iter + 1):
+        mean = np.exp(design @ beta)
+        gradient = design.T @ (row_weights * (goals - mean)) - penalty * beta
+        hessian = (design * (row_weights * mean)[:, None]).T @ design + np.diag(penalty)
+        step = np.linalg.solve(hessian, gradient)
+        beta = beta + step
+        if np.max(np.abs(step)) < tol:
+            break
+
+    attack = beta[2 : 2 + teams]
+    defence = beta[2 + teams :]
+    attack_mean = attack.mean()
+    defence_mean = defence.mean()
+    return PoissonRatings(
+        team_ids=team_ids,
+        intercept=float(beta[0] + attack_mean - defence_mean),
+        home_advantage=float(beta[1]),
+        attack=attack - attack_mean,
+        defence=defence - defence_mean,
+        iterations=iterations,
+    )
+
+
+def outcome_probabilities(
+    expected_home: Any,
+    expected_away: Any,
+    *,
+    max_goals: int = RATING_MAX_GOALS,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Independent Poisson scorelines up to max_goals, renormalized for the truncated tail.
+    home = np.atleast_1d(np.asarray(expected_home, dtype="float64"))
+    away = np.atleast_1d(np.asarray(expected_away, dtype="float64"))
+    goals = np.arange(max_goals + 1)
+    log_factorial = np.concatenate([[0.0], np.cumsum(np.log(goals[1:]))])
+    home_pmf = np.exp(goals * np.log(home[:, None]) - home[:, None] - log_factorial)
+    away_pmf = np.exp(goals * np.log(away[:, None]) - away[:, None] - log_factorial)
+    joint = home_pmf[:, :, None] * away_pmf[:, None, :]
+    total = joint.sum(axis=(1, 2))
+    home_win = np.tril(np.ones((max_goals + 1, max_goals + 1)), k=-1)
+    p_home = (joint * home_win).sum(axis=(1, 2)) / total
+    p_away = (joint * home_win.T).sum(axis=(1, 2)) / total
+    p_draw = np.einsum("mii->m", joint) / total
+    return p_home, p_draw, p_away
+
+
+def elo_expected(home_elo: Any, away_elo: Any, *, home_advantage: float = ELO_HOME_ADVANTAGE) -> np.ndarray:
+    difference = np.asarray(home_elo, dtype="float64") + home_advantage - np.asarray(away_elo, dtype="float64")
+    return 1.0 / (1.0 + 10.0 ** (-difference / 400.0))
+
+
+def elo_deltas(
+    home_elo: Any,
+    away_elo: Any,
+    home_goals: Any,
+    away_goals: Any,
+    *,
+    k: float = ELO_K,
+    home_advantage: float = ELO_HOME_ADVANTAGE,
+) -> np.ndarray:
+    # Home-side rating change (the away side moves by the opposite amount); wider wins weigh more.
+    margin = np.abs(np.asarray(home_goals, dtype="float64") - np.asarray(away_goals, dtype="float64"))
+    multiplier = np.where(margin <= 1, 1.0, np.where(margin == 2, 1.5, (11.0 + margin) / 8.0))
+    score = np.sign(np.asarray(home_goals, dtype="float64") - np.asarray(away_goals, dtype="float64")) * 0.5 + 0.5
+    return k * multiplier * (score - elo_expected(home_elo, away_elo, home_advantage=home_advantage))
+
+
+def carry_over_elo(final_elo: pd.Series, *, carry: float = ELO_SEASON_CARRY) -> pd.Series:
+    # Between seasons ratings regress toward the mean; promoted sides start at the initial rating.
+    return ELO_INITIAL + carry * (final_elo.astype("float64") - ELO_INITIAL)
+
+
+def rating_steps(matches: pd.DataFrame) -> pd.Series:
+    """Order completed matches into rating steps in which no team plays twice.
+
+    Seasons with kickoff dates step by calendar day; undated seasons step by tournament round,
+    ordered by their first match_id. A step is split where a team reappears (two-legged finals
+    share a round), which keeps the vectorized Elo update identical to a sequential one.
+    """
+    if matches.empty:
+        return pd.Series(dtype="int64", index=matches.index)
+    dates = pd.to_datetime(matches["match_date"], errors="coerce")
+    if dates.notna().all():
+        group_order = dates.dt.normalize().rank(method="dense")
+    else:
+        round_keys = matches["tournament"].astype("string").fillna("") + "|" + matches["round_number"].astype("string").fillna("")
+        group_order = matches.groupby(round_keys)["match_id"].transform("min").rank(method="dense")
+    ordered = pd.DataFrame(
+        {
+            "group": group_order.to_numpy(),
+            "match_id": matches["match_id"].to_numpy(),
+            "home_id": matches["home_id"].to_numpy(),
+            "away_id": matches["away_id"].to_numpy(),
+        },
+        index=matches.index,
+    ).sort_values(["group", "match_id"], kind="mergesort")
+
+    steps = np.empty(len(ordered), dtype="int64")
+    step = 0
+    current_group = None
+    seen: set[int] = set()
+    for position, (group, home_id, away_id) in enumerate(
+        zip(ordered["group"].to_numpy(), ordered["home_id"].to_numpy(), ordered["away_id"].to_numpy())
+    ):
+        if group != current_group or home_id in seen or away_id in seen:
+            step += 1
+            current_group = group
+            seen = set()
+        seen.update((home_id, away_id))
+        steps[position] = step
+    return pd.Series(steps, index=ordered.index).reindex(matches.index)
+
+
+def rating_inputs(matches: pd.DataFrame) -> pd.DataFrame:
+    columns = ["match_id", "match_date", "tournament", "round_number", "home_id", "away_id", "home_score", "away_score"]
+    if matches.empty or not {"home_score", "away_score"}.issubset(matches.columns):
+        return pd.DataFrame(columns=columns)
+    completed = matches.dropna(subset=["home_score", "away_score", "home_id", "away_id"])
+    if "fecha_dt" in completed.columns:
+        dates = pd.to_datetime(completed["fecha_dt"], errors="coerce")
+    else:
+        dates = pd.to_datetime(completed.get("fecha"), format="%d/%m/%Y %H:%M", errors="coerce")
+    work = pd.DataFrame(
+        {
+            "match_id": completed["match_id"].astype("int64").to_numpy(),
+            "match_date": np.asarray(dates, dtype="datetime64[ns]"),
+            "tournament": completed["tournament"].to_numpy() if "tournament" in completed.columns else pd.NA,
+            "round_number": completed["round_number"].to_numpy() if "round_number" in completed.columns else pd.NA,
+            "home_id": completed["home_id"].astype("int64").to_numpy(),
+            "away_id": completed["away_id"].astype("int64").to_numpy(),
+            "home_score": completed["home_score"].astype("int64").to_numpy(),
+            "away_score": completed["away_score"].astype("int64").to_numpy(),
+        }
+    )
+    work["step"] = rating_steps(work).to_numpy()
+    return work.sort_values(["step", "match_id"], kind="mergesort").reset_index(drop=True)
+
+
+@dataclass(frozen=True)
+class RatingState:
+    # Everything needed to continue a season: the last Poisson fit and each side's Elo.
+    poisson: PoissonRatings
+    elo: pd.Series
+    matches_played: pd.Series
+    last_step: int = 0
+
+    @classmethod
+    def initial(cls, initial_elo: pd.Series | None = None) -> RatingState:
+        elo = initial_elo.astype("float64") if initial_elo is not None else pd.Series(dtype="float64")
+        return cls(poisson=PoissonRatings.prior(), elo=elo, matches_played=pd.Series(dtype="int64"))
+
+
+def advance_ratings(
+    played: pd.DataFrame,
+    new_matches: pd.DataFrame,
+    state: RatingState,
+) -> tuple[pd.DataFrame, pd.DataFrame, RatingState]:
+    """Fold `new_matches` into `state` step by step.
+
+    `played` holds the matches already folded in; every refit uses all of them plus the steps
+    added so far, warm-started from the previous fit. Returns pre-match probabilities for the
+    new matches, per-step team ratings and the advanced state.
+    """
+    if new_matches.empty:
+        return pd.DataFrame(columns=MATCH_PROBABILITY_COLUMNS), pd.DataFrame(columns=TEAM_RATING_COLUMNS), state
+    history = played[["home_id", "away_id", "home_score", "away_score"]]
+    poisson = state.poisson
+    elo = state.elo.copy()
+    matches_played = state.matches_played.copy()
+    probability_frames = []
+    rating_frames = []
+    for step, step_matches in new_matches.groupby("step", sort=True):
+        home_ids = step_matches["home_id"].to_numpy(dtype="int64")
+        away_ids = step_matches["away_id"].to_numpy(dtype="int64")
+        expected_home, expected_away = poisson.expected_goals(home_ids, away_ids)
+        p_home, p_draw, p_away = outcome_probabilities(expected_home, expected_away)
+        home_elo = elo.reindex(home_ids).fillna(ELO_INITIAL).to_numpy()
+        away_elo = elo.reindex(away_ids).fillna(ELO_INITIAL).to_numpy()
+        probability_frames.append(
+            pd.DataFrame(
+                {
+                    "match_id": step_matches["match_id"].to_numpy(),
+                    "step": int(step),
+                    "home_id": home_ids,
+                    "away_id": away_ids,
+                    "expected_home_goals": expected_home,
+                    "expected_away_goals": expected_away,
+                    "p_home": p_home,
+                    "p_draw": p_draw,
+                    "p_away": p_away,
+                    "elo_home": home_elo,
+                    "elo_away": away_elo,
+                    "elo_expected_home": elo_expected(home_elo, away_elo),
+                }
+            )
+        )
+
+        # Teams are unique within a step, so the simultaneous update equals the sequential one.
+        delta = elo_deltas(home_elo, away_elo, step_matches["home_score"], step_matches["away_score"])
+        step_teams = np.concatenate([home_ids, away_ids])
+        elo = elo.combine_first(pd.Series(ELO_INITIAL, index=step_teams))
+        elo.loc[home_ids] = home_elo + delta
+        elo.loc[away_ids] = away_elo - delta
+        matches_played = matches_played.add(pd.Series(1, index=step_teams), fill_value=0).astype("int64")
+
+        history = pd.concat([history, step_matches[["home_id", "away_id", "home_score", "away_score"]]], ignore_index=True)
+        poisson = fit_poisson_ratings(
+            history["home_id"],
+            history["away_id"],
+            history["home_score"],
+            history["away_score"],
+            init=poisson,
+        )
+        teams = np.asarray(sorted(set(poisson.team_ids.tolist()) | set(elo.index.tolist())), dtype="int64")
+        rating_frames.append(
+            pd.DataFrame(
+                {
+                    "step": int(step),
+                    "step_date": pd.to_datetime(step_matches["match_date"]).max(),
+                    "team_id": teams,
+                    "attack": poisson._strengths(teams, poisson.attack),
+                    "defence": poisson._strengths(teams, poisson.defence),
+                    "elo": elo.reindex(teams).fillna(ELO_INITIAL).to_numpy(),
+                    "matches_played": matches_played.reindex(teams).fillna(0).astype("int64").to_numpy(),
+                    "intercept": poisson.intercept,
+                    "home_advantage": poisson.home_advantage,
+                }
+            )
+        )
+    next_state = RatingState(
+        poisson=poisson,
+        elo=elo.sort_index(),
+        matches_played=matches_played.sort_index(),
+        last_step=int(new_matches["step"].max()),
+    )
+    return (
+        pd.concat(probability_frames, ignore_index=True)[MATCH_PROBABILITY_COLUMNS],
+        pd.concat(rating_frames, ignore_index=True)[TEAM_RATING_COLUMNS],
+        next_state,
+    )
+
+
+def state_from_ratings(team_ratings: pd.DataFrame) -> RatingState:
+    # Rebuilds the continuation state from the last stored step.
+    if team_ratings.empty:
+        return RatingState.initial()
+    last_step = int(team_ratings["step"].max())
+    last = team_ratings.loc[team_ratings["step"] == last_step].sort_values("team_id")
+    team_ids = last["team_id"].astype("int64").to_numpy()
+    poisson = PoissonRatings(
+        team_ids=team_ids,
+        intercept=float(last["intercept"].iloc[0]),
+        home_advantage=float(last["home_advantage"].iloc[0]),
+        attack=last["attack"].to_numpy(dtype="float64"),
+        defence=last["defence"].to_numpy(dtype="float64"),
+    )
+    return RatingState(
+        poisson=poisson,
+        elo=pd.Series(last["elo"].to_numpy(dtype="float64"), index=team_ids),
+        matches_played=pd.Series(last["matches_played"].to_numpy(dtype="int64"), index=team_ids),
+        last_step=last_step,
+    )
+
+
+def fixture_probabilities(fixtures: pd.DataFrame, state: RatingState) -> pd.DataFrame:
+    # Probabilities for scheduled matches from the latest ratings.
+    if fixtures.empty:
+        return pd.DataFrame(columns=MATCH_PROBABILITY_COLUMNS)
+    home_ids = fixtures["home_id"].to_numpy(dtype="int64")
+    away_ids = fixtures["away_id"].to_numpy(dtype="int64")
+    expected_home, expected_away = state.poisson.expected_goals(home_ids, away_ids)
+    p_home, p_draw, p_away = outcome_probabilities(expected_home, expected_away)
+    home_elo = state.elo.reindex(home_ids).fillna(ELO_INITIAL).to_numpy()
+    away_elo = state.elo.reindex(away_ids).fillna(ELO_INITIAL).to_numpy()
+    return pd.DataFrame(
+        {
+            "match_id": fixtures["match_id"].to_numpy(dtype="int64"),
+            "step": state.last_step + 1,
+            "home_id": home_ids,
+            "away_id": away_ids,
+            "expected_home_goals": expected_home,
+            "expected_away_goals": expected_away,
+            "p_home": p_home,
+            "p_draw": p_draw,
+            "p_away": p_away,
+            "elo_home": home_elo,
+            "elo_away": away_elo,
+            "elo_expected_home": elo_expected(home_elo, away_elo),
+        }
+    )[MATCH_PROBABILITY_COLUMNS]
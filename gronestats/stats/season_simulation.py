@@ -0,0 +1,318 @@
+from __future__ import annotations
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from gronestats.stats.team_stats import match_points
+
+
+SEASON_SIMULATIONS = 20_000
+SIMULATION_CHUNK_SIZE = 5_000
+# Below this many simulations a process pool costs more to start than it saves.
+SIMULATION_POOL_MIN = 100_000
+SEASON_STAGES = ("Apertura", "Clausura")
+PROJECTION_COLUMNS = [
+    "team_id",
+    "team_name",
+    "points",
+    "matches_remaining",
+    "expected_points",
+    "expected_position",
+    *(f"p_{stage.lower()}" for stage in SEASON_STAGES),
+    "p_aggregate_first",
+    "p_playoff",
+    "p_relegation",
+]
+
+
+@dataclass(frozen=True)
+class SeasonRules:
+    # Stage tables rank like calculate_standings (Pts, DG, GF, name); the aggregate table sums the stages.
+    stages: tuple[str, ...] = SEASON_STAGES
+    # Stage winners qualify first; the best remaining aggregate finishers fill the other spots.
+    playoff_spots: int = 3
+    relegation_spots: int = 3
+
+
+def season_stage(tournament: object) -> str | None:
+    if tournament is None or pd.isna(tournament):
+        return None
+    text = str(tournament).lower()
+    if "grand final" in text:
+        return None
+    for stage in SEASON_STAGES:
+        if stage.lower() in text:
+            return stage
+    return None
+
+
+@dataclass(frozen=True)
+class SeasonModel:
+    # Everything a worker needs, as plain arrays so it pickles cheaply into a process pool.
+    team_ids: np.ndarray
+    name_order: np.ndarray
+    stages: tuple[str, ...]
+    participants: np.ndarray
+    base_points: np.ndarray
+    base_goal_difference: np.ndarray
+    base_goals_for: np.ndarray
+    fixture_stage: np.ndarray
+    fixture_home: np.ndarray
+    fixture_away: np.ndarray
+    expected_home: np.ndarray
+    expected_away: np.ndarray
+    rules: SeasonRules
+
+
+def build_season_model(
+    played: pd.DataFrame,
+    remaining: pd.DataFrame,
+    *,
+    team_names: dict[int, str] | None = None,
+    rules: SeasonRules | None = None,
+) -> SeasonModel:
+    """Collect played results and the remaining fixtures' expected goals per stage.
+
+    Only Apertura/Clausura matches count; stages without any match are left out, so a season
+    whose Clausura is not scheduled yet projects the Apertura and the aggregate so far.
+    """
+    rules = rules or SeasonRules()
+    played = played.reindex(columns=["tournament", "home_id", "away_id", "home_score", "away_score"])
+    remaining = remaining.reindex(columns=["tournament", "home_id", "away_id", "expected_home_goals", "expected_away_goals"])
+    played = played.assign(stage=played["tournament"].map(season_stage)).dropna(
+        subset=["stage", "home_id", "away_id", "home_score", "away_score"]
+    )
+    remaining = remaining.assign(stage=remaining["tournament"].map(season_stage)).dropna(
+        subset=["stage", "home_id", "away_id", "expected_home_goals", "expected_away_goals"]
+    )
+    stages = tuple(stage for stage in rules.stages if (played["stage"] == stage).any() or (remaining["stage"] == stage).any())
+    team_ids = np.unique(
+        np.concatenate(
+            [frame[column].to_numpy(dtype="int64") for frame in (played, remaining) for column in ("home_id", "away_id")]
+        )
+    )
+    teams = len(team_ids)
+    names = np.array([str((team_names or {}).get(int(team_id), team_id)) for team_id in team_ids], dtype=object)
+    name_order = np.empty(teams, dtype="int64")
+    name_order[np.argsort(names, kind="stable")] = np.arange(teams)
+
+    participants = np.zeros((len(stages), teams), dtype=bool)
+    base_points = np.zeros((len(stages), teams), dtype="int64")
+    base_goal_difference = np.zeros((len(stages), teams), dtype="int64")
+    base_goals_for = np.zeros((len(stages), teams), dtype="int64")
+    for index, stage in enumerate(stages):
+        stage_played = played.loc[played["stage"] == stage]
+        stage_remaining = remaining.loc[remaining["stage"] == stage]
+        for frame in (stage_played, stage_remaining):
+            for column in ("home_id", "away_id"):
+                participants[index, np.searchsorted(team_ids, frame[column].to_numpy(dtype="int64"))] = True
+        home = np.searchsorted(team_ids, stage_played["home_id"].to_numpy(dtype="int64"))
+        away = np.searchsorted(team_ids, stage_played["away_id"].to_numpy(dtype="int64"))
+        home_goals = stage_played["home_score"].to_numpy(dtype="int64")
+        away_goals = stage_played["away_score"].to_numpy(dtype="int64")
+        np.add.at(base_points[index], home, match_points(home_goals, away_goals))
+        np.add.at(base_points[index], away, match_points(away_goals, home_goals))
+        np.add.at(base_goal_difference[index], home, home_goals - away_goals)
+        np.add.at(base_goal_difference[index], away, away_goals - home_goals)
+        np.add.at(base_goals_for[index], home, home_goals)
+        np.add.at(base_goals_for[index], away, away_goals)
+
+    stage_codes = {stage: index for index, stage in enumerate(stages)}
+    return SeasonModel(
+        team_ids=team_ids,
+        name_order=name_order,
+        stages=stages,
+        participants=participants,
+        base_points=base_points,
+        base_goal_difference=base_goal_difference,
+        base_goals_for=base_goals_for,
+        fixture_stage=remaining["stage"].map(stage_codes).to_numpy(dtype="int64"),
+        fixture_home=np.searchsorted(team_ids, remaining["home_id"].to_numpy(dtype="int64")),
+        fixture_away=np.searchsorted(team_ids, remaining["away_id"].to_numpy(dtype="int64")),
+        expected_home=remaining["expected_home_goals"].to_numpy(dtype="float64"),
+        expected_away=remaining["expected_away_goals"].to_numpy(dtype="float64"),
+        rules=rules,
+    )
+
+
+def _positions(points: np.ndarray, goal_difference: np.ndarray, goals_for: np.ndarray, name_order: np.ndarray, eligible: np.ndarray) -> np.ndarray:
+    # One sortable integer per team and simulation; non-participants sink to the bottom.
+    teams = points.shape[1]
+    key = ((points * 4096 + goal_difference + 2048) * 4096 + goals_for) * teams + (teams - 1 - name_order)
+    key = np.where(eligible, key, -1)
+    order = np.argsort(-key, axis=1, kind="stable")
+    positions = np.empty_like(order)
+    np.put_along_axis(positions, order, np.arange(teams)[None, :], axis=1)
+    return positions
+
+
+def _simulate_chunk(model: SeasonModel, simulations: int, seed: np.random.SeedSequence) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    teams = len(model.team_ids)
+    home_goals = rng.poisson(model.expected_home, size=(simulations, len(model.expected_home)))
+    away_goals = rng.poisson(model.expected_away, size=(simulations, len(model.expected_away)))
+    home_points = match_points(home_goals, away_goals)
+    away_points = match_points(away_goals, home_goals)
+    home_onehot = np.eye(teams, dtype="int64")[model.fixture_home]
+    away_onehot = np.eye(teams, dtype="int64")[model.fixture_away]
+
+    total_points = np.zeros((simulations, teams), dtype="int64")
+    total_goal_difference = np.zeros((simulations, teams), dtype="int64")
+    total_goals_for = np.zeros((simulations, teams), dtype="int64")
+    stage_winners = np.zeros((simulations, teams), dtype=bool)
+    stage_titles = np.zeros((len(model.stages), teams), dtype="int64")
+    for index in range(len(model.stages)):
+        mask = model.fixture_stage == index
+        points = model.base_points[index] + home_points[:, mask] @ home_onehot[mask] + away_points[:, mask] @ away_onehot[mask]
+        goal_difference = model.base_goal_difference[index] + (home_goals[:, mask] - away_goals[:, mask]) @ (
+            home_onehot[mask] - away_onehot[mask]
+        )
+        goals_for = model.base_goals_for[index] + home_goals[:, mask] @ home_onehot[mask] + away_goals[:, mask] @ away_onehot[mask]
+        winners = _positions(points, goal_difference, goals_for, model.name_order, model.participants[index]) == 0
+        stage_titles[index] = winners.sum(axis=0)
+        stage_winners |= winners
+        total_points += points
+        total_goal_difference += goal_difference
+        total_goals_for += goals_for
+
+    eligible = np.broadcast_to(model.participants.any(axis=0), (simulations, teams))
+    positions = _positions(total_points, total_goal_difference, total_goals_for, model.name_order, eligible)
+    order = np.argsort(positions, axis=1)
+    ranked_winners = np.take_along_axis(stage_winners, order, axis=1)
+    open_spots = model.rules.playoff_spots - ranked_winners.sum(axis=1, keepdims=True)
+    ranked_playoff = ranked_winners | (~ranked_winners & (np.cumsum(~ranked_winners, axis=1) <= open_spots))
+    playoff = np.empty_like(ranked_playoff)
+    np.put_along_axis(playoff, order, ranked_playoff, axis=1)
+    relegation_line = int(eligible[0].sum()) - model.rules.relegation_spots
+
+    position_counts = np.zeros((teams, teams), dtype="int64")
+    np.add.at(position_counts, (np.broadcast_to(np.arange(teams), positions.shape), positions), 1)
+    return {
+        "simulations": np.array(simulations),
+        "points": total_points.sum(axis=0),
+        "positions": position_counts,
+        "stage_titles": stage_titles,
+        "aggregate_first": (positions == 0).sum(axis=0),
+        "playoff": playoff.sum(axis=0),
+        "relegation": (positions >= relegation_line).sum(axis=0),
+    }
+
+
+def _chunk_sizes(simulations: int) -> list[int]:
+    full, rest = divmod(int(simulations), SIMULATION_CHUNK_SIZE)
+    return [SIMULATION_CHUNK_SIZE] * full + ([rest] if rest else [])
+
+
+def run_simulations(
+    model: SeasonModel,
+    simulations: int = SEASON_SIMULATIONS,
+    *,
+    seed: int = 0,
+    workers: int | None = None,
+) -> dict[str, np.ndarray]:
+    """Sample `simulations` season completions and sum the outcome counts.
+
+    Work is split into fixed-size chunks with their own spawned seeds, so the totals are the same
+    whether the chunks run in this process or across a pool.
+    """
+    sizes = _chunk_sizes(simulations)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    if workers is None:
+        workers = min(len(sizes), os.cpu_count() or 1) if simulations >= SIMULATION_POOL_MIN else 1
+    if workers <= 1 or len(sizes) <= 1:
+        results = [_simulate_chunk(model, size, chunk_seed) for size, chunk_seed in zip(sizes, seeds)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_simulate_chunk, model, size, chunk_seed) for size, chunk_seed in zip(sizes, seeds)]
+            results = [future.result() for future in futures]
+    return {key: sum(result[key] for result in results) for key in results[0]}
+
+
+def projection_tables(model: SeasonModel, totals: dict[str, np.ndarray], team_names: dict[int, str] | None = None) -> dict[str, pd.DataFrame]:
+    simulations = float(totals["simulations"])
+    teams = len(model.team_ids)
+    remaining = np.bincount(model.fixture_home, minlength=teams) + np.bincount(model.fixture_away, minlength=teams)
+    projections = pd.DataFrame(
+        {
+            "team_id": model.team_ids,
+            "team_name": [str((team_names or {}).get(int(team_id), team_id)) for team_id in model.team_ids],
+            "points": model.base_points.sum(axis=0),
+            "matches_remaining": remaining,
+            "expected_points": totals["points"] / simulations,
+            "expected_position": (totals["positions"] @ np.arange(1, teams + 1)) / simulations,
+            "p_aggregate_first": totals["aggregate_first"] / simulations,
+            "p_playoff": totals["playoff"] / simulations,
+            "p_relegation": totals["relegation"] / simulations,
+        }
+    )
+    for stage in SEASON_STAGES:
+        column = f"p_{stage.lower()}"
+        projections[column] = totals["stage_titles"][model.stages.index(stage)] / simulations if stage in model.stages else np.nan
+    projections = projections.loc[model.participants.any(axis=0), PROJECTION_COLUMNS]
+    projections = projections.sort_values(["expected_position", "team_name"], kind="mergesort").reset_index(drop=True)
+
+    positions = pd.DataFrame(totals["positions"] / simulations, columns=np.arange(1, teams + 1))
+    positions.insert(0, "team_id", model.team_ids)
+    positions = positions.loc[model.participants.any(axis=0)].set_index("team_id").loc[projections["team_id"]].reset_index()
+    return {"season_projections": projections, "position_probabilities": positions}
+
+
+def simulate_season(
+    played: pd.DataFrame,
+    remaining: pd.DataFrame,
+    *,
+    simulations: int = SEASON_SIMULATIONS,
+    seed: int = 0,
+    workers: int | None = None,
+    team_names: dict[int, str] | None = None,
+    rules: SeasonRules | None = None,
+) -> dict[str, pd.DataFrame]:
+    model = build_season_model(played, remaining, team_names=team_names, rules=rules)
+    if len(model.team_ids) == 0:
+        return {"season_projections": pd.DataFrame(columns=PROJECTION_COLUMNS), "position_probabilities": pd.DataFrame()}
+    return projection_tables(model, run_simulations(model, simulations, seed=seed, workers=workers), team_names)
+
+
+def simulate_release(release_dir: Path, **kwargs: object) -> dict[str, pd.DataFrame]:
+    # Played results from matches.parquet, remaining fixtures from the published match_probabilities.
+    matches = pd.read_parquet(release_dir / "matches.parquet")
+    probabilities = pd.read_parquet(release_dir / "match_probabilities.parquet")
+    teams = pd.read_parquet(release_dir / "teams.parquet")
+    remaining = probabilities.loc[~probabilities["is_played"].astype(bool)]
+    team_names = dict(zip(teams["team_id"].astype(int), teams["short_name"].astype(str)))
+    return simulate_season(matches, remaining, team_names=team_names, **kwargs)
+
+
+def main() -> None:
+    from gronestats.dashboard.data import season_current_dir
+
+    parser = argparse.ArgumentParser(description="Simulate the rest of a season from the published ratings.")
+    parser.add_argument("--season", type=int, required=True)
+    parser.add_argument("--simulations", type=int, default=SEASON_SIMULATIONS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, help="Process pool size; defaults to all cores for large runs.")
+    parser.add_argument("--relegation-spots", type=int, default=SeasonRules.relegation_spots)
+    parser.add_argument("--playoff-spots", type=int, default=SeasonRules.playoff_spots)
+    parser.add_argument("--positions", action="store_true", help="Also print the finishing-position distribution.")
+    args = parser.parse_args()
+
+    tables = simulate_release(
+        season_current_dir(args.season),
+        simulations=args.simulations,
+        seed=args.seed,
+        workers=args.workers,
+        rules=SeasonRules(playoff_spots=args.playoff_spots, relegation_spots=args.relegation_spots),
+    )
+    print(tables["season_projections"].round(3).to_string(index=False))
+    if args.positions:
+        print(tables["position_probabilities"].round(3).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+
+GOAL_MOUTH_COLUMNS = ["goal_mouth_y", "goal_mouth_z"]
+BLOCK_COLUMNS = ["block_x", "block_y", "block_z"]
+SHOT_COORDINATE_COLUMNS = [*GOAL_MOUTH_COLUMNS, *BLOCK_COLUMNS]
+
+_NUMBER = r"(-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)"
+_LIST_PAYLOAD = rf"^\s*[\[(]?\s*{_NUMBER}\s*,\s*{_NUMBER}(?:\s*,\s*{_NUMBER})?"
+
+
+def _payload_text(values: pd.Series) -> pd.Series:
+    # Raw sheets carry python/JSON literals as text; dict or list objects share the same repr.
+    text = values.astype("string")
+    return text.where(values.notna(), pd.NA).str.strip()
+
+
+def parse_coordinate_payloads(values: pd.Series, axes: tuple[str, ...]) -> pd.DataFrame:
+    text = _payload_text(values)
+    parsed = pd.DataFrame(index=values.index)
+    for axis in axes:
+        extracted = text.str.extract(rf"""['"]{axis}['"]\s*:\s*['"]?{_NUMBER}""", expand=False)
+        parsed[axis] = pd.to_numeric(extracted, errors="coerce").astype("float64")
+    return parsed
+
+
+def parse_goal_mouth_coordinates(values: pd.Series) -> pd.DataFrame:
+    text = _payload_text(values)
+    parsed = parse_coordinate_payloads(values, ("y", "z"))
+    # Goal-mouth payloads may also arrive as bare (y, z) pairs.
+    pairs = text.str.extract(_LIST_PAYLOAD)
+    parsed["y"] = parsed["y"].fillna(pd.to_numeric(pairs[0], errors="coerce").astype("float64"))
+    parsed["z"] = parsed["z"].fillna(pd.to_numeric(pairs[1], errors="coerce").astype("float64"))
+    complete = parsed["y"].notna() & parsed["z"].notna()
+    return pd.DataFrame(
+        {
+            "goal_mouth_y": parsed["y"].where(complete, np.nan),
+            "goal_mouth_z": parsed["z"].where(complete, np.nan),
+        },
+        index=values.index,
+    )
+
+
+def _fill_parsed_columns(
+    work: pd.DataFrame,
+    columns: list[str],
+    raw_column: str,
+    parse: Callable[[pd.Series], pd.DataFrame],
+) -> None:
+    for column in columns:
+        if column not in work.columns:
+            work[column] = np.nan
+        work[column] = pd.to_numeric(work[column], errors="coerce").astype("float64")
+    if raw_column not in work.columns:
+        return
+    # Only rows whose numeric columns are still empty (older releases or warehouse rows) are parsed.
+    pending = work[columns].isna().all(axis=1) & work[raw_column].notna()
+    if pending.any():
+        work.loc[pending, columns] = parse(work.loc[pending, raw_column]).to_numpy(dtype="float64", na_value=np.nan)
+
+
+def _parse_block_coordinates(values: pd.Series) -> pd.DataFrame:
+    return parse_coordinate_payloads(values, ("x", "y", "z"))
+
+
+def add_shot_coordinate_columns(shot_events: pd.DataFrame) -> pd.DataFrame:
+    work = shot_events.copy()
+    _fill_parsed_columns(work, GOAL_MOUTH_COLUMNS, "goal_mouth_coordinates", parse_goal_mouth_coordinates)
+    _fill_parsed_columns(work, BLOCK_COLUMNS, "block_coordinates", _parse_block_coordinates)
+    return work
@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from gronestats.data_layout import season_layout
+from gronestats.stats.player_stats import per90
+
+
+SIMILARITY_MODES = ("two_sided", "at_least", "at_most")
+SIMILARITY_MIN_MINUTES = 900
+SIMILARITY_QUERY_CHUNK = 256
+SIMILARITY_COUNT_COLUMNS = ["goals", "assists", "saves", "fouls", "penaltywon", "penaltyconceded"]
+SIMILARITY_IDENTITY_COLUMNS = ["player_id", "name", "team_id", "position", "minutesplayed", "matches_played"]
+
+
+@dataclass(frozen=True)
+class SimilarityFeature:
+    column: str
+    mode: str = "two_sided"
+    weight: float = 1.0
+
+
+DEFAULT_SIMILARITY_FEATURES = (
+    SimilarityFeature("goals_per90", "two_sided", 0.22),
+    SimilarityFeature("assists_per90", "two_sided", 0.16),
+    SimilarityFeature("rating", "at_least", 0.18),
+    SimilarityFeature("saves_per90", "two_sided", 0.12),
+    SimilarityFeature("fouls_per90", "two_sided", 0.08),
+    SimilarityFeature("penaltywon_per90", "two_sided", 0.06),
+    SimilarityFeature("cards_per90", "at_most", 0.10),
+    SimilarityFeature("penaltyconceded_per90", "at_most", 0.08),
+)
+
+
+def _numeric(frame: pd.DataFrame, column: str) -> pd.Series:
+    if column not in frame.columns:
+        return pd.Series(0.0, index=frame.index, dtype="float64")
+    return pd.to_numeric(frame[column], errors="coerce").fillna(0).astype("float64")
+
+
+def build_similarity_features(
+    player_match: pd.DataFrame,
+    player_totals: pd.DataFrame | None = None,
+    *,
+    min_minutes: int = SIMILARITY_MIN_MINUTES,
+) -> pd.DataFrame:
+    if player_match.empty or "player_id" not in player_match.columns:
+        return pd.DataFrame(columns=SIMILARITY_IDENTITY_COLUMNS)
+
+    work = player_match.loc[player_match["player_id"].notna()].copy()
+    work["player_id"] = pd.to_numeric(work["player_id"], errors="coerce").astype("int64")
+    for column in ["minutesplayed", *SIMILARITY_COUNT_COLUMNS, "yellowcards", "redcards"]:
+        work[column] = _numeric(work, column)
+    work["cards"] = work["yellowcards"] + work["redcards"]
+    work["rating"] = pd.to_numeric(work["rating"], errors="coerce") if "rating" in work.columns else np.nan
+
+    order = [column for column in ["fecha_dt", "match_id"] if column in work.columns]
+    identity = work.sort_values(order, kind="mergesort") if order else work
+    identity = identity.groupby("player_id").tail(1).set_index("player_id")
+    grouped = work.groupby("player_id").agg(
+        matches_played=("match_id", "nunique"),
+        minutesplayed=("minutesplayed", "sum"),
+        cards=("cards", "sum"),
+        rating=("rating", "mean"),
+        **{column: (column, "sum") for column in SIMILARITY_COUNT_COLUMNS},
+    )
+    # Published full-season totals win over the player_match aggregate where they exist.
+    if player_totals is not None and not player_totals.empty and "player_id" in player_totals.columns:
+        totals = player_totals.loc[player_totals["player_id"].notna()].copy()
+        totals["player_id"] = pd.to_numeric(totals["player_id"], errors="coerce").astype("int64")
+        totals = totals.drop_duplicates(subset=["player_id"]).set_index("player_id")
+        for column in ["minutesplayed", "matches_played", *SIMILARITY_COUNT_COLUMNS]:
+            if column in totals.columns:
+                grouped[column] = _numeric(totals, column).reindex(grouped.index).fillna(grouped[column])
+
+    for column in ["name", "team_id", "position"]:
+        grouped[column] = identity[column].reindex(grouped.index) if column in identity.columns else pd.NA
+    grouped = grouped.loc[grouped["minutesplayed"] >= min_minutes].reset_index()
+    if grouped.empty:
+        return pd.DataFrame(columns=SIMILARITY_IDENTITY_COLUMNS)
+
+    for column in [*SIMILARITY_COUNT_COLUMNS, "cards"]:
+        grouped[f"{column}_per90"] = per90(grouped[column], grouped["minutesplayed"])
+    grouped["team_id"] = pd.to_numeric(grouped["team_id"], errors="coerce").astype("Int64")
+    grouped["position"] = grouped["position"].astype("string").str.upper()
+    return grouped.sort_values("player_id", kind="mergesort").reset_index(drop=True)
+
+
+def robust_ranges(values: np.ndarray) -> np.ndarray:
+    low, high = np.nanpercentile(values, [5, 95], axis=0)
+    spread = high - low
+    # Degenerate p5-p95 windows fall back to min-max, then to a tiny epsilon.
+    fallback = np.nanmax(values, axis=0) - np.nanmin(values, axis=0)
+    spread = np.where(np.isclose(spread, 0), fallback, spread)
+    return np.where(np.isclose(spread, 0), 1e-6, spread)
+
+
+def _feature_arrays(
+    columns: tuple[str, ...],
+    features: tuple[SimilarityFeature, ...],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    unknown_modes = sorted({feature.mode for feature in features} - set(SIMILARITY_MODES))
+    if unknown_modes:
+        raise ValueError(f"Unknown similarity modes: {unknown_modes}")
+    missing = [feature.column for feature in features if feature.column not in columns]
+    if missing:
+        raise KeyError(f"Features not present in the similarity index: {missing}")
+    column_positions = np.array([columns.index(feature.column) for feature in features], dtype="int64")
+    weights = np.array([feature.weight for feature in features], dtype="float64")
+    if weights.sum() <= 0:
+        raise ValueError("Similarity weights must add up to a positive value.")
+    mode_codes = np.array([SIMILARITY_MODES.index(feature.mode) for feature in features], dtype="int64")
+    return column_positions, weights / weights.sum(), mode_codes
+
+
+def _similarity_block(
+    reference: np.ndarray,
+    candidates: np.ndarray,
+    weights: np.ndarray,
+    mode_codes: np.ndarray,
+) -> np.ndarray:
+    # reference: (q, f), candidates: (n, f) -> scores (q, n) in [0, 100].
+    delta = candidates[None, :, :] - reference[:, None, :]
+    penalty = np.abs(delta)
+    penalty = np.where(mode_codes == 1, np.maximum(-delta, 0.0), penalty)
+    penalty = np.where(mode_codes == 2, np.maximum(delta, 0.0), penalty)
+    return np.clip(1.0 - penalty, 0.0, 1.0) @ weights * 100.0
+
+
+@dataclass(frozen=True)
+class SimilarityIndex:
+    players: pd.DataFrame
+    matrix: np.ndarray
+    columns: tuple[str, ...]
+    features: tuple[SimilarityFeature, ...]
+    positions: dict[int, int]
+
+    @classmethod
+    def from_frame(
+        cls,
+        frame: pd.DataFrame,
+        features: tuple[SimilarityFeature, ...] = DEFAULT_SIMILARITY_FEATURES,
+    ) -> SimilarityIndex:
+        columns = tuple(dict.fromkeys(feature.column for feature in features))
+        players = frame.reset_index(drop=True)
+        if players.empty:
+            return cls(players=players, matrix=np.empty((0, len(columns))), columns=columns, features=features, positions={})
+        missing = [column for column in columns if column not in players.columns]
+        if missing:
+            raise KeyError(f"Similarity features missing from frame: {missing}")
+        numeric = players[list(columns)].apply(pd.to_numeric, errors="coerce").astype("float64")
+        values = numeric.fillna(numeric.median()).fillna(0.0).to_numpy(dtype="float64")
+        # Scaling by the robust range turns every feature gap into a share of the league spread.
+        matrix = values / robust_ranges(values)
+        positions = {int(player_id): row for row, player_id in enumerate(players["player_id"].tolist())}
+        return cls(players=players, matrix=matrix, columns=columns, features=features, positions=positions)
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.positions
+
+    def __contains__(self, player_id: object) -> bool:
+        return player_id is not None and int(player_id) in self.positions
+
+    def _candidate_mask(self, rows: np.ndarray, *, same_position: bool) -> np.ndarray:
+        mask = np.ones((len(rows), len(self.players)), dtype=bool)
+        mask[np.arange(len(rows)), rows] = False
+        if same_position and "position" in self.players.columns:
+            player_positions = self.players["position"].astype("string").fillna("").to_numpy(dtype=object)
+            mask &= player_positions[rows][:, None] == player_positions[None, :]
+        return mask
+
+    def scores(
+        self,
+        player_ids: list[int],
+        *,
+        features: tuple[SimilarityFeature, ...] | None = None,
+    ) -> np.ndarray:
+        column_positions, weights, mode_codes = _feature_arrays(self.columns, features or self.features)
+        rows = np.array([self.positions[int(player_id)] for player_id in player_ids], dtype="int64")
+        matrix = self.matrix[:, column_positions]
+        return _similarity_block(matrix[rows], matrix, weights, mode_codes)
+
+    def top_k_many(
+        self,
+        player_ids: list[int] | None = None,
+        k: int = 10,
+        *,
+        same_position: bool = False,
+        features: tuple[SimilarityFeature, ...] | None = None,
+        chunk_size: int = SIMILARITY_QUERY_CHUNK,
+    ) -> pd.DataFrame:
+        result_columns = ["player_id", "rank", "similar_player_id", "similarity_score"]
+        if self.is_empty or k <= 0:
+            return pd.DataFrame(columns=result_columns)
+        query_ids = list(self.positions) if player_ids is None else [int(player_id) for player_id in player_ids if int(player_id) in self.positions]
+        column_positions, weights, mode_codes = _feature_arrays(self.columns, features or self.features)
+        matrix = self.matrix[:, column_positions]
+        candidate_ids = self.players["player_id"].to_numpy(dtype="int64")
+        limit = min(k, len(candidate_ids) - 1)
+        if not query_ids or limit <= 0:
+            return pd.DataFrame(columns=result_columns)
+
+        blocks: list[pd.DataFrame] = []
+        for start in range(0, len(query_ids), chunk_size):
+            chunk_ids = query_ids[start : start + chunk_size]
+            rows = np.array([self.positions[player_id] for player_id in chunk_ids], dtype="int64")
+            scores = _similarity_block(matrix[rows], matrix, weights, mode_codes)
+            scores = np.where(self._candidate_mask(rows, same_position=same_position), scores, -np.inf)
+            top = np.argpartition(-scores, limit - 1, axis=1)[:, :limit]
+            top_scores = np.take_along_axis(scores, top, axis=1)
+            order = np.argsort(-top_scores, axis=1, kind="stable")
+            top = np.take_along_axis(top, order, axis=1)
+            top_scores = np.take_along_axis(top_scores, order, axis=1)
+            blocks.append(
+                pd.DataFrame(
+                    {
+                        "player_id": np.repeat(np.array(chunk_ids, dtype="int64"), limit),
+                        "rank": np.tile(np.arange(1, limit + 1, dtype="int64"), len(chunk_ids)),
+                        "similar_player_id": candidate_ids[top].ravel(),
+                        "similarity_score": top_scores.ravel(),
+                    }
+                )
+            )
+        result = pd.concat(blocks, ignore_index=True)
+        return result.loc[np.isfinite(result["similarity_score"])].reset_index(drop=True)
+
+    def top_k(
+        self,
+        player_id: int,
+        k: int = 10,
+        *,
+        same_position: bool = False,
+        features: tuple[SimilarityFeature, ...] | None = None,
+    ) -> pd.DataFrame:
+        if player_id not in self:
+            return pd.DataFrame()
+        neighbours = self.top_k_many([int(player_id)], k, same_position=same_position, features=features)
+        identity = self.players.rename(columns={"player_id": "similar_player_id"})
+        return neighbours.merge(identity, on="similar_player_id", how="left").drop(columns=["player_id"])
+
+
+def load_season_similarity_index(
+    season_year: int,
+    *,
+    min_minutes: int = SIMILARITY_MIN_MINUTES,
+    repo_root: Path | None = None,
+) -> SimilarityIndex:
+    current_dir = season_layout(season_year, repo_root=repo_root).dashboard.current_dir
+    player_match = pd.read_parquet(current_dir / "player_match.parquet")
+    totals_path = current_dir / "player_totals_full_season.parquet"
+    player_totals = pd.read_parquet(totals_path) if totals_path.exists() else None
+    return SimilarityIndex.from_frame(build_similarity_features(player_match, player_totals, min_minutes=min_minutes))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rank the most similar players from a published dashboard release.")
+    parser.add_argument("--season", type=int, required=True)
+    parser.add_argument("--player-id", type=int, action="append", dest="player_ids")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--min-minutes", type=int, default=SIMILARITY_MIN_MINUTES)
+    parser.add_argument("--same-position", action="store_true")
+    parser.add_argument("--output", type=Path, help="CSV destination; all players are ranked when no --player-id is given.")
+    args = parser.parse_args()
+
+    index = load_season_similarity_index(args.season, min_minutes=args.min_minutes)
+    neighbours = index.top_k_many(args.player_ids, args.top, same_position=args.same_position)
+    names = index.players.set_index("player_id")["name"]
+    neighbours["name"] = neighbours["player_id"].map(names)
+    neighbours["similar_name"] = neighbours["similar_player_id"].map(names)
+    neighbours["similarity_score"] = neighbours["similarity_score"].round(2)
+    if args.output is not None:
+        neighbours.to_csv(args.output, index=False, encoding="utf-8-sig")
+        print(args.output)
+    else:
+        print(neighbours.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
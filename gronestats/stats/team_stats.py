@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from gronestats.stats.player_stats import as_float_array, wrap_like
+
+
+RESULT_CODES = np.array(["L", "D", "W"], dtype=object)
+
+
+def goal_difference(goals_for: Any, goals_against: Any) -> np.ndarray | pd.Series:
+    return wrap_like(as_float_array(goals_for) - as_float_array(goals_against), goals_for)
+
+
+def match_results(goals_for: Any, goals_against: Any) -> np.ndarray | pd.Series:
+    difference = as_float_array(goals_for) - as_float_array(goals_against)
+    return wrap_like(RESULT_CODES[(np.sign(difference) + 1).astype("int64")], goals_for)
+
+
+def match_points(goals_for: Any, goals_against: Any, *, win: int = 3, draw: int = 1) -> np.ndarray | pd.Series:
+    difference = as_float_array(goals_for) - as_float_array(goals_against)
+    points = np.where(difference > 0, win, np.where(difference == 0, draw, 0)).astype("int64")
+    return wrap_like(points, goals_for)
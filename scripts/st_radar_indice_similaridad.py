@@ -63,7 +63,31 @@ if not CSV.exists():
     st.error(f"No se encuentra {CSV}. Ejecuta antes el script que genera top10_similares_a_noriega.csv.")
     st.stop()
 
-df = pd.read_csv(CSV, encoding="utf-8-sig").fillna(0)
+
+@st.cache_data(show_spinner=False)
+def build_percentile_table(csv_path: str, modified_at: float) -> pd.DataFrame:
+    # Percentiles only depend on the CSV, so slider changes reuse them and just reweight.
+    df = pd.read_csv(csv_path, encoding="utf-8-sig").fillna(0)
+    for col in FEATURES:
+        if col not in df.columns:
+            df[col] = 0.0
+    columns = list(FEATURES)
+    values = df[columns].astype(float)
+    sims = values.rank(pct=True, method="average")
+    at_most = [col for col, mode in FEATURES.items() if mode == "at_most"]
+    sims[at_most] = 1 - sims[at_most]
+    two_sided = [col for col, mode in FEATURES.items() if mode == "two_sided"]
+    if two_sided:
+        ref_rows = values.loc[df["player"] == "Erick Noriega", two_sided]
+        ref_vals = ref_rows.iloc[0] if not ref_rows.empty else values[two_sided].median()
+        rng = values[two_sided].quantile(0.95) - values[two_sided].quantile(0.05)
+        rng = rng.where(~np.isclose(rng, 0), values[two_sided].max() - values[two_sided].min())
+        rng = rng.where(~np.isclose(rng, 0), 1.0)
+        sims[two_sided] = (1 - (values[two_sided] - ref_vals).abs() / rng).clip(0, 1)
+    return df.join(sims.add_suffix("_sim"))
+
+
+df = build_percentile_table(str(CSV), CSV.stat().st_mtime)
 
 # --- Sidebar: reset button + sliders stored in session_state ---
 st.sidebar.header("Peso de métricas (ajusta y aplica)")
@@ -103,36 +127,10 @@ st.sidebar.markdown("**Pesos normalizados:**")
 for k, v in norm_weights.items():
     st.sidebar.write(f"{METRICS_DICT[k]}: {v:.2f}")
 
-# --- Compute _sim columns (percentiles / two_sided logic) ---
-df_proc = df.copy()
-for col, mode in FEATURES.items():
-    if col not in df_proc.columns:
-        df_proc[col] = 0.0
-    pct = df_proc[col].rank(pct=True, method="average").values  # 0-1
-    if mode == "at_least":
-        sim = pct
-    elif mode == "at_most":
-        sim = 1 - pct # type: ignore
-    elif mode == "two_sided":
-        ref_val = df_proc.loc[df_proc["player"] == "Erick Noriega", col].values
-        if len(ref_val) == 0:
-            ref_val = np.array([df_proc[col].median()])
-        ref_val = float(ref_val[0])
-        rng = df_proc[col].quantile(0.95) - df_proc[col].quantile(0.05)
-        if np.isclose(rng, 0):
-            rng = df_proc[col].max() - df_proc[col].min()
-        if np.isclose(rng, 0):
-            rng = 1.0
-        sim = 1 - (np.abs(df_proc[col] - ref_val) / rng)
-        sim = np.clip(sim, 0, 1)
-    else:
-        sim = pct
-    df_proc[col + "_sim"] = sim
-
 # --- Dynamic score with normalized weights ---
-df_proc["dynamic_score"] = 0.0
-for f in FEATURES.keys():
-    df_proc["dynamic_score"] += df_proc[f + "_sim"] * norm_weights[f]
+df_proc = df.copy()
+sim_matrix = df_proc[[f + "_sim" for f in FEATURES]].to_numpy(dtype=float)
+df_proc["dynamic_score"] = sim_matrix @ np.array([norm_weights[f] for f in FEATURES])
 max_score = df_proc["dynamic_score"].max()
 if np.isclose(max_score, 0):
     max_score = 1.0
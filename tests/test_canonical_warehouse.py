@@ -223,3 +223,59 @@ def test_empty_typed_frame_preserves_schema_for_optional_layers() -> None:
     assert frame.empty
     assert list(frame.columns) == ["season_year", "match_id", "player_id", "team_id", "team_name", "name", "x", "y"]
     assert str(coerced["x"].dtype) == "float64"
+
+
+def test_dashboard_bundle_publishes_binned_heatmap_grid() -> None:
+    curated = _sample_curated_tables()
+    curated["heatmap_points"] = pd.DataFrame(
+        {
+            "match_id": [1, 1, 1, 1],
+            "player_id": [100, 100, 100, 200],
+            "team_id": [10, 10, 10, 20],
+            "team_name": ["Alianza", "Alianza", "Alianza", "Melgar"],
+            "name": ["Jugador Uno", "Jugador Uno", "Jugador Uno", "Jugador Dos"],
+            "x": [10.0, 12.0, 95.0, 100.0],
+            "y": [5.0, 6.0, 50.0, 100.0],
+        }
+    )
+
+    dashboard_bundle = build_dashboard_bundle_from_canonical(build_canonical_tables(curated, season=2025))
+    grid = dashboard_bundle["heatmap_grid"]
+
+    assert list(grid.columns) == list(DASHBOARD_EXPORT_SCHEMAS["heatmap_grid"].column_names)
+    assert grid[["player_id", "cell_x", "cell_y", "points_count"]].astype(int).values.tolist() == [
+        [100, 1, 0, 2],
+        [100, 11, 4, 1],
+        [200, 11, 8, 1],
+    ]
+    assert int(grid["points_count"].sum()) == len(dashboard_bundle["heatmap_points"])
+
+
+def test_dashboard_shot_events_publish_numeric_goal_mouth_and_block_columns() -> None:
+    curated = _sample_curated_tables()
+    curated["shot_events"]["block_coordinates"] = ["{'x': 2.2, 'y': 42.4, 'z': 0}"]
+
+    shot_events = build_dashboard_bundle_from_canonical(build_canonical_tables(curated, season=2025))["shot_events"]
+
+    assert list(shot_events.columns) == list(DASHBOARD_EXPORT_SCHEMAS["shot_events"].column_names)
+    assert shot_events[["goal_mouth_y", "goal_mouth_z"]].iloc[0].tolist() == [50.0, 20.0]
+    assert shot_events[["block_x", "block_y", "block_z"]].iloc[0].tolist() == [2.2, 42.4, 0.0]
+
+
+def test_upsert_adds_new_contract_columns_to_existing_warehouse(tmp_path: Path) -> None:
+    duckdb = pytest.importorskip("duckdb")
+    warehouse_path = tmp_path / "warehouse" / "gronestats.duckdb"
+    warehouse_path.parent.mkdir(parents=True)
+    legacy_columns = [column for column in CANONICAL_SCHEMAS["shot_events_canonical"].columns if column.name != "block_z"]
+    con = duckdb.connect(str(warehouse_path))
+    try:
+        columns_sql = ", ".join(f'"{column.name}" {column.duckdb_type}' for column in legacy_columns)
+        con.execute(f'CREATE TABLE "shot_events_canonical" ({columns_sql})')
+    finally:
+        con.close()
+
+    upsert_canonical_tables(warehouse_path, build_canonical_tables(_sample_curated_tables(), season=2025), season=2025)
+    restored = load_canonical_tables_for_season(warehouse_path, season=2025)
+
+    assert "block_z" in restored["shot_events_canonical"].columns
+    assert len(restored["shot_events_canonical"]) == 1
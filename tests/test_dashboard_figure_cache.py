@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from matplotlib import pyplot as plt
+
+from gronestats.dashboard.figure_cache import FigureCache, FigureCacheKey
+
+
+def _key(entity: str, *, release_id: str = "20260407_223646", fmt: str = "png") -> FigureCacheKey:
+    return FigureCacheKey(
+        release_id=release_id,
+        chart="player_heatmap",
+        entity=entity,
+        scope="Acumulado del tramo regular:abc",
+        theme="#0f1824|#c6b170",
+        fmt=fmt,
+    )
+
+
+def _build_figure() -> plt.Figure:
+    fig, ax = plt.subplots(figsize=(1, 1))
+    ax.plot([0, 1], [0, 1])
+    return fig
+
+
+def test_figure_cache_renders_once_per_key() -> None:
+    cache = FigureCache()
+    calls: list[int] = []
+
+    def _build() -> plt.Figure:
+        calls.append(1)
+        return _build_figure()
+
+    first = cache.get_or_render(_key("1"), _build)
+    second = cache.get_or_render(_key("1"), _build)
+
+    assert first == second
+    assert first.startswith(b"\x89PNG")
+    assert len(calls) == 1
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_figure_cache_keys_separate_release_and_format() -> None:
+    assert _key("1").digest != _key("1", release_id="20260408_101010").digest
+    assert _key("1").digest != _key("1", fmt="svg").digest
+
+    cache = FigureCache()
+    payload = cache.get_or_render(_key("1", fmt="svg"), _build_figure)
+
+    assert b"<svg" in payload
+
+
+def test_figure_cache_evicts_least_recently_used_entries() -> None:
+    cache = FigureCache(max_bytes=10)
+    cache.put(_key("1"), b"aaaa")
+    cache.put(_key("2"), b"bbbb")
+    assert cache.get(_key("1")) == b"aaaa"
+
+    cache.put(_key("3"), b"cccc")
+
+    assert cache.get(_key("2")) is None
+    assert cache.get(_key("1")) == b"aaaa"
+    assert cache.get(_key("3")) == b"cccc"
+    assert cache.size_bytes <= 10
+
+
+def test_figure_cache_disk_tier_survives_memory_reset(tmp_path: Path) -> None:
+    cache = FigureCache(disk_dir=tmp_path)
+    cache.put(_key("1"), b"payload")
+    cache.clear()
+
+    assert cache.get(_key("1")) == b"payload"
+    assert (tmp_path / "20260407_223646" / f"{_key('1').digest}.png").exists()
+
+    fresh = FigureCache(disk_dir=tmp_path)
+    assert fresh.get(_key("1")) == b"payload"
+
+
+def test_figure_cache_bounds_disk_tier(tmp_path: Path) -> None:
+    cache = FigureCache(disk_dir=tmp_path, disk_max_bytes=12)
+    for entity in ["1", "2", "3"]:
+        cache.put(_key(entity), b"12345678")
+
+    stored = [path for path in tmp_path.rglob("*.png")]
+    assert sum(path.stat().st_size for path in stored) <= 12
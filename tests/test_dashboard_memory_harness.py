@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from gronestats.dashboard.config import DASHBOARD_CACHE_MAX_SEASONS, DATA_ROOT, published_season_count
+from gronestats.dashboard.memory_harness import format_samples, simulate_sessions
+from gronestats.dashboard.models import DatasetBundle
+
+
+def _bundle() -> DatasetBundle:
+    return DatasetBundle(
+        season_year=2025,
+        season_label="Liga 1 2025",
+        data_dir=Path("gronestats/data/Liga 1 Peru/2025/dashboard/current"),
+        matches=pd.DataFrame({"match_id": [1, 2], "round_number": [1, 2], "tournament": ["Liga 1, Apertura"] * 2}),
+        teams=pd.DataFrame({"team_id": [10, 20]}),
+        players=pd.DataFrame({"player_id": [1]}),
+        player_match=pd.DataFrame({"match_id": [1, 2], "player_id": [1, 1], "minutesplayed": [90, 90]}),
+        player_totals=pd.DataFrame(),
+        team_stats=pd.DataFrame(),
+        average_positions=pd.DataFrame(),
+        heatmap_points=pd.DataFrame(),
+        validation_status="passed",
+        validation_warnings=tuple(),
+        manifest={"release_id": "20260407_223646"},
+        validation={},
+        loaded_at=datetime(2026, 3, 12, 12, 0, 0),
+    )
+
+
+def test_simulate_sessions_shares_one_bundle_for_cache_resource() -> None:
+    samples = simulate_sessions(_bundle, 3, strategy="cache_resource")
+
+    assert [sample["sessions"] for sample in samples] == [1, 2, 3]
+    assert {sample["distinct_bundles"] for sample in samples} == {1}
+    assert "cache_resource" in format_samples(samples)
+
+
+def test_simulate_sessions_copies_bundle_per_session_for_cache_data() -> None:
+    samples = simulate_sessions(_bundle, 3, strategy="cache_data")
+
+    assert [sample["distinct_bundles"] for sample in samples] == [1, 2, 3]
+
+
+def test_simulate_sessions_rejects_unknown_strategy() -> None:
+    with pytest.raises(ValueError):
+        simulate_sessions(_bundle, 1, strategy="global")
+
+
+def test_season_bundle_cache_holds_every_published_season(tmp_path: Path) -> None:
+    for name in ("2024", "2025", "2026", "log_data"):
+        (tmp_path / name).mkdir()
+    (tmp_path / "2023").write_text("", encoding="utf-8")
+
+    assert published_season_count(tmp_path) == 3
+    assert published_season_count(tmp_path / "missing") == 0
+    assert DASHBOARD_CACHE_MAX_SEASONS >= max(5, published_season_count(DATA_ROOT))
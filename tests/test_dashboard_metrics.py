@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 import pandas as pd
 import pytest
+from matplotlib import pyplot as plt
 
-from gronestats.dashboard.data import filter_regular_season_matches, normalize_matches
+from gronestats.dashboard.data import filter_regular_season_matches, normalize_form_table, normalize_matches
 from gronestats.dashboard.metrics import (
     PLAYER_ACCUMULATED_SCOPE,
     add_per90_metrics,
@@ -20,14 +23,22 @@ from gronestats.dashboard.metrics import (
     build_match_standout_players,
     build_match_team_average_positions,
     build_leaderboards,
+    build_player_percentile_table,
     build_player_profile,
+    build_player_scope,
     build_player_visual_matches,
     build_players_table,
     build_team_context_matches,
+    build_top_team_form,
     calculate_standings,
     calculate_team_splits,
 )
-from gronestats.dashboard.models import DatasetBundle, FilterState
+from gronestats.dashboard import match_stats
+from gronestats.dashboard.match_stats import MatchStatsIndex
+from gronestats.dashboard.models import DatasetBundle, FilterState, PlayerLayerIndex, ScopeCache
+from gronestats.dashboard.views.figure_specs import player_accumulated_heatmap_figure_spec
+from gronestats.processing.form_tables import build_form_tables
+from gronestats.stats.form import TEAM_FORM_SPEC, extend_form, team_form_inputs
 
 
 def _make_dashboard_bundle(
@@ -499,6 +510,45 @@ def test_build_player_visual_matches_returns_only_matches_with_positional_data()
     assert visual_matches["has_heatmap"].tolist() == [True, False]
 
 
+def test_player_layer_index_slices_match_full_frame_masks() -> None:
+    heatmap_points = pd.DataFrame(
+        {
+            "match_id": pd.array([3, 1, 2, 1, 3, 1, 2], dtype="Int64"),
+            "player_id": pd.array([7, 5, 5, 7, pd.NA, 5, 7], dtype="Int64"),
+            "x": [10.0, 20.0, 30.0, 40.0, 50.0, 60.0, 70.0],
+            "y": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0],
+        }
+    )
+
+    index = PlayerLayerIndex.from_frame(heatmap_points)
+
+    assert set(index.offsets) == {5, 7}
+    for player_id in (5, 7):
+        expected = heatmap_points[heatmap_points["player_id"] == player_id].sort_values("match_id", kind="mergesort")
+        assert index.player_rows(player_id)["x"].tolist() == expected["x"].tolist()
+    assert index.player_rows(5, {1})["x"].tolist() == [20.0, 60.0]
+    assert index.player_match_ids(7, {2, 3}) == {2, 3}
+    assert index.player_rows(99).empty
+    assert index.player_match_ids(99) == set()
+    assert PlayerLayerIndex.from_frame(pd.DataFrame()).is_empty
+
+
+def test_player_layer_index_reuses_frame_already_sorted_by_player() -> None:
+    heatmap_points = pd.DataFrame(
+        {
+            "match_id": pd.array([1, 2, 1], dtype="Int64"),
+            "player_id": pd.array([5, 5, 7], dtype="Int64"),
+            "x": [1.0, 2.0, 3.0],
+            "y": [1.0, 2.0, 3.0],
+        }
+    )
+
+    index = PlayerLayerIndex.from_frame(heatmap_points)
+
+    assert index.frame is heatmap_points
+    assert index.offsets == {5: (0, 2), 7: (2, 3)}
+
+
 def test_build_player_profile_prefers_context_match_for_visual_panel() -> None:
     bundle = _make_dashboard_bundle(
         player_match=pd.DataFrame(
@@ -575,11 +625,50 @@ def test_build_player_profile_prefers_context_match_for_visual_panel() -> None:
     assert profile.default_visual_scope == "Partido contextual"
     assert profile.contextual_average_position_row is not None
     assert int(profile.contextual_average_position_row["match_id"]) == 2
-    assert len(profile.contextual_heatmap_points) == 1
-    assert len(profile.accumulated_heatmap_points) == 2
+    assert len(profile.contextual_heatmap_grid) == 1
+    assert len(profile.accumulated_heatmap_grid) == 2
     assert profile.accumulated_average_position_row is not None
 
 
+def test_accumulated_heatmap_without_average_position_titles_the_player() -> None:
+    bundle = _make_dashboard_bundle(
+        player_match=pd.DataFrame(
+            {
+                "match_id": [1],
+                "player_id": [1],
+                "team_id": [10],
+                "name": ["Jugador Valido"],
+                "position": ["F"],
+                "rating": [7.2],
+                "minutesplayed": [90],
+                "goals": [1],
+                "assists": [0],
+                "saves": [0],
+                "fouls": [1],
+                "penaltywon": [0],
+                "penaltysave": [0],
+                "penaltyconceded": [0],
+                "fecha_dt": pd.to_datetime(["2025-01-01"]),
+                "home": ["Alianza"],
+                "away": ["Melgar"],
+                "scoreline": ["1 - 0"],
+            }
+        ),
+        heatmap_points=pd.DataFrame({"match_id": [1], "player_id": [1], "team_id": [10], "x": [28.0], "y": [53.0]}),
+    )
+    profile = build_player_profile(bundle, FilterState(round_range=(1, 1), min_minutes=0), player_id=1)
+
+    assert profile is not None
+    assert profile.accumulated_average_position_row is None
+    assert not profile.accumulated_heatmap_grid.empty
+    _, build = player_accumulated_heatmap_figure_spec(profile)
+    figure = build()
+    try:
+        assert figure.axes[0].get_title() == "Jugador Valido | heatmap acumulado del jugador"
+    finally:
+        plt.close(figure)
+
+
 def test_build_player_profile_excludes_rating_from_summary_and_percentiles() -> None:
     bundle = _make_dashboard_bundle(
         player_match=pd.DataFrame(
@@ -743,7 +832,7 @@ def test_build_player_profile_defaults_to_accumulated_when_context_has_no_visual
     assert profile is not None
     assert profile.default_visual_scope == PLAYER_ACCUMULATED_SCOPE
     assert profile.contextual_average_position_row is None
-    assert profile.contextual_heatmap_points.empty
+    assert profile.contextual_heatmap_grid.empty
     assert profile.accumulated_average_position_row is not None
 
 
@@ -1073,3 +1162,132 @@ def test_build_player_profile_accumulated_scope_uses_regular_tournaments_even_if
     assert int(profile.accumulated_average_position_row["matches_count"]) == 1
     assert profile.visual_coverage["regular_average_match_count"] == 1
     assert profile.visual_coverage["regular_heatmap_match_count"] == 1
+
+
+def test_match_stats_index_formats_values_and_memoizes_groups() -> None:
+    index = MatchStatsIndex.from_frame(
+        pd.DataFrame(
+            {
+                "match_id": [1, 1, 1, 2],
+                "GROUP": ["Match overview", "Shots", "Match overview", "Shots"],
+                "KEY": ["ballPossession", "totalShotsOnGoal", "expectedGoals", "totalShotsOnGoal"],
+                "name": ["Ball possession", None, "Expected goals", "Total shots"],
+                "HOMEVALUE": [55, 3, 1.25, None],
+                "AWAYVALUE": [45, 2, 0.8, 4],
+            }
+        )
+    )
+
+    grouped = index.grouped(1)
+
+    assert list(grouped) == ["Match overview", "Shots"]
+    assert grouped["Match overview"]["Local"].tolist() == ["55%", "1.25"]
+    assert grouped["Shots"]["Metrica"].tolist() == ["Total shots on goal"]
+    assert index.grouped(1) is grouped
+    assert index.lookup(2).loc["totalShotsOnGoal", "Local"] == "-"
+    assert index.lookup(99).empty
+
+
+def test_match_stats_memos_are_bounded_under_concurrent_sessions(monkeypatch) -> None:  # noqa: ANN001
+    monkeypatch.setattr(match_stats, "DASHBOARD_MATCH_STATS_CACHE_ENTRIES", 4)
+    index = MatchStatsIndex.from_frame(
+        pd.DataFrame(
+            {
+                "match_id": list(range(1, 21)),
+                "GROUP": ["Shots"] * 20,
+                "KEY": ["totalShotsOnGoal"] * 20,
+                "name": ["Total shots"] * 20,
+                "HOMEVALUE": list(range(20)),
+                "AWAYVALUE": [1] * 20,
+            }
+        )
+    )
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        looked_up = list(pool.map(lambda match_id: index.lookup(match_id % 20 + 1), range(200)))
+        grouped = list(pool.map(lambda match_id: index.grouped(match_id % 20 + 1), range(200)))
+
+    assert [frame.loc["totalShotsOnGoal", "Local"] for frame in looked_up[:20]] == [str(value) for value in range(20)]
+    assert all(list(groups) == ["Shots"] for groups in grouped)
+    assert (len(index._lookups), len(index._groups)) == (4, 4)
+
+
+def test_build_player_percentile_table_ranks_within_position_cohorts() -> None:
+    player_stats = pd.DataFrame(
+        {
+            "player_id": [1, 2, 3, 4, 5],
+            "position": ["F", "F", "D", "D", pd.NA],
+            "goals_per90": [0.5, 0.2, 0.1, 0.3, 0.4],
+            "saves_per90": [0.0, 0.0, 0.0, 0.0, 0.0],
+            "minutesplayed": [900, 1800, 900, 450, 90],
+        }
+    )
+
+    table = build_player_percentile_table(player_stats)
+
+    assert table.loc[[1, 2], "goals_per90"].tolist() == [100.0, 50.0]
+    assert table.loc[[3, 4], "goals_per90"].tolist() == [50.0, 100.0]
+    assert table.loc[5, "goals_per90"] == 80.0
+    assert table.loc[4, "matches_played"] == 100.0
+
+
+def test_build_player_scope_is_reused_for_the_same_filters() -> None:
+    bundle = _make_dashboard_bundle(
+        player_match=pd.DataFrame(
+            {
+                "match_id": [1],
+                "player_id": [1],
+                "name": ["Jugador Valido"],
+                "team_id": [10],
+                "position": ["F"],
+                "minutesplayed": [90],
+                "goals": [1],
+                "assists": [0],
+            }
+        )
+    )
+    filters = FilterState(round_range=(1, 1), min_minutes=0)
+
+    first = build_player_scope(bundle, filters)
+
+    assert build_player_scope(bundle, filters) is first
+    assert build_player_scope(bundle, FilterState(round_range=(1, 1), min_minutes=10)) is not first
+    assert first[1].loc[1, "goals_per90"] == 100.0
+
+
+def test_scope_cache_is_bounded_under_concurrent_sessions_and_pickles() -> None:
+    cache = ScopeCache()
+
+    def read(key: int) -> int:
+        return cache.get_or_build(key % 12, lambda: key % 12, max_entries=4)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert list(pool.map(read, range(2_000))) == [key % 12 for key in range(2_000)]
+    assert len(cache) == 4
+
+    restored = pickle.loads(pickle.dumps(cache))
+    assert restored.get_or_build(next(iter(cache._entries)), lambda: "rebuilt", max_entries=4) != "rebuilt"
+
+
+def test_build_top_team_form_reads_published_form_for_the_full_season() -> None:
+    matches = pd.DataFrame(
+        {
+            "match_id": [1, 2, 3, 4, 5, 6],
+            "round_number": [1, 1, 2, 2, 3, 3],
+            "fecha_dt": pd.to_datetime(["2025-01-01", "2025-01-01", "2025-01-08", "2025-01-08", "2025-01-15", "2025-01-15"]),
+            "home_id": [10, 30, 20, 10, 30, 40],
+            "away_id": [20, 40, 30, 40, 10, 20],
+            "home": ["Alianza", "Cristal", "Melgar", "Alianza", "Cristal", "Cienciano"],
+            "away": ["Melgar", "Cienciano", "Cristal", "Cienciano", "Alianza", "Melgar"],
+            "home_score": [2, 1, 0, 1, 2, 0],
+            "away_score": [0, 1, 3, 1, 2, 1],
+            "scoreline": ["2 - 0", "1 - 1", "0 - 3", "1 - 1", "2 - 2", "0 - 1"],
+        }
+    )
+    form_state = extend_form(pd.DataFrame(), team_form_inputs(matches), TEAM_FORM_SPEC)
+    team_form = normalize_form_table(build_form_tables({"team_form": form_state})["team_form"], "team_id")
+
+    published = build_top_team_form(matches, team_form)
+
+    pd.testing.assert_frame_equal(published, build_top_team_form(matches), check_dtype=False)
+    assert published.loc[published["team_id"] == 10, "Form"].iloc[0] == ["W", "D", "D"]
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from gronestats.dashboard.data import build_dashboard_bundle
+from gronestats.dashboard.figure_cache import FigureCache
+from gronestats.dashboard.metrics import build_match_summary
+from gronestats.dashboard.models import FilterState
+from gronestats.dashboard.prerender import full_season_filters, prerender_release_assets
+from gronestats.dashboard.views.figure_specs import match_momentum_figure_spec
+
+
+def _copy_single_match_release(source_dir: Path, target_dir: Path) -> int:
+    matches = pd.read_parquet(source_dir / "matches.parquet")
+    momentum = pd.read_parquet(source_dir / "match_momentum.parquet")
+    match_id = int(momentum["match_id"].iloc[0])
+    target_dir.mkdir(parents=True)
+    for path in source_dir.iterdir():
+        if path.suffix == ".json":
+            shutil.copy2(path, target_dir / path.name)
+        elif path.suffix == ".parquet":
+            frame = pd.read_parquet(path)
+            if "match_id" in frame.columns:
+                frame = frame[pd.to_numeric(frame["match_id"], errors="coerce") == match_id]
+            frame.to_parquet(target_dir / path.name, index=False)
+    assert match_id in set(matches["match_id"].astype(int))
+    return match_id
+
+
+def test_prerendered_match_assets_are_served_without_rendering(tmp_path: Path) -> None:
+    source_dir = Path("gronestats/data/Liga 1 Peru/2026/dashboard/current")
+    if not (source_dir / "match_momentum.parquet").exists() or not (source_dir / "manifest.json").exists():
+        pytest.skip("Temporada 2026 sin release publicada en el workspace actual.")
+
+    release_dir = tmp_path / "release"
+    match_id = _copy_single_match_release(source_dir, release_dir)
+
+    result = prerender_release_assets(release_dir, season_year=2026, max_workers=1)
+
+    assert result["status"] == "rendered"
+    assert result["asset_count"] > 0
+    index = json.loads((release_dir / "assets" / "index.json").read_text(encoding="utf-8"))
+    assert len(index["assets"]) == result["asset_count"]
+
+    bundle = build_dashboard_bundle(release_dir, 2026)
+    assert bundle.assets_dir == release_dir / "assets"
+    # The dashboard ranks with a minutes floor; figure keys must not depend on it.
+    defaults = full_season_filters(bundle)
+    filters = FilterState(round_range=defaults.round_range, min_minutes=180, tournaments=defaults.tournaments)
+    summary = build_match_summary(bundle, filters, match_id, pd.DataFrame())
+    assert summary is not None
+    key, _ = match_momentum_figure_spec(summary)
+
+    def _fail() -> None:
+        raise AssertionError("Pre-rendered asset should be served instead of rendering.")
+
+    payload = FigureCache().get_or_render(key, _fail, assets_dir=summary.assets_dir)
+
+    assert payload.startswith(b"\x89PNG")
+
+
+def test_prerender_skips_release_without_release_id(tmp_path: Path) -> None:
+    pd.DataFrame({"match_id": [1], "round_number": [1], "tournament": ["Liga 1, Apertura"]}).to_parquet(
+        tmp_path / "matches.parquet", index=False
+    )
+
+    result = prerender_release_assets(tmp_path, season_year=2026, max_workers=1)
+
+    assert result["status"] == "skipped"
+    assert not (tmp_path / "assets").exists()
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gronestats.processing.canonical_warehouse import FORM_STATE_SCHEMAS, load_season_rows
+from gronestats.processing.form_tables import load_form_tables, update_form_state
+from gronestats.stats.form import TEAM_FORM_SPEC, extend_form, team_form_inputs
+
+
+def _matches(rounds: int) -> pd.DataFrame:
+    # Four teams, two matches per round; scores cycle so streaks and form windows change.
+    fixtures = [((1, 2), (3, 4)), ((1, 3), (2, 4)), ((1, 4), (2, 3))]
+    scores = [(2, 0), (1, 1), (0, 1), (3, 2), (0, 0), (1, 0), (2, 2)]
+    rows = []
+    for round_number in range(1, rounds + 1):
+        for slot, (home_id, away_id) in enumerate(fixtures[(round_number - 1) % len(fixtures)]):
+            home_score, away_score = scores[(round_number * 2 + slot) % len(scores)]
+            rows.append(
+                {
+                    "match_id": round_number * 10 + slot,
+                    "round_number": round_number,
+                    "home_id": home_id,
+                    "away_id": away_id,
+                    "home_score": home_score,
+                    "away_score": away_score,
+                    "fecha": f"{round_number:02d}/03/2025 15:{slot:02d}",
+                }
+            )
+    return pd.DataFrame(rows)
+
+
+def _player_match(matches: pd.DataFrame) -> pd.DataFrame:
+    return pd.DataFrame(
+        [
+            {
+                "match_id": match.match_id,
+                "player_id": 100 + match.home_id,
+                "team_id": match.home_id,
+                "minutesplayed": 90,
+                "goals": int(match.home_score > 0),
+                "assists": 0,
+                "rating": 6.0 + match.home_score / 2,
+            }
+            for match in matches.itertuples()
+        ]
+    )
+
+
+def test_extend_form_round_by_round_matches_full_season() -> None:
+    inputs = team_form_inputs(_matches(9))
+    full = extend_form(pd.DataFrame(), inputs, TEAM_FORM_SPEC)
+
+    state = pd.DataFrame()
+    for round_number in range(1, 10):
+        computed = extend_form(state, inputs.loc[inputs["round_number"] == round_number], TEAM_FORM_SPEC)
+        state = pd.concat([state, computed], ignore_index=True) if not state.empty else computed
+
+    keys = ["team_id", "match_id"]
+    pd.testing.assert_frame_equal(
+        full.sort_values(keys).reset_index(drop=True).astype(object),
+        state.sort_values(keys).reset_index(drop=True).astype(object),
+    )
+
+    team = full.loc[full["team_id"] == 1].reset_index(drop=True)
+    expected_points = team["points"].rolling(5, min_periods=1).sum()
+    expected_ewm = team["points"].astype(float).ewm(alpha=TEAM_FORM_SPEC.alpha, adjust=False).mean()
+    assert team["form_points"].tolist() == expected_points.tolist()
+    assert np.allclose(team["ewm_points"], expected_ewm)
+    assert team["form_sequence"].iloc[-1] == "".join(team["result"].tail(5))
+    last_result = team["result"].iloc[-1]
+    run = 0
+    for result in reversed(team["result"].tolist()):
+        if result != last_result:
+            break
+        run += 1
+    assert (team["streak_value"].iloc[-1], team["streak_length"].iloc[-1]) == (last_result, run)
+
+
+def test_update_form_state_appends_new_rounds_and_rebuilds_on_corrections(tmp_path: Path) -> None:
+    pytest.importorskip("duckdb")
+    warehouse_path = tmp_path / "gronestats.duckdb"
+    season_matches = _matches(9)
+
+    def canonical(matches: pd.DataFrame) -> dict[str, pd.DataFrame]:
+        return {"matches_canonical": matches, "player_match_canonical": _player_match(matches)}
+
+    first = update_form_state(warehouse_path, canonical(season_matches.loc[season_matches["round_number"] <= 6]), 2025)
+    second = update_form_state(warehouse_path, canonical(season_matches), 2025)
+    assert first["team_form_state"]["mode"] == "rebuilt"
+    assert second["team_form_state"] == {"mode": "appended", "rows_written": 12}
+    assert second["player_form_state"] == {"mode": "appended", "rows_written": 6}
+
+    incremental = load_form_tables(warehouse_path, 2025)
+    rebuilt_path = tmp_path / "rebuilt.duckdb"
+    update_form_state(rebuilt_path, canonical(season_matches), 2025)
+    for table_name, frame in load_form_tables(rebuilt_path, 2025).items():
+        pd.testing.assert_frame_equal(incremental[table_name], frame)
+    assert incremental["team_form"]["team_id"].tolist() == [1, 2, 3, 4]
+
+    corrected = season_matches.copy()
+    corrected.loc[0, "home_score"] = 5
+    third = update_form_state(warehouse_path, canonical(corrected), 2025)
+    assert third["team_form_state"]["mode"] == "rebuilt"
+    stored = load_season_rows(warehouse_path, FORM_STATE_SCHEMAS["team_form_state"], 2025)
+    assert len(stored) == 2 * len(season_matches)
+    assert int(stored.loc[(stored["match_id"] == 10) & (stored["team_id"] == 1), "goals_for"].iloc[0]) == 5
@@ -13,6 +13,7 @@ from gronestats.processing.pipeline import (
     build_average_positions_curated,
     build_heatmap_points_curated,
     build_player_totals_full_season,
+    build_shot_events_curated,
     publish_release_atomically,
     resolve_changed_match_ids,
     should_refresh_fantasy_bridge,
@@ -107,6 +108,33 @@ def test_average_positions_and_heatmap_points_keep_raw_coordinates() -> None:
     assert heatmap_points["y"].tolist() == [10.0, 20.0]
 
 
+def test_build_shot_events_curated_resolves_team_and_numeric_coordinates() -> None:
+    shotmap_raw = pd.DataFrame(
+        {
+            "match_id": [1, 1, 2],
+            "id": [11, 12, 21],
+            "playerId": [100, 200, 300],
+            "isHome": [True, False, None],
+            "shotType": ["goal", "block", "miss"],
+            "goalMouthCoordinates": ["{'x': 0, 'y': 51.2, 'z': 9.1}", None, "sin datos"],
+            "blockCoordinates": [None, "{'x': 1.9, 'y': 52, 'z': 0}", None],
+            "time_seconds": [60, 120, 30],
+        }
+    )
+    matches = pd.DataFrame(
+        {"match_id": [1, 2], "home_id": [10, 30], "away_id": [20, 40], "home": ["Alianza", "Cristal"], "away": ["Melgar", "Cusco"]}
+    )
+
+    shots = build_shot_events_curated(shotmap_raw, matches)
+
+    assert shots["team_id"].tolist() == [10, 20, 40]
+    assert shots["team_name"].tolist() == ["Alianza", "Melgar", "Cusco"]
+    assert str(shots["team_id"].dtype) == "Int64"
+    assert shots.loc[shots["shot_id"] == 11, ["goal_mouth_y", "goal_mouth_z"]].iloc[0].tolist() == [51.2, 9.1]
+    assert shots.loc[shots["shot_id"] == 12, ["block_x", "block_y", "block_z"]].iloc[0].tolist() == [1.9, 52.0, 0.0]
+    assert shots.loc[shots["shot_id"] == 21, "goal_mouth_y"].isna().all()
+
+
 def test_resolve_changed_match_ids_detects_inventory_and_master_changes() -> None:
     current_raw = pd.DataFrame(
         {
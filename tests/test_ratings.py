@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gronestats.processing.rating_tables import load_rating_tables, update_rating_state
+from gronestats.stats.ratings import (
+    ELO_INITIAL,
+    RatingState,
+    advance_ratings,
+    elo_deltas,
+    fit_poisson_ratings,
+    outcome_probabilities,
+    rating_inputs,
+)
+
+
+def _matches(rounds: int, *, seed: int = 7) -> pd.DataFrame:
+    # Six teams in a circle-method round robin with Poisson scores driven by fixed strengths.
+    rng = np.random.default_rng(seed)
+    strength = {1: 0.4, 2: 0.2, 3: 0.0, 4: -0.1, 5: -0.2, 6: -0.3}
+    teams = list(strength)
+    rows = []
+    for round_number in range(1, rounds + 1):
+        rotation = teams[:1] + teams[1:][round_number % 5 :] + teams[1:][: round_number % 5]
+        for slot in range(3):
+            home_id, away_id = rotation[slot], rotation[-1 - slot]
+            if round_number % 2:
+                home_id, away_id = away_id, home_id
+            rows.append(
+                {
+                    "match_id": round_number * 10 + slot,
+                    "tournament": "Liga 1, Apertura",
+                    "round_number": round_number,
+                    "home_id": home_id,
+                    "away_id": away_id,
+                    "home_score": int(rng.poisson(np.exp(0.3 + strength[home_id] - strength[away_id]))),
+                    "away_score": int(rng.poisson(np.exp(0.0 + strength[away_id] - strength[home_id]))),
+                    "fecha": f"{round_number:02d}/03/2025 {15 + slot}:00",
+                }
+            )
+    return pd.DataFrame(rows)
+
+
+def test_poisson_irls_matches_penalized_likelihood_optimum() -> None:
+    optimize = pytest.importorskip("scipy.optimize")
+    matches = _matches(10)
+    ratings = fit_poisson_ratings(matches["home_id"], matches["away_id"], matches["home_score"], matches["away_score"], ridge=1.5)
+
+    team_ids = np.sort(pd.unique(matches[["home_id", "away_id"]].to_numpy().ravel()))
+    code = {team_id: index for index, team_id in enumerate(team_ids)}
+    home = matches["home_id"].map(code).to_numpy()
+    away = matches["away_id"].map(code).to_numpy()
+    teams = len(team_ids)
+
+    def objective(beta: np.ndarray) -> float:
+        attack, defence = beta[2 : 2 + teams], beta[2 + teams :]
+        home_rate = beta[0] + beta[1] + attack[home] - defence[away]
+        away_rate = beta[0] + attack[away] - defence[home]
+        loglik = (matches["home_score"] * home_rate - np.exp(home_rate)).sum() + (
+            matches["away_score"] * away_rate - np.exp(away_rate)
+        ).sum()
+        return float(-loglik + 0.75 * (attack @ attack + defence @ defence))
+
+    reference = optimize.minimize(objective, np.zeros(2 + 2 * teams), method="BFGS", options={"gtol": 1e-9}).x
+    assert ratings.iterations < 10
+    assert ratings.home_advantage == pytest.approx(reference[1], abs=1e-5)
+    assert np.allclose(ratings.attack, reference[2 : 2 + teams] - reference[2 : 2 + teams].mean(), atol=1e-5)
+    assert np.allclose(ratings.defence, reference[2 + teams :] - reference[2 + teams :].mean(), atol=1e-5)
+
+    expected_home, expected_away = ratings.expected_goals([1, 6], [6, 1])
+    p_home, p_draw, p_away = outcome_probabilities(expected_home, expected_away)
+    assert np.allclose(p_home + p_draw + p_away, 1.0)
+    assert p_home[0] > p_home[1]
+
+
+def test_stepwise_elo_equals_sequential_updates_and_steps_split_repeated_teams() -> None:
+    matches = _matches(6)
+    final_leg = matches.iloc[[0]].assign(match_id=999, home_id=matches.iloc[0]["away_id"], away_id=matches.iloc[0]["home_id"])
+    undated = pd.concat([matches, final_leg], ignore_index=True).assign(fecha=None)
+    inputs = rating_inputs(undated)
+    assert inputs.groupby("step")[["home_id"]].size().max() == 3
+    assert inputs.loc[inputs["match_id"] == 999, "step"].iloc[0] > inputs.loc[inputs["match_id"] == 10, "step"].iloc[0]
+
+    _, ratings, state = advance_ratings(inputs.iloc[0:0], inputs, RatingState.initial())
+    elo: dict[int, float] = {}
+    for match in inputs.itertuples():
+        home_elo, away_elo = elo.get(match.home_id, ELO_INITIAL), elo.get(match.away_id, ELO_INITIAL)
+        delta = float(elo_deltas(home_elo, away_elo, match.home_score, match.away_score))
+        elo[match.home_id], elo[match.away_id] = home_elo + delta, away_elo - delta
+    assert state.elo.to_dict() == pytest.approx(elo)
+    assert ratings["step"].nunique() == inputs["step"].nunique()
+
+
+def test_update_rating_state_appends_new_steps_and_refits_on_corrections(tmp_path: Path) -> None:
+    pytest.importorskip("duckdb")
+    warehouse_path = tmp_path / "gronestats.duckdb"
+    season_matches = _matches(10)
+
+    first = update_rating_state(warehouse_path, {"matches_canonical": season_matches.loc[season_matches["round_number"] <= 6]}, 2025)
+    second = update_rating_state(warehouse_path, {"matches_canonical": season_matches}, 2025)
+    assert first["mode"] == "rebuilt"
+    assert second == {"mode": "appended", "matches_written": 12, "steps_written": 4}
+
+    fixtures = pd.DataFrame({"match_id": [500], "home_id": [1], "away_id": [6]})
+    incremental = load_rating_tables(warehouse_path, 2025, fixtures)
+    rebuilt_path = tmp_path / "rebuilt.duckdb"
+    update_rating_state(rebuilt_path, {"matches_canonical": season_matches}, 2025)
+    for table_name, frame in load_rating_tables(rebuilt_path, 2025, fixtures).items():
+        pd.testing.assert_frame_equal(incremental[table_name], frame, check_exact=False, rtol=1e-9)
+
+    probabilities = incremental["match_probabilities"]
+    assert len(probabilities) == len(season_matches) + 1
+    upcoming = probabilities.loc[~probabilities["is_played"].astype(bool)].iloc[0]
+    assert upcoming["p_home"] + upcoming["p_draw"] + upcoming["p_away"] == pytest.approx(1.0)
+    assert incremental["team_ratings"]["net_rank"].min() == 1
+
+    corrected = season_matches.copy()
+    corrected.loc[0, "home_score"] = 6
+    assert update_rating_state(warehouse_path, {"matches_canonical": corrected}, 2025)["mode"] == "rebuilt"
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from gronestats.data_layout import season_layout
+from gronestats.scouting_index import (
+    SCOUTING_FEATURE_COLUMNS,
+    ScoutingIndex,
+    build_season_vectors,
+    rebuild_scouting_index,
+    scouting_index_path,
+    update_scouting_index,
+)
+
+
+def _player_match(goals_by_player: dict[int, int], matches: int = 8) -> pd.DataFrame:
+    return pd.DataFrame(
+        [
+            {
+                "match_id": match_id,
+                "player_id": player_id,
+                "name": f"Jugador {player_id}",
+                "team_id": 10,
+                "position": "F" if player_id < 5 else "D",
+                "minutesplayed": 90,
+                "goals": goals if match_id <= 4 else 0,
+                "assists": player_id % 2,
+                "fouls": 1,
+                "rating": 6.5 + goals / 4,
+            }
+            for player_id, goals in goals_by_player.items()
+            for match_id in range(1, matches + 1)
+        ]
+    )
+
+
+def _write_release(repo_root: Path, season_year: int, player_match: pd.DataFrame) -> None:
+    current_dir = season_layout(season_year, repo_root=repo_root).dashboard.current_dir
+    current_dir.mkdir(parents=True)
+    player_match.to_parquet(current_dir / "player_match.parquet", index=False)
+
+
+def test_update_scouting_index_only_swaps_the_published_season(tmp_path: Path) -> None:
+    _write_release(tmp_path, 2024, _player_match({1: 1, 2: 0, 5: 0}))
+    _write_release(tmp_path, 2025, _player_match({1: 2, 3: 1, 6: 0}))
+    rebuild_scouting_index(repo_root=tmp_path, warehouse_path=tmp_path / "missing.duckdb")
+    before = pd.read_parquet(scouting_index_path(repo_root=tmp_path))
+
+    season_vectors = build_season_vectors(_player_match({1: 0, 4: 1}), None, season_year=2025)
+    update_scouting_index(season_vectors, season_year=2025, repo_root=tmp_path)
+
+    after = pd.read_parquet(scouting_index_path(repo_root=tmp_path))
+    pd.testing.assert_frame_equal(
+        after.loc[after["season_year"] == 2024].reset_index(drop=True),
+        before.loc[before["season_year"] == 2024].reset_index(drop=True),
+    )
+    assert after.loc[after["season_year"] == 2025, "player_id"].tolist() == [1, 4]
+
+
+def test_nearest_matches_brute_force_distances_across_seasons() -> None:
+    vectors = pd.concat(
+        [
+            build_season_vectors(_player_match({1: 1, 2: 0, 5: 0}), None, season_year=2024),
+            build_season_vectors(_player_match({1: 2, 3: 1, 6: 0}), None, season_year=2025),
+        ],
+        ignore_index=True,
+    )
+    index = ScoutingIndex.from_frame(vectors)
+
+    neighbours = index.nearest(3, 2025, k=10)
+
+    values = vectors[SCOUTING_FEATURE_COLUMNS].to_numpy(dtype="float64")
+    standardized = (values - values.mean(axis=0)) / np.where(values.std(axis=0) > 0, values.std(axis=0), 1.0)
+    query = standardized[index.rows[(2025, 3)]]
+    expected = {
+        (int(season), int(player)): float(np.linalg.norm(standardized[row] - query))
+        for (season, player), row in index.rows.items()
+        if player != 3
+    }
+    assert len(neighbours) == len(expected)
+    assert neighbours["distance"].is_monotonic_increasing
+    for row in neighbours.itertuples():
+        assert np.isclose(row.distance, expected[(row.season_year, row.player_id)])
+
+    same_player_allowed = index.nearest(1, 2025, k=1, exclude_same_player=False)
+    assert (same_player_allowed["season_year"].iloc[0], same_player_allowed["player_id"].iloc[0]) != (2025, 1)
+    assert set(index.nearest(1, 2025, k=10, seasons=[2024], same_position=True)["player_id"]) == {2}
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pandas as pd
+
+from gronestats.data_layout import season_layout
+from gronestats.season_catalog import (
+    LEAGUE_CATALOG_INDEX_FILENAME,
+    SEASON_CATALOG_FILENAME,
+    update_league_catalog_index,
+    write_season_catalog,
+)
+
+
+def _write_release(repo_root: Path, season_year: int, *, player_ids: list[int], scores: list[tuple[int, int]]) -> Path:
+    current_dir = season_layout(season_year, repo_root=repo_root).dashboard.current_dir
+    current_dir.mkdir(parents=True)
+    pd.DataFrame(
+        {
+            "match_id": list(range(1, len(scores) + 1)),
+            "home_score": [home for home, _ in scores],
+            "away_score": [away for _, away in scores],
+        }
+    ).to_parquet(current_dir / "matches.parquet", index=False)
+    pd.DataFrame({"team_id": [10, 20]}).to_parquet(current_dir / "teams.parquet", index=False)
+    pd.DataFrame({"player_id": player_ids}).to_parquet(current_dir / "players.parquet", index=False)
+    pd.DataFrame(
+        {
+            "player_id": player_ids,
+            "name": [f"Jugador {player_id}" for player_id in player_ids],
+            "goals": [player_id % 3 for player_id in player_ids],
+        }
+    ).to_parquet(current_dir / "player_match.parquet", index=False)
+    (current_dir / "manifest.json").write_text(json.dumps({"release_id": f"{season_year}0101_000000"}), encoding="utf-8")
+    (current_dir / "validation.json").write_text(
+        json.dumps({"status": "passed", "warnings": ["sin momentum"], "validated_at": "2026-01-01T00:00:00+00:00"}),
+        encoding="utf-8",
+    )
+    return current_dir
+
+
+def test_write_season_catalog_summarizes_release(tmp_path: Path) -> None:
+    current_dir = _write_release(tmp_path, 2025, player_ids=[1, 2, 5], scores=[(2, 1), (0, 0)])
+
+    catalog = write_season_catalog(current_dir, season_year=2025)
+
+    assert json.loads((current_dir / SEASON_CATALOG_FILENAME).read_text(encoding="utf-8")) == catalog
+    assert catalog["matches"] == 2
+    assert catalog["goals"] == 3
+    assert catalog["goals_per_match"] == 1.5
+    assert (catalog["top_scorer"], catalog["top_scorer_goals"]) == ("Jugador 2", 2)
+    assert catalog["validation_status"] == "passed"
+    assert catalog["release_id"] == "20250101_000000"
+
+
+def test_league_catalog_index_merges_seasons_and_backfills_missing_catalogs(tmp_path: Path) -> None:
+    current_2025 = _write_release(tmp_path, 2025, player_ids=[1, 2, 5], scores=[(2, 1), (0, 0)])
+    _write_release(tmp_path, 2026, player_ids=[2, 7], scores=[(1, 1)])
+    write_season_catalog(current_2025, season_year=2025)
+
+    index_path = update_league_catalog_index(repo_root=tmp_path)
+
+    index = json.loads(index_path.read_text(encoding="utf-8"))
+    assert index_path.name == LEAGUE_CATALOG_INDEX_FILENAME
+    assert [entry["season_year"] for entry in index["seasons"]] == [2026, 2025]
+    assert index["total_matches"] == 3
+    assert index["total_goals"] == 5
+    assert index["total_players"] == 4
+    assert all("player_ids" not in entry for entry in index["seasons"])
+    assert not list(index_path.parent.glob(".*.tmp"))
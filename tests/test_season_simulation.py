@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gronestats.dashboard.metrics import calculate_standings
+from gronestats.stats.ratings import outcome_probabilities
+from gronestats.stats.season_simulation import SeasonRules, build_season_model, run_simulations, simulate_season
+
+
+TEAM_NAMES = {1: "Alianza", 2: "Cristal", 3: "Melgar", 4: "Universitario", 5: "Cienciano"}
+
+
+def _played() -> pd.DataFrame:
+    rows = [
+        ("Liga 1, Apertura", 1, 2, 2, 0),
+        ("Liga 1, Apertura", 3, 4, 1, 1),
+        ("Liga 1, Apertura", 5, 1, 0, 3),
+        ("Liga 1, Apertura", 2, 3, 2, 2),
+        ("Liga 1, Apertura", 4, 5, 1, 0),
+        ("Liga 1, Clausura", 2, 1, 1, 0),
+        ("Liga 1, Clausura", 4, 3, 0, 2),
+        ("Primera Division, Grand Final", 1, 4, 3, 0),
+    ]
+    return pd.DataFrame(
+        [
+            {"match_id": index, "tournament": tournament, "home_id": home, "away_id": away, "home_score": hs, "away_score": as_}
+            for index, (tournament, home, away, hs, as_) in enumerate(rows, start=1)
+        ]
+    ).assign(
+        home=lambda frame: frame["home_id"].map(TEAM_NAMES),
+        away=lambda frame: frame["away_id"].map(TEAM_NAMES),
+        round_number=1,
+        fecha_dt=pd.NaT,
+        scoreline=lambda frame: frame["home_score"].astype(str) + "-" + frame["away_score"].astype(str),
+    )
+
+
+def _remaining(rows: list[tuple[str, int, int, float, float]]) -> pd.DataFrame:
+    return pd.DataFrame(
+        [
+            {
+                "match_id": 100 + index,
+                "tournament": tournament,
+                "home_id": home,
+                "away_id": away,
+                "expected_home_goals": expected_home,
+                "expected_away_goals": expected_away,
+            }
+            for index, (tournament, home, away, expected_home, expected_away) in enumerate(rows)
+        ]
+    )
+
+
+def test_completed_season_reproduces_standings_rules() -> None:
+    played = _played()
+    tables = simulate_season(played, _remaining([]), simulations=50, team_names=TEAM_NAMES, rules=SeasonRules(relegation_spots=2))
+    projections = tables["season_projections"].set_index("team_id")
+
+    apertura = calculate_standings(played.loc[played["tournament"].str.contains("Apertura")])
+    clausura = calculate_standings(played.loc[played["tournament"].str.contains("Clausura")])
+    aggregate = calculate_standings(played.loc[~played["tournament"].str.contains("Grand Final")])
+    assert projections.loc[int(apertura["team_id"].iloc[0]), "p_apertura"] == 1.0
+    assert projections.loc[int(clausura["team_id"].iloc[0]), "p_clausura"] == 1.0
+    assert projections.loc[int(aggregate["team_id"].iloc[0]), "p_aggregate_first"] == 1.0
+    assert projections["expected_position"].tolist() == list(range(1, 6))
+    assert projections.index.tolist() == aggregate["team_id"].astype(int).tolist()
+    assert projections.loc[aggregate["team_id"].tail(2).astype(int), "p_relegation"].tolist() == [1.0, 1.0]
+    assert projections["points"].tolist() == aggregate["Pts"].tolist()
+    assert projections["p_playoff"].sum() == pytest.approx(3.0)
+
+
+def test_sampled_outcomes_follow_poisson_odds_and_chunks_are_reproducible() -> None:
+    played = _played().query("tournament == 'Liga 1, Apertura'")
+    # Alianza (6 pts) and Universitario (5 pts after a draw) meet in the last Apertura match.
+    remaining = _remaining([("Liga 1, Apertura", 4, 1, 1.4, 1.1)])
+    model = build_season_model(played, remaining, team_names=TEAM_NAMES)
+
+    totals = run_simulations(model, 60_000, seed=11, workers=1)
+    p_home, _, _ = outcome_probabilities(1.4, 1.1)
+    apertura_titles = dict(zip(model.team_ids, totals["stage_titles"][0] / totals["simulations"]))
+    assert apertura_titles[4] == pytest.approx(p_home[0], abs=0.01)
+    assert sum(apertura_titles.values()) == pytest.approx(1.0)
+
+    pooled = run_simulations(model, 12_000, seed=5, workers=2)
+    serial = run_simulations(model, 12_000, seed=5, workers=1)
+    assert all(np.array_equal(pooled[key], serial[key]) for key in serial)
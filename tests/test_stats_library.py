@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from gronestats.analysis import indice_similaridad
+from gronestats.stats.benchmarks import BENCHMARKS, benchmark_frame, run_benchmarks
+from gronestats.stats.player_stats import per90, percentile_ranks, rolling_mean, rolling_sum, shrunk_rate
+from gronestats.stats.team_stats import match_points, match_results
+
+
+def test_per90_accepts_pandas_numpy_and_arrow_inputs() -> None:
+    goals = pd.Series([2, None, 1, 3], dtype="Int64", index=[10, 11, 12, 13])
+    minutes = pd.Series([180, 90, 0, None], dtype="Int64", index=[10, 11, 12, 13])
+
+    result = per90(goals, minutes)
+
+    assert result.index.tolist() == [10, 11, 12, 13]
+    assert result.tolist() == [1.0, 0.0, 0.0, 0.0]
+    assert per90(pa.array([2, None, 1, 3]), np.array([180.0, 90.0, 0.0, np.nan])).tolist() == result.tolist()
+    assert np.isnan(per90(np.array([1.0]), np.array([0.0]), fill=np.nan)[0])
+
+
+def test_similarity_index_per90_keeps_nan_stats_out_of_the_percentile_range() -> None:
+    tackles = pd.Series([9.0, np.nan, 1.0, 4.0])
+    minutes = pd.Series([900.0, 900.0, 0.0, 1800.0])
+
+    result = indice_similaridad.per90(tackles, minutes)
+
+    # The pre-library formula: s * 90 / minutes with zero minutes as NaN.
+    expected = tackles * 90 / minutes.replace(0, np.nan)
+    np.testing.assert_array_equal(result.to_numpy(), expected.to_numpy())
+    assert indice_similaridad.p5_p95(result) == indice_similaridad.p5_p95(expected)
+    assert per90(tackles, minutes).tolist()[1] == 0.0
+
+
+def test_percentile_ranks_by_group_and_rows_without_group() -> None:
+    values = pd.Series([1.0, 2.0, 3.0, 10.0, None])
+    groups = pd.Series(["F", "F", "D", "D", None])
+
+    ranks = percentile_ranks(values, groups)
+
+    assert ranks.tolist() == pytest.approx([0.5, 1.0, 0.5, 1.0, 0.2])
+
+    # Ties, NaN values kept out of the denominator and every rank method match pandas' grouped rank.
+    rng = np.random.default_rng(3)
+    tied = pd.Series(rng.integers(0, 4, 400).astype(float)).mask(rng.random(400) < 0.1)
+    positions = pd.Series(rng.choice(["G", "D", "M"], 400))
+    for method in ("max", "min", "average", "dense"):
+        expected = tied.groupby(positions).rank(pct=True, method=method)
+        np.testing.assert_allclose(percentile_ranks(tied, positions, method=method, fill=None), expected)
+
+
+def test_rolling_kernels_match_pandas_groupby_rolling() -> None:
+    frame = benchmark_frame(600, seed=3)
+    goals = frame["goals"].astype(float)
+
+    expected_sum = goals.fillna(0).groupby(frame["player_id"]).transform(lambda values: values.rolling(4, min_periods=1).sum())
+    expected_mean = goals.groupby(frame["player_id"]).transform(lambda values: values.rolling(4, min_periods=1).mean())
+
+    assert np.allclose(rolling_sum(goals, 4, frame["player_id"]), expected_sum)
+    assert np.allclose(rolling_mean(goals, 4, frame["player_id"]), expected_mean, equal_nan=True)
+
+
+def test_shrunk_rate_and_match_outcomes() -> None:
+    rates = shrunk_rate(np.array([1.0, 30.0]), np.array([1.0, 100.0]), prior_weight=10.0)
+    pooled = 31 / 101
+    assert rates.tolist() == pytest.approx([(1 + 10 * pooled) / 11, (30 + 10 * pooled) / 110])
+
+    goals_for = pd.Series([2, 1, 0])
+    goals_against = pd.Series([0, 1, 3])
+    assert match_results(goals_for, goals_against).tolist() == ["W", "D", "L"]
+    assert match_points(goals_for, goals_against).tolist() == [3, 1, 0]
+
+
+def test_vectorized_kernels_match_their_references() -> None:
+    # Speedup budgets are wall-clock checks; see test_vectorized_kernels_meet_their_speedup_budgets.
+    frame = benchmark_frame(2_000)
+    for name, (vectorized, reference) in BENCHMARKS.items():
+        assert np.allclose(np.asarray(vectorized(frame), dtype=float), np.asarray(reference(frame), dtype=float)), name
+
+
+@pytest.mark.benchmark
+def test_vectorized_kernels_meet_their_speedup_budgets() -> None:
+    # Best of 9 runs per side keeps one slow run from failing a budget; deselected unless `-m benchmark`.
+    over_budget = [
+        f"{result.name}: {result.speedup:.1f}x"
+        for result in run_benchmarks(repeats=9)
+        if not result.within_budget
+    ]
+    assert over_budget == []
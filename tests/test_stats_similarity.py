@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gronestats.stats.similarity import (
+    SimilarityFeature,
+    SimilarityIndex,
+    build_similarity_features,
+)
+
+
+def _player_match() -> pd.DataFrame:
+    rows = []
+    profiles = {
+        1: ("F", 1, 0, 7.4),
+        2: ("F", 1, 0, 7.2),
+        3: ("F", 0, 1, 6.8),
+        4: ("D", 0, 0, 6.9),
+        5: ("D", 0, 0, 6.6),
+    }
+    for player_id, (position, goals, assists, rating) in profiles.items():
+        for match_id in range(1, 12):
+            rows.append(
+                {
+                    "match_id": match_id,
+                    "player_id": player_id,
+                    "name": f"Jugador {player_id}",
+                    "team_id": 10 if player_id % 2 else 20,
+                    "position": position,
+                    "minutesplayed": 90,
+                    "goals": goals if match_id % 2 else 0,
+                    "assists": assists,
+                    "fouls": player_id % 3,
+                    "yellowcards": 1 if match_id == player_id else 0,
+                    "rating": rating,
+                }
+            )
+    rows.append({"match_id": 1, "player_id": 6, "name": "Suplente", "team_id": 10, "position": "F", "minutesplayed": 20, "goals": 1})
+    return pd.DataFrame(rows)
+
+
+def test_build_similarity_features_prefers_published_totals_and_applies_minimum() -> None:
+    totals = pd.DataFrame({"player_id": [1], "minutesplayed": [1980], "goals": [12]})
+
+    features = build_similarity_features(_player_match(), totals, min_minutes=900)
+
+    assert features["player_id"].tolist() == [1, 2, 3, 4, 5]
+    first = features.iloc[0]
+    assert first["goals_per90"] == pytest.approx(12 / 22)
+    assert first["cards_per90"] == pytest.approx(1 / 22)
+    assert features.loc[features["player_id"] == 2, "goals_per90"].iloc[0] == pytest.approx(6 / 11)
+
+
+def test_similarity_modes_only_penalize_the_configured_direction() -> None:
+    frame = pd.DataFrame({"player_id": [1, 2, 3], "value": [0.0, 5.0, 10.0]})
+    at_least = SimilarityIndex.from_frame(frame, (SimilarityFeature("value", "at_least"),))
+    at_most = SimilarityIndex.from_frame(frame, (SimilarityFeature("value", "at_most"),))
+    two_sided = SimilarityIndex.from_frame(frame, (SimilarityFeature("value", "two_sided"),))
+
+    # Gaps are measured against the p5-p95 spread (0.5-9.5), so a 5-point gap keeps 1 - 5/9.
+    partial = 100 * (1 - 5 / 9)
+    assert at_least.scores([2])[0].tolist() == pytest.approx([partial, 100.0, 100.0])
+    assert at_most.scores([2])[0].tolist() == pytest.approx([100.0, 100.0, partial])
+    assert two_sided.scores([2])[0].tolist() == pytest.approx([partial, 100.0, partial])
+    with pytest.raises(ValueError):
+        two_sided.scores([2], features=(SimilarityFeature("value", "closest"),))
+
+
+def test_batched_top_k_matches_single_queries_and_respects_positions() -> None:
+    index = SimilarityIndex.from_frame(build_similarity_features(_player_match(), min_minutes=900))
+
+    batched = index.top_k_many(k=2, chunk_size=2)
+    for player_id in [1, 2, 3, 4, 5]:
+        single = index.top_k(player_id, 2)
+        expected = batched.loc[batched["player_id"] == player_id]
+        assert single["similar_player_id"].tolist() == expected["similar_player_id"].tolist()
+        assert np.allclose(single["similarity_score"], expected["similarity_score"])
+        assert player_id not in expected["similar_player_id"].tolist()
+
+    assert index.top_k(1, 3)["similar_player_id"].iloc[0] == 2
+    defenders = index.top_k(4, 5, same_position=True)
+    assert defenders["similar_player_id"].tolist() == [5]
+    assert index.top_k(6, 3).empty